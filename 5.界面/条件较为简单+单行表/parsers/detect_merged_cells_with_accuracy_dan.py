@@ -4,38 +4,73 @@
 """
 import os
 import json
-from openpyxl import load_workbook
 from datetime import datetime
 
+from parsers.xlsx_stream_reader import XlsxStreamReader, fill_merged_rows
 
-def build_merged_cells_map(ws):
-    """
-    构建合并单元格映射表
-    返回：{(row, col): (master_row, master_col)}
-    """
-    merged_map = {}
-    for merged_range in ws.merged_cells.ranges:
-        min_row, min_col = merged_range.min_row, merged_range.min_col
-        max_row, max_col = merged_range.max_row, merged_range.max_col
-        
-        # 所有合并区域内的单元格都指向左上角的主单元格
-        for row in range(min_row, max_row + 1):
-            for col in range(min_col, max_col + 1):
-                merged_map[(row, col)] = (min_row, min_col)
-    
-    return merged_map
 
+# 列映射（基于分析结果）- 单行表格式：列号 -> (分类, 字段)
+COL_CONFIG = {
+    1: ("序号", "序号"),
+    # 岗位信息 (B-D, 2-4)
+    2: ("岗位信息", "应聘单位"),
+    3: ("岗位信息", "应聘部门路径"),
+    4: ("岗位信息", "应聘岗位"),
+    # 基本信息 (E-X, 5-24)
+    5: ("基本信息", "姓名"),
+    6: ("基本信息", "证件号码"),
+    7: ("基本信息", "性别"),
+    8: ("基本信息", "民族"),
+    9: ("基本信息", "出生日期"),
+    10: ("基本信息", "婚姻状况"),
+    11: ("基本信息", "籍贯"),
+    12: ("基本信息", "政治面貌"),
+    13: ("基本信息", "入党时间"),
+    14: ("基本信息", "入党转正日期"),
+    15: ("基本信息", "所在二级单位"),
+    16: ("基本信息", "现职务或岗位"),
+    17: ("基本信息", "现职级"),
+    18: ("基本信息", "现从事岗位序列"),
+    19: ("基本信息", "从事岗位序列时间"),
+    20: ("基本信息", "参加工作时间"),
+    21: ("基本信息", "手机"),
+    22: ("基本信息", "电子邮箱"),
+    23: ("基本信息", "是否大集体企业员工"),
+    24: ("基本信息", "是否满足回避原则"),
+    # 学历信息 (Y-Z, 25-26)
+    25: ("学历信息", "毕业院校"),
+    26: ("学历信息", "专业"),
+    # 工作经历信息 (AA-AJ, 27-36)
+    27: ("工作经历信息", "纵向工作经历层级个数（二级单位本部、三级单位本部、四级单位本部、基层一线；各层级工作经历至少满一年）"),
+    28: ("工作经历信息", "系统内工作时长（年）"),
+    29: ("工作经历信息", "基层一线工作时长（年）"),
+    30: ("工作经历信息", "班站所长工作时长（年）"),
+    31: ("工作经历信息", "党支部书记工作时长（年）"),
+    32: ("工作经历信息", "管制业务工作时长（年）"),
+    33: ("工作经历信息", "非管制业务工作时长（年）"),
+    34: ("工作经历信息", "二级单位本部职能部门和直属机构管理类和专业技术类岗位工作时长（年）（仅不包含借用经历）"),
+    35: ("工作经历信息", "三级单位本部职能部门工作时长（年）（仅不包含借用经历）"),
+    36: ("工作经历信息", "东西部单位工作时长（年）"),
+    # 资格证书 (AK-AL, 37-38)
+    37: ("资格证书", "职称等级（最高）"),
+    38: ("资格证书", "职称名称"),
+    # 个人荣誉 (AM-AN, 39-40)
+    39: ("个人荣誉", "个人荣誉级别（最高）"),
+    40: ("个人荣誉", "荣誉名称"),
+    # 绩效信息 (AO-AT, 41-46)
+    41: ("绩效信息", "2021年绩效"),
+    42: ("绩效信息", "2022年绩效"),
+    43: ("绩效信息", "2023年绩效"),
+    44: ("绩效信息", "2024年绩效"),
+    45: ("绩效信息", "2025年绩效"),
+    46: ("绩效信息", "近三年绩效为\"A\"或\"优秀\"的个数"),
+    # 处分信息 (AU-AV, 47-48)
+    47: ("处分信息", "近三年党纪处分最高等级"),
+    48: ("处分信息", "近三年政务处分最高等级")
+}
 
-def get_cell_value(ws, row, col, merged_map):
-    """
-    获取单元格的值（处理合并单元格）
-    """
-    cell_coord = (row, col)
-    if cell_coord in merged_map:
-        master_coord = merged_map[cell_coord]
-        return ws.cell(master_coord[0], master_coord[1]).value
-    else:
-        return ws.cell(row, col).value
+# 学历信息的字段先暂存在这些键中，每读完一行统一解析
+EDUCATION_TEMP_KEYS = {"毕业院校": "_temp_毕业院校", "专业": "_temp_专业"}
 
 
 def convert_value(value):
@@ -142,147 +177,120 @@ def parse_education_info(毕业院校_text, 专业_text):
     return {"原文": 原文, "调整后": 调整后}
 
 
-def parse_excel_to_single_row_json(file_path):
-    """
-    解析 Excel 文件为单行表 JSON 格式
+def compile_column_handlers(col_config, max_column=None):
     """
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"文件未找到: {file_path}")
+    把列映射编译为按列的处理函数表（解析时不再逐个单元格判断分类）
     
-    wb = load_workbook(file_path, data_only=True)
-    ws = wb.active
+    Args:
+        col_config: 列映射 {列号: (分类, 字段)}
+        max_column: 工作表最大列号，超出的列不处理（为None时不限制）
     
-    # 构建合并单元格映射
-    merged_map = build_merged_cells_map(ws)
+    Returns:
+        [(列位置(从0开始), 处理函数(person, value)), ...]，按列号排序
+    """
+    handlers = []
+    for col_idx, (category, field) in sorted(col_config.items()):
+        if max_column is not None and col_idx > max_column:
+            break
+        if category == "序号":
+            def handler(person, value):
+                person["序号"] = value
+        elif category == "学历信息":
+            # 先存储到临时位置，读完一行后统一解析
+            def handler(person, value, key=EDUCATION_TEMP_KEYS[field]):
+                person[key] = value
+        else:
+            def handler(person, value, category=category, field=field):
+                person[category][field] = value
+        handlers.append((col_idx - 1, handler))
+    return handlers
+
+
+def group_single_row_persons(filled_rows, handlers, with_rows=False):
+    """
+    把逐行读取的数据行合并为人员记录（序号改变时开始一个新的人）
     
-    # 定义列映射（基于分析结果）- 单行表格式
-    col_config = {
-        1: ("序号", "序号"),
-        # 岗位信息 (B-D, 2-4)
-        2: ("岗位信息", "应聘单位"),
-        3: ("岗位信息", "应聘部门路径"),
-        4: ("岗位信息", "应聘岗位"),
-        # 基本信息 (E-X, 5-24)
-        5: ("基本信息", "姓名"),
-        6: ("基本信息", "证件号码"),
-        7: ("基本信息", "性别"),
-        8: ("基本信息", "民族"),
-        9: ("基本信息", "出生日期"),
-        10: ("基本信息", "婚姻状况"),
-        11: ("基本信息", "籍贯"),
-        12: ("基本信息", "政治面貌"),
-        13: ("基本信息", "入党时间"),
-        14: ("基本信息", "入党转正日期"),
-        15: ("基本信息", "所在二级单位"),
-        16: ("基本信息", "现职务或岗位"),
-        17: ("基本信息", "现职级"),
-        18: ("基本信息", "现从事岗位序列"),
-        19: ("基本信息", "从事岗位序列时间"),
-        20: ("基本信息", "参加工作时间"),
-        21: ("基本信息", "手机"),
-        22: ("基本信息", "电子邮箱"),
-        23: ("基本信息", "是否大集体企业员工"),
-        24: ("基本信息", "是否满足回避原则"),
-        # 学历信息 (Y-Z, 25-26)
-        25: ("学历信息", "毕业院校"),
-        26: ("学历信息", "专业"),
-        # 工作经历信息 (AA-AJ, 27-36)
-        27: ("工作经历信息", "纵向工作经历层级个数（二级单位本部、三级单位本部、四级单位本部、基层一线；各层级工作经历至少满一年）"),
-        28: ("工作经历信息", "系统内工作时长（年）"),
-        29: ("工作经历信息", "基层一线工作时长（年）"),
-        30: ("工作经历信息", "班站所长工作时长（年）"),
-        31: ("工作经历信息", "党支部书记工作时长（年）"),
-        32: ("工作经历信息", "管制业务工作时长（年）"),
-        33: ("工作经历信息", "非管制业务工作时长（年）"),
-        34: ("工作经历信息", "二级单位本部职能部门和直属机构管理类和专业技术类岗位工作时长（年）（仅不包含借用经历）"),
-        35: ("工作经历信息", "三级单位本部职能部门工作时长（年）（仅不包含借用经历）"),
-        36: ("工作经历信息", "东西部单位工作时长（年）"),
-        # 资格证书 (AK-AL, 37-38)
-        37: ("资格证书", "职称等级（最高）"),
-        38: ("资格证书", "职称名称"),
-        # 个人荣誉 (AM-AN, 39-40)
-        39: ("个人荣誉", "个人荣誉级别（最高）"),
-        40: ("个人荣誉", "荣誉名称"),
-        # 绩效信息 (AO-AT, 41-46)
-        41: ("绩效信息", "2021年绩效"),
-        42: ("绩效信息", "2022年绩效"),
-        43: ("绩效信息", "2023年绩效"),
-        44: ("绩效信息", "2024年绩效"),
-        45: ("绩效信息", "2025年绩效"),
-        46: ("绩效信息", "近三年绩效为\"A\"或\"优秀\"的个数"),
-        # 处分信息 (AU-AV, 47-48)
-        47: ("处分信息", "近三年党纪处分最高等级"),
-        48: ("处分信息", "近三年政务处分最高等级")
-    }
+    Args:
+        filled_rows: fill_merged_rows 的输出（从第3行开始）
+        handlers: compile_column_handlers 的结果
+        with_rows: 是否同时返回人员记录的起始行号
     
-    # 读取数据（从第3行开始）
-    result = []
+    Yields:
+        人员记录字典；with_rows 为True时为 (起始行号, 人员记录字典)
+    """
     current_person = None
     current_序号 = None
+    current_row = None
     
-    for row_idx in range(3, ws.max_row + 1):
-        # 获取序号（第1列）
-        序号_val = get_cell_value(ws, row_idx, 1, merged_map)
-        
+    for row_idx, row_values, _ in filled_rows:
         # 如果序号改变，说明是新的一个人
+        序号_val = row_values[0] if row_values else None
         if 序号_val is not None and 序号_val != current_序号:
             if current_person is not None:
-                result.append(current_person)
+                yield (current_row, current_person) if with_rows else current_person
             
             current_序号 = 序号_val
             current_person = initialize_person_data(序号_val)
+            current_row = row_idx
         
-        # 读取当前行数据
-        if current_person is not None:
-            for col_idx, (category, field) in col_config.items():
-                if col_idx > ws.max_column:
-                    break
-                    
-                value = get_cell_value(ws, row_idx, col_idx, merged_map)
-                value = convert_value(value)
-                
-                if not value:
-                    continue
-                
-                # 映射到数据结构
-                if category == "序号":
-                    current_person["序号"] = value
-                elif category == "岗位信息":
-                    current_person["岗位信息"][field] = value
-                elif category == "基本信息":
-                    current_person["基本信息"][field] = value
-                elif category == "学历信息":
-                    # 先存储到临时位置，稍后统一解析
-                    if field == "毕业院校":
-                        current_person["_temp_毕业院校"] = value
-                    elif field == "专业":
-                        current_person["_temp_专业"] = value
-                elif category == "工作经历信息":
-                    current_person["工作经历信息"][field] = value
-                elif category == "资格证书":
-                    current_person["资格证书"][field] = value
-                elif category == "个人荣誉":
-                    current_person["个人荣誉"][field] = value
-                elif category == "绩效信息":
-                    current_person["绩效信息"][field] = value
-                elif category == "处分信息":
-                    current_person["处分信息"][field] = value
-            
-            # 处理完一行所有列后，解析学历信息
-            if current_person is not None:
-                毕业院校_text = current_person.get("_temp_毕业院校", "")
-                专业_text = current_person.get("_temp_专业", "")
-                if 毕业院校_text or 专业_text:
-                    current_person["学历信息"] = parse_education_info(毕业院校_text, 专业_text)
-                # 清理临时字段
-                current_person.pop("_temp_毕业院校", None)
-                current_person.pop("_temp_专业", None)
+        if current_person is None:
+            continue
+        
+        for position, handler in handlers:
+            value = row_values[position]
+            if value is None:
+                continue
+            value = convert_value(value)
+            if value:
+                handler(current_person, value)
+        
+        # 处理完一行所有列后，解析学历信息
+        毕业院校_text = current_person.get("_temp_毕业院校", "")
+        专业_text = current_person.get("_temp_专业", "")
+        if 毕业院校_text or 专业_text:
+            current_person["学历信息"] = parse_education_info(毕业院校_text, 专业_text)
+        # 清理临时字段
+        current_person.pop("_temp_毕业院校", None)
+        current_person.pop("_temp_专业", None)
     
     # 添加最后一个人
     if current_person is not None:
-        result.append(current_person)
+        yield (current_row, current_person) if with_rows else current_person
+
+
+def iter_single_row_persons(file_path, col_config=None, sheet_name=None, with_rows=False):
+    """
+    流式逐个解析单行表中的人员记录
+    
+    Args:
+        file_path: Excel 文件路径
+        col_config: 列映射，为None时使用 COL_CONFIG
+        sheet_name: 工作表名称，为None时解析活动工作表
+        with_rows: 是否同时返回人员记录的起始行号
+    
+    Yields:
+        人员记录字典；with_rows 为True时为 (起始行号, 人员记录字典)
+    """
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"文件未找到: {file_path}")
     
-    return result
+    with XlsxStreamReader(file_path, sheet_name) as reader:
+        merged_ranges = reader.merged_ranges()
+        handlers = compile_column_handlers(col_config or COL_CONFIG)
+        width = max((position for position, _ in handlers), default=-1) + 1
+        
+        # 合并区域超出最后一个数据行时，区域内的空行也要处理
+        last_merged_row = max((max_row for _, _, max_row, _ in merged_ranges), default=None)
+        rows = reader.iter_rows(max_row=last_merged_row)
+        yield from group_single_row_persons(fill_merged_rows(rows, merged_ranges, width, start_row=3),
+                                            handlers, with_rows)
+
+
+def parse_excel_to_single_row_json(file_path):
+    """
+    解析 Excel 文件为单行表 JSON 格式（XLSX 流式读取）
+    """
+    return list(iter_single_row_persons(file_path))
 
 def initialize_person_data(序号):
     """初始化一个人的数据结构 - 单行表格式"""
@@ -403,7 +411,7 @@ def main():
         print("=" * 80)
         print("🎯 准确率评估")
         print("=" * 80)
-        print("• 检测方法: openpyxl (直接读取 Excel XML 结构)")
+        print("• 检测方法: XLSX 流式读取 (zipfile 直接读取 Excel XML 结构)")
         print("• 合并单元格识别准确率: ≥ 99.9%")
         print("• 数据读取准确率: ≥ 99.9%")
         print("• 说明: 直接解析 Excel 文件的 XML 结构，读取 <mergeCells> 标签")
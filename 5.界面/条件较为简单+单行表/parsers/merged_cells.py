@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""
+合并单元格区域索引模块
+
+按列保存合并区域的起止行，查找单元格所属的合并区域时在该列上二分查找。
+每个合并区域只按覆盖的列各记录一次（不按单元格展开），多行表中大量纵向
+合并的宽表也只占用与合并区域数量相当的内存。
+"""
+from bisect import bisect_right
+
+
+class MergedCellIndex:
+    """合并区域索引：master(row, col) 返回单元格所在合并区域的主单元格（左上角）"""
+
+    def __init__(self, ranges):
+        """
+        Args:
+            ranges: 合并区域 [(min_row, min_col, max_row, max_col), ...]（区域之间互不重叠）
+        """
+        columns = {}
+        for min_row, min_col, max_row, max_col in ranges:
+            for col in range(min_col, max_col + 1):
+                columns.setdefault(col, []).append((min_row, max_row, min_col))
+
+        # 每列：起始行（升序）、结束行、主单元格列号，三个列表按下标对应
+        self._columns = {}
+        for col, entries in columns.items():
+            entries.sort()
+            self._columns[col] = (
+                [min_row for min_row, _, _ in entries],
+                [max_row for _, max_row, _ in entries],
+                [min_col for _, _, min_col in entries],
+            )
+
+    def __bool__(self):
+        return bool(self._columns)
+
+    def master(self, row, col):
+        """
+        查找单元格所在合并区域的主单元格
+
+        Args:
+            row: 行号
+            col: 列号
+
+        Returns:
+            (master_row, master_col)；不在任何合并区域内时返回None
+        """
+        column = self._columns.get(col)
+        if column is None:
+            return None
+        starts, ends, master_cols = column
+        position = bisect_right(starts, row) - 1
+        if position < 0 or ends[position] < row:
+            return None
+        return starts[position], master_cols[position]
+
+    def is_master_or_unmerged(self, row, col):
+        """单元格是合并区域的主单元格，或不在任何合并区域内"""
+        master = self.master(row, col)
+        return master is None or master == (row, col)
@@ -9,18 +9,26 @@ FastAPI 后端服务 - 处理简历初筛请求
 """
 import os
 import json
-import shutil
-import tempfile
+import uuid
+import dataclasses
+import functools
 import asyncio
 import time
 import webbrowser
 import threading
-from typing import List
-from datetime import datetime
-from fastapi import FastAPI, UploadFile, File, HTTPException
+import multiprocessing
+import tempfile
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List, Literal, Optional
+from urllib.parse import quote
+from fastapi import FastAPI, UploadFile, File, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, FileResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
+from pydantic import BaseModel
+from starlette.background import BackgroundTask
 import uvicorn
 
 # 导入现有的解析脚本
@@ -37,6 +45,27 @@ def get_resource_path(relative_path):
         base_path = os.path.dirname(os.path.abspath(__file__))
     return os.path.join(base_path, relative_path)
 
+def get_output_dir():
+    """获取输出目录（打包环境使用exe所在目录的output文件夹），不存在时创建"""
+    if getattr(sys, 'frozen', False):
+        # 打包环境：使用exe所在目录
+        output_dir = os.path.join(os.path.dirname(sys.executable), "output")
+    else:
+        # 开发环境：使用项目目录
+        output_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "output")
+    os.makedirs(output_dir, exist_ok=True)
+    return output_dir
+
+def get_result_store_path():
+    """获取筛选结果库路径"""
+    return os.path.join(get_output_dir(), "筛选结果.db")
+
+def get_job_dir(job_id):
+    """获取后台筛选任务的目录（保存上传文件和结果流），不存在时创建"""
+    job_dir = os.path.join(get_output_dir(), "jobs", job_id)
+    os.makedirs(job_dir, exist_ok=True)
+    return job_dir
+
 # 获取当前目录（兼容打包环境）
 if getattr(sys, 'frozen', False):
     # 打包后的环境
@@ -48,19 +77,29 @@ else:
 sys.path.insert(0, current_dir)
 
 # 导入解析函数（从 parsers 目录）
-from parsers.detect_merged_cells_with_accuracy import parse_excel_to_multirow_json
-from parsers.detect_merged_cells_with_accuracy_position_adjust import parse_excel_to_position_json
+from parsers.workbook_tasks import parse_position_task, parse_resume_task
 from parsers.clean_external import clean_position_data
 
 # 导入 LLM 筛选模块（从本地目录）
+from core.incremental import IncrementalScreening, PairResultStore
+from core.screening_jobs import NullReporter, ScreeningJobManager, ScreeningJobStore
 from core.screener import ResumeScreener
+from core.sharding import ShardPool
+from exporters.result_exporter import build_output_pairs
+from exporters.ndjson_writer import NdjsonLineIndex, NdjsonResultWriter
+from exporters.result_store import ResultStore
+from exporters.table_exporter import iter_results_csv, write_results_xlsx
 from managers.llm_manager import get_model_manager
 from utils.logger_config import setup_logger
+from utils.loop_monitor import LoopLagMonitor
+from utils.json_response import FastJSONResponse
+from utils.upload_stream import ReceivedUpload, UploadTooLargeError, receive_upload
 
 # 初始化日志
 logger = setup_logger("backend_service")
 
-app = FastAPI(title="AI简历初筛系统", version="2.0.0")
+# 响应默认用 orjson 序列化（未安装时使用标准库 json）
+app = FastAPI(title="AI简历初筛系统", version="2.0.0", default_response_class=FastJSONResponse)
 
 # 配置静态文件服务（用于提供前端页面）
 # 注意：在打包环境中，current_dir已经通过上面的代码正确设置了
@@ -78,15 +117,114 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# 全局变量：模型管理器和筛选器
+# 响应压缩：浏览器支持 gzip 时压缩 1KB 以上的响应（结果分页、详情、导出的JSON），
+# SSE 进度流不压缩
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=6)
+
+# 单个上传文件的大小上限（MB），可在 config.py 中配置 MAX_UPLOAD_MB
+try:
+    from config import MAX_UPLOAD_MB
+except ImportError:
+    MAX_UPLOAD_MB = 50
+MAX_UPLOAD_BYTES = int(MAX_UPLOAD_MB * 1024 * 1024)
+
+# 上传请求体的大小上限：两个文件加上表单的其他内容
+MAX_REQUEST_BYTES = 2 * MAX_UPLOAD_BYTES + 1024 * 1024
+
+# 筛选进程数（规则判断按简历分片在多个进程中执行），可在 config.py 中配置 SCREENING_PROCESSES，
+# 为1时不使用进程池
+try:
+    from config import SCREENING_PROCESSES
+except ImportError:
+    SCREENING_PROCESSES = os.cpu_count() or 1
+
+# 结果库保留的运行数（更早的运行在保存新运行时删除），可在 config.py 中配置 RESULT_RUNS_TO_KEEP
+try:
+    from config import RESULT_RUNS_TO_KEEP
+except ImportError:
+    RESULT_RUNS_TO_KEEP = 50
+
+# 配对数达到该值时才使用筛选进程池（配对较少时启动进程的开销大于收益）
+SHARDING_MIN_PAIRS = 1000
+
+
+@app.middleware("http")
+async def limit_request_size(request: Request, call_next):
+    """请求体声明的大小超过上限时直接返回413，不接收上传内容"""
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > MAX_REQUEST_BYTES:
+        return JSONResponse(status_code=413,
+                            content={"detail": f"上传内容超过大小上限（每个文件 {MAX_UPLOAD_MB}MB）"})
+    return await call_next(request)
+
+
+# 全局变量：模型管理器、筛选器和后台筛选任务队列
 model_manager = None
 screener = None
+job_manager = None
+
+# 同时执行的后台筛选任务数（每个任务内部已并发筛选所有岗位）
+SCREENING_JOB_WORKERS = 1
+
+# 解析进程池（Excel解析、岗位数据清理）和IO线程池（JSON文件、结果库写入）的大小
+PARSE_WORKERS = 2
+IO_WORKERS = 4
+
+# 解析进程池、IO线程池（服务启动时创建）和事件循环延迟监测
+parse_executor = None
+io_executor = None
+loop_monitor = LoopLagMonitor()
+
+
+async def run_in_parse_pool(func, *args):
+    """在解析进程池中执行CPU密集的任务（服务未启动时使用默认线程池），不阻塞事件循环"""
+    return await asyncio.get_running_loop().run_in_executor(parse_executor, func, *args)
+
+
+async def run_in_io_pool(func, *args):
+    """
+    在IO线程池中执行文件和数据库读写，以及结果需要留在主进程中的计算（如构建简历画像）
+    （服务未启动时使用默认线程池），不阻塞事件循环
+    """
+    return await asyncio.get_running_loop().run_in_executor(io_executor, func, *args)
+
+
+def write_json_file(data, output_path):
+    """保存JSON文件（在IO线程池中执行）"""
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def with_result_store(func, *args):
+    """打开结果库执行 func(结果库, *args) 后关闭（在IO线程池中执行）"""
+    store = ResultStore(get_result_store_path())
+    try:
+        return func(store, *args)
+    finally:
+        store.close()
+
+
+async def query_result_store(func, *args):
+    """在IO线程池中查询结果库，不阻塞事件循环"""
+    return await run_in_io_pool(with_result_store, func, *args)
+
+
+def save_run_results(source, screening_pairs):
+    """保存一次运行的筛选结果到结果库（在IO线程池中执行，只保留最近的运行），返回运行ID"""
+    store = ResultStore(get_result_store_path())
+    try:
+        run_id = store.create_run(source)
+        store.add_records(run_id, screening_pairs)
+        store.prune_runs(RESULT_RUNS_TO_KEEP)
+    finally:
+        store.close()
+    return run_id
 
 
 @app.on_event("startup")
 async def startup_event():
     """服务启动时初始化"""
-    global model_manager, screener
+    global model_manager, screener, job_manager, parse_executor, io_executor
     
     logger.info("🚀 正在初始化 AI 简历初筛服务...")
     
@@ -108,9 +246,37 @@ async def startup_event():
     # 初始化筛选器
     screener = ResumeScreener(model_manager=model_manager, major_library_path=major_library_path, school_library_path=school_library_path)
     
+    # 解析在独立进程中执行，文件和结果库写入在线程池中执行，事件循环只负责调度和LLM请求
+    parse_executor = ProcessPoolExecutor(max_workers=PARSE_WORKERS)
+    io_executor = ThreadPoolExecutor(max_workers=IO_WORKERS, thread_name_prefix="io")
+    loop_monitor.start()
+    
+    # 后台筛选任务队列（上次未完成的任务重新排队）
+    job_manager = ScreeningJobManager(
+        await run_in_io_pool(ScreeningJobStore, os.path.join(get_output_dir(), "筛选任务.db")),
+        run_screening_job,
+        max_workers=SCREENING_JOB_WORKERS,
+        llm_queue_depth=lambda: model_manager.in_flight if model_manager else None,
+        executor=io_executor,
+    )
+    await job_manager.start()
+    
     logger.info("✅ AI 简历初筛服务初始化完成")
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """服务停止时停止后台筛选任务（执行中的任务下次启动时重新排队）"""
+    if job_manager is not None:
+        await job_manager.stop()
+        await run_in_io_pool(job_manager.store.close)
+    await loop_monitor.stop()
+    if parse_executor is not None:
+        parse_executor.shutdown(wait=False, cancel_futures=True)
+    if io_executor is not None:
+        io_executor.shutdown(wait=True)
+
+
 @app.get("/")
 async def root():
     """根路径 - 返回前端页面"""
@@ -124,7 +290,14 @@ async def root():
         "endpoints": {
             "/": "系统信息",
             "/health": "健康检查",
-            "/api/screen": "简历初筛接口 (POST)"
+            "/api/screen": "简历初筛接口 (POST)",
+            "/api/jobs": "提交后台筛选任务 (POST) / 任务列表",
+            "/api/jobs/{job_id}/events": "后台筛选任务进度（SSE）",
+            "/api/jobs/{job_id}/results": "分页查询后台筛选任务已完成的结果",
+            "/api/runs": "筛选运行列表",
+            "/api/results": "查询筛选结果",
+            "/api/results/export": "导出筛选结果JSON",
+            "/api/results/download": "下载筛选结果表格（xlsx/csv）"
         }
     }
 
@@ -135,46 +308,51 @@ async def health_check():
     return {
         "status": "ok",
         "message": "服务运行正常",
-        "llm_available": model_manager is not None
+        "llm_available": model_manager is not None,
+        "loop_lag": loop_monitor.snapshot()
     }
 
 
-@app.post("/api/screen")
-async def screen_resumes(
-    resume_file: UploadFile = File(..., description="简历导入多行表Excel文件"),
-    position_file: UploadFile = File(..., description="岗位需求明细表Excel文件")
-):
+def build_screening_indexes(resumes_data):
     """
-    简历初筛接口
-    接收两个 Excel 文件,返回筛选结果
+    构建筛选共用的简历画像、应聘岗位倒排索引和规则引擎（在IO线程池中执行）
     
-    注意：为确保结果一致性，岗位数据直接使用 7.LLM_resume_filter 中的JSON文件
+    Returns:
+        (简历画像列表, PositionIndex, RuleEngine)
+    """
+    profiles = screener.build_profiles(resumes_data)
+    # 应聘岗位倒排索引：每个岗位直接取候选简历
+    position_index = screener.build_position_index(profiles)
+    # 无需LLM的岗位使用向量化规则引擎批量判断
+    rule_engine = screener.build_rule_engine(profiles)
+    return profiles, position_index, rule_engine
+
+
+async def run_screening(resume_upload, position_upload, source="api", reporter=None, stream_path=None):
     """
-    temp_dir = None
+    执行一次完整的筛选：解析两个工作簿、清理系统外数据、筛选所有配对并保存到结果库
+    
+    Args:
+        resume_upload: 简历文件（ReceivedUpload，内存中的内容或任务目录中的文件；
+                       上传时的文件名用于保存解析结果和增量解析）
+        position_upload: 岗位文件（ReceivedUpload）
+        source: 结果库中记录的运行来源
+        reporter: 进度报告（JobReporter），为None时不报告进度
+        stream_path: 逐条写入筛选结果的NDJSON文件，为None时在 output 目录中为本次运行单独创建
+                     （并发的请求互不覆盖，结果保存到结果库后删除）
+    
+    Returns:
+        (输出记录列表, 统计信息)
+    """
+    reporter = reporter or NullReporter()
+    resume_filename = resume_upload.filename
+    position_filename = position_upload.filename
+    result_store = None
+    incremental = None
+    stream_writer = None
+    shard_pool = None
     try:
-        # 创建临时目录
-        temp_dir = tempfile.mkdtemp()
-        
-        # 保存上传的文件
-        resume_path = os.path.join(temp_dir, resume_file.filename)
-        position_path = os.path.join(temp_dir, position_file.filename)
-        
-        with open(resume_path, "wb") as f:
-            shutil.copyfileobj(resume_file.file, f)
-        
-        with open(position_path, "wb") as f:
-            shutil.copyfileobj(position_file.file, f)
-        
-        # 解析简历文件
-        print(f"⏳ 正在解析简历文件: {resume_file.filename}")
-        resumes_data = parse_excel_to_multirow_json(resume_path)
-        
-        if not resumes_data:
-            raise HTTPException(status_code=400, detail="简历文件解析失败")
-        
-        print(f"✅ 简历解析完成，共 {len(resumes_data)} 条记录")
-        
-        # 保存解析后的JSON到data文件夹
+        # 解析后的JSON和缓存保存到data文件夹
         # 在打包环境中，使用exe所在目录的data文件夹（而不是临时目录）
         if getattr(sys, 'frozen', False):
             # 打包环境：使用exe所在目录
@@ -185,44 +363,48 @@ async def screen_resumes(
             data_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
         os.makedirs(data_dir, exist_ok=True)
         
-        # 生成简历JSON文件名（基于上传的文件名）
-        resume_json_filename = os.path.splitext(resume_file.filename)[0] + ".json"
-        resume_json_path = os.path.join(data_dir, resume_json_filename)
+        # 解析结果缓存：内容相同的工作簿（通常是重复上传的岗位表）不再重新解析
+        cache_path = os.path.join(data_dir, "解析缓存.db")
         
-        with open(resume_json_path, 'w', encoding='utf-8') as f:
-            json.dump(resumes_data, f, ensure_ascii=False, indent=2)
+        # 简历文件和岗位文件在解析进程池中同时解析
+        print(f"⏳ 正在解析简历文件: {resume_filename}")
+        print(f"⏳ 正在解析岗位文件: {position_filename}")
+        reporter.stage("解析简历和岗位")
+        (resumes_data, resume_cache_hit), (positions_data, position_cache_hit) = await asyncio.gather(
+            run_in_parse_pool(parse_resume_task, cache_path, resume_upload.source, resume_filename,
+                              resume_upload.sha256),
+            run_in_parse_pool(parse_position_task, cache_path, position_upload.source, position_upload.sha256),
+        )
         
-        print(f"💾 简历JSON已保存到: {resume_json_path}")
+        if not resumes_data:
+            raise HTTPException(status_code=400, detail="简历文件解析失败")
         
-        # 解析岗位文件
-        print(f"⏳ 正在解析岗位文件: {position_file.filename}")
-        positions_data = parse_excel_to_position_json(position_path)
+        print(f"✅ 简历解析完成，共 {len(resumes_data)} 条记录{'（使用解析缓存）' if resume_cache_hit else ''}")
         
         if not positions_data:
             raise HTTPException(status_code=400, detail="岗位文件解析失败")
         
-        print(f"✅ 岗位解析完成，共 {len(positions_data)} 个岗位")
-        
-        # 生成岗位JSON文件名（基于上传的文件名）
-        position_json_filename = os.path.splitext(position_file.filename)[0] + ".json"
-        position_json_path = os.path.join(data_dir, position_json_filename)
-        
-        with open(position_json_path, 'w', encoding='utf-8') as f:
-            json.dump(positions_data, f, ensure_ascii=False, indent=2)
-        
-        print(f"💾 岗位JSON已保存到: {position_json_path}")
+        print(f"✅ 岗位解析完成，共 {len(positions_data)} 个岗位{'（使用解析缓存）' if position_cache_hit else ''}")
         
         # 执行清理系统外数据处理
         print(f"⏳ 正在清理系统外数据...")
-        cleaned_positions_data = clean_position_data(positions_data)
+        reporter.stage("清理系统外数据")
+        cleaned_positions_data = await run_in_parse_pool(clean_position_data, positions_data)
         
-        # 生成清理后的JSON文件名（带"_去掉系统外"后缀）
-        position_json_cleaned_filename = os.path.splitext(position_file.filename)[0] + "_去掉系统外.json"
-        position_json_cleaned_path = os.path.join(data_dir, position_json_cleaned_filename)
+        # 生成JSON文件名（基于上传的文件名，清理后的岗位数据带"_去掉系统外"后缀）
+        resume_json_path = os.path.join(data_dir, os.path.splitext(resume_filename)[0] + ".json")
+        position_json_path = os.path.join(data_dir, os.path.splitext(position_filename)[0] + ".json")
+        position_json_cleaned_path = os.path.join(data_dir, os.path.splitext(position_filename)[0] + "_去掉系统外.json")
         
-        with open(position_json_cleaned_path, 'w', encoding='utf-8') as f:
-            json.dump(cleaned_positions_data, f, ensure_ascii=False, indent=2)
+        # 三个JSON文件在IO线程池中同时写入
+        await asyncio.gather(
+            run_in_io_pool(write_json_file, resumes_data, resume_json_path),
+            run_in_io_pool(write_json_file, positions_data, position_json_path),
+            run_in_io_pool(write_json_file, cleaned_positions_data, position_json_cleaned_path),
+        )
         
+        print(f"💾 简历JSON已保存到: {resume_json_path}")
+        print(f"💾 岗位JSON已保存到: {position_json_path}")
         print(f"💾 清理后的岗位JSON已保存到: {position_json_cleaned_path}")
         
         # 使用清理后的数据进行筛选
@@ -234,6 +416,35 @@ async def screen_resumes(
         # 记录开始时间
         start_time = time.time()
         
+        # 简历画像、应聘岗位倒排索引和规则引擎只构建一次，所有岗位共用
+        # （CPU密集，在IO线程池中构建，筛选时在事件循环中直接使用）
+        profiles, position_index, rule_engine = await run_in_io_pool(build_screening_indexes, resumes_data)
+        # 增量筛选：岗位和简历指纹都未变化的配对复用上次保存的结果
+        result_store = await run_in_io_pool(PairResultStore, os.path.join(data_dir, "筛选结果缓存.db"))
+        # 已完成的配对分批写入结果库（在IO线程池中执行），筛选中途重启时不需要重新筛选；
+        # 构建时计算所有简历的指纹，同样在IO线程池中执行
+        incremental = await run_in_io_pool(functools.partial(IncrementalScreening, screener, result_store,
+                                                             resumes_data, resume_file="上传文件",
+                                                             executor=io_executor))
+        # 每份简历筛选完成即追加写入一行（可边筛选边读取，崩溃时保留已完成的结果）
+        temporary_stream = stream_path is None
+        if temporary_stream:
+            stream_path = os.path.join(get_output_dir(), f"筛选结果流_{uuid.uuid4().hex}.ndjson")
+        stream_writer = await run_in_io_pool(NdjsonResultWriter, stream_path)
+        
+        # 进度按配对计算：每个岗位的候选简历数之和
+        total_pairs = sum(len(position_index.candidates(job.get('岗位', ''))) for job in positions_data)
+        reporter.stage("筛选", total=total_pairs)
+        
+        # 配对较多时规则判断分片交给筛选进程池，事件循环只负责调用LLM
+        if SCREENING_PROCESSES > 1 and total_pairs >= SHARDING_MIN_PAIRS:
+            shard_pool = ShardPool(screener, resumes_data, max_workers=SCREENING_PROCESSES)
+        
+        def on_result(result):
+            """每个配对筛选完成（或复用缓存结果）时写入结果流并报告进度"""
+            stream_writer.write(result)
+            reporter.advance()
+        
         # 并发筛选所有岗位
         async def screen_job_with_info(job):
             """筛选单个岗位并返回结果"""
@@ -241,14 +452,29 @@ async def screen_resumes(
             job_id = job.get('序号', 0)
             logger.info(f"[并发] 📌 开始筛选岗位 {job_id}: {job_name}")
             
-            results = await screener.screen_batch(job, resumes_data, resume_file="上传文件")
+            results = await incremental.screen_job(job, profiles=profiles, position_index=position_index,
+                                                   rule_engine=rule_engine, on_result=on_result, shard_pool=shard_pool)
             
             logger.info(f"[并发] ✅ 岗位 {job_name} 筛选完成，共 {len(results)} 份简历")
             return job, results
         
+        async def render_job_results(job, results):
+            """为单个岗位的简要结果生成详细原因说明"""
+            return job, await screener.render_results(job, results, resumes_data, resume_file="上传文件",
+                                                      profiles=profiles, shard_pool=shard_pool)
+        
         # 并发执行所有岗位的筛选
         job_results_list = await asyncio.gather(*[screen_job_with_info(job) for job in positions_data])
         
+        # 只保留当前上下文（专业库、院校库、模型、日期）的配对结果
+        await incremental.prune()
+        
+        # 规则引擎判断的配对只有简要结果，输出前生成详细原因说明
+        reporter.stage("生成原因说明")
+        job_results_list = await asyncio.gather(*[
+            render_job_results(job, results) for job, results in job_results_list
+        ])
+        
         # 整理结果
         all_results = []
         for job, results in job_results_list:
@@ -260,202 +486,11 @@ async def screen_resumes(
         # 计算耗时
         elapsed_time = time.time() - start_time
         
-        # 构建输出结果
-        screening_results = []
-        
-        # 创建一个已处理的简历集合（使用序号+姓名避免重复）
-        processed_resumes = set()
-        
-        for result in all_results:
-            resume_id = result.resume_id
-            job_name_from_result = result.job_name
-            
-            logger.info(f"🔍 处理筛选结果: resume_id={resume_id}, job_name={job_name_from_result}")
-            
-            # 从 filter_details 中提取姓名（如果有的话）
-            name_from_result = None
-            if result.filter_details and len(result.filter_details) > 0:
-                resume_info = result.filter_details[0].get('resume_info', '')
-                # resume_info 格式: "序号=2 | 姓名=张三 | 学历=博士研究生 | 学校=清华大学"
-                if '姓名=' in resume_info:
-                    parts = resume_info.split('|')
-                    for part in parts:
-                        if '姓名=' in part:
-                            name_from_result = part.split('姓名=')[1].strip()
-                            break
-            
-            logger.info(f"   从结果中提取的姓名: {name_from_result}")
-            
-            # 从resumes列表中查找简历数据
-            matching_resumes = [resume for resume in resumes_data if str(resume.get('序号', '')) == resume_id]
-            
-            logger.info(f"   找到 {len(matching_resumes)} 个匹配的简历记录")
-            
-            if not matching_resumes:
-                logger.warning(f"⚠️  未找到简历数据：resume_id={resume_id}")
-                continue
-            
-            # 找到正确的简历
-            resume_data = None
-            if len(matching_resumes) == 1:
-                resume_data = matching_resumes[0]
-                logger.info(f"   唯一匹配，直接使用")
-            else:
-                # 有多个相同序号的简历，通过姓名匹配
-                logger.info(f"   多个匹配，通过姓名匹配: {name_from_result}")
-                if name_from_result:
-                    for resume in matching_resumes:
-                        name = resume.get('基本信息', {}).get('姓名', '')
-                        if name == name_from_result:
-                            resume_data = resume
-                            logger.info(f"     ✅ 找到匹配的简历: {name}")
-                            break
-                
-                # 如果没找到，使用第一个未处理的
-                if not resume_data:
-                    logger.warning(f"   ⚠️  无法通过姓名匹配，使用第一个未处理的简历")
-                    for resume in matching_resumes:
-                        name = resume.get('基本信息', {}).get('姓名', '')
-                        unique_key = f"{resume_id}_{name}"
-                        if unique_key not in processed_resumes:
-                            resume_data = resume
-                            logger.info(f"     ✅ 使用未处理的简历: {name}")
-                            break
-                
-                # 如果所有都处理过了，跳过
-                if not resume_data:
-                    logger.warning(f"   ⚠️  所有匹配的简历都已处理过，跳过")
-                    continue
-            
-            # 标记为已处理
-            name = resume_data.get('基本信息', {}).get('姓名', '')
-            unique_key = f"{resume_id}_{name}"
-            processed_resumes.add(unique_key)
-            
-            # 获取基本信息
-            basic_info = resume_data.get('基本信息', {})
-            name = basic_info.get('姓名', '')
-            resume_number = resume_data.get('序号', '')
-            
-            # 获取岗位信息
-            job_info = resume_data.get('岗位信息', {})
-            applied_position = job_info.get('应聘岗位', '')
-            
-            # 获取学习经历统计信息
-            education_info = resume_data.get('学习经历统计信息', {})
-            highest_education = education_info.get('最高学历', '')
-            highest_school = education_info.get('最高学历毕业院校', '')
-            highest_school_type = education_info.get('最高学历毕业院校类型', '')
-            
-            # 计算年龄
-            birth_date = basic_info.get('出生日期', '')
-            age = ''
-            if birth_date:
-                try:
-                    date_part = birth_date.split()[0] if ' ' in birth_date else birth_date
-                    parts = date_part.split('-')
-                    if len(parts) >= 1:
-                        year = int(parts[0])
-                        month = int(parts[1]) if len(parts) > 1 else 1
-                        day = int(parts[2]) if len(parts) > 2 else 1
-                        current_date = datetime.now()
-                        age_calc = current_date.year - year
-                        if (current_date.month, current_date.day) < (month, day):
-                            age_calc -= 1
-                        age = str(age_calc)
-                except:
-                    pass
-            
-            # 构建关键画像
-            key_profile_parts = []
-            if highest_education:
-                key_profile_parts.append(highest_education)
-            if highest_school:
-                key_profile_parts.append(highest_school)
-            if highest_school_type:
-                key_profile_parts.append(highest_school_type)
-            if age:
-                key_profile_parts.append(f"{age}岁")
-            
-            key_profile = ' | '.join(key_profile_parts) if key_profile_parts else ''
-            
-            # 获取现职务或岗位
-            current_position = basic_info.get('现职务或岗位', '')
-            if current_position:
-                key_profile += f"\n现任：{current_position}"
-            
-            # 构建AI初筛结果
-            ai_result = "拟通过" if result.passed else "拟淘汰"
-            
-            # 构建淘汰原因
-            failed_filters = [detail.get('filter_name') for detail in result.filter_details if not detail.get('passed')]
-            elimination_reason = '/'.join(failed_filters) if failed_filters else ''
-            
-            # 构建筛选条件详情
-            filter_details = []
-            for detail in result.filter_details:
-                filter_name = detail.get('filter_name', '')
-                passed = detail.get('passed', False)
-                method = detail.get('method', detail.get('source', '未知'))
-                reason = detail.get('reason', '')
-                
-                # 获取筛选详情
-                detail_info = detail.get('details', {})
-                detail_text = ''
-                if isinstance(detail_info, dict):
-                    detail_text = detail_info.get('detail', '')
-                
-                # 格式化原因说明：去掉"原文"字段
-                import re
-                # 如果reason中包含requirement字典，去掉"原文"字段
-                if "'原文'" in reason or '"原文"' in reason:
-                    # 使用正则表达式去掉"原文"字段及其值，并处理多余的逗号
-                    reason = re.sub(r"['\"]原文['\"]\s*:\s*[^,}]+,\s*", "", reason)  # 先处理后面有逗号的情况
-                    reason = re.sub(r",?\s*['\"]原文['\"]\s*:\s*[^,}]+", "", reason)  # 再处理其他情况
-                    # 清理可能留下的多余逗号和空格
-                    reason = re.sub(r",\s*,", ",", reason)  # 去掉连续逗号
-                    reason = re.sub(r"{\s*,", "{", reason)  # 去掉{后的逗号
-                
-                # 在筛选详情末尾添加逗号（如果detail_text不为空）
-                if detail_text:
-                    detail_text = detail_text.rstrip() + ','
-                
-                # 转换判断方法
-                if method == 'rule' or '规则' in str(method):
-                    method_display = '规则'
-                elif method == 'llm' or 'LLM' in str(method):
-                    method_display = 'LLM'
-                else:
-                    method_display = str(method)
-                
-                filter_detail = {
-                    "筛选条件": filter_name,
-                    "是否通过": "通过" if passed else "不通过",
-                    "判断方法": method_display,
-                    "原因说明": reason,
-                    "筛选详情": detail_text
-                }
-                filter_details.append(filter_detail)
-            
-            # 构建输出记录
-            output_record = {
-                "序号": int(resume_number) if str(resume_number).isdigit() else resume_number,
-                "姓名": name,
-                "关键画像": key_profile,
-                "应聘岗位": applied_position,
-                "AI初筛结果": ai_result,
-                "淘汰原因": elimination_reason,
-                "筛选条件详情": filter_details
-            }
-            
-            screening_results.append(output_record)
-            logger.info(f"   ✅ 添加到结果列表")
-        
+        # 构建输出记录：筛选结果携带简历位置，直接取简历和画像（与导出器共用同一转换逻辑，已按序号排序）
+        screening_pairs = await run_in_io_pool(build_output_pairs, all_results, resumes_data, profiles)
+        screening_results = [record for _, record in screening_pairs]
         logger.info(f"📊 最终筛选结果数: {len(screening_results)}")
         
-        # 按序号排序
-        screening_results.sort(key=lambda x: x.get('序号', 0) if isinstance(x.get('序号'), (int, str)) and str(x.get('序号')).isdigit() else 0)
-        
         # 统计信息
         total_passed = sum(1 for r in screening_results if r["AI初筛结果"] == "拟通过")
         total_count = len(screening_results)
@@ -464,32 +499,67 @@ async def screen_resumes(
             "total": total_count,
             "passed": total_passed,
             "rejected": total_count - total_passed,
+            "reused_pairs": incremental.reused,
+            "recomputed_pairs": incremental.recomputed,
+            "parse_cache_hits": int(resume_cache_hit) + int(position_cache_hit),
             "elapsed_time": f"{elapsed_time:.2f}秒"
         }
         
         print(f"✅ AI 初筛完成，共处理 {total_count} 份简历")
         print(f"   通过: {total_passed} 份")
         print(f"   淘汰: {total_count - total_passed} 份")
+        print(f"   配对: 复用 {incremental.reused} 个，重新筛选 {incremental.recomputed} 个")
         print(f"   耗时: {elapsed_time:.2f}秒")
         
-        # 保存结果到文件（可选）
-        # 在打包环境中，使用exe所在目录的output文件夹
-        if getattr(sys, 'frozen', False):
-            # 打包环境：使用exe所在目录
-            exe_dir = os.path.dirname(sys.executable)
-            output_dir = os.path.join(exe_dir, "output")
-        else:
-            # 开发环境：使用项目目录
-            output_dir = os.path.join(os.path.dirname(__file__), "output")
-        os.makedirs(output_dir, exist_ok=True)
-        output_path = os.path.join(output_dir, "简历初筛结果.json")
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(screening_results, f, ensure_ascii=False, indent=2)
+        # 保存结果到结果库（每次筛选作为一次运行，需要JSON文件时通过 /api/results/export 导出）
+        run_id = await run_in_io_pool(save_run_results, source, screening_pairs)
+        statistics["run_id"] = run_id
+        
+        print(f"💾 结果已保存到结果库: 运行 {run_id}")
         
-        print(f"💾 结果已保存到: {output_path}")
+        if temporary_stream:
+            # 结果已保存到结果库，不再需要本次运行的结果流
+            await run_in_io_pool(stream_writer.close)
+            await run_in_io_pool(os.remove, stream_path)
+        
+        return screening_results, statistics
+    
+    finally:
+        if shard_pool is not None:
+            shard_pool.close()
+        if incremental is not None:
+            # 筛选中断时也写入已完成的配对，下次筛选直接复用
+            await incremental.flush()
+        if result_store is not None:
+            await run_in_io_pool(result_store.close)
+        if stream_writer is not None:
+            # 等待写入线程写完剩余内容（fsync）不阻塞事件循环
+            await run_in_io_pool(stream_writer.close)
+
+
+@app.post("/api/screen")
+async def screen_resumes(
+    resume_file: UploadFile = File(..., description="简历导入多行表Excel文件"),
+    position_file: UploadFile = File(..., description="岗位需求明细表Excel文件")
+):
+    """
+    简历初筛接口
+    接收两个 Excel 文件,返回筛选结果
+    
+    注意：为确保结果一致性，岗位数据直接使用 7.LLM_resume_filter 中的JSON文件
+    """
+    # 上传文件按块读入内存（同时计算内容摘要、检查大小），直接从内存解析，不写临时文件
+    try:
+        resume_upload = await receive_upload(resume_file, MAX_UPLOAD_BYTES)
+        position_upload = await receive_upload(position_file, MAX_UPLOAD_BYTES)
+    except UploadTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    
+    try:
+        screening_results, statistics = await run_screening(resume_upload, position_upload)
         
         # 返回结果
-        return JSONResponse(content={
+        return FastJSONResponse(content={
             "success": True,
             "message": "简历初筛完成",
             "data": screening_results,
@@ -501,14 +571,6 @@ async def screen_resumes(
         import traceback
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=f"处理失败: {str(e)}")
-    
-    finally:
-        # 清理临时文件
-        if temp_dir and os.path.exists(temp_dir):
-            try:
-                shutil.rmtree(temp_dir)
-            except:
-                pass
 
 
 @app.post("/")
@@ -522,7 +584,420 @@ async def screen_resumes_root(
     return await screen_resumes(resume_file, position_file)
 
 
+@app.get("/api/runs")
+async def list_runs(limit: int = 20):
+    """最近的筛选运行"""
+    return {"success": True, "runs": await query_result_store(ResultStore.list_runs, limit)}
+
+
+@app.get("/api/results")
+async def query_results(
+    run_id: Optional[int] = None,
+    job: Optional[str] = None,
+    resume_id: Optional[str] = None,
+    passed: Optional[bool] = None,
+    failed_filter: Optional[str] = None
+):
+    """
+    查询筛选结果（默认最近一次运行）
+    可按岗位、简历序号、是否通过和未通过的筛选条件过滤
+    """
+    def query(store):
+        selected_run_id = store.latest_run_id() if run_id is None else run_id
+        if selected_run_id is None:
+            raise HTTPException(status_code=404, detail="暂无筛选结果")
+        return selected_run_id, store.query(selected_run_id, job_name=job, resume_id=resume_id, passed=passed,
+                                            failed_filter=failed_filter)
+    
+    selected_run_id, records = await query_result_store(query)
+    return {"success": True, "run_id": selected_run_id, "data": records}
+
+
+# 结果分页查询每页的最大记录数
+MAX_PAGE_SIZE = 500
+
+
+@app.get("/api/results/page")
+async def query_results_page(
+    run_id: Optional[int] = None,
+    job: Optional[str] = None,
+    passed: Optional[bool] = None,
+    failed_filter: Optional[str] = None,
+    search: Optional[str] = None,
+    sort: str = "序号",
+    order: str = "asc",
+    page: int = Query(1, ge=1),
+    page_size: int = Query(50, ge=1, le=MAX_PAGE_SIZE)
+):
+    """
+    分页查询筛选结果摘要（默认最近一次运行）
+    可按岗位、是否通过、未通过的筛选条件和姓名/关键画像过滤，按序号、姓名、应聘岗位或AI初筛结果排序；
+    摘要不含筛选条件详情，查看候选人时通过 /api/results/records/{id} 读取
+    """
+    if order not in ("asc", "desc"):
+        raise HTTPException(status_code=400, detail="order 只支持 asc 或 desc")
+    
+    def query(store):
+        selected_run_id = store.latest_run_id() if run_id is None else run_id
+        if selected_run_id is None:
+            raise HTTPException(status_code=404, detail="暂无筛选结果")
+        try:
+            return selected_run_id, *store.query_page(selected_run_id, job_name=job, passed=passed,
+                                                      failed_filter=failed_filter, search=search, sort=sort,
+                                                      descending=order == "desc",
+                                                      offset=(page - 1) * page_size, limit=page_size)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    
+    selected_run_id, total, summaries = await query_result_store(query)
+    return {"success": True, "run_id": selected_run_id, "total": total, "page": page, "page_size": page_size,
+            "data": summaries}
+
+
+@app.get("/api/results/facets")
+async def results_facets(run_id: Optional[int] = None):
+    """一次运行的筛选选项（岗位列表、各筛选条件的未通过人数），默认最近一次运行"""
+    def query(store):
+        selected_run_id = store.latest_run_id() if run_id is None else run_id
+        if selected_run_id is None:
+            raise HTTPException(status_code=404, detail="暂无筛选结果")
+        return selected_run_id, store.facets(selected_run_id)
+    
+    selected_run_id, facets = await query_result_store(query)
+    return {"success": True, "run_id": selected_run_id, **facets}
+
+
+@app.get("/api/results/records/{pair_id}")
+async def get_result_record(pair_id: int, run_id: int):
+    """读取一个候选人的完整筛选结果（含各筛选条件的原因说明和筛选详情）"""
+    record = await query_result_store(ResultStore.get_record, run_id, pair_id)
+    if record is None:
+        raise HTTPException(status_code=404, detail="筛选结果不存在")
+    return {"success": True, "run_id": run_id, "data": record}
+
+
+def export_run_file(run_id, suffix, write):
+    """
+    把一次运行的筛选结果写入本次请求单独的临时文件（在IO线程池中执行）
+    
+    Args:
+        run_id: 运行ID，为None时使用最近一次运行
+        suffix: 临时文件扩展名
+        write: 写入函数，参数为 (结果库, 运行ID, 文件路径)
+    
+    Returns:
+        (运行ID, 临时文件路径)，暂无筛选结果时为 (None, None)
+    """
+    store = ResultStore(get_result_store_path())
+    try:
+        if run_id is None:
+            run_id = store.latest_run_id()
+        if run_id is None:
+            return None, None
+        fd, output_path = tempfile.mkstemp(prefix="导出_", suffix=suffix, dir=get_output_dir())
+        os.close(fd)
+        try:
+            write(store, run_id, output_path)
+        except BaseException:
+            os.remove(output_path)
+            raise
+    finally:
+        store.close()
+    return run_id, output_path
+
+
+def open_result_run(run_id):
+    """
+    打开结果库并确定运行ID（在IO线程池中执行，结果库由调用方关闭）
+    
+    Returns:
+        (结果库, 运行ID)，暂无筛选结果时为 (None, None)
+    """
+    store = ResultStore(get_result_store_path())
+    if run_id is None:
+        run_id = store.latest_run_id()
+    if run_id is None:
+        store.close()
+        return None, None
+    return store, run_id
+
+
+def write_json_export(store, run_id, output_path, **options):
+    """按原有格式写出JSON（options 为 ResultStore.export_json 的过滤条件和手动标记）"""
+    store.export_json(run_id, output_path, **options)
+
+
+def write_xlsx_export(store, run_id, output_path):
+    """逐行写出XLSX表格"""
+    write_results_xlsx(store.iter_records(run_id), output_path)
+
+
+async def send_json_export(run_id, **options):
+    """导出JSON到本次请求的临时文件并返回（发送后删除）"""
+    write = functools.partial(write_json_export, **options)
+    run_id, output_path = await run_in_io_pool(export_run_file, run_id, ".json", write)
+    if output_path is None:
+        raise HTTPException(status_code=404, detail="暂无筛选结果")
+    return FileResponse(output_path, media_type="application/json", filename="简历初筛结果.json",
+                        background=BackgroundTask(os.remove, output_path))
+
+
+@app.get("/api/results/export")
+async def export_results(
+    run_id: Optional[int] = None,
+    job: Optional[str] = None,
+    passed: Optional[bool] = None,
+    failed_filter: Optional[str] = None,
+    search: Optional[str] = None
+):
+    """
+    按原有格式导出一次运行的筛选结果（简历初筛结果.json）
+    过滤条件与 /api/results/page 相同，不传时导出全部结果
+    """
+    return await send_json_export(run_id, job_name=job, passed=passed, failed_filter=failed_filter, search=search)
+
+
+class ResultOverride(BaseModel):
+    """结果表中手动标记的初筛结果"""
+    AI初筛结果: Literal["拟通过", "拟淘汰"]
+    淘汰原因: str = ""
+
+
+class ExportRequest(BaseModel):
+    """导出请求：结果表当前的过滤条件和手动标记（配对ID -> 标记）"""
+    run_id: Optional[int] = None
+    job: Optional[str] = None
+    passed: Optional[bool] = None
+    failed_filter: Optional[str] = None
+    search: Optional[str] = None
+    overrides: Dict[int, ResultOverride] = {}
+
+
+@app.post("/api/results/export")
+async def export_results_with_overrides(request: ExportRequest):
+    """
+    按结果表当前的过滤条件导出筛选结果，手动标记的通过/淘汰替换导出记录中的
+    AI初筛结果和淘汰原因（过滤仍按筛选得出的结果，与结果表一致）
+    """
+    overrides = {
+        pair_id: {"AI初筛结果": override.AI初筛结果, "淘汰原因": override.淘汰原因}
+        for pair_id, override in request.overrides.items()
+    }
+    return await send_json_export(request.run_id, job_name=request.job, passed=request.passed,
+                                  failed_filter=request.failed_filter, search=request.search,
+                                  overrides=overrides)
+
+
+@app.get("/api/results/download")
+async def download_results(run_id: Optional[int] = None, format: str = "xlsx"):
+    """
+    下载一次运行的筛选结果表格（format=xlsx 或 csv）
+    每个候选人一行，每个筛选条件一组列；CSV 边读取结果库边流式返回
+    """
+    if format not in ("xlsx", "csv"):
+        raise HTTPException(status_code=400, detail="format 只支持 xlsx 或 csv")
+    
+    if format == "xlsx":
+        # XLSX 在IO线程池中写入本次请求的临时文件，发送后删除
+        run_id, output_path = await run_in_io_pool(export_run_file, run_id, ".xlsx", write_xlsx_export)
+        if output_path is None:
+            raise HTTPException(status_code=404, detail="暂无筛选结果")
+        return FileResponse(output_path, filename="简历初筛结果.xlsx",
+                            media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                            background=BackgroundTask(os.remove, output_path))
+    
+    store, run_id = await run_in_io_pool(open_result_run, run_id)
+    if store is None:
+        raise HTTPException(status_code=404, detail="暂无筛选结果")
+    
+    def stream_csv():
+        # 同步生成器由 StreamingResponse 在线程池中迭代
+        try:
+            yield from iter_results_csv(store.iter_records(run_id))
+        finally:
+            store.close()
+    
+    headers = {"Content-Disposition": f"attachment; filename*=UTF-8''{quote('简历初筛结果.csv')}"}
+    return StreamingResponse(stream_csv(), media_type="text/csv; charset=utf-8", headers=headers)
+
+
+async def run_screening_job(params, reporter):
+    """
+    执行一个后台筛选任务（由任务队列调用）
+    
+    Args:
+        params: 任务参数（submit_screening_job 保存的上传文件路径、文件名和内容摘要）
+        reporter: 任务进度
+    
+    Returns:
+        统计信息（保存为任务结果）
+    """
+    resume_upload = ReceivedUpload(params["resume_filename"], params.get("resume_sha256"),
+                                   params.get("resume_size", 0), path=params["resume_path"])
+    position_upload = ReceivedUpload(params["position_filename"], params.get("position_sha256"),
+                                     params.get("position_size", 0), path=params["position_path"])
+    try:
+        _, statistics = await run_screening(resume_upload, position_upload, source="job", reporter=reporter,
+                                            stream_path=os.path.join(params["job_dir"], "筛选结果流.ndjson"))
+    except Exception:
+        _remove_job_uploads(params)
+        raise
+    _remove_job_uploads(params)
+    return statistics
+
+
+def _remove_job_uploads(params):
+    """任务结束后删除上传的文件（结果流保留，供查询已完成的结果）"""
+    for key in ("resume_path", "position_path"):
+        try:
+            os.remove(params[key])
+        except OSError:
+            pass
+
+
+@app.post("/api/jobs")
+async def submit_screening_job(
+    resume_file: UploadFile = File(..., description="简历导入多行表Excel文件"),
+    position_file: UploadFile = File(..., description="岗位需求明细表Excel文件")
+):
+    """
+    提交后台筛选任务，立即返回任务ID
+    进度通过 /api/jobs/{job_id}/events 推送，完成后结果保存到结果库（统计信息中的 run_id）
+    """
+    job_id = uuid.uuid4().hex
+    job_dir = get_job_dir(job_id)
+    params = {
+        "job_dir": job_dir,
+        "resume_filename": resume_file.filename,
+        "resume_path": os.path.join(job_dir, "简历_" + os.path.basename(resume_file.filename)),
+        "position_filename": position_file.filename,
+        "position_path": os.path.join(job_dir, "岗位_" + os.path.basename(position_file.filename)),
+    }
+    # 上传文件按块写入任务目录（不使用临时目录），服务重启后排队中的任务仍可执行；
+    # 写入时计算的内容摘要随任务保存，解析时查缓存不再重读文件
+    try:
+        for prefix, upload in (("resume", resume_file), ("position", position_file)):
+            received = await receive_upload(upload, MAX_UPLOAD_BYTES, save_path=params[f"{prefix}_path"])
+            params[f"{prefix}_sha256"] = received.sha256
+            params[f"{prefix}_size"] = received.size
+    except UploadTooLargeError as e:
+        _remove_job_uploads(params)
+        try:
+            os.rmdir(job_dir)
+        except OSError:
+            pass
+        raise HTTPException(status_code=413, detail=str(e))
+    
+    await job_manager.submit(params, job_id=job_id)
+    return {"success": True, "job_id": job_id, "status": "queued", "queued": job_manager.queued_count()}
+
+
+def _job_info(job):
+    """任务信息（不返回服务器上的文件路径）"""
+    params = job["params"]
+    return {
+        "job_id": job["job_id"],
+        "status": job["status"],
+        "resume_file": params.get("resume_filename"),
+        "position_file": params.get("position_filename"),
+        "progress": job["progress"],
+        "statistics": job["result"],
+        "error": job["error"],
+        "created": job["created"],
+        "updated": job["updated"],
+    }
+
+
+async def _get_job_or_404(job_id):
+    job = await job_manager.snapshot(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"筛选任务不存在: {job_id}")
+    return job
+
+
+@app.get("/api/jobs")
+async def list_screening_jobs(limit: int = 20):
+    """最近提交的后台筛选任务"""
+    return {"success": True, "jobs": [_job_info(job) for job in await job_manager.list(limit)]}
+
+
+@app.get("/api/jobs/{job_id}")
+async def get_screening_job(job_id: str):
+    """后台筛选任务的状态和进度"""
+    return {"success": True, "job": _job_info(await _get_job_or_404(job_id))}
+
+
+@app.get("/api/jobs/{job_id}/events")
+async def screening_job_events(job_id: str):
+    """
+    后台筛选任务进度（Server-Sent Events）
+    每次进度变化推送一条 data: {任务信息JSON}，任务完成或失败后结束
+    """
+    await _get_job_or_404(job_id)
+    
+    async def stream_events():
+        async for job in job_manager.subscribe(job_id):
+            yield f"data: {json.dumps(_job_info(job), ensure_ascii=False)}\n\n"
+    
+    headers = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    return StreamingResponse(stream_events(), media_type="text/event-stream", headers=headers)
+
+
+# 缓存行偏移索引的结果流个数（最近查询的任务）
+STREAM_INDEX_CACHE_SIZE = 16
+_stream_indexes: "OrderedDict[str, NdjsonLineIndex]" = OrderedDict()
+_stream_indexes_lock = threading.Lock()
+
+
+def read_stream_page(stream_path: str, offset: int, limit: int):
+    """
+    分页读取任务的结果流（在IO线程池中执行）
+    每个结果流的行偏移索引会被缓存，再次查询时只扫描新追加的结果
+
+    Returns:
+        (结果总数, 该页的 ScreeningResult 列表)
+    """
+    if not os.path.exists(stream_path):
+        return 0, []
+    with _stream_indexes_lock:
+        index = _stream_indexes.get(stream_path)
+        if index is None:
+            index = _stream_indexes[stream_path] = NdjsonLineIndex(stream_path)
+        _stream_indexes.move_to_end(stream_path)
+        if len(_stream_indexes) > STREAM_INDEX_CACHE_SIZE:
+            _stream_indexes.popitem(last=False)
+    return index.read_page(offset, limit)
+
+
+@app.get("/api/jobs/{job_id}/results")
+async def screening_job_results(
+    job_id: str,
+    page: int = Query(1, ge=1),
+    page_size: int = Query(50, ge=1, le=MAX_PAGE_SIZE)
+):
+    """
+    分页查询后台筛选任务已完成的配对结果（执行中也可查询，按完成顺序）
+    任务完成后，整理好的结果可通过 /api/results?run_id=... 查询
+    """
+    job = await _get_job_or_404(job_id)
+    stream_path = os.path.join(job["params"]["job_dir"], "筛选结果流.ndjson")
+    # 结果流可能很大，在IO线程池中读取，只解析当前页
+    total, results = await run_in_io_pool(read_stream_page, stream_path, (page - 1) * page_size, page_size)
+    return {
+        "success": True,
+        "job": _job_info(job),
+        "run_id": (job["result"] or {}).get("run_id"),
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+        "data": [dataclasses.asdict(result) for result in results],
+    }
+
+
 if __name__ == "__main__":
+    # 打包为exe后解析进程池的子进程需要
+    multiprocessing.freeze_support()
+    
     print("=" * 80)
     print("🚀 AI简历初筛系统 - 后端服务")
     print("=" * 80)
@@ -6,3 +6,9 @@ DASHSCOPE_API_KEY = "sk-dff6d0f5d956485fa0ac71998e63d036"
 LLM_MODEL = "qwen-max"
 # 阿里云 DashScope Base URL
 DASHSCOPE_BASE_URL = "https://dashscope.aliyuncs.com/compatible-mode/v1"
+
+# 单个上传文件的大小上限（MB），超过时拒绝上传
+MAX_UPLOAD_MB = 50
+
+# 结果库保留的筛选运行数，更早的运行在保存新运行时删除
+RESULT_RUNS_TO_KEEP = 50
@@ -4,13 +4,26 @@
 核心功能模块
 """
 
-from .models import FilterResult, ScreeningResult
+from .incremental import IncrementalScreening, PairResultStore
+from .models import EduLevel, FilterResult, ResumeProfile, ScreeningResult
+from .position_index import PositionIndex
+from .profile import build_resume_profile, build_resume_profiles
+from .rule_engine import RuleEngine, RuleEvaluation
 from .screener import ResumeScreener
 from .toolkit import ResumeFilterToolkit
 
 __all__ = [
+    'IncrementalScreening',
+    'PairResultStore',
+    'EduLevel',
     'FilterResult',
+    'ResumeProfile',
     'ScreeningResult',
+    'build_resume_profile',
+    'build_resume_profiles',
+    'PositionIndex',
+    'RuleEngine',
+    'RuleEvaluation',
     'ResumeScreener',
     'ResumeFilterToolkit',
 ]
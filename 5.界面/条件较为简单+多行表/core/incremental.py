@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+增量筛选模块（基于内容指纹）
+
+每份简历和每个岗位按规范化JSON计算内容指纹，专业库/院校库内容、模型名称、
+参考日期（年龄和工作年限按当天计算）合成筛选上下文指纹。（上下文, 岗位, 简历）
+三者指纹都未变化的配对直接复用上次保存的筛选结果，只重新筛选发生变化的配对。
+简历指纹不包含简历位置，插入或删除简历不会使其他简历的结果失效，复用时
+按当前位置改写结果中的位置信息。
+"""
+
+import asyncio
+import dataclasses
+import hashlib
+import json
+import re
+import sqlite3
+import time
+from concurrent.futures import Executor
+from datetime import date
+from typing import Dict, List, Optional, Set, Tuple
+
+from core.models import LLM_FAILURE_METHODS, LLM_UNAVAILABLE_METHOD, ScreeningResult
+from utils.logger_config import setup_logger
+
+logger = setup_logger("incremental")
+
+# 筛选规则版本，规则逻辑变化导致结果不同时递增，使旧结果全部失效
+FINGERPRINT_VERSION = 4
+
+# 默认每完成多少个配对写入一次结果库
+DEFAULT_FLUSH_EVERY = 200
+
+# 默认距离上次写入超过多少秒时再写入一次结果库
+DEFAULT_FLUSH_SECONDS = 2.0
+
+# 筛选详情的简历信息中的位置（见 ResumeScreener._format_resume_info）
+_POSITION_PATTERN = re.compile(r"位置=第\d+条")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pair_results (
+    context_hash TEXT NOT NULL,
+    job_hash TEXT NOT NULL,
+    resume_hash TEXT NOT NULL,
+    result TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (context_hash, job_hash, resume_hash)
+);
+"""
+
+
+def canonical_hash(data) -> str:
+    """规范化JSON（键排序、紧凑分隔符）的 SHA-256 指纹"""
+    payload = json.dumps(data, ensure_ascii=False, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def file_hash(path: Optional[str]) -> Optional[str]:
+    """文件内容的 SHA-256 指纹（路径为空或文件不存在时返回None）"""
+    if not path:
+        return None
+    digest = hashlib.sha256()
+    try:
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+def build_context_fingerprint(screener, resume_file: str = "简历-多行表.json",
+                              reference_date: Optional[date] = None) -> str:
+    """
+    计算筛选上下文指纹
+
+    Args:
+        screener: ResumeScreener
+        resume_file: 简历文件名（写入筛选详情的位置信息）
+        reference_date: 参考日期，为None时使用当天
+
+    Returns:
+        上下文指纹
+    """
+    model_manager = screener.toolkit.model_manager
+    return canonical_hash({
+        "版本": FINGERPRINT_VERSION,
+        "专业库": file_hash(screener.major_library_path),
+        "院校库": file_hash(screener.school_library_path),
+        "模型": getattr(model_manager, "model_name", type(model_manager).__name__) if model_manager else None,
+        "参考日期": (reference_date or date.today()).isoformat(),
+        "简历文件": resume_file,
+    })
+
+
+def resume_fingerprints(resume_list: List[Dict]) -> List[str]:
+    """
+    计算每份简历的指纹（与 resume_list 一一对应，只取决于简历内容）
+
+    筛选详情中的简历位置（第几条）不计入指纹，复用结果时由 relocate_result 改写。
+    """
+    return [canonical_hash(resume) for resume in resume_list]
+
+
+def relocate_result(result: ScreeningResult, resume_index: int) -> ScreeningResult:
+    """
+    把复用的筛选结果改写为简历的当前位置
+
+    Args:
+        result: 保存的筛选结果（可能来自简历位置不同的上一次筛选）
+        resume_index: 简历在当前简历列表中的位置
+
+    Returns:
+        ScreeningResult（位置未变化时原样返回）
+    """
+    if result.resume_index == resume_index:
+        return result
+    position = f"位置=第{resume_index + 1}条"
+    filter_details = [
+        {**detail, "resume_info": _POSITION_PATTERN.sub(position, detail["resume_info"])}
+        if isinstance(detail.get("resume_info"), str) else detail
+        for detail in result.filter_details
+    ]
+    return dataclasses.replace(result, resume_index=resume_index, filter_details=filter_details)
+
+
+class PairResultStore:
+    """（上下文, 岗位, 简历）配对筛选结果库（SQLite）"""
+
+    def __init__(self, db_path: str):
+        """
+        打开（或创建）结果库
+
+        Args:
+            db_path: 数据库文件路径
+        """
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        self.conn.executescript(_SCHEMA)
+
+    def close(self):
+        """关闭数据库连接"""
+        self.conn.close()
+
+    def get_many(self, context_hash: str, job_hash: str, resume_hashes: List[str]) -> Dict[str, ScreeningResult]:
+        """
+        读取已保存的筛选结果
+
+        Args:
+            context_hash: 上下文指纹
+            job_hash: 岗位指纹
+            resume_hashes: 简历指纹列表
+
+        Returns:
+            简历指纹 -> ScreeningResult（只包含已保存的配对）
+        """
+        found = {}
+        unique_hashes = list(dict.fromkeys(resume_hashes))
+        # SQLite 单条语句的参数个数有限，分批查询
+        for start in range(0, len(unique_hashes), 500):
+            batch = unique_hashes[start:start + 500]
+            rows = self.conn.execute(
+                f"SELECT resume_hash, result FROM pair_results WHERE context_hash = ? AND job_hash = ? "
+                f"AND resume_hash IN ({','.join('?' * len(batch))})",
+                (context_hash, job_hash, *batch),
+            )
+            for resume_hash, payload in rows:
+                found[resume_hash] = ScreeningResult(**json.loads(payload))
+        return found
+
+    def put_many(self, context_hash: str, job_hash: str, items: List[Tuple[str, ScreeningResult]]):
+        """
+        保存筛选结果（一个事务内完成）
+
+        Args:
+            context_hash: 上下文指纹
+            job_hash: 岗位指纹
+            items: (简历指纹, ScreeningResult) 列表
+        """
+        now = time.time()
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO pair_results (context_hash, job_hash, resume_hash, result, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                ((context_hash, job_hash, resume_hash,
+                  json.dumps(dataclasses.asdict(result), ensure_ascii=False), now)
+                 for resume_hash, result in items),
+            )
+
+    def prune(self, keep_context_hash: str) -> int:
+        """删除其他上下文（库、模型或日期已变化）的结果，返回删除的条数"""
+        with self.conn:
+            cursor = self.conn.execute("DELETE FROM pair_results WHERE context_hash != ?", (keep_context_hash,))
+        return cursor.rowcount
+
+
+class IncrementalScreening:
+    """一次增量筛选：复用指纹未变化的配对结果，并统计复用和重新筛选的数量"""
+
+    def __init__(self, screener, store: PairResultStore, resume_list: List[Dict],
+                 resume_file: str = "简历-多行表.json", reference_date: Optional[date] = None,
+                 executor: Optional[Executor] = None, flush_every: int = DEFAULT_FLUSH_EVERY,
+                 flush_seconds: float = DEFAULT_FLUSH_SECONDS):
+        """
+        初始化增量筛选
+
+        Args:
+            screener: ResumeScreener
+            store: 配对结果库
+            resume_list: 简历列表
+            resume_file: 简历文件名（用于显示位置信息）
+            reference_date: 参考日期，为None时使用当天
+            executor: 执行结果库读写的线程池，为None时使用事件循环的默认线程池
+            flush_every: 每完成多少个配对写入一次结果库
+            flush_seconds: 距离上次写入超过多少秒时写入一次结果库
+        """
+        self.screener = screener
+        self.store = store
+        self.resume_list = resume_list
+        self.resume_file = resume_file
+        self.context_hash = build_context_fingerprint(screener, resume_file, reference_date)
+        self.resume_hashes = resume_fingerprints(resume_list)
+        self.reused = 0
+        self.recomputed = 0
+        # 含这些方法的结果不写入结果库：LLM调用或连接失败时默认通过，恢复后应重新判断；
+        # 配置了模型却未能使用（模型未初始化）同样是临时状态
+        self.transient_methods = LLM_FAILURE_METHODS
+        if screener.toolkit.model_manager is not None:
+            self.transient_methods = self.transient_methods | {LLM_UNAVAILABLE_METHOD}
+        self.not_cached = 0
+        self.executor = executor
+        self.flush_every = flush_every
+        self.flush_seconds = flush_seconds
+        # 已完成、尚未写入结果库的配对：(岗位指纹, 简历指纹, ScreeningResult)
+        self._pending: List[Tuple[str, str, ScreeningResult]] = []
+        self._last_flush = time.monotonic()
+        self._flushes: Set[asyncio.Future] = set()
+        # 结果库连接在线程池中使用，同一时间只执行一个操作
+        self._store_lock = asyncio.Lock()
+
+    async def _run_store(self, func, *args):
+        """在线程池中执行结果库操作（依次执行，不阻塞事件循环）"""
+        async with self._store_lock:
+            return await asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+
+    def _put_pending(self, items: List[Tuple[str, str, ScreeningResult]]):
+        """按岗位分组写入结果库（在线程池中执行）"""
+        by_job: Dict[str, List[Tuple[str, ScreeningResult]]] = {}
+        for job_hash, resume_hash, result in items:
+            by_job.setdefault(job_hash, []).append((resume_hash, result))
+        for job_hash, job_items in by_job.items():
+            self.store.put_many(self.context_hash, job_hash, job_items)
+
+    async def _write_pending(self, items: List[Tuple[str, str, ScreeningResult]]):
+        try:
+            await self._run_store(self._put_pending, items)
+        except Exception as e:
+            # 结果库只用于复用，写入失败不影响本次筛选
+            logger.error(f"[增量] ❌ 写入 {len(items)} 个配对结果失败：{e}")
+
+    def _schedule_flush(self):
+        """把已完成的配对交给线程池写入结果库（不等待写入完成）"""
+        items, self._pending = self._pending, []
+        self._last_flush = time.monotonic()
+        if items:
+            task = asyncio.ensure_future(self._write_pending(items))
+            self._flushes.add(task)
+            task.add_done_callback(self._flushes.discard)
+
+    def is_transient(self, result: ScreeningResult) -> bool:
+        """结果中是否有条件因LLM临时不可用而默认通过（不能复用）"""
+        return any(detail.get("method") in self.transient_methods for detail in result.filter_details)
+
+    def _record(self, job_hash: str, result: ScreeningResult):
+        """记录一个刚完成的配对，达到条数或时间间隔时分批写入结果库（LLM临时不可用的结果不写入）"""
+        if self.is_transient(result):
+            self.not_cached += 1
+            return
+        self._pending.append((job_hash, self.resume_hashes[result.resume_index], result))
+        if len(self._pending) >= self.flush_every or time.monotonic() - self._last_flush >= self.flush_seconds:
+            self._schedule_flush()
+
+    async def flush(self):
+        """写入所有已完成的配对并等待写入完成（筛选中断时也应调用，保留已完成的配对）"""
+        self._schedule_flush()
+        if self._flushes:
+            await asyncio.gather(*list(self._flushes))
+
+    async def prune(self) -> int:
+        """写入所有已完成的配对后，删除其他上下文的结果（在线程池中执行），返回删除的条数"""
+        await self.flush()
+        return await self._run_store(self.store.prune, self.context_hash)
+
+    async def screen_job(self, job_data: Dict, profiles=None, position_index=None,
+                         rule_engine=None, on_result=None, shard_pool=None) -> List[ScreeningResult]:
+        """
+        增量筛选一个岗位（参数与 ResumeScreener.screen_batch 相同）
+
+        重新筛选的配对每完成一个即记录下来，分批写入结果库（见 flush_every、flush_seconds），
+        筛选中途服务重启时已写入的配对不需要重新筛选。
+
+        Returns:
+            List[ScreeningResult]（与 screen_batch 的结果一致）
+        """
+        if profiles is None:
+            profiles = self.screener.build_profiles(self.resume_list)
+        if position_index is None:
+            position_index = self.screener.build_position_index(profiles)
+
+        candidates = position_index.candidates(job_data.get('岗位', ''))
+        if not candidates:
+            return []
+
+        job_hash = canonical_hash(job_data)
+        cached = await self._run_store(self.store.get_many, self.context_hash, job_hash,
+                                       [self.resume_hashes[i] for i in candidates])
+        # 内容相同的简历可能换了位置（或在列表中出现多次），复用的结果按当前位置改写
+        reused_by_index: Dict[int, ScreeningResult] = {
+            index: relocate_result(cached[self.resume_hashes[index]], index)
+            for index in candidates if self.resume_hashes[index] in cached
+        }
+        stale = [index for index in candidates if index not in reused_by_index]
+        if on_result is not None:
+            for result in reused_by_index.values():
+                on_result(result)
+
+        def on_fresh_result(result: ScreeningResult):
+            """重新筛选的配对完成：记录待写入结果库，再交给调用方的回调"""
+            self._record(job_hash, result)
+            if on_result is not None:
+                on_result(result)
+
+        fresh_by_index: Dict[int, ScreeningResult] = {}
+        not_cached = self.not_cached
+        if stale:
+            fresh = await self.screener.screen_batch(job_data, self.resume_list, resume_file=self.resume_file,
+                                                     profiles=profiles, position_index=position_index,
+                                                     rule_engine=rule_engine, indices=stale, on_result=on_fresh_result,
+                                                     shard_pool=shard_pool)
+            fresh_by_index = {result.resume_index: result for result in fresh}
+            await self.flush()
+
+        self.reused += len(candidates) - len(stale)
+        self.recomputed += len(stale)
+        logger.info(f"[增量] ♻️ 岗位 {job_data.get('岗位', '')}：复用 {len(candidates) - len(stale)} 个配对，"
+                    f"重新筛选 {len(stale)} 个配对")
+        if self.not_cached > not_cached:
+            logger.warning(f"[增量] ⚠️ 岗位 {job_data.get('岗位', '')}：{self.not_cached - not_cached} 个配对因LLM不可用"
+                           f"默认通过，不写入结果库（下次重新筛选）")
+
+        return [reused_by_index.get(index) or fresh_by_index[index] for index in candidates]
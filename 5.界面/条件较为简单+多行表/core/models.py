@@ -5,7 +5,16 @@
 """
 
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from enum import IntEnum
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+# LLM调用失败、连接失败时默认通过的方法（临时故障，恢复后应重新判断）
+LLM_CALL_FAILED_METHOD = "规则匹配-LLM调用失败"
+LLM_CONNECTION_FAILED_METHOD = "规则匹配-LLM连接失败"
+LLM_FAILURE_METHODS = frozenset({LLM_CALL_FAILED_METHOD, LLM_CONNECTION_FAILED_METHOD})
+
+# 模型未初始化时默认通过的方法
+LLM_UNAVAILABLE_METHOD = "规则匹配-模型未初始化"
 
 
 @dataclass
@@ -26,3 +35,62 @@ class ScreeningResult:
     passed: bool  # 是否通过
     filter_details: List[Dict]  # 各筛选条件的详细结果
     summary: str  # 总结说明
+    resume_index: Optional[int] = None  # 简历在简历列表中的位置（序号可能重复，导出时按位置取简历）
+
+
+class EduLevel(IntEnum):
+    """学历等级（数值越大学历越高）"""
+    NONE = 0
+    HIGH_SCHOOL = 1
+    JUNIOR_COLLEGE = 2
+    BACHELOR = 3
+    MASTER = 4
+    DOCTOR = 5
+
+    @classmethod
+    def from_text(cls, text: str) -> "EduLevel":
+        """从学历文本中识别学历等级（取文本中出现的最高等级）"""
+        level = 0
+        if text:
+            for keyword, keyword_level in EDU_LEVEL_KEYWORDS.items():
+                if keyword in text:
+                    level = max(level, keyword_level)
+        return cls(level)
+
+
+# 学历关键词 -> 学历等级
+EDU_LEVEL_KEYWORDS = {
+    "博士": EduLevel.DOCTOR,
+    "硕士研究生": EduLevel.MASTER,
+    "硕士": EduLevel.MASTER,
+    "大学本科": EduLevel.BACHELOR,
+    "本科": EduLevel.BACHELOR,
+    "专科": EduLevel.JUNIOR_COLLEGE,
+    "高中": EduLevel.HIGH_SCHOOL,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class ResumeProfile:
+    """简历画像：每份简历加载时计算一次，供所有岗位的筛选器和导出器共用"""
+    index: int  # 简历在列表中的位置
+    resume_id: str  # 简历序号
+    name: str  # 姓名
+    applied_unit: str  # 应聘单位
+    applied_department: str  # 应聘部门路径
+    applied_position: str  # 应聘岗位
+    birth_date: str  # 出生日期（原值）
+    age: Optional[int]  # 年龄，缺少或无法解析出生日期时为None
+    join_date: str  # 参加工作时间（原值）
+    work_years: Optional[int]  # 工作年限，缺少参加工作时间时为None
+    political_status: str  # 政治面貌
+    current_position: str  # 现职务或岗位
+    highest_education: str  # 最高学历
+    edu_level: EduLevel  # 最高学历等级
+    highest_school: str  # 最高学历毕业院校
+    highest_school_type: str  # 最高学历毕业院校类型
+    education_form: str  # 最高学历学习形式（全日制教育/非全日制教育）
+    school_attributes: FrozenSet[str]  # 院校库中的属性标签（如985、211）
+    majors: Tuple[str, ...]  # 专业名称
+    major_classes: Tuple[str, ...]  # 专业对应的专业类
+    major_class_bits: int  # 专业类位集（第 i 位对应 MajorLibrary.class_names[i]）
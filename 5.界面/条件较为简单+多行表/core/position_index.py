@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+应聘岗位倒排索引模块
+
+加载简历后构建一次：规范化的应聘岗位 -> 简历在列表中的位置。
+screen_batch 每个岗位直接取候选简历，不再逐份比对应聘岗位。
+"""
+
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+from core.models import ResumeProfile
+
+
+def normalize_position(name) -> str:
+    """规范化岗位名称（去除首尾空格，空值返回空字符串）"""
+    if not name:
+        return ""
+    return str(name).strip()
+
+
+class PositionIndex:
+    """应聘岗位倒排索引"""
+
+    def __init__(self, profiles: List[ResumeProfile]):
+        """
+        构建索引
+
+        Args:
+            profiles: 简历画像列表（profile.index 为简历在列表中的位置）
+        """
+        self.total = len(profiles)
+        # 应聘岗位 -> [简历位置]（保持简历列表中的原始顺序）
+        self._by_position: Dict[str, List[int]] = defaultdict(list)
+        # (应聘岗位, 应聘单位) -> [简历位置]
+        self._by_unit: Dict[Tuple[str, str], List[int]] = defaultdict(list)
+        # (应聘岗位, 应聘单位, 应聘部门路径) -> [简历位置]
+        self._by_full_path: Dict[Tuple[str, str, str], List[int]] = defaultdict(list)
+
+        for profile in profiles:
+            position = normalize_position(profile.applied_position)
+            # 应聘岗位为空的简历不参与任何岗位匹配
+            if not position:
+                continue
+            unit = normalize_position(profile.applied_unit)
+            self._by_position[position].append(profile.index)
+            self._by_unit[(position, unit)].append(profile.index)
+            self._by_full_path[(position, unit, normalize_position(profile.applied_department))].append(profile.index)
+
+    def candidates(self, job_name: str, unit: Optional[str] = None, department: Optional[str] = None) -> List[int]:
+        """
+        获取应聘该岗位的简历位置（仅完全匹配，不进行包含匹配）
+
+        Args:
+            job_name: 岗位名称（来自岗位数据）
+            unit: 应聘单位，为None时不限制单位
+            department: 应聘部门路径，为None时不限制部门（需同时指定 unit）
+
+        Returns:
+            简历位置列表（按简历列表原始顺序）
+        """
+        position = normalize_position(job_name)
+        if not position:
+            return []
+
+        if unit is None:
+            return list(self._by_position.get(position, []))
+
+        unit = normalize_position(unit)
+        if department is None:
+            return list(self._by_unit.get((position, unit), []))
+        return list(self._by_full_path.get((position, unit, normalize_position(department)), []))
+
+    def positions(self) -> List[str]:
+        """返回索引中的所有应聘岗位"""
+        return list(self._by_position.keys())
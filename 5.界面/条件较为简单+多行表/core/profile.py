@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+简历画像构建模块
+
+每份简历只在加载时解析一次嵌套的原始数据，得到紧凑的 ResumeProfile，
+之后所有岗位的筛选器和导出器都直接读取画像字段，不再重复计算
+年龄、工作年限、专业类、学历等级和院校属性。
+"""
+
+from typing import Dict, List, Optional
+from core.models import EduLevel, ResumeProfile
+from extractors.resume_extractor import ResumeExtractor
+from utils.calculator import Calculator
+
+
+def build_resume_profile(resume_data: Dict, index: int = 0, major_library=None, rule_matcher=None) -> ResumeProfile:
+    """
+    构建单份简历的画像
+
+    Args:
+        resume_data: 简历数据
+        index: 简历在列表中的位置
+        major_library: 专业库管理器（用于查找专业类），为None时不计算专业类
+        rule_matcher: 规则匹配器（用于查找院校属性），为None时不计算院校属性
+
+    Returns:
+        ResumeProfile
+    """
+    basic_info = resume_data.get("基本信息", {})
+    job_info = resume_data.get("岗位信息", {})
+    education_info = resume_data.get("学习经历统计信息", {})
+
+    birth_date = basic_info.get("出生日期", "")
+    join_date = basic_info.get("参加工作时间", "")
+    highest_education = education_info.get("最高学历", "")
+    highest_school = education_info.get("最高学历毕业院校", "")
+
+    majors = tuple(ResumeExtractor.extract_majors_from_resume(resume_data))
+    major_classes = tuple(major_library.get_major_classes(list(majors))) if major_library and majors else ()
+    major_class_bits = major_library.get_major_class_bits(majors) if major_library and majors else 0
+    school_attributes = frozenset(rule_matcher.lookup_school_attributes(highest_school)) if rule_matcher and highest_school else frozenset()
+
+    return ResumeProfile(
+        index=index,
+        resume_id=str(resume_data.get("序号", "未知")),
+        name=basic_info.get("姓名", ""),
+        applied_unit=job_info.get("应聘单位", ""),
+        applied_department=job_info.get("应聘部门路径", ""),
+        applied_position=job_info.get("应聘岗位", ""),
+        birth_date=birth_date,
+        age=Calculator.parse_age(birth_date) if birth_date else None,
+        join_date=join_date,
+        work_years=Calculator.calculate_work_years(join_date) if join_date else None,
+        political_status=basic_info.get("政治面貌", ""),
+        current_position=basic_info.get("现职务或岗位", ""),
+        highest_education=highest_education,
+        edu_level=EduLevel.from_text(highest_education),
+        highest_school=highest_school,
+        highest_school_type=education_info.get("最高学历毕业院校类型", ""),
+        education_form=ResumeExtractor.extract_highest_education_form(resume_data),
+        school_attributes=school_attributes,
+        majors=majors,
+        major_classes=major_classes,
+        major_class_bits=major_class_bits,
+    )
+
+
+def build_resume_profiles(resume_list: List[Dict], major_library=None, rule_matcher=None) -> List[ResumeProfile]:
+    """
+    批量构建简历画像（与 resume_list 一一对应）
+
+    Args:
+        resume_list: 简历列表
+        major_library: 专业库管理器
+        rule_matcher: 规则匹配器
+
+    Returns:
+        List[ResumeProfile]
+    """
+    return [
+        build_resume_profile(resume, index, major_library, rule_matcher)
+        for index, resume in enumerate(resume_list)
+    ]
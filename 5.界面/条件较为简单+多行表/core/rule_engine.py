@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+向量化规则引擎模块
+
+加载简历后把简历画像转换为列式数组（年龄、工作年限、学历等级、
+院校属性、专业类等），每个岗位的规则条件在所有候选简历上一次性
+计算为布尔掩码，得到「简历 × 筛选条件」的通过矩阵和失败代码。
+
+只有岗位的所有条件都无需调用LLM时才使用本引擎（见 compile_job），
+否则 screen_batch 仍逐份简历筛选。引擎判断的简历只生成带失败代码的简要结果，
+详细的原因说明在输出前才由 ResumeScreener.render_results 生成。
+"""
+
+import re
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from core.models import EDU_LEVEL_KEYWORDS, ResumeProfile
+from extractors.requirement_extractor import RequirementExtractor
+from utils.logger_config import setup_logger
+
+logger = setup_logger("rule_engine")
+
+# 筛选条件顺序与 ResumeScreener.screen_resume 一致
+FILTER_NAMES = ("学历要求", "专业要求", "年龄要求", "绩效要求", "工作经历", "工作经验", "政治面貌", "职称要求")
+
+# 需要进行相关工作经验判断（LLM）的关键词，与 WorkYearsFilter 一致
+RELATED_WORK_KEYWORDS = ["相关工作经验", "相关经验", "相关岗位工作经验", "相关研究经验"]
+
+
+class RuleCode(IntEnum):
+    """规则判断结果代码"""
+    PASSED = 0  # 通过
+    MISSING = 1  # 简历数据缺失
+    FAILED = 2  # 不符合要求
+
+
+# 简要结果中各筛选条件的方法（详细原因说明尚未生成）
+RULE_RESULT_METHOD = "规则匹配-向量化"
+
+# 未生成详细说明时使用的原因
+RULE_CODE_REASONS = {
+    RuleCode.PASSED: "符合要求",
+    RuleCode.MISSING: "简历数据缺失",
+    RuleCode.FAILED: "不符合要求",
+}
+
+
+@dataclass
+class RuleEvaluation:
+    """一个岗位在候选简历上的规则判断结果"""
+    indices: np.ndarray  # 候选简历在简历列表中的位置
+    codes: np.ndarray  # 失败代码矩阵（候选简历数 × 筛选条件数），取值为 RuleCode
+
+    @property
+    def passed_matrix(self) -> np.ndarray:
+        """通过矩阵（候选简历数 × 筛选条件数）"""
+        return self.codes == RuleCode.PASSED
+
+    @property
+    def passed(self) -> np.ndarray:
+        """每份候选简历是否通过所有条件"""
+        return self.passed_matrix.all(axis=1)
+
+
+def _encode_sets(values: Sequence[Sequence[str]]) -> Tuple[Dict[str, int], np.ndarray]:
+    """
+    把每份简历的字符串集合编码为 (词表, 成员矩阵)
+
+    Args:
+        values: 每份简历的字符串集合
+
+    Returns:
+        (字符串 -> 列号, 简历数 × 词表大小 的布尔矩阵)
+    """
+    vocabulary: Dict[str, int] = {}
+    for items in values:
+        for item in items:
+            vocabulary.setdefault(item, len(vocabulary))
+
+    matrix = np.zeros((len(values), len(vocabulary)), dtype=bool)
+    for row, items in enumerate(values):
+        for item in items:
+            matrix[row, vocabulary[item]] = True
+    return vocabulary, matrix
+
+
+class RuleEngine:
+    """向量化规则引擎（列式存储简历画像，按岗位批量计算规则条件）"""
+
+    def __init__(self, profiles: List[ResumeProfile], rule_matcher, llm_matcher=None, age_filter=None, major_library=None):
+        """
+        构建列式数据（加载简历后调用一次，所有岗位共用）
+
+        Args:
+            profiles: 简历画像列表（与简历列表一一对应）
+            rule_matcher: 规则匹配器（判断院校库是否可用）
+            llm_matcher: LLM匹配器（判断是否可以调用LLM），为None时视为LLM不可用
+            age_filter: 年龄筛选器（用于规范化年龄要求）
+            major_library: 专业库管理器（用于编译专业要求），为None时专业要求交给逐份筛选
+        """
+        self.rule_matcher = rule_matcher
+        self.llm_matcher = llm_matcher
+        self.age_filter = age_filter
+        self.major_library = major_library
+
+        self.has_birth = np.array([bool(p.birth_date) for p in profiles], dtype=bool)
+        # 无法解析出生日期时按0岁处理，与年龄筛选器一致
+        self.age = np.array([p.age if p.age is not None else 0 for p in profiles], dtype=np.int32)
+        self.has_join = np.array([bool(p.join_date) for p in profiles], dtype=bool)
+        self.work_years = np.array([p.work_years if p.work_years is not None else 0 for p in profiles], dtype=np.int32)
+        self.edu_level = np.array([int(p.edu_level) for p in profiles], dtype=np.int8)
+        self.fulltime = np.array([p.education_form == "全日制教育" for p in profiles], dtype=bool)
+        self.has_school = np.array([bool(p.highest_school) for p in profiles], dtype=bool)
+        self.school_type_985_211 = np.array(
+            ["985" in p.highest_school_type or "211" in p.highest_school_type for p in profiles], dtype=bool
+        )
+        self.has_majors = np.array([bool(p.majors) for p in profiles], dtype=bool)
+        self.school_vocabulary, self.school_matrix = _encode_sets([p.school_attributes for p in profiles])
+        # 专业类成员矩阵，第 i 列对应专业库中的第 i 个专业类
+        class_count = len(major_library.class_names) if major_library else 0
+        self.major_class_matrix = np.array(
+            [[bool(p.major_class_bits >> class_id & 1) for class_id in range(class_count)] for p in profiles], dtype=bool
+        ).reshape(len(profiles), class_count)
+
+    @property
+    def llm_available(self) -> bool:
+        """是否可以调用LLM"""
+        return bool(self.llm_matcher is not None and self.llm_matcher.model_manager)
+
+    def supports(self, job_data: Dict) -> bool:
+        """岗位的所有条件是否都可以由本引擎判断（无需LLM）"""
+        return self.compile_job(job_data) is not None
+
+    def compile_job(self, job_data: Dict) -> Optional[List]:
+        """
+        把岗位要求编译为每个筛选条件的判断函数
+
+        Args:
+            job_data: 岗位数据
+
+        Returns:
+            与 FILTER_NAMES 对应的判断函数列表（参数为候选简历位置数组，返回 RuleCode 数组），
+            岗位存在需要LLM或文本解析的条件时返回None
+        """
+        qualification = job_data.get("资格条件", [])
+        job_duty = job_data.get("岗位职责", [])
+        job_requirement = job_data.get("岗位任职条件", [])
+
+        education_rule = self._compile_education(RequirementExtractor.extract_education_requirement(qualification))
+        major_rule = self._compile_major(RequirementExtractor.extract_major_requirement(qualification))
+        age_rule = self._compile_age(RequirementExtractor.extract_age_requirement(qualification))
+        # 绩效、工作经历、职称条件在简历有无相关信息时最终都交给LLM判断
+        performance_rule = self._compile_llm_only(RequirementExtractor.extract_performance_requirement(qualification))
+        work_experience_rule = self._compile_llm_only(RequirementExtractor.extract_work_experience_requirement(qualification))
+        title_rule = self._compile_llm_only(RequirementExtractor.extract_title_requirement(qualification))
+        work_years_rule = self._compile_work_years(job_duty, job_requirement)
+        # 政治面貌规则目前总是通过
+        political_rule = self._always_pass
+
+        rules = [education_rule, major_rule, age_rule, performance_rule,
+                 work_experience_rule, work_years_rule, political_rule, title_rule]
+        if any(rule is None for rule in rules):
+            return None
+        return rules
+
+    def evaluate(self, job_data: Dict, indices: Sequence[int]) -> Optional[RuleEvaluation]:
+        """
+        在候选简历上批量计算岗位的所有规则条件
+
+        Args:
+            job_data: 岗位数据
+            indices: 候选简历在简历列表中的位置
+
+        Returns:
+            RuleEvaluation，岗位需要LLM判断时返回None
+        """
+        rules = self.compile_job(job_data)
+        if rules is None:
+            return None
+
+        rows = np.asarray(indices, dtype=np.intp)
+        codes = np.empty((len(rows), len(FILTER_NAMES)), dtype=np.int8)
+        for column, rule in enumerate(rules):
+            codes[:, column] = rule(rows)
+
+        logger.debug(f"规则引擎：岗位={job_data.get('岗位', '')}，候选简历 {len(rows)} 份，"
+                     f"通过 {int((codes == RuleCode.PASSED).all(axis=1).sum())} 份")
+        return RuleEvaluation(indices=rows, codes=codes)
+
+    @staticmethod
+    def _always_pass(rows: np.ndarray) -> np.ndarray:
+        return np.full(len(rows), RuleCode.PASSED, dtype=np.int8)
+
+    @staticmethod
+    def _to_codes(passed: np.ndarray, missing: Optional[np.ndarray] = None) -> np.ndarray:
+        """把通过掩码（和数据缺失掩码）转换为 RuleCode 数组"""
+        codes = np.where(passed, RuleCode.PASSED, RuleCode.FAILED).astype(np.int8)
+        if missing is not None:
+            codes[missing] = RuleCode.MISSING
+        return codes
+
+    def _compile_llm_only(self, requirement):
+        """只能由LLM判断的条件：无要求或模型未初始化（默认通过）时可由引擎判断"""
+        if not requirement or not self.llm_available:
+            return self._always_pass
+        return None
+
+    def _school_has_any(self, rows: np.ndarray, attributes: List[str]) -> np.ndarray:
+        """
+        学校是否具有任一指定属性（与 RuleMatcher._check_school_attributes 一致：
+        院校库可用且有毕业院校时查院校库，否则使用学校类型字段）
+        """
+        if not self.rule_matcher.school_library:
+            return self.school_type_985_211[rows]
+
+        columns = [self.school_vocabulary[attr] for attr in attributes if attr in self.school_vocabulary]
+        in_library = self.school_matrix[np.ix_(rows, columns)].any(axis=1) if columns else np.zeros(len(rows), dtype=bool)
+        return np.where(self.has_school[rows], in_library, self.school_type_985_211[rows])
+
+    def _compile_education(self, requirement):
+        """学历要求（与 RuleMatcher.match_education_rule 的结构化数据分支一致）"""
+        if not requirement:
+            return self._always_pass
+        if not isinstance(requirement, dict):
+            return self._always_pass
+        if not ("条件" in requirement and "排名" in requirement):
+            # 只有原文时使用文本解析，交给逐份筛选
+            return None if "原文" in requirement else self._always_pass
+
+        condition = requirement.get("条件", "或")
+        rankings = requirement.get("排名", [])
+        educations = requirement.get("学历", [])
+
+        ranking_attributes = []
+        for rank_req in rankings:
+            if isinstance(rank_req, str) and ("985" in rank_req or "211" in rank_req):
+                ranking_attributes.append([attr for attr in ("985", "211") if attr in rank_req])
+
+        req_level = 0
+        requires_fulltime = False
+        required_attributes = []
+        for edu_req in educations:
+            if isinstance(edu_req, str):
+                if "全日制" in edu_req:
+                    requires_fulltime = True
+                if "985" in edu_req:
+                    required_attributes.append("985")
+                if "211" in edu_req:
+                    required_attributes.append("211")
+                for edu, level in EDU_LEVEL_KEYWORDS.items():
+                    if edu in edu_req:
+                        req_level = max(req_level, int(level))
+        for rank_req in rankings:
+            if isinstance(rank_req, str) and "全日制" in rank_req:
+                requires_fulltime = True
+
+        def rule(rows: np.ndarray) -> np.ndarray:
+            matched_ranking = np.zeros(len(rows), dtype=bool)
+            for attributes in ranking_attributes:
+                matched_ranking |= self._school_has_any(rows, attributes)
+
+            matched_education = self.edu_level[rows] >= req_level
+            if requires_fulltime:
+                matched_education &= self.fulltime[rows]
+            if required_attributes:
+                matched_education &= self._school_has_any(rows, required_attributes)
+
+            if condition == "或":
+                return self._to_codes(matched_ranking | matched_education)
+            return self._to_codes(matched_ranking & matched_education)
+
+        return rule
+
+    def _compile_major(self, requirement):
+        """专业要求（与 MajorFilter 及 RuleMatcher.match_major_rule 的结构化数据分支一致）"""
+        if not requirement:
+            return self._always_pass
+        if isinstance(requirement, dict) and "条件" in requirement and "专业" in requirement:
+            # 专业类不匹配时需要LLM判断
+            if self.llm_available or self.major_library is None:
+                return None
+        elif isinstance(requirement, dict) and "原文" in requirement:
+            return None
+        else:
+            def rule_default(rows: np.ndarray) -> np.ndarray:
+                return self._to_codes(self.has_majors[rows], ~self.has_majors[rows])
+            return rule_default
+
+        condition = requirement.get("条件", "或") or "或"
+        experiences = requirement.get("经历", [])
+        # 专业要求编译为专业类位集，再映射为专业类成员矩阵的列
+        requirement_bits = 0
+        for req_bits in self.major_library.compile_major_requirement(requirement.get("专业", [])):
+            requirement_bits |= req_bits
+        columns = [class_id for class_id in range(len(self.major_library.class_names)) if requirement_bits >> class_id & 1]
+
+        def rule(rows: np.ndarray) -> np.ndarray:
+            if columns:
+                major_matched = self.major_class_matrix[np.ix_(rows, columns)].any(axis=1)
+            else:
+                major_matched = np.zeros(len(rows), dtype=bool)
+            # 经历匹配与规则匹配器一致（目前不依赖简历内容，整列取同一个值）
+            experience_matched = np.full(len(rows), self.rule_matcher.match_major_experience(experiences, []))
+            rule_matched = self.rule_matcher.combine_major_conditions(condition, major_matched, experience_matched)
+            # 规则不通过且专业类不匹配时交给LLM（模型未初始化，默认通过）
+            passed = rule_matched | ~major_matched
+            has_majors = self.has_majors[rows]
+            return self._to_codes(passed & has_majors, ~has_majors)
+
+        return rule
+
+    def _compile_age(self, requirement):
+        """年龄要求（与 AgeFilter 一致）"""
+        age_requirement = self.age_filter._normalize_age_requirement(requirement) if self.age_filter else None
+        if not age_requirement:
+            return self._always_pass
+        max_age = age_requirement.get("max_age")
+
+        def rule(rows: np.ndarray) -> np.ndarray:
+            has_birth = self.has_birth[rows]
+            return self._to_codes(has_birth & (self.age[rows] <= max_age), ~has_birth)
+
+        return rule
+
+    def _compile_work_years(self, job_duty: List, job_requirement: List):
+        """工作经验要求（与 WorkYearsFilter 及 RuleMatcher.match_work_years_rule 一致）"""
+        if not job_duty and not job_requirement:
+            return self._always_pass
+
+        requirement = RequirementExtractor.extract_work_years_requirement(job_requirement)
+        if not requirement:
+            return self._always_pass
+
+        if isinstance(requirement, dict):
+            original_text = requirement.get("原文", "")
+            # 需要相关工作经验判断，且LLM可用时交给逐份筛选
+            if original_text and any(keyword in original_text for keyword in RELATED_WORK_KEYWORDS) and self.llm_available:
+                return None
+
+        min_years = 0
+        if isinstance(requirement, dict):
+            if "min_years" in requirement:
+                min_years = requirement.get("min_years", 0)
+            elif requirement.get("规整后"):
+                match = re.search(r'(\d+)', str(requirement["规整后"]))
+                if match:
+                    min_years = int(match.group(1))
+        if min_years == 0:
+            return self._always_pass
+
+        def rule(rows: np.ndarray) -> np.ndarray:
+            has_join = self.has_join[rows]
+            return self._to_codes(has_join & (self.work_years[rows] >= min_years), ~has_join)
+
+        return rule
@@ -5,14 +5,31 @@
 """
 
 import asyncio
+import dataclasses
 import time
-from typing import Dict, List, Optional
-from core.models import ScreeningResult
+from typing import Callable, Dict, List, Optional, Tuple
+from core.models import ResumeProfile, ScreeningResult
+from core.position_index import PositionIndex
+from core.rule_engine import FILTER_NAMES, RULE_CODE_REASONS, RULE_RESULT_METHOD, RuleCode, RuleEngine, RuleEvaluation
+from core.sharding import ShardPool
 from core.toolkit import ResumeFilterToolkit
 from utils.logger_config import setup_logger
 
 logger = setup_logger("resume_screener")
 
+# screen_resume 依次执行的筛选条件（与 FILTER_NAMES 顺序一致）：
+# (条件名称, 工具箱的筛选方法名, 结果未注明方法时是否以来源作为方法)
+FILTER_STEPS = (
+    ("学历要求", "filter_education", False),
+    ("专业要求", "filter_major", False),
+    ("年龄要求", "filter_age", False),
+    ("绩效要求", "filter_performance", True),
+    ("工作经历", "filter_work_experience", False),
+    ("工作经验", "filter_work_years", False),
+    ("政治面貌", "filter_political_status", False),
+    ("职称要求", "filter_professional_title", True),
+)
+
 
 def _format_time(seconds: float) -> str:
     """
@@ -51,9 +68,49 @@ class ResumeScreener:
             major_library_path: 专业库.json文件路径
             school_library_path: 院校库.json文件路径
         """
+        self.major_library_path = major_library_path
+        self.school_library_path = school_library_path
         self.toolkit = ResumeFilterToolkit(model_manager, major_library_path, school_library_path)
     
-    async def screen_resume(self, job_data: Dict, resume_data: Dict, resume_index: int = None, resume_file: str = "简历-多行表.json") -> ScreeningResult:
+    def build_profiles(self, resume_list: List[Dict]) -> List[ResumeProfile]:
+        """
+        为简历列表构建画像（加载简历后调用一次，结果传给每个岗位的 screen_batch 复用）
+        
+        Args:
+            resume_list: 简历列表
+        
+        Returns:
+            与 resume_list 一一对应的 ResumeProfile 列表
+        """
+        return self.toolkit.build_profiles(resume_list)
+    
+    def build_position_index(self, profiles: List[ResumeProfile]) -> PositionIndex:
+        """
+        构建应聘岗位倒排索引（加载简历后调用一次，所有岗位共用）
+        
+        Args:
+            profiles: 简历画像列表
+        
+        Returns:
+            PositionIndex
+        """
+        return PositionIndex(profiles)
+    
+    def build_rule_engine(self, profiles: List[ResumeProfile]) -> RuleEngine:
+        """
+        构建向量化规则引擎（加载简历后调用一次，所有岗位共用）
+        
+        Args:
+            profiles: 简历画像列表
+        
+        Returns:
+            RuleEngine
+        """
+        return self.toolkit.build_rule_engine(profiles)
+    
+    async def screen_resume(self, job_data: Dict, resume_data: Dict, resume_index: int = None, resume_file: str = "简历-多行表.json",
+                            profile: Optional[ResumeProfile] = None,
+                            llm_filters: Optional[List[str]] = None) -> ScreeningResult:
         """
         筛选单个简历（异步方法，支持并发）
         
@@ -62,6 +119,9 @@ class ResumeScreener:
             resume_data: 简历数据
             resume_index: 简历在列表中的索引（用于显示位置信息）
             resume_file: 简历文件名（用于显示位置信息）
+            profile: 简历画像，为None时现场构建
+            llm_filters: 不为None时，追加模型未初始化时请求了LLM判断的条件名称
+                         （只在逐份顺序筛选时准确，供分片工作进程使用）
         
         Returns:
             ScreeningResult
@@ -74,144 +134,27 @@ class ResumeScreener:
         start_time = time.time()
         logger.info(f"[并发] 🚀 开始筛选简历 {resume_id} 对岗位 {job_name} (线程ID: {id(asyncio.current_task())})")
         
+        if profile is None:
+            profile = self.toolkit.build_profile(resume_data, resume_index or 0)
+        
         # 提取简历关键信息用于显示
-        education_info = resume_data.get("学习经历统计信息", {})
-        resume_info = self._format_resume_info(resume_data, education_info, resume_index, resume_file)
+        resume_info = self._format_resume_info(profile, resume_index, resume_file)
         
-        # 执行所有筛选条件
+        # 依次执行所有筛选条件
         filter_results = []
-        
-        # 1. 学历要求
-        filter_start = time.time()
-        result1 = await self.toolkit.filter_education(job_data, resume_data)
-        logger.debug(f"[并发] 简历 {resume_id} - 学历要求完成，耗时 {time.time() - filter_start:.2f}秒")
-        method = result1.details.get("method", "规则匹配") if result1.details else "规则匹配"
-        filter_results.append({
-            "filter_name": "学历要求",
-            "passed": result1.passed,
-            "reason": result1.reason,
-            "source": result1.source,
-            "method": method,
-            "details": result1.details,
-            "resume_info": resume_info
-        })
-        
-        # 2. 专业要求
-        filter_start = time.time()
-        result2 = await self.toolkit.filter_major(job_data, resume_data)
-        logger.debug(f"[并发] 简历 {resume_id} - 专业要求完成，耗时 {time.time() - filter_start:.2f}秒")
-        method2 = result2.details.get("method", "规则匹配") if result2.details else "规则匹配"
-        filter_results.append({
-            "filter_name": "专业要求",
-            "passed": result2.passed,
-            "reason": result2.reason,
-            "source": result2.source,
-            "method": method2,
-            "details": result2.details,
-            "resume_info": resume_info
-        })
-        
-        # 3. 年龄要求
-        filter_start = time.time()
-        result3 = await self.toolkit.filter_age(job_data, resume_data)
-        logger.debug(f"[并发] 简历 {resume_id} - 年龄要求完成，耗时 {time.time() - filter_start:.2f}秒")
-        method3 = result3.details.get("method", "规则匹配") if result3.details else "规则匹配"
-        filter_results.append({
-            "filter_name": "年龄要求",
-            "passed": result3.passed,
-            "reason": result3.reason,
-            "source": result3.source,
-            "method": method3,
-            "details": result3.details,
-            "resume_info": resume_info
-        })
-        
-        # 4. 绩效要求（异步方法，支持并发LLM调用）
-        filter_start = time.time()
-        result4 = await self.toolkit.filter_performance(job_data, resume_data)
-        filter_time = time.time() - filter_start
-        logger.info(f"[并发] 简历 {resume_id} - 绩效要求完成，耗时 {_format_time(filter_time)} (方法: {result4.source})")
-        method4 = result4.details.get("method", result4.source) if result4.details else result4.source
-        filter_results.append({
-            "filter_name": "绩效要求",
-            "passed": result4.passed,
-            "reason": result4.reason,
-            "source": result4.source,
-            "method": method4,
-            "details": result4.details,
-            "resume_info": resume_info
-        })
-        
-        # 5. 工作经历
-        filter_start = time.time()
-        result5 = await self.toolkit.filter_work_experience(job_data, resume_data)
-        logger.debug(f"[并发] 简历 {resume_id} - 工作经历完成，耗时 {time.time() - filter_start:.2f}秒")
-        method5 = result5.details.get("method", "规则匹配") if result5.details else "规则匹配"
-        filter_results.append({
-            "filter_name": "工作经历",
-            "passed": result5.passed,
-            "reason": result5.reason,
-            "source": result5.source,
-            "method": method5,
-            "details": result5.details,
-            "resume_info": resume_info
-        })
-        
-        # 6. 工作经验
-        filter_start = time.time()
-        result6 = await self.toolkit.filter_work_years(job_data, resume_data)
-        logger.debug(f"[并发] 简历 {resume_id} - 工作经验完成，耗时 {time.time() - filter_start:.2f}秒")
-        method6 = result6.details.get("method", "规则匹配") if result6.details else "规则匹配"
-        filter_results.append({
-            "filter_name": "工作经验",
-            "passed": result6.passed,
-            "reason": result6.reason,
-            "source": result6.source,
-            "method": method6,
-            "details": result6.details,
-            "resume_info": resume_info
-        })
-        
-        # 7. 政治面貌
-        filter_start = time.time()
-        result7 = await self.toolkit.filter_political_status(job_data, resume_data)
-        logger.debug(f"[并发] 简历 {resume_id} - 政治面貌完成，耗时 {time.time() - filter_start:.2f}秒")
-        method7 = result7.details.get("method", "规则匹配") if result7.details else "规则匹配"
-        filter_results.append({
-            "filter_name": "政治面貌",
-            "passed": result7.passed,
-            "reason": result7.reason,
-            "source": result7.source,
-            "method": method7,
-            "details": result7.details,
-            "resume_info": resume_info
-        })
-        
-        # 8. 职称要求（异步方法，支持并发LLM调用）
-        filter_start = time.time()
-        result8 = await self.toolkit.filter_professional_title(job_data, resume_data)
-        filter_time = time.time() - filter_start
-        logger.info(f"[并发] 简历 {resume_id} - 职称要求完成，耗时 {_format_time(filter_time)} (方法: {result8.source})")
-        method8 = result8.details.get("method", result8.source) if result8.details else result8.source
-        filter_results.append({
-            "filter_name": "职称要求",
-            "passed": result8.passed,
-            "reason": result8.reason,
-            "source": result8.source,
-            "method": method8,
-            "details": result8.details,
-            "resume_info": resume_info
-        })
+        llm_calls = self.toolkit.llm_matcher.unavailable_calls
+        for step in FILTER_STEPS:
+            filter_results.append(await self._run_filter(step, job_data, resume_data, profile, resume_info))
+            if llm_filters is not None and self.toolkit.llm_matcher.unavailable_calls != llm_calls:
+                # 模型未初始化时该条件请求了LLM判断
+                llm_filters.append(step[0])
+                llm_calls = self.toolkit.llm_matcher.unavailable_calls
         
         # 判断是否通过（所有条件都必须通过）
         all_passed = all(r["passed"] for r in filter_results)
         
         # 生成总结
-        failed_filters = [r for r in filter_results if not r["passed"]]
-        if failed_filters:
-            summary = f"不通过。未通过条件：{', '.join([f['filter_name'] for f in failed_filters])}"
-        else:
-            summary = "通过。所有硬性条件均符合要求"
+        summary = self._build_summary([r["filter_name"] for r in filter_results if not r["passed"]])
         
         # 记录总耗时
         total_time = time.time() - start_time
@@ -223,10 +166,85 @@ class ResumeScreener:
             job_name=job_name,
             passed=all_passed,
             filter_details=filter_results,
-            summary=summary
+            summary=summary,
+            resume_index=resume_index
         )
     
-    async def screen_batch(self, job_data: Dict, resume_list: List[Dict], resume_file: str = "简历-多行表.json") -> List[ScreeningResult]:
+    async def _run_filter(self, step: Tuple[str, str, bool], job_data: Dict, resume_data: Dict,
+                          profile: ResumeProfile, resume_info: str) -> Dict:
+        """
+        执行一个筛选条件
+        
+        Args:
+            step: FILTER_STEPS 中的一项
+            job_data: 岗位数据
+            resume_data: 简历数据
+            profile: 简历画像
+            resume_info: 简历信息（写入筛选详情）
+        
+        Returns:
+            筛选详情字典
+        """
+        filter_name, method_name, method_from_source = step
+        filter_start = time.time()
+        result = await getattr(self.toolkit, method_name)(job_data, resume_data, profile)
+        filter_time = time.time() - filter_start
+        if method_from_source:
+            # 可能调用LLM的条件（异步方法，支持并发LLM调用）
+            logger.info(f"[并发] 简历 {profile.resume_id} - {filter_name}完成，耗时 {_format_time(filter_time)} (方法: {result.source})")
+            default_method = result.source
+        else:
+            logger.debug(f"[并发] 简历 {profile.resume_id} - {filter_name}完成，耗时 {filter_time:.2f}秒")
+            default_method = "规则匹配"
+        return {
+            "filter_name": filter_name,
+            "passed": result.passed,
+            "reason": result.reason,
+            "source": result.source,
+            "method": result.details.get("method", default_method) if result.details else default_method,
+            "details": result.details,
+            "resume_info": resume_info
+        }
+    
+    async def complete_llm_filters(self, job_data: Dict, resume_data: Dict, result: ScreeningResult,
+                                   llm_filters: List[str], profile: Optional[ResumeProfile] = None) -> ScreeningResult:
+        """
+        用当前的模型重新执行工作进程中请求了LLM判断的条件（其余条件的结果保留）
+        
+        Args:
+            job_data: 岗位数据
+            resume_data: 简历数据
+            result: 工作进程（未初始化模型）的筛选结果
+            llm_filters: 请求了LLM判断的条件名称
+            profile: 简历画像，为None时现场构建
+        
+        Returns:
+            ScreeningResult（当前也未初始化模型时原样返回）
+        """
+        if not llm_filters or self.toolkit.model_manager is None:
+            return result
+        if profile is None:
+            profile = self.toolkit.build_profile(resume_data, result.resume_index or 0)
+        
+        steps = {step[0]: step for step in FILTER_STEPS}
+        filter_results = list(result.filter_details)
+        for position, detail in enumerate(filter_results):
+            if detail["filter_name"] in llm_filters:
+                filter_results[position] = await self._run_filter(steps[detail["filter_name"]], job_data, resume_data,
+                                                                  profile, detail["resume_info"])
+        
+        failed_names = [r["filter_name"] for r in filter_results if not r["passed"]]
+        return dataclasses.replace(result, passed=not failed_names, filter_details=filter_results,
+                                   summary=self._build_summary(failed_names))
+    
+    async def screen_batch(self, job_data: Dict, resume_list: List[Dict], resume_file: str = "简历-多行表.json",
+                           profiles: Optional[List[ResumeProfile]] = None,
+                           position_index: Optional[PositionIndex] = None,
+                           rule_engine: Optional[RuleEngine] = None,
+                           render: Optional[Callable[[int, bool], bool]] = None,
+                           indices: Optional[List[int]] = None,
+                           on_result: Optional[Callable[[ScreeningResult], None]] = None,
+                           shard_pool: Optional[ShardPool] = None) -> List[ScreeningResult]:
         """
         批量筛选简历（只筛选应聘岗位匹配的简历，支持并发处理）
         
@@ -234,6 +252,14 @@ class ResumeScreener:
             job_data: 岗位数据
             resume_list: 简历列表
             resume_file: 简历文件名（用于显示位置信息）
+            profiles: 与 resume_list 一一对应的简历画像（由 build_profiles 预先构建），为None时现场构建
+            position_index: 应聘岗位倒排索引（由 build_position_index 预先构建），为None时现场构建
+            rule_engine: 向量化规则引擎（由 build_rule_engine 预先构建），岗位无需LLM时用它批量判断，为None时逐份筛选
+            render: 使用规则引擎时，判断某份简历（参数为简历位置和是否通过）是否立即生成详细原因说明，
+                    为None时只生成简要结果（输出前由 render_results 生成详细原因说明）
+            indices: 只筛选这些位置上的简历（仍需应聘岗位匹配），为None时筛选所有匹配的简历
+            on_result: 每份简历筛选完成时立即调用（如 NdjsonResultWriter.write），按完成顺序
+            shard_pool: 分片筛选进程池，不为None时规则判断在工作进程中执行，当前事件循环只调用LLM
         
         Returns:
             List[ScreeningResult]
@@ -242,22 +268,17 @@ class ResumeScreener:
         job_name = job_data.get('岗位', '')
         job_id = job_data.get('序号', 0)
         
-        # 筛选出应聘岗位匹配的简历
-        matched_resumes = []
-        for index, resume in enumerate(resume_list):
-            # 获取简历中的应聘岗位
-            job_info = resume.get('岗位信息', {})
-            applied_position = job_info.get('应聘岗位', '')
-            
-            # 记录每次匹配尝试的详细信息
-            logger.info(f"[匹配尝试] 岗位='{job_name}' vs 应聘岗位='{applied_position}' (简历序号: {resume.get('序号', '未知')})")
-            
-            # 检查是否匹配
-            if self._match_position(job_name, applied_position):
-                logger.info(f"✅ 岗位匹配：岗位='{job_name}' <-> 应聘岗位='{applied_position}' → 匹配")
-                matched_resumes.append((index, resume))
-            else:
-                logger.debug(f"❌ 岗位不匹配：岗位='{job_name}' <-> 应聘岗位='{applied_position}' → 不匹配")
+        if profiles is None:
+            profiles = self.build_profiles(resume_list)
+        
+        if position_index is None:
+            position_index = self.build_position_index(profiles)
+        
+        # 从倒排索引中取出应聘岗位匹配的简历（仅完全匹配）
+        matched_resumes = [(index, resume_list[index]) for index in position_index.candidates(job_name)]
+        if indices is not None:
+            selected = set(indices)
+            matched_resumes = [(index, resume) for index, resume in matched_resumes if index in selected]
         
         logger.info(f"岗位：{job_name}：找到 {len(matched_resumes)} 份匹配的简历（总简历数：{len(resume_list)}）")
         
@@ -265,6 +286,17 @@ class ResumeScreener:
         if not matched_resumes:
             return []
         
+        # 岗位所有条件都无需LLM时，使用规则引擎批量判断
+        if rule_engine is not None:
+            evaluation = rule_engine.evaluate(job_data, [index for index, _ in matched_resumes])
+            if evaluation is not None:
+                return await self._screen_batch_by_rules(job_data, resume_list, evaluation, profiles, resume_file,
+                                                         render, on_result)
+        
+        if shard_pool is not None:
+            return await self._screen_batch_sharded(job_data, resume_list, [index for index, _ in matched_resumes],
+                                                    profiles, resume_file, shard_pool, on_result)
+        
         # 记录并发开始时间
         batch_start_time = time.time()
         resume_ids = [str(resume.get("序号", "未知")) for _, resume in matched_resumes]
@@ -273,7 +305,7 @@ class ResumeScreener:
         # 使用 asyncio.gather 并发处理所有简历，并实时打印结果
         tasks = {
             asyncio.create_task(
-                self.screen_resume(job_data, resume, resume_index=index, resume_file=resume_file)
+                self.screen_resume(job_data, resume, resume_index=index, resume_file=resume_file, profile=profiles[index])
             ): (index, resume)
             for index, resume in matched_resumes
         }
@@ -287,30 +319,13 @@ class ResumeScreener:
             results.append(result)
             
             # 立即打印该简历的筛选结果
-            print(f"\n简历 {result.resume_id} - 岗位 {result.job_name}: {result.summary}")
-            for detail in result.filter_details:
-                status = "✅通过" if detail['passed'] else "❌不通过"
-                method = detail.get('method', detail['source'])
-                detail_info = detail.get('details', {})
-                
-                # 提取筛选详情
-                detail_text = ""
-                if isinstance(detail_info, dict):
-                    if 'detail' in detail_info:
-                        detail_text = detail_info['detail']
-                
-                # 输出格式
-                print(f"  {detail['filter_name']}: {status} [{method}]")
-                if detail_text:
-                    print(f"    筛选详情: {detail_text}")
-                else:
-                    print(f"    筛选详情: ")
-            print()  # 空行分隔
-        
-        # 按原始顺序排序结果（保持一致性）
-        results_dict = {r.resume_id: r for r in results}
-        results = [results_dict.get(str(resume.get("序号", "未知")), None) for _, resume in matched_resumes]
-        results = [r for r in results if r is not None]
+            self._print_result(result)
+            if on_result is not None:
+                on_result(result)
+        
+        # 按原始顺序排序结果（保持一致性，按简历位置对应，序号重复时也不会混淆）
+        results_dict = {r.resume_index: r for r in results}
+        results = [results_dict[index] for index, _ in matched_resumes]
         
         # 记录并发结束时间
         batch_time = time.time() - batch_start_time
@@ -319,56 +334,217 @@ class ResumeScreener:
         
         return list(results)
     
-    def _match_position(self, job_name: str, applied_position: str) -> bool:
+    async def _screen_batch_sharded(self, job_data: Dict, resume_list: List[Dict], indices: List[int],
+                                    profiles: Optional[List[ResumeProfile]], resume_file: str, shard_pool: ShardPool,
+                                    on_result: Optional[Callable[[ScreeningResult], None]] = None,
+                                    print_results: bool = True) -> List[ScreeningResult]:
         """
-        匹配岗位名称和应聘岗位（仅完全匹配，不进行包含匹配）
+        分片筛选：各分片在工作进程中完成规则判断，返回后由当前事件循环补全需要LLM的条件
         
         Args:
-            job_name: 岗位名称（来自岗位数据）
-            applied_position: 应聘岗位（来自简历数据）
+            job_data: 岗位数据
+            resume_list: 简历列表
+            indices: 要筛选的简历位置
+            profiles: 简历画像列表，为None时现场构建
+            resume_file: 简历文件名（用于显示位置信息）
+            shard_pool: 分片筛选进程池
+            on_result: 每份简历筛选完成时立即调用
+            print_results: 是否打印每份简历的筛选结果
         
         Returns:
-            是否匹配
+            List[ScreeningResult]（与 indices 顺序一致）
         """
-        # 去除首尾空格
-        job_name = job_name.strip() if job_name else ""
-        applied_position = applied_position.strip() if applied_position else ""
+        batch_start_time = time.time()
+        shards = shard_pool.shards(indices)
+        logger.info(f"[分片] 🧩 岗位 {job_data.get('岗位', '')}：{len(indices)} 份简历分为 {len(shards)} 个分片")
+        
+        async def screen_shard(shard: List[int]) -> List[ScreeningResult]:
+            shard_results = await shard_pool.screen_shard(job_data, shard, resume_file)
+            completed = await asyncio.gather(*[
+                self.complete_llm_filters(job_data, resume_list[result.resume_index], result, llm_filters,
+                                          profiles[result.resume_index] if profiles is not None else None)
+                for result, llm_filters in shard_results
+            ])
+            for result in completed:
+                if print_results:
+                    self._print_result(result)
+                if on_result is not None:
+                    on_result(result)
+            return completed
+        
+        parts = await asyncio.gather(*[screen_shard(shard) for shard in shards])
+        logger.info(f"[分片] 🎉 分片筛选完成！{len(indices)} 份简历总耗时 {_format_time(time.time() - batch_start_time)}")
+        return [result for part in parts for result in part]
+    
+    async def _screen_batch_by_rules(self, job_data: Dict, resume_list: List[Dict], evaluation: RuleEvaluation,
+                                     profiles: List[ResumeProfile], resume_file: str,
+                                     render: Optional[Callable[[int, bool], bool]] = None,
+                                     on_result: Optional[Callable[[ScreeningResult], None]] = None) -> List[ScreeningResult]:
+        """
+        根据规则引擎的判断结果生成筛选结果（只为 render 选中的简历立即生成详细原因说明）
         
-        # 如果任一为空，不匹配
-        if not job_name or not applied_position:
-            logger.debug(f"岗位匹配：岗位名称或应聘岗位为空，不匹配 (岗位='{job_name}', 应聘岗位='{applied_position}')")
-            return False
+        Args:
+            job_data: 岗位数据
+            resume_list: 简历列表
+            evaluation: 规则引擎的判断结果
+            profiles: 简历画像列表
+            resume_file: 简历文件名（用于显示位置信息）
+            render: 判断某份简历是否立即生成详细原因说明，为None时都只生成简要结果
+            on_result: 每份简历的结果生成后立即调用
         
-        # 完全匹配
-        matched = job_name == applied_position
+        Returns:
+            List[ScreeningResult]（按简历列表原始顺序）
+        """
+        batch_start_time = time.time()
+        passed = evaluation.passed
+        logger.info(f"[规则引擎] ⚡ 岗位 {job_data.get('岗位', '')} 批量判断 {len(evaluation.indices)} 份简历，通过 {int(passed.sum())} 份")
+        
+        results = []
+        for row, index in enumerate(evaluation.indices.tolist()):
+            if render is not None and render(index, bool(passed[row])):
+                # 规则判断无需LLM，逐份生成与逐份筛选完全一致的详细结果
+                result = await self.screen_resume(job_data, resume_list[index], resume_index=index,
+                                                  resume_file=resume_file, profile=profiles[index])
+            else:
+                result = self._build_rule_result(job_data, profiles[index], evaluation.codes[row], index, resume_file)
+            results.append(result)
+            self._print_result(result)
+            if on_result is not None:
+                on_result(result)
         
-        logger.debug(f"岗位匹配：岗位='{job_name}' vs 应聘岗位='{applied_position}' → {'匹配' if matched else '不匹配'}")
-        return matched
+        logger.info(f"[规则引擎] 🎉 批量筛选完成！{len(results)} 份简历总耗时 {_format_time(time.time() - batch_start_time)}")
+        return results
     
-    def _format_resume_info(self, resume_data: Dict, education_info: Dict, resume_index: int = None, resume_file: str = "简历-多行表.json") -> str:
+    async def render_results(self, job_data: Dict, results: List[ScreeningResult], resume_list: List[Dict],
+                             resume_file: str = "简历-多行表.json",
+                             profiles: Optional[List[ResumeProfile]] = None,
+                             shard_pool: Optional[ShardPool] = None) -> List[ScreeningResult]:
+        """
+        为规则引擎生成的简要结果生成详细原因说明（其余结果原样保留）
+        
+        简要结果的岗位所有条件都无需LLM，逐份筛选得到与不使用规则引擎时完全一致的结果，
+        只在结果需要输出（返回、导出、保存到结果库）时调用。
+        
+        Args:
+            job_data: 岗位数据
+            results: 该岗位的筛选结果列表
+            resume_list: 简历列表
+            resume_file: 简历文件名（用于显示位置信息）
+            profiles: 简历画像列表，为None时现场构建
+            shard_pool: 分片筛选进程池，不为None时在工作进程中生成
+        
+        Returns:
+            List[ScreeningResult]（与 results 顺序一致）
+        """
+        indices = [result.resume_index for result in results if self.is_rule_result(result)]
+        if not indices:
+            return results
+        
+        if shard_pool is not None:
+            rendered = await self._screen_batch_sharded(job_data, resume_list, indices, profiles, resume_file, shard_pool,
+                                                        print_results=False)
+        else:
+            rendered = [
+                await self.screen_resume(job_data, resume_list[index], resume_index=index, resume_file=resume_file,
+                                         profile=profiles[index] if profiles is not None else None)
+                for index in indices
+            ]
+        rendered_by_index = {result.resume_index: result for result in rendered}
+        return [rendered_by_index[result.resume_index] if self.is_rule_result(result) else result
+                for result in results]
+    
+    @staticmethod
+    def is_rule_result(result: ScreeningResult) -> bool:
+        """是否为规则引擎生成的简要结果（尚未生成详细原因说明）"""
+        return any(detail.get("method") == RULE_RESULT_METHOD for detail in result.filter_details)
+    
+    def _build_rule_result(self, job_data: Dict, profile: ResumeProfile, codes, resume_index: int,
+                           resume_file: str) -> ScreeningResult:
+        """
+        根据规则引擎的失败代码生成简要筛选结果（不生成详细原因说明）
+        
+        Args:
+            job_data: 岗位数据
+            profile: 简历画像
+            codes: 该简历各筛选条件的失败代码（与 FILTER_NAMES 对应）
+            resume_index: 简历在列表中的索引
+            resume_file: 简历文件名
+        
+        Returns:
+            ScreeningResult
+        """
+        resume_info = self._format_resume_info(profile, resume_index, resume_file)
+        filter_results = []
+        for filter_name, code in zip(FILTER_NAMES, codes.tolist()):
+            code = RuleCode(code)
+            filter_results.append({
+                "filter_name": filter_name,
+                "passed": code == RuleCode.PASSED,
+                "reason": RULE_CODE_REASONS[code],
+                "source": "rule",
+                "method": RULE_RESULT_METHOD,
+                "details": {"method": RULE_RESULT_METHOD, "code": int(code)},
+                "resume_info": resume_info
+            })
+        
+        failed_names = [r["filter_name"] for r in filter_results if not r["passed"]]
+        return ScreeningResult(
+            resume_id=profile.resume_id,
+            job_id=job_data.get("序号", 0),
+            job_name=job_data.get('岗位', ''),
+            passed=not failed_names,
+            filter_details=filter_results,
+            summary=self._build_summary(failed_names),
+            resume_index=resume_index
+        )
+    
+    @staticmethod
+    def _build_summary(failed_names: List[str]) -> str:
+        """根据未通过的条件名称生成总结"""
+        if failed_names:
+            return f"不通过。未通过条件：{', '.join(failed_names)}"
+        return "通过。所有硬性条件均符合要求"
+    
+    @staticmethod
+    def _print_result(result: ScreeningResult):
+        """打印单份简历的筛选结果"""
+        print(f"\n简历 {result.resume_id} - 岗位 {result.job_name}: {result.summary}")
+        for detail in result.filter_details:
+            status = "✅通过" if detail['passed'] else "❌不通过"
+            method = detail.get('method', detail['source'])
+            detail_info = detail.get('details', {})
+            
+            # 提取筛选详情
+            detail_text = ""
+            if isinstance(detail_info, dict):
+                if 'detail' in detail_info:
+                    detail_text = detail_info['detail']
+            
+            # 输出格式
+            print(f"  {detail['filter_name']}: {status} [{method}]")
+            if detail_text:
+                print(f"    筛选详情: {detail_text}")
+            else:
+                print(f"    筛选详情: ")
+        print()  # 空行分隔
+    
+    def _format_resume_info(self, profile: ResumeProfile, resume_index: int = None, resume_file: str = "简历-多行表.json") -> str:
         """
         格式化简历信息用于显示
         
         Args:
-            resume_data: 简历数据
-            education_info: 学习经历统计信息
+            profile: 简历画像
             resume_index: 简历索引
             resume_file: 简历文件名
         
         Returns:
             格式化的简历信息字符串
         """
-        resume_id = resume_data.get("序号", "未知")
-        basic_info = resume_data.get("基本信息", {})
-        name = basic_info.get("姓名", "未知")
-        highest_education = education_info.get("最高学历", "")
-        highest_school = education_info.get("最高学历毕业院校", "")
-        
-        info_parts = [f"序号={resume_id}", f"姓名={name}"]
-        if highest_education:
-            info_parts.append(f"学历={highest_education}")
-        if highest_school:
-            info_parts.append(f"学校={highest_school}")
+        info_parts = [f"序号={profile.resume_id}", f"姓名={profile.name or '未知'}"]
+        if profile.highest_education:
+            info_parts.append(f"学历={profile.highest_education}")
+        if profile.highest_school:
+            info_parts.append(f"学校={profile.highest_school}")
         
         if resume_index is not None:
             info_parts.append(f"位置=第{resume_index+1}条")
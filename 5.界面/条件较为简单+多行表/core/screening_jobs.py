@@ -0,0 +1,394 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+后台筛选任务模块
+
+提交筛选任务后立即返回任务ID，任务按提交顺序交给固定数量的工作协程执行；
+执行过程中的进度（阶段、已完成配对数、预计剩余时间、LLM 排队数）推送给订阅者
+（后端以 SSE 转发给浏览器）。任务状态保存在 SQLite 中：服务重启后，排队中和
+执行被中断的任务重新排队。筛选完成的配对每隔几秒（或每完成一批）写入配对结果缓存，
+重新执行时直接复用，只有中断前最后一批尚未写入的配对需要重新筛选。
+"""
+
+import asyncio
+import functools
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import Executor
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+from utils.logger_config import setup_logger
+
+logger = setup_logger("screening_jobs")
+
+# 任务状态
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_DONE = "done"
+JOB_FAILED = "failed"
+
+FINISHED_STATUSES = (JOB_DONE, JOB_FAILED)
+
+# 默认同时执行的任务数
+DEFAULT_MAX_WORKERS = 1
+
+# 进度写入数据库的最小间隔（秒），阶段变化和任务结束时立即写入
+PROGRESS_SAVE_SECONDS = 1.0
+
+# 订阅者在没有新进度时重发当前进度的间隔（秒），同时起到连接保活的作用
+SUBSCRIBE_REFRESH_SECONDS = 15.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS screening_jobs (
+    job_id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    params TEXT NOT NULL,
+    progress TEXT NOT NULL,
+    result TEXT,
+    error TEXT,
+    created REAL NOT NULL,
+    updated REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_screening_jobs_status ON screening_jobs (status, created);
+"""
+
+
+def _initial_progress() -> Dict:
+    return {"stage": "排队中", "done": 0, "total": None, "eta_seconds": None, "llm_in_flight": None}
+
+
+class ScreeningJobStore:
+    """筛选任务表（SQLite）"""
+
+    def __init__(self, db_path: str):
+        """
+        打开（或创建）任务库
+
+        Args:
+            db_path: 数据库文件路径
+        """
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(_SCHEMA)
+        # 读写都在线程池中执行，共用一个连接，依次执行
+        self._lock = threading.Lock()
+
+    def close(self):
+        """关闭数据库连接"""
+        self.conn.close()
+
+    def create(self, job_id: str, params: Dict):
+        """新建排队中的任务"""
+        now = time.time()
+        with self._lock, self.conn:
+            self.conn.execute(
+                "INSERT INTO screening_jobs (job_id, status, params, progress, created, updated) VALUES (?, ?, ?, ?, ?, ?)",
+                (job_id, JOB_QUEUED, json.dumps(params, ensure_ascii=False),
+                 json.dumps(_initial_progress(), ensure_ascii=False), now, now),
+            )
+
+    def update(self, job_id: str, status: Optional[str] = None, progress: Optional[Dict] = None,
+               result: Optional[Dict] = None, error: Optional[str] = None):
+        """更新任务状态、进度、结果或错误信息（为None的字段不修改）"""
+        fields = {"updated": time.time()}
+        if status is not None:
+            fields["status"] = status
+        if progress is not None:
+            fields["progress"] = json.dumps(progress, ensure_ascii=False)
+        if result is not None:
+            fields["result"] = json.dumps(result, ensure_ascii=False)
+        if error is not None:
+            fields["error"] = error
+        assignments = ", ".join(f"{name} = ?" for name in fields)
+        with self._lock, self.conn:
+            self.conn.execute(f"UPDATE screening_jobs SET {assignments} WHERE job_id = ?",
+                              (*fields.values(), job_id))
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        """读取任务，不存在时返回None"""
+        with self._lock:
+            row = self.conn.execute("SELECT * FROM screening_jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return self._to_dict(row) if row is not None else None
+
+    def list(self, limit: int = 20) -> List[Dict]:
+        """最近提交的任务"""
+        with self._lock:
+            rows = self.conn.execute("SELECT * FROM screening_jobs ORDER BY created DESC LIMIT ?",
+                                     (limit,)).fetchall()
+        return [self._to_dict(row) for row in rows]
+
+    def unfinished(self) -> List[Dict]:
+        """排队中和执行中的任务（按提交顺序）"""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT * FROM screening_jobs WHERE status IN (?, ?) ORDER BY created", (JOB_QUEUED, JOB_RUNNING)
+            ).fetchall()
+        return [self._to_dict(row) for row in rows]
+
+    @staticmethod
+    def _to_dict(row: sqlite3.Row) -> Dict:
+        return {
+            "job_id": row["job_id"],
+            "status": row["status"],
+            "params": json.loads(row["params"]),
+            "progress": json.loads(row["progress"]),
+            "result": json.loads(row["result"]) if row["result"] else None,
+            "error": row["error"],
+            "created": row["created"],
+            "updated": row["updated"],
+        }
+
+
+class JobReporter:
+    """一个任务的进度：由筛选流程调用，推送给订阅者并定期写入任务库（在线程池中写入）"""
+
+    def __init__(self, manager: "ScreeningJobManager", job_id: str):
+        self.manager = manager
+        self.job_id = job_id
+        self.progress = _initial_progress()
+        self._stage_started = time.monotonic()
+        self._last_saved = 0.0
+        self._saving: Optional[asyncio.Future] = None
+        self._save_again = False
+
+    def stage(self, name: str, total: Optional[int] = None):
+        """
+        进入新的阶段
+
+        Args:
+            name: 阶段名称（如"解析简历"、"筛选"）
+            total: 该阶段的工作量（如配对数），用于计算完成比例和预计剩余时间
+        """
+        self.progress.update(stage=name, done=0, total=total, eta_seconds=None)
+        self._stage_started = time.monotonic()
+        self._publish(save=True)
+
+    def advance(self, count: int = 1):
+        """当前阶段完成 count 个工作量（可作为 screen_batch 的 on_result 回调的一部分）"""
+        self.progress["done"] += count
+        done, total = self.progress["done"], self.progress["total"]
+        if total and done:
+            elapsed = time.monotonic() - self._stage_started
+            self.progress["eta_seconds"] = round(elapsed / done * max(total - done, 0), 1)
+        self._publish(save=False)
+
+    def _publish(self, save: bool):
+        self.progress["llm_in_flight"] = self.manager.llm_queue_depth()
+        now = time.monotonic()
+        if save or now - self._last_saved >= PROGRESS_SAVE_SECONDS:
+            self._save()
+            self._last_saved = now
+        self.manager.publish(self.job_id)
+
+    def _save(self):
+        """写入当前进度（不等待）；上一次写入尚未完成时，完成后再写入最新进度"""
+        if self._saving is not None and not self._saving.done():
+            self._save_again = True
+            return
+        self._saving = asyncio.ensure_future(self._write_progress())
+
+    async def _write_progress(self):
+        while True:
+            self._save_again = False
+            try:
+                await self.manager.run_store(self.manager.store.update, self.job_id, progress=dict(self.progress))
+            except Exception as e:
+                # 进度只用于展示，写入失败不影响筛选
+                logger.error(f"❌ 任务 {self.job_id} 的进度写入失败: {e}")
+            if not self._save_again:
+                return
+
+    async def drain(self):
+        """等待进度写入完成（任务结束时调用，避免旧的进度覆盖最终状态）"""
+        if self._saving is not None:
+            await self._saving
+
+
+class NullReporter:
+    """不报告进度（同步执行筛选时使用，接口与 JobReporter 相同）"""
+
+    def stage(self, name: str, total: Optional[int] = None):
+        pass
+
+    def advance(self, count: int = 1):
+        pass
+
+
+class ScreeningJobManager:
+    """筛选任务调度：固定数量的工作协程按提交顺序执行任务"""
+
+    def __init__(self, store: ScreeningJobStore,
+                 runner: Callable[[Dict, JobReporter], Awaitable[Dict]],
+                 max_workers: int = DEFAULT_MAX_WORKERS,
+                 llm_queue_depth: Optional[Callable[[], Optional[int]]] = None,
+                 executor: Optional[Executor] = None):
+        """
+        初始化任务调度
+
+        Args:
+            store: 任务库
+            runner: 执行一个任务的协程函数 runner(任务参数, 进度) -> 任务结果（可JSON序列化）
+            max_workers: 同时执行的任务数
+            llm_queue_depth: 返回当前已提交未完成的LLM请求数的函数（无LLM时返回None）
+            executor: 执行任务库读写的线程池，为None时使用事件循环的默认线程池
+        """
+        self.store = store
+        self.runner = runner
+        self.max_workers = max(1, max_workers)
+        self.llm_queue_depth = llm_queue_depth or (lambda: None)
+        self.executor = executor
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self._reporters: Dict[str, JobReporter] = {}
+        # 执行中的任务（状态和参数），查询时不需要读取任务库
+        self._running: Dict[str, Dict] = {}
+        self._subscribers: Dict[str, List[asyncio.Queue]] = {}
+
+    async def start(self):
+        """启动工作协程，并把上次未完成的任务重新排队"""
+        self._queue = asyncio.Queue()
+        for job in await self.run_store(self.store.unfinished):
+            if job["status"] == JOB_RUNNING:
+                logger.warning(f"⚠️ 任务 {job['job_id']} 在服务停止时未完成，重新排队")
+                await self.run_store(self.store.update, job["job_id"], status=JOB_QUEUED,
+                                     progress=_initial_progress())
+            self._queue.put_nowait(job["job_id"])
+        self._workers = [asyncio.create_task(self._work()) for _ in range(self.max_workers)]
+        logger.info(f"✅ 筛选任务队列已启动：{self.max_workers} 个工作协程，{self._queue.qsize()} 个任务排队")
+
+    async def stop(self):
+        """停止工作协程（执行中的任务保持执行中状态，下次启动时重新排队）"""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def submit(self, params: Dict, job_id: Optional[str] = None) -> str:
+        """
+        提交任务
+
+        Args:
+            params: 任务参数（可JSON序列化，交给 runner）
+            job_id: 任务ID，为None时自动生成
+
+        Returns:
+            任务ID
+        """
+        job_id = job_id or uuid.uuid4().hex
+        await self.run_store(self.store.create, job_id, params)
+        self._queue.put_nowait(job_id)
+        logger.info(f"📥 已提交筛选任务 {job_id}（排队 {self._queue.qsize()} 个）")
+        return job_id
+
+    async def run_store(self, func, *args, **kwargs):
+        """在线程池中执行任务库操作，不阻塞事件循环"""
+        return await asyncio.get_running_loop().run_in_executor(self.executor,
+                                                                functools.partial(func, *args, **kwargs))
+
+    def queued_count(self) -> int:
+        """排队等待执行的任务数"""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def list(self, limit: int = 20) -> List[Dict]:
+        """最近提交的任务（执行中的任务使用内存中的最新进度）"""
+        return [self._overlay(job) for job in await self.run_store(self.store.list, limit)]
+
+    async def snapshot(self, job_id: str) -> Optional[Dict]:
+        """
+        任务当前状态（执行中的任务直接使用内存中的状态和最新进度，不读取任务库）
+
+        Returns:
+            任务信息；不存在时返回None
+        """
+        job = self._running.get(job_id)
+        if job is not None:
+            return self._overlay(dict(job))
+        job = await self.run_store(self.store.get, job_id)
+        return self._overlay(job) if job is not None else None
+
+    def _overlay(self, job: Dict) -> Dict:
+        """执行中的任务换成内存中的最新进度"""
+        reporter = self._reporters.get(job["job_id"])
+        if reporter is not None:
+            job["progress"] = dict(reporter.progress)
+        return job
+
+    def publish(self, job_id: str):
+        """通知订阅者任务状态已变化"""
+        for queue in self._subscribers.get(job_id, []):
+            queue.put_nowait(True)
+
+    async def subscribe(self, job_id: str) -> AsyncIterator[Dict]:
+        """
+        订阅任务进度：先返回当前状态，之后每次变化返回最新状态，任务结束后停止
+
+        Yields:
+            snapshot 的结果
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        self._subscribers.setdefault(job_id, []).append(queue)
+        try:
+            while True:
+                job = await self.snapshot(job_id)
+                if job is None:
+                    return
+                yield job
+                if job["status"] in FINISHED_STATUSES:
+                    return
+                try:
+                    await asyncio.wait_for(queue.get(), SUBSCRIBE_REFRESH_SECONDS)
+                except asyncio.TimeoutError:
+                    continue
+                # 合并积压的通知，只推送最新状态
+                while not queue.empty():
+                    queue.get_nowait()
+        finally:
+            subscribers = self._subscribers.get(job_id, [])
+            if queue in subscribers:
+                subscribers.remove(queue)
+            if not subscribers:
+                self._subscribers.pop(job_id, None)
+
+    async def _work(self):
+        while True:
+            job_id = await self._queue.get()
+            try:
+                await self._run(job_id)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job_id: str):
+        job = await self.run_store(self.store.get, job_id)
+        if job is None or job["status"] in FINISHED_STATUSES:
+            return
+        reporter = JobReporter(self, job_id)
+        self._reporters[job_id] = reporter
+        await self.run_store(self.store.update, job_id, status=JOB_RUNNING)
+        job.update(status=JOB_RUNNING, updated=time.time())
+        self._running[job_id] = job
+        logger.info(f"▶️ 开始执行筛选任务 {job_id}")
+        try:
+            result = await self.runner(job["params"], reporter)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            message = getattr(e, "detail", None) or str(e)
+            logger.error(f"❌ 筛选任务 {job_id} 失败: {message}")
+            reporter.progress["eta_seconds"] = None
+            await reporter.drain()
+            await self.run_store(self.store.update, job_id, status=JOB_FAILED, progress=reporter.progress,
+                                 error=str(message))
+        else:
+            reporter.progress.update(stage="完成", eta_seconds=None)
+            await reporter.drain()
+            await self.run_store(self.store.update, job_id, status=JOB_DONE, progress=reporter.progress,
+                                 result=result)
+            logger.info(f"✅ 筛选任务 {job_id} 完成")
+        finally:
+            self._running.pop(job_id, None)
+            self._reporters.pop(job_id, None)
+            self.publish(job_id)
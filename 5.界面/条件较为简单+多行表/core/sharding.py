@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+分片并行筛选模块
+
+把一个岗位的候选简历切分为分片，交给 ProcessPoolExecutor 的多个进程执行规则判断。
+每个工作进程启动时加载一次专业库、院校库和简历列表，之后只接收岗位数据和简历位置。
+
+工作进程不创建模型管理器：逐份筛选时请求了LLM判断的条件会被记录下来，
+由主进程的事件循环只对这些条件调用LLM（见 ResumeScreener.complete_llm_filters），
+保证LLM的并发数和限流在全局生效，规则判断则不占用主进程。
+"""
+
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from core.models import ResumeProfile, ScreeningResult
+from utils.logger_config import setup_logger
+
+logger = setup_logger("sharding")
+
+# 每个分片包含的简历数
+DEFAULT_SHARD_SIZE = 200
+
+# 工作进程内的全局状态（由 _init_worker 初始化，每个进程一份）
+_worker_screener = None
+_worker_resumes: List[Dict] = []
+_worker_profiles: Dict[int, ResumeProfile] = {}
+
+
+def _init_worker(major_library_path: Optional[str], school_library_path: Optional[str], resume_list: List[Dict]):
+    """
+    工作进程初始化：加载专业库和院校库，保存简历列表
+
+    Args:
+        major_library_path: 专业库.json文件路径
+        school_library_path: 院校库.json文件路径
+        resume_list: 简历列表
+    """
+    global _worker_screener, _worker_resumes, _worker_profiles
+    from core.screener import ResumeScreener
+
+    # 工作进程只执行规则判断，不创建模型管理器
+    _worker_screener = ResumeScreener(None, major_library_path, school_library_path)
+    _worker_resumes = resume_list
+    _worker_profiles = {}
+
+
+def _screen_shard(job_data: Dict, indices: List[int], resume_file: str) -> List[Tuple[ScreeningResult, List[str]]]:
+    """
+    在工作进程中筛选一个分片（不调用LLM）
+
+    Args:
+        job_data: 岗位数据
+        indices: 分片中简历在简历列表中的位置
+        resume_file: 简历文件名（用于显示位置信息）
+
+    Returns:
+        (ScreeningResult, 请求了LLM判断的条件名称列表) 列表（与 indices 顺序一致）
+    """
+    async def run() -> List[Tuple[ScreeningResult, List[str]]]:
+        results = []
+        for index in indices:
+            profile = _worker_profiles.get(index)
+            if profile is None:
+                profile = _worker_screener.toolkit.build_profile(_worker_resumes[index], index)
+                _worker_profiles[index] = profile
+            llm_filters: List[str] = []
+            result = await _worker_screener.screen_resume(job_data, _worker_resumes[index], resume_index=index,
+                                                          resume_file=resume_file, profile=profile,
+                                                          llm_filters=llm_filters)
+            results.append((result, llm_filters))
+        return results
+
+    return asyncio.run(run())
+
+
+def split_shards(indices: List[int], shard_size: int) -> List[List[int]]:
+    """把简历位置列表按 shard_size 切分为分片"""
+    return [indices[start:start + shard_size] for start in range(0, len(indices), shard_size)]
+
+
+class ShardPool:
+    """分片筛选进程池（一次筛选创建一个，工作进程持有该次筛选的简历列表）"""
+
+    def __init__(self, screener, resume_list: List[Dict], max_workers: Optional[int] = None,
+                 shard_size: int = DEFAULT_SHARD_SIZE):
+        """
+        创建进程池
+
+        Args:
+            screener: 主进程的 ResumeScreener（提供专业库和院校库路径）
+            resume_list: 简历列表
+            max_workers: 工作进程数，为None时使用CPU核数
+            shard_size: 每个分片包含的简历数
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.shard_size = shard_size
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            initializer=_init_worker,
+            initargs=(screener.major_library_path, screener.school_library_path, resume_list),
+        )
+        logger.info(f"[分片] 🧩 已创建 {self.max_workers} 个筛选进程，每个分片 {shard_size} 份简历")
+
+    def shards(self, indices: List[int]) -> List[List[int]]:
+        """把简历位置列表切分为分片"""
+        return split_shards(indices, self.shard_size)
+
+    async def screen_shard(self, job_data: Dict, indices: List[int],
+                           resume_file: str) -> List[Tuple[ScreeningResult, List[str]]]:
+        """
+        在工作进程中筛选一个分片（不阻塞事件循环）
+
+        Args:
+            job_data: 岗位数据
+            indices: 分片中简历在简历列表中的位置
+            resume_file: 简历文件名（用于显示位置信息）
+
+        Returns:
+            (ScreeningResult, 请求了LLM判断的条件名称列表) 列表（与 indices 顺序一致）
+        """
+        return await asyncio.get_running_loop().run_in_executor(self.executor, _screen_shard,
+                                                                job_data, indices, resume_file)
+
+    def close(self):
+        """关闭进程池（不等待未开始的分片）"""
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -4,8 +4,10 @@
 筛选工具箱模块
 """
 
-from typing import Dict, Optional
-from core.models import FilterResult
+from typing import Dict, List, Optional
+from core.models import FilterResult, ResumeProfile
+from core.profile import build_resume_profile, build_resume_profiles
+from core.rule_engine import RuleEngine
 from filters.education import EducationFilter
 from filters.major import MajorFilter
 from filters.age import AgeFilter
@@ -50,34 +52,46 @@ class ResumeFilterToolkit:
         self.work_years_filter = WorkYearsFilter(model_manager, self.rule_matcher, self.llm_matcher)
         self.political_status_filter = PoliticalStatusFilter(model_manager, self.rule_matcher, self.llm_matcher)
     
-    async def filter_education(self, job_data: Dict, resume_data: Dict) -> FilterResult:
+    def build_profile(self, resume_data: Dict, index: int = 0) -> ResumeProfile:
+        """构建单份简历的画像（使用工具箱的专业库和院校库）"""
+        return build_resume_profile(resume_data, index, self.major_library, self.rule_matcher)
+    
+    def build_profiles(self, resume_list: List[Dict]) -> List[ResumeProfile]:
+        """批量构建简历画像（与简历列表一一对应，加载简历后调用一次即可供所有岗位复用）"""
+        return build_resume_profiles(resume_list, self.major_library, self.rule_matcher)
+    
+    def build_rule_engine(self, profiles: List[ResumeProfile]) -> RuleEngine:
+        """构建向量化规则引擎（使用工具箱的匹配器判断院校库和LLM是否可用）"""
+        return RuleEngine(profiles, self.rule_matcher, self.llm_matcher, self.age_filter, self.major_library)
+    
+    async def filter_education(self, job_data: Dict, resume_data: Dict, profile: Optional[ResumeProfile] = None) -> FilterResult:
         """筛选：学历要求"""
-        return await self.education_filter.filter(job_data, resume_data)
+        return await self.education_filter.filter(job_data, resume_data, profile)
     
-    async def filter_major(self, job_data: Dict, resume_data: Dict) -> FilterResult:
+    async def filter_major(self, job_data: Dict, resume_data: Dict, profile: Optional[ResumeProfile] = None) -> FilterResult:
         """筛选：专业要求"""
-        return await self.major_filter.filter(job_data, resume_data)
+        return await self.major_filter.filter(job_data, resume_data, profile)
     
-    async def filter_age(self, job_data: Dict, resume_data: Dict) -> FilterResult:
+    async def filter_age(self, job_data: Dict, resume_data: Dict, profile: Optional[ResumeProfile] = None) -> FilterResult:
         """筛选：年龄要求"""
-        return await self.age_filter.filter(job_data, resume_data)
+        return await self.age_filter.filter(job_data, resume_data, profile)
     
-    async def filter_performance(self, job_data: Dict, resume_data: Dict) -> FilterResult:
+    async def filter_performance(self, job_data: Dict, resume_data: Dict, profile: Optional[ResumeProfile] = None) -> FilterResult:
         """筛选：绩效要求"""
-        return await self.performance_filter.filter(job_data, resume_data)
+        return await self.performance_filter.filter(job_data, resume_data, profile)
     
-    async def filter_work_experience(self, job_data: Dict, resume_data: Dict) -> FilterResult:
+    async def filter_work_experience(self, job_data: Dict, resume_data: Dict, profile: Optional[ResumeProfile] = None) -> FilterResult:
         """筛选：工作经历要求"""
-        return await self.work_experience_filter.filter(job_data, resume_data)
+        return await self.work_experience_filter.filter(job_data, resume_data, profile)
     
-    async def filter_work_years(self, job_data: Dict, resume_data: Dict) -> FilterResult:
+    async def filter_work_years(self, job_data: Dict, resume_data: Dict, profile: Optional[ResumeProfile] = None) -> FilterResult:
         """筛选：工作经验要求"""
-        return await self.work_years_filter.filter(job_data, resume_data)
+        return await self.work_years_filter.filter(job_data, resume_data, profile)
     
-    async def filter_political_status(self, job_data: Dict, resume_data: Dict) -> FilterResult:
+    async def filter_political_status(self, job_data: Dict, resume_data: Dict, profile: Optional[ResumeProfile] = None) -> FilterResult:
         """筛选：政治面貌要求"""
-        return await self.political_status_filter.filter(job_data, resume_data)
+        return await self.political_status_filter.filter(job_data, resume_data, profile)
     
-    async def filter_professional_title(self, job_data: Dict, resume_data: Dict) -> FilterResult:
+    async def filter_professional_title(self, job_data: Dict, resume_data: Dict, profile: Optional[ResumeProfile] = None) -> FilterResult:
         """筛选：职称要求"""
-        return await self.title_filter.filter(job_data, resume_data)
+        return await self.title_filter.filter(job_data, resume_data, profile)
@@ -0,0 +1,401 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+筛选工作队列模块（SQLite）
+
+协调者把（岗位, 简历分片）写入一个 SQLite 数据库文件，任意节点上的
+工作者通过共享的数据库文件租用工作单元、筛选并写回结果。工作者处理
+工作单元期间由单独的线程定期续租（不依赖筛选让出事件循环），租约超时
+（工作者崩溃）的工作单元会被重新分配；租用次数达到上限的工作单元标记为
+失败，不再重试。全部完成后合并结果，交给 export_screening_results 导出。
+"""
+
+import asyncio
+import dataclasses
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from core.models import ScreeningResult
+from core.sharding import DEFAULT_SHARD_SIZE, split_shards
+from utils.logger_config import setup_logger
+
+logger = setup_logger("work_queue")
+
+# 默认租约时长（秒），超时未完成的工作单元会被其他工作者重新租用
+DEFAULT_LEASE_SECONDS = 600
+
+# 没有可租用的工作单元但其他工作者仍持有租约时的等待间隔（秒）
+DEFAULT_POLL_SECONDS = 5
+
+# 处理工作单元期间每隔租约时长的这一比例续租一次
+HEARTBEAT_FRACTION = 1 / 3
+
+# 工作单元最多被租用的次数，租约再次过期（工作者反复崩溃）后标记为失败
+DEFAULT_MAX_ATTEMPTS = 3
+
+# 工作单元状态
+STATUS_PENDING = "pending"
+STATUS_LEASED = "leased"
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS jobs (
+    job_index INTEGER PRIMARY KEY,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS resumes (
+    resume_index INTEGER PRIMARY KEY,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS units (
+    unit_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_index INTEGER NOT NULL,
+    resume_indices TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    worker TEXT,
+    lease_expires REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    results TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_units_status ON units (status, lease_expires);
+"""
+
+
+class QueueNotEmptyError(Exception):
+    """队列中已有工作单元（重复写入会使结果重复）"""
+
+
+def default_worker_id() -> str:
+    """默认工作者标识：主机名-进程号"""
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+class WorkQueue:
+    """基于 SQLite 的筛选工作队列（可放在共享目录中供多个节点使用）"""
+
+    def __init__(self, db_path: str):
+        """
+        打开（或创建）工作队列数据库
+
+        Args:
+            db_path: 数据库文件路径
+        """
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path, timeout=30, isolation_level=None)
+        self.conn.execute("PRAGMA busy_timeout = 30000")
+        self.conn.executescript(_SCHEMA)
+
+    def close(self):
+        """关闭数据库连接"""
+        self.conn.close()
+
+    def set_meta(self, key: str, value: str):
+        """保存元数据（如简历文件名）"""
+        self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def get_meta(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        """读取元数据"""
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else default
+
+    def enqueue(self, jobs: List[Dict], resume_list: List[Dict], units: List[Tuple[int, List[int]]],
+                reset: bool = False):
+        """
+        写入岗位、简历和工作单元（一个事务内完成）
+
+        Args:
+            jobs: 岗位列表
+            resume_list: 简历列表
+            units: (岗位位置, 简历位置列表) 工作单元列表
+            reset: 是否先清空队列中已有的岗位、简历、工作单元和结果
+
+        Raises:
+            QueueNotEmptyError: 队列中已有工作单元且 reset 为False
+        """
+        with self._transaction():
+            if reset:
+                self.conn.execute("DELETE FROM units")
+                self.conn.execute("DELETE FROM jobs")
+                self.conn.execute("DELETE FROM resumes")
+            else:
+                existing = self.conn.execute("SELECT COUNT(*) FROM units").fetchone()[0]
+                if existing:
+                    raise QueueNotEmptyError(f"队列中已有 {existing} 个工作单元，重新写入前需要清空队列")
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO jobs (job_index, data) VALUES (?, ?)",
+                ((index, json.dumps(job, ensure_ascii=False)) for index, job in enumerate(jobs)),
+            )
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO resumes (resume_index, data) VALUES (?, ?)",
+                ((index, json.dumps(resume, ensure_ascii=False)) for index, resume in enumerate(resume_list)),
+            )
+            self.conn.executemany(
+                "INSERT INTO units (job_index, resume_indices) VALUES (?, ?)",
+                ((job_index, json.dumps(indices)) for job_index, indices in units),
+            )
+        logger.info(f"[队列] 📥 已写入 {len(jobs)} 个岗位、{len(resume_list)} 份简历、{len(units)} 个工作单元")
+
+    def load_jobs(self) -> List[Dict]:
+        """读取岗位列表"""
+        return [json.loads(row[0]) for row in self.conn.execute("SELECT data FROM jobs ORDER BY job_index")]
+
+    def load_resumes(self) -> List[Dict]:
+        """读取简历列表"""
+        return [json.loads(row[0]) for row in self.conn.execute("SELECT data FROM resumes ORDER BY resume_index")]
+
+    def lease(self, worker_id: str, lease_seconds: float = DEFAULT_LEASE_SECONDS,
+              max_attempts: int = DEFAULT_MAX_ATTEMPTS) -> Optional[Tuple[int, int, List[int]]]:
+        """
+        租用一个工作单元（待处理或租约已过期的单元）
+
+        租约已过期且已被租用 max_attempts 次的工作单元（每次处理都使工作者崩溃）标记为失败。
+
+        Args:
+            worker_id: 工作者标识
+            lease_seconds: 租约时长（秒）
+            max_attempts: 工作单元最多被租用的次数
+
+        Returns:
+            (工作单元ID, 岗位位置, 简历位置列表)，没有可租用的单元时返回None
+        """
+        now = time.time()
+        with self._transaction():
+            failed = self.conn.execute(
+                "UPDATE units SET status = ?, lease_expires = NULL "
+                "WHERE status = ? AND lease_expires < ? AND attempts >= ?",
+                (STATUS_FAILED, STATUS_LEASED, now, max_attempts),
+            ).rowcount
+            if failed:
+                logger.error(f"[队列] ❌ {failed} 个工作单元已被租用 {max_attempts} 次仍未完成，标记为失败")
+            row = self.conn.execute(
+                "SELECT unit_id, job_index, resume_indices FROM units "
+                "WHERE status = ? OR (status = ? AND lease_expires < ?) ORDER BY unit_id LIMIT 1",
+                (STATUS_PENDING, STATUS_LEASED, now),
+            ).fetchone()
+            if row is None:
+                return None
+            self.conn.execute(
+                "UPDATE units SET status = ?, worker = ?, lease_expires = ?, attempts = attempts + 1 WHERE unit_id = ?",
+                (STATUS_LEASED, worker_id, now + lease_seconds, row[0]),
+            )
+        return row[0], row[1], json.loads(row[2])
+
+    def renew(self, unit_id: int, worker_id: str, lease_seconds: float = DEFAULT_LEASE_SECONDS) -> bool:
+        """
+        续租工作单元（处理期间定期调用，避免处理时间超过租约时长时被其他工作者接管）
+
+        Args:
+            unit_id: 工作单元ID
+            worker_id: 工作者标识
+            lease_seconds: 从现在起的租约时长（秒）
+
+        Returns:
+            是否续租成功（租约已被其他工作者接管时为False）
+        """
+        with self._transaction():
+            cursor = self.conn.execute(
+                "UPDATE units SET lease_expires = ? WHERE unit_id = ? AND worker = ? AND status = ?",
+                (time.time() + lease_seconds, unit_id, worker_id, STATUS_LEASED),
+            )
+        return cursor.rowcount > 0
+
+    def complete(self, unit_id: int, worker_id: str, results: List[ScreeningResult]) -> bool:
+        """
+        写回工作单元的筛选结果（租约已被其他工作者接管时忽略）
+
+        Args:
+            unit_id: 工作单元ID
+            worker_id: 工作者标识
+            results: 筛选结果列表
+
+        Returns:
+            是否写入成功
+        """
+        payload = json.dumps([dataclasses.asdict(result) for result in results], ensure_ascii=False)
+        with self._transaction():
+            cursor = self.conn.execute(
+                "UPDATE units SET status = ?, results = ?, lease_expires = NULL "
+                "WHERE unit_id = ? AND worker = ? AND status = ?",
+                (STATUS_DONE, payload, unit_id, worker_id, STATUS_LEASED),
+            )
+        if cursor.rowcount == 0:
+            logger.warning(f"[队列] ⚠️ 工作单元 {unit_id} 的租约已被接管，丢弃 {worker_id} 的结果")
+            return False
+        return True
+
+    def progress(self) -> Dict[str, int]:
+        """各状态的工作单元数"""
+        counts = {STATUS_PENDING: 0, STATUS_LEASED: 0, STATUS_DONE: 0, STATUS_FAILED: 0}
+        for status, count in self.conn.execute("SELECT status, COUNT(*) FROM units GROUP BY status"):
+            counts[status] = count
+        return counts
+
+    def is_finished(self) -> bool:
+        """是否所有工作单元都已结束（完成或失败）"""
+        progress = self.progress()
+        return progress[STATUS_PENDING] == 0 and progress[STATUS_LEASED] == 0
+
+    def merge_results(self) -> List[ScreeningResult]:
+        """
+        合并所有已完成工作单元的结果（按岗位和工作单元顺序）
+
+        Returns:
+            List[ScreeningResult]
+        """
+        all_results = []
+        rows = self.conn.execute(
+            "SELECT results FROM units WHERE status = ? ORDER BY job_index, unit_id", (STATUS_DONE,)
+        )
+        for (payload,) in rows:
+            all_results.extend(ScreeningResult(**item) for item in json.loads(payload))
+        return all_results
+
+    def _transaction(self):
+        """立即获取写锁的事务（多个工作者同时租用时互斥）"""
+        return _ImmediateTransaction(self.conn)
+
+
+class _ImmediateTransaction:
+    """BEGIN IMMEDIATE ... COMMIT/ROLLBACK 上下文管理器"""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+    def __enter__(self):
+        self.conn.execute("BEGIN IMMEDIATE")
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb):
+        self.conn.execute("ROLLBACK" if exc_type else "COMMIT")
+        return False
+
+
+def enqueue_screening(queue: WorkQueue, screener, jobs: List[Dict], resume_list: List[Dict],
+                      resume_file: str = "简历-多行表.json", shard_size: int = DEFAULT_SHARD_SIZE,
+                      reset: bool = False) -> int:
+    """
+    协调者：按应聘岗位把（岗位, 简历分片）写入工作队列
+
+    Args:
+        queue: 工作队列
+        screener: ResumeScreener（用于构建应聘岗位索引）
+        jobs: 岗位列表
+        resume_list: 简历列表
+        resume_file: 简历文件名（用于显示位置信息）
+        shard_size: 每个工作单元包含的简历数
+        reset: 是否先清空队列中已有的工作单元和结果
+
+    Returns:
+        工作单元数
+
+    Raises:
+        QueueNotEmptyError: 队列中已有工作单元且 reset 为False
+    """
+    position_index = screener.build_position_index(screener.build_profiles(resume_list))
+    units = []
+    for job_index, job in enumerate(jobs):
+        for shard in split_shards(position_index.candidates(job.get('岗位', '')), shard_size):
+            units.append((job_index, shard))
+
+    queue.enqueue(jobs, resume_list, units, reset=reset)
+    queue.set_meta("resume_file", resume_file)
+    return len(units)
+
+
+class _LeaseHeartbeat:
+    """
+    处理工作单元期间在单独的线程中定期续租（使用自己的数据库连接）
+
+    规则筛选不会让出事件循环，续租放在线程中才能在处理期间按时执行。
+    """
+
+    def __init__(self, db_path: str, unit_id: int, worker_id: str, lease_seconds: float):
+        self.db_path = db_path
+        self.unit_id = unit_id
+        self.worker_id = worker_id
+        self.lease_seconds = lease_seconds
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"lease-{unit_id}", daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._stopped.set()
+        self._thread.join()
+        return False
+
+    def _run(self):
+        queue = WorkQueue(self.db_path)
+        try:
+            while not self._stopped.wait(self.lease_seconds * HEARTBEAT_FRACTION):
+                if not queue.renew(self.unit_id, self.worker_id, self.lease_seconds):
+                    logger.warning(f"[队列] ⚠️ 工作单元 {self.unit_id} 的租约已被接管，{self.worker_id} 停止续租")
+                    return
+        except sqlite3.Error as e:
+            logger.error(f"[队列] ❌ 工作单元 {self.unit_id} 续租失败：{e}")
+        finally:
+            queue.close()
+
+
+async def run_worker(queue: WorkQueue, screener, worker_id: Optional[str] = None,
+                     lease_seconds: float = DEFAULT_LEASE_SECONDS,
+                     poll_seconds: float = DEFAULT_POLL_SECONDS,
+                     max_attempts: int = DEFAULT_MAX_ATTEMPTS) -> int:
+    """
+    工作者：循环租用工作单元并筛选，直到所有工作单元都已完成
+
+    Args:
+        queue: 工作队列
+        screener: ResumeScreener（可带模型管理器）
+        worker_id: 工作者标识，为None时使用 主机名-进程号
+        lease_seconds: 租约时长（秒），处理期间每隔 lease_seconds * HEARTBEAT_FRACTION 续租一次
+        poll_seconds: 其他工作者仍持有租约时的等待间隔（秒）
+        max_attempts: 工作单元最多被租用的次数，超过后标记为失败
+
+    Returns:
+        本工作者完成的工作单元数
+    """
+    worker_id = worker_id or default_worker_id()
+    jobs = queue.load_jobs()
+    resume_list = queue.load_resumes()
+    resume_file = queue.get_meta("resume_file", "简历-多行表.json")
+    profiles = {}
+
+    completed = 0
+    while True:
+        unit = queue.lease(worker_id, lease_seconds, max_attempts)
+        if unit is None:
+            if queue.is_finished():
+                break
+            # 其他工作者仍持有租约：等待其完成，或租约过期后接管
+            await asyncio.sleep(poll_seconds)
+            continue
+        unit_id, job_index, indices = unit
+        logger.info(f"[队列] 🔧 {worker_id} 租用工作单元 {unit_id}：岗位 {jobs[job_index].get('岗位', '')}，{len(indices)} 份简历")
+
+        for index in indices:
+            if index not in profiles:
+                profiles[index] = screener.toolkit.build_profile(resume_list[index], index)
+        with _LeaseHeartbeat(queue.db_path, unit_id, worker_id, lease_seconds):
+            results = await asyncio.gather(*[
+                screener.screen_resume(jobs[job_index], resume_list[index], resume_index=index,
+                                       resume_file=resume_file, profile=profiles[index])
+                for index in indices
+            ])
+        if queue.complete(unit_id, worker_id, list(results)):
+            completed += 1
+
+    logger.info(f"[队列] ✅ 所有工作单元已完成，{worker_id} 共完成 {completed} 个")
+    return completed
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+多节点筛选（协调者/工作者模式）
+
+用法：
+    # 协调者：把岗位和简历切分为工作单元写入队列数据库（放在各节点都能访问的共享目录）
+    python distributed_screen.py coordinator --db 队列.db --jobs 岗位.json --resumes 简历.json
+    # 队列中已有工作单元时拒绝写入，加 --reset 清空已有的工作单元和结果后重新写入
+
+    # 工作者：在任意节点上启动一个或多个，租用工作单元并写回结果
+    python distributed_screen.py worker --db 队列.db
+
+    # 合并：所有工作单元完成后导出筛选结果
+    python distributed_screen.py merge --db 队列.db --output 筛选结果.json [--store 筛选结果.db]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+
+# 添加当前目录到路径
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from core.screener import ResumeScreener
+from core.sharding import DEFAULT_SHARD_SIZE
+from core.work_queue import (DEFAULT_LEASE_SECONDS, DEFAULT_MAX_ATTEMPTS, STATUS_FAILED, QueueNotEmptyError,
+                             WorkQueue, enqueue_screening, run_worker)
+from exporters.result_exporter import export_screening_results
+from exporters.result_store import ResultStore
+from utils.data_loader import load_job_data, load_resume_data
+from utils.logger_config import setup_logger
+
+logger = setup_logger("distributed_screen")
+
+# 专业库和院校库路径（使用当前目录下的 data 目录）
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+MAJOR_LIBRARY_PATH = os.path.join(DATA_DIR, "专业库.json")
+SCHOOL_LIBRARY_PATH = os.path.join(DATA_DIR, "院校库.json")
+
+
+def create_screener(use_llm: bool = True) -> ResumeScreener:
+    """创建筛选器（use_llm 为True时加载模型管理器）"""
+    model_manager = None
+    if use_llm:
+        from managers.llm_manager import get_model_manager
+        model_manager = get_model_manager()
+        if not model_manager:
+            logger.warning("模型管理器未初始化，LLM筛选功能不可用")
+    return ResumeScreener(model_manager=model_manager, major_library_path=MAJOR_LIBRARY_PATH,
+                          school_library_path=SCHOOL_LIBRARY_PATH)
+
+
+def run_coordinator(args):
+    """协调者：写入工作单元"""
+    jobs = load_job_data(args.jobs)
+    resumes = load_resume_data(args.resumes)
+    queue = WorkQueue(args.db)
+    try:
+        unit_count = enqueue_screening(queue, create_screener(use_llm=False), jobs, resumes,
+                                       resume_file=os.path.basename(args.resumes), shard_size=args.shard_size,
+                                       reset=args.reset)
+    except QueueNotEmptyError as e:
+        print(f"❌ {e}（使用 --reset 清空已有的工作单元和结果后重新写入）")
+        sys.exit(1)
+    finally:
+        queue.close()
+    print(f"✅ 已写入 {unit_count} 个工作单元：{args.db}")
+
+
+def run_worker_command(args):
+    """工作者：租用并处理工作单元"""
+    queue = WorkQueue(args.db)
+    try:
+        completed = asyncio.run(run_worker(queue, create_screener(use_llm=not args.no_llm),
+                                           worker_id=args.worker_id, lease_seconds=args.lease_seconds,
+                                           max_attempts=args.max_attempts))
+    finally:
+        queue.close()
+    print(f"✅ 工作者完成 {completed} 个工作单元")
+
+
+def run_merge(args):
+    """合并：导出所有工作单元的筛选结果"""
+    queue = WorkQueue(args.db)
+    try:
+        progress = queue.progress()
+        if not queue.is_finished() and not args.partial:
+            print(f"❌ 仍有未完成的工作单元：{progress}（使用 --partial 导出已完成部分）")
+            sys.exit(1)
+        if progress[STATUS_FAILED] and not args.partial:
+            print(f"❌ 有 {progress[STATUS_FAILED]} 个工作单元多次处理失败：{progress}（使用 --partial 导出已完成部分）")
+            sys.exit(1)
+        all_results = queue.merge_results()
+        jobs = queue.load_jobs()
+        resumes = queue.load_resumes()
+    finally:
+        queue.close()
+    result_store = ResultStore(args.store) if args.store else None
+    try:
+        export_screening_results(all_results, jobs, resumes, args.output, result_store=result_store,
+                                 source="distributed")
+    finally:
+        if result_store is not None:
+            result_store.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="多节点简历筛选（协调者/工作者）")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    coordinator = subparsers.add_parser("coordinator", help="切分工作单元并写入队列")
+    coordinator.add_argument("--db", required=True, help="队列数据库文件路径")
+    coordinator.add_argument("--jobs", required=True, help="岗位JSON文件路径")
+    coordinator.add_argument("--resumes", required=True, help="简历JSON文件路径")
+    coordinator.add_argument("--shard-size", type=int, default=DEFAULT_SHARD_SIZE, help="每个工作单元包含的简历数")
+    coordinator.add_argument("--reset", action="store_true", help="清空队列中已有的工作单元和结果后重新写入")
+    coordinator.set_defaults(func=run_coordinator)
+
+    worker = subparsers.add_parser("worker", help="租用并处理工作单元")
+    worker.add_argument("--db", required=True, help="队列数据库文件路径")
+    worker.add_argument("--worker-id", default=None, help="工作者标识（默认：主机名-进程号）")
+    worker.add_argument("--lease-seconds", type=float, default=DEFAULT_LEASE_SECONDS, help="租约时长（秒）")
+    worker.add_argument("--max-attempts", type=int, default=DEFAULT_MAX_ATTEMPTS,
+                        help="工作单元最多被租用的次数，超过后标记为失败")
+    worker.add_argument("--no-llm", action="store_true", help="不加载模型管理器，只使用规则筛选")
+    worker.set_defaults(func=run_worker_command)
+
+    merge = subparsers.add_parser("merge", help="合并结果并导出")
+    merge.add_argument("--db", required=True, help="队列数据库文件路径")
+    merge.add_argument("--output", default="筛选结果.json", help="输出文件路径")
+    merge.add_argument("--store", default=None, help="同时写入的结果库文件路径（可选）")
+    merge.add_argument("--partial", action="store_true", help="允许在仍有未完成工作单元时导出")
+    merge.set_defaults(func=run_merge)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
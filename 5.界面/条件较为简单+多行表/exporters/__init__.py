@@ -4,6 +4,11 @@
 导出模块
 """
 
-from .result_exporter import export_screening_results
+from .result_exporter import build_key_profile, build_output_pairs, build_output_record, export_screening_results
+from .ndjson_writer import NdjsonLineIndex, NdjsonResultWriter, read_ndjson_results
+from .result_store import ResultStore
+from .table_exporter import iter_results_csv, write_results_csv, write_results_xlsx
 
-__all__ = ['export_screening_results']
+__all__ = ['build_key_profile', 'build_output_pairs', 'build_output_record', 'export_screening_results', 'ResultStore',
+           'NdjsonLineIndex', 'NdjsonResultWriter', 'read_ndjson_results',
+           'write_results_xlsx', 'write_results_csv', 'iter_results_csv']
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+NDJSON 流式结果写入模块
+
+每条 ScreeningResult 完成后立即追加一行JSON（带缓冲，定期 fsync），
+其他进程可以像 tail -f 一样边筛选边读取；内存占用与结果数量无关，
+进程崩溃时已写入的结果仍然保留（最多丢失最后一行未写完的内容）。
+文件写入和 fsync 在单独的写入线程中执行，调用 write 的事件循环不会被磁盘IO阻塞；
+等待写入的行数有上限，磁盘跟不上时 write 等待写入线程（背压），内存不会无限增长。
+"""
+
+import dataclasses
+import json
+import os
+import queue
+import threading
+import time
+from array import array
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from core.models import ScreeningResult
+from utils.logger_config import setup_logger
+
+logger = setup_logger("ndjson_writer")
+
+# 默认每写入多少条结果 fsync 一次
+DEFAULT_FSYNC_EVERY = 100
+
+# 默认距离上次 fsync 超过多少秒时再 fsync 一次
+DEFAULT_FSYNC_SECONDS = 2.0
+
+# 默认最多排队等待写入的行数，达到后 write 等待写入线程
+DEFAULT_MAX_PENDING = 10000
+
+# 队列已满时检查写入线程是否已出错的间隔（秒）
+_PUT_POLL_SECONDS = 0.5
+
+# 通知写入线程写完剩余内容后退出
+_CLOSE = object()
+
+
+class NdjsonResultWriter:
+    """按行追加写入筛选结果（一行一个JSON对象，由写入线程写入磁盘）"""
+
+    def __init__(self, output_file: str, fsync_every: int = DEFAULT_FSYNC_EVERY,
+                 fsync_seconds: float = DEFAULT_FSYNC_SECONDS, append: bool = False,
+                 max_pending: int = DEFAULT_MAX_PENDING):
+        """
+        打开输出文件并启动写入线程
+
+        Args:
+            output_file: 输出文件路径（.ndjson）
+            fsync_every: 每写入多少条结果 fsync 一次
+            fsync_seconds: 距离上次 fsync 超过多少秒时 fsync 一次（没有新结果时也会写入已缓冲的内容）
+            append: 是否追加到已有文件（默认覆盖）
+            max_pending: 最多排队等待写入的行数，达到后 write 等待写入线程
+        """
+        self.output_file = output_file
+        self.fsync_every = fsync_every
+        self.fsync_seconds = fsync_seconds
+        self.count = 0
+        self._closed = False
+        self._error: Optional[BaseException] = None
+        self._lines: "queue.Queue" = queue.Queue(maxsize=max_pending)
+        self._file = open(output_file, "a" if append else "w", encoding="utf-8", buffering=1 << 16)
+        self._thread = threading.Thread(target=self._run, name="ndjson-writer", daemon=True)
+        self._thread.start()
+
+    def write(self, result: ScreeningResult, extra: Optional[Dict] = None):
+        """
+        写入一条筛选结果（可作为 screen_batch 的 on_result 回调，只排队不等待磁盘IO；
+        排队的行数达到上限时等待写入线程）
+
+        Args:
+            result: 筛选结果
+            extra: 附加字段（如运行ID），合并到该行JSON中
+
+        Raises:
+            ValueError: 已关闭
+            RuntimeError: 写入线程已出错（之后的结果无法写入）
+        """
+        if self._closed:
+            raise ValueError(f"筛选结果流已关闭：{self.output_file}")
+        record = dataclasses.asdict(result)
+        if extra:
+            record.update(extra)
+        self._put(json.dumps(record, ensure_ascii=False) + "\n")
+        self.count += 1
+
+    def _put(self, item):
+        """放入写入队列，队列已满时等待；写入线程已出错时抛出异常"""
+        while True:
+            self._check_error()
+            try:
+                self._lines.put(item, timeout=_PUT_POLL_SECONDS)
+                return
+            except queue.Full:
+                continue
+
+    def _check_error(self):
+        if self._error is not None:
+            raise RuntimeError(f"筛选结果流写入失败：{self.output_file}：{self._error}") from self._error
+
+    def _run(self):
+        """写入线程：按行写入文件，达到条数或时间间隔时 fsync"""
+        pending = 0
+        last_sync = time.monotonic()
+        try:
+            while True:
+                try:
+                    line = self._lines.get(timeout=self.fsync_seconds)
+                except queue.Empty:
+                    line = None
+                if line is _CLOSE:
+                    break
+                if line is not None:
+                    self._file.write(line)
+                    pending += 1
+                if pending and (pending >= self.fsync_every or time.monotonic() - last_sync >= self.fsync_seconds):
+                    self._sync()
+                    pending = 0
+                    last_sync = time.monotonic()
+            self._sync()
+        except BaseException as e:
+            self._error = e
+            logger.error(f"❌ 写入筛选结果流失败：{self.output_file}：{e}")
+        finally:
+            self._file.close()
+
+    def _sync(self):
+        """把缓冲区写入磁盘"""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self):
+        """
+        等待写入线程写完剩余内容并关闭文件（会阻塞到 fsync 完成，在事件循环中应放到线程池执行）
+
+        Raises:
+            写入线程中发生的异常
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if self._error is None:
+            try:
+                self._put(_CLOSE)
+            except RuntimeError:
+                pass
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+        logger.info(f"已流式写入 {self.count} 条筛选结果：{self.output_file}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+# ScreeningResult 的字段名（读取时忽略多余的字段）
+_RESULT_FIELDS = frozenset(field.name for field in dataclasses.fields(ScreeningResult))
+
+
+def _read_lines(input_file: str) -> Iterator[str]:
+    """逐行读取已写完整的非空行（遇到崩溃时未写完的最后一行即停止）"""
+    with open(input_file, "r", encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.endswith("\n"):
+                logger.warning(f"⚠️ 第 {line_number} 行未写完整，已跳过：{input_file}")
+                break
+            line = line.strip()
+            if line:
+                yield line
+
+
+def _parse_result(line: str) -> ScreeningResult:
+    """把一行JSON转换为 ScreeningResult（忽略多余的字段）"""
+    record = json.loads(line)
+    return ScreeningResult(**{key: value for key, value in record.items() if key in _RESULT_FIELDS})
+
+
+def read_ndjson_results(input_file: str) -> Iterator[ScreeningResult]:
+    """
+    逐行读取 NDJSON 筛选结果（跳过崩溃时未写完的最后一行）
+
+    Args:
+        input_file: NDJSON 文件路径
+
+    Yields:
+        ScreeningResult
+    """
+    for line in _read_lines(input_file):
+        yield _parse_result(line)
+
+
+class NdjsonLineIndex:
+    """
+    NDJSON 结果流的行偏移索引（分页读取用，可在多个线程中使用）
+
+    每次读取前只扫描上次之后追加的内容（尚未写完的最后一行等到写完后再加入），
+    读取某一页时直接定位到该页每一行的起始位置，不需要从头读取整个文件。
+    """
+
+    def __init__(self, input_file: str):
+        """
+        Args:
+            input_file: NDJSON 文件路径
+        """
+        self.input_file = input_file
+        self._offsets = array("q")  # 每个已写完整的非空行的起始位置
+        self._scanned = 0  # 已扫描到的位置（最后一个完整行的末尾）
+        self._lock = threading.Lock()
+
+    def _refresh(self):
+        """扫描上次之后追加的完整行"""
+        size = os.path.getsize(self.input_file)
+        if size < self._scanned:
+            # 文件被重新写入，重建索引
+            self._offsets = array("q")
+            self._scanned = 0
+        if size == self._scanned:
+            return
+        with open(self.input_file, "rb") as f:
+            f.seek(self._scanned)
+            position = self._scanned
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                if line.strip():
+                    self._offsets.append(position)
+                position += len(line)
+        self._scanned = position
+
+    def read_page(self, offset: int, limit: int) -> Tuple[int, List[ScreeningResult]]:
+        """
+        分页读取筛选结果
+
+        Args:
+            offset: 跳过的结果数
+            limit: 最多返回的结果数
+
+        Returns:
+            (目前已写完整的结果总数, 该页的 ScreeningResult 列表)
+        """
+        with self._lock:
+            self._refresh()
+            total = len(self._offsets)
+            starts = self._offsets[offset:offset + limit]
+        page = []
+        if starts:
+            with open(self.input_file, "rb") as f:
+                for start in starts:
+                    f.seek(start)
+                    page.append(_parse_result(f.readline().decode("utf-8")))
+        return total, page
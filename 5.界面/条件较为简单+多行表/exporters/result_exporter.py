@@ -5,165 +5,215 @@
 """
 
 import json
-from typing import Dict, List
-from datetime import datetime
+import re
+from typing import Dict, List, Optional, Tuple
 from utils.logger_config import setup_logger
-from core.models import ScreeningResult
+from core.models import ResumeProfile, ScreeningResult
+from core.profile import build_resume_profile
 
 logger = setup_logger("result_exporter")
 
 
-def export_screening_results(all_results: List[ScreeningResult], jobs: List[Dict], resumes: List[Dict], output_file: str = "筛选结果.json"):
+def build_key_profile(profile: ResumeProfile) -> str:
     """
-    导出筛选结果为JSON格式
+    根据简历画像生成"关键画像"展示文本（学历 | 学校 | 学校类型 | 年龄，以及现任职务）
     
     Args:
-        all_results: 所有筛选结果
-        jobs: 岗位列表
-        resumes: 所有简历列表
-        output_file: 输出文件名
+        profile: 简历画像
+    
+    Returns:
+        关键画像字符串
     """
-    # 构建输出结果列表（每个简历一条记录，参考简历初筛结果.json格式）
-    output_list = []
+    key_profile_parts = []
+    if profile.highest_education:
+        key_profile_parts.append(profile.highest_education)
+    if profile.highest_school:
+        key_profile_parts.append(profile.highest_school)
+    if profile.highest_school_type:
+        key_profile_parts.append(profile.highest_school_type)
+    if profile.age is not None:
+        key_profile_parts.append(f"{profile.age}岁")
     
-    # 为每个筛选结果创建一条记录
-    for result in all_results:
-        resume_id = result.resume_id
-        
-        # 从resumes列表中查找简历数据
-        resume_data = None
-        for resume in resumes:
-            if str(resume.get('序号', '')) == resume_id:
-                resume_data = resume
-                break
-        
-        if not resume_data:
-            continue
-        
-        # 获取基本信息
-        basic_info = resume_data.get('基本信息', {})
-        name = basic_info.get('姓名', '')
-        resume_number = resume_data.get('序号', '')
-        
-        # 获取岗位信息
-        job_info = resume_data.get('岗位信息', {})
-        applied_position = job_info.get('应聘岗位', '')
-        
-        # 获取学习经历统计信息
-        education_info = resume_data.get('学习经历统计信息', {})
-        highest_education = education_info.get('最高学历', '')
-        highest_school = education_info.get('最高学历毕业院校', '')
-        highest_school_type = education_info.get('最高学历毕业院校类型', '')
-        
-        # 计算年龄
-        birth_date = basic_info.get('出生日期', '')
-        age = ''
-        if birth_date:
-            try:
-                date_part = birth_date.split()[0] if ' ' in birth_date else birth_date
-                parts = date_part.split('-')
-                if len(parts) >= 1:
-                    year = int(parts[0])
-                    month = int(parts[1]) if len(parts) > 1 else 1
-                    day = int(parts[2]) if len(parts) > 2 else 1
-                    current_date = datetime.now()
-                    age_calc = current_date.year - year
-                    if (current_date.month, current_date.day) < (month, day):
-                        age_calc -= 1
-                    age = str(age_calc)
-            except:
-                pass
-        
-        # 构建关键画像
-        key_profile_parts = []
-        if highest_education:
-            key_profile_parts.append(highest_education)
-        if highest_school:
-            key_profile_parts.append(highest_school)
-        if highest_school_type:
-            key_profile_parts.append(highest_school_type)
-        if age:
-            key_profile_parts.append(f"{age}岁")
-        
-        key_profile = ' | '.join(key_profile_parts) if key_profile_parts else ''
+    key_profile = ' | '.join(key_profile_parts) if key_profile_parts else ''
+    
+    # 获取现职务或岗位
+    if profile.current_position:
+        key_profile += f"\n现任：{profile.current_position}"
+    
+    return key_profile
+
+
+def build_output_record(result: ScreeningResult, resume_data: Dict, profile: ResumeProfile,
+                        key_profile: Optional[str] = None) -> Dict:
+    """
+    把一条筛选结果转换为输出记录（简历初筛结果.json 中的一条）
+    
+    Args:
+        result: 筛选结果
+        resume_data: 简历数据
+        profile: 简历画像
+        key_profile: 已生成的关键画像（同一简历对应多个岗位时复用），为None时现场生成
+    
+    Returns:
+        输出记录字典
+    """
+    # 获取基本信息
+    name = profile.name
+    resume_number = resume_data.get('序号', '')
+    
+    # 获取岗位信息
+    applied_position = profile.applied_position
+    
+    # 构建关键画像（年龄来自简历画像，不再重复计算）
+    if key_profile is None:
+        key_profile = build_key_profile(profile)
+    
+    # 构建AI初筛结果
+    ai_result = "拟通过" if result.passed else "拟淘汰"
+    
+    # 构建淘汰原因（未通过的筛选条件）
+    failed_filters = [detail.get('filter_name') for detail in result.filter_details if not detail.get('passed')]
+    elimination_reason = '/'.join(failed_filters) if failed_filters else ''
+    
+    # 构建筛选条件详情
+    filter_details = []
+    for detail in result.filter_details:
+        filter_name = detail.get('filter_name', '')
+        passed = detail.get('passed', False)
+        method = detail.get('method', detail.get('source', '未知'))
+        reason = detail.get('reason', '')
         
-        # 获取现职务或岗位
-        current_position = basic_info.get('现职务或岗位', '')
-        if current_position:
-            key_profile += f"\n现任：{current_position}"
+        # 获取筛选详情
+        detail_info = detail.get('details', {})
+        detail_text = ''
+        if isinstance(detail_info, dict):
+            detail_text = detail_info.get('detail', '')
         
-        # 构建AI初筛结果
-        ai_result = "拟通过" if result.passed else "拟淘汰"
+        # 格式化原因说明：如果reason中包含requirement字典，去掉"原文"字段
+        if "'原文'" in reason or '"原文"' in reason:
+            # 使用正则表达式去掉"原文"字段及其值，并处理多余的逗号
+            reason = re.sub(r"['\"]原文['\"]\s*:\s*[^,}]+,\s*", "", reason)  # 先处理后面有逗号的情况
+            reason = re.sub(r",?\s*['\"]原文['\"]\s*:\s*[^,}]+", "", reason)  # 再处理其他情况
+            # 清理可能留下的多余逗号和空格
+            reason = re.sub(r",\s*,", ",", reason)  # 去掉连续逗号
+            reason = re.sub(r"{\s*,", "{", reason)  # 去掉{后的逗号
         
-        # 构建淘汰原因（未通过的筛选条件）
-        failed_filters = [detail.get('filter_name') for detail in result.filter_details if not detail.get('passed')]
-        elimination_reason = '/'.join(failed_filters) if failed_filters else ''
+        # 在筛选详情末尾添加逗号（如果detail_text不为空）
+        if detail_text:
+            detail_text = detail_text.rstrip() + ','
         
-        # 构建筛选条件详情
-        filter_details = []
-        for detail in result.filter_details:
-            filter_name = detail.get('filter_name', '')
-            passed = detail.get('passed', False)
-            method = detail.get('method', detail.get('source', '未知'))
-            reason = detail.get('reason', '')
-            
-            # 获取筛选详情
-            detail_info = detail.get('details', {})
-            detail_text = ''
-            if isinstance(detail_info, dict):
-                detail_text = detail_info.get('detail', '')
-            
-            # 格式化原因说明：去掉"原文"字段
-            import re
-            # 如果reason中包含requirement字典，去掉"原文"字段
-            if "'原文'" in reason or '"原文"' in reason:
-                # 使用正则表达式去掉"原文"字段及其值，并处理多余的逗号
-                reason = re.sub(r"['\"]原文['\"]\s*:\s*[^,}]+,\s*", "", reason)  # 先处理后面有逗号的情况
-                reason = re.sub(r",?\s*['\"]原文['\"]\s*:\s*[^,}]+", "", reason)  # 再处理其他情况
-                # 清理可能留下的多余逗号和空格
-                reason = re.sub(r",\s*,", ",", reason)  # 去掉连续逗号
-                reason = re.sub(r"{\s*,", "{", reason)  # 去掉{后的逗号
-            
-            # 在筛选详情末尾添加逗号（如果detail_text不为空）
-            if detail_text:
-                detail_text = detail_text.rstrip() + ','
-            
-            # 转换判断方法：'rule' -> '规则', 'llm' -> 'LLM'
-            if method == 'rule' or '规则' in str(method):
-                method_display = '规则'
-            elif method == 'llm' or 'LLM' in str(method):
-                method_display = 'LLM'
-            else:
-                method_display = str(method)
-            
-            filter_detail = {
-                "筛选条件": filter_name,
-                "是否通过": "通过" if passed else "不通过",
-                "判断方法": method_display,
-                "原因说明": reason,
-                "筛选详情": detail_text
-            }
-            filter_details.append(filter_detail)
+        # 转换判断方法：'rule' -> '规则', 'llm' -> 'LLM'
+        if method == 'rule' or '规则' in str(method):
+            method_display = '规则'
+        elif method == 'llm' or 'LLM' in str(method):
+            method_display = 'LLM'
+        else:
+            method_display = str(method)
         
-        # 构建输出记录
-        output_record = {
-            "序号": int(resume_number) if str(resume_number).isdigit() else resume_number,
-            "姓名": name,
-            "关键画像": key_profile,
-            "应聘岗位": applied_position,
-            "AI初筛结果": ai_result,
-            "淘汰原因": elimination_reason,
-            "筛选条件详情": filter_details
+        filter_detail = {
+            "筛选条件": filter_name,
+            "是否通过": "通过" if passed else "不通过",
+            "判断方法": method_display,
+            "原因说明": reason,
+            "筛选详情": detail_text
         }
+        filter_details.append(filter_detail)
+    
+    # 构建输出记录
+    return {
+        "序号": int(resume_number) if str(resume_number).isdigit() else resume_number,
+        "姓名": name,
+        "关键画像": key_profile,
+        "应聘岗位": applied_position,
+        "AI初筛结果": ai_result,
+        "淘汰原因": elimination_reason,
+        "筛选条件详情": filter_details
+    }
+
+
+def output_record_sort_key(record: Dict) -> int:
+    """输出记录的排序键（按序号排序，非数字序号排在最前）"""
+    return record.get('序号', 0) if isinstance(record.get('序号'), (int, str)) and str(record.get('序号')).isdigit() else 0
+
+
+def build_output_pairs(all_results: List[ScreeningResult], resumes: List[Dict],
+                       profiles: Optional[List[ResumeProfile]] = None) -> List[Tuple[ScreeningResult, Dict]]:
+    """
+    把筛选结果转换为输出记录（按结果携带的简历位置直接取简历，一次遍历完成）
+    
+    Args:
+        all_results: 所有筛选结果
+        resumes: 所有简历列表
+        profiles: 与 resumes 一一对应的简历画像（筛选时已构建的可直接传入），为None时现场构建
+    
+    Returns:
+        [(筛选结果, 输出记录), ...]（已按序号排序）
+    """
+    # 序号 -> 第一份该序号简历的位置（筛选结果未携带简历位置时按序号查找）
+    index_by_resume_id: Dict[str, int] = {}
+    for index, resume in enumerate(resumes):
+        index_by_resume_id.setdefault(str(resume.get('序号', '')), index)
+    
+    # 简历位置 -> (简历画像, 关键画像)，同一简历对应多个岗位时只生成一次
+    summaries: Dict[int, tuple] = {}
+    
+    output_list = []
+    for result in all_results:
+        # 优先按结果携带的简历位置取简历（序号重复时不会取错人）
+        resume_index = result.resume_index
+        if resume_index is None or not 0 <= resume_index < len(resumes):
+            resume_index = index_by_resume_id.get(result.resume_id)
+        if resume_index is None:
+            logger.warning(f"未找到简历数据：resume_id={result.resume_id}")
+            continue
+        resume_data = resumes[resume_index]
         
-        output_list.append(output_record)
+        summary = summaries.get(resume_index)
+        if summary is None:
+            profile = profiles[resume_index] if profiles is not None else build_resume_profile(resume_data, resume_index)
+            summary = (profile, build_key_profile(profile))
+            summaries[resume_index] = summary
+        profile, key_profile = summary
+        output_list.append((result, build_output_record(result, resume_data, profile, key_profile)))
     
     # 按序号排序
-    output_list.sort(key=lambda x: x.get('序号', 0) if isinstance(x.get('序号'), (int, str)) and str(x.get('序号')).isdigit() else 0)
+    output_list.sort(key=lambda item: output_record_sort_key(item[1]))
+    return output_list
+
+
+def export_screening_results(all_results: List[ScreeningResult], jobs: List[Dict], resumes: List[Dict], output_file: Optional[str] = "筛选结果.json",
+                             profiles: Optional[List[ResumeProfile]] = None, result_store=None,
+                             source: str = "export") -> List[Dict]:
+    """
+    导出筛选结果为JSON格式
     
-    # 保存到文件
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(output_list, f, ensure_ascii=False, indent=2)
+    Args:
+        all_results: 所有筛选结果
+        jobs: 岗位列表
+        resumes: 所有简历列表
+        output_file: 输出文件名，为None时不写JSON文件（只写入结果库）
+        profiles: 与 resumes 一一对应的简历画像（筛选时已构建的可直接传入），为None时现场构建
+        result_store: 结果库（ResultStore），不为None时把本次结果作为一次运行写入结果库
+        source: 写入结果库时记录的运行来源
+    
+    Returns:
+        输出记录列表（已按序号排序）
+    """
+    # 构建输出结果列表（每个筛选结果一条记录，参考简历初筛结果.json格式）
+    output_list = build_output_pairs(all_results, resumes, profiles)
+    records = [record for _, record in output_list]
+    
+    if result_store is not None:
+        run_id = result_store.create_run(source)
+        result_store.add_records(run_id, output_list)
+        logger.info(f"筛选结果已写入结果库：{result_store.db_path}（运行 {run_id}）")
+    
+    if output_file:
+        # 保存到文件
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(records, f, ensure_ascii=False, indent=2)
+        
+        logger.info(f"筛选结果已导出到：{output_file}")
+        print(f"\n✅ 筛选结果已导出到：{output_file}")
     
-    logger.info(f"筛选结果已导出到：{output_file}")
-    print(f"\n✅ 筛选结果已导出到：{output_file}")
+    return records
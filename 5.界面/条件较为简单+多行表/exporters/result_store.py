@@ -0,0 +1,391 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+筛选结果库模块（SQLite）
+
+每次筛选作为一次运行（runs）写入，每个（岗位, 简历）配对一行（pairs），
+每个筛选条件的结论一行（filter_outcomes）。按岗位、简历、是否通过和
+未通过的筛选条件建立索引，查询时不需要加载全部结果；需要时再按原有
+JSON 格式（简历初筛结果.json）导出。
+
+界面分页浏览时只读取当前页的摘要（不含各筛选条件的原因说明和筛选详情），
+查看某个候选人时再按配对ID读取完整记录。
+"""
+
+import json
+import sqlite3
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from core.models import ScreeningResult
+from utils.logger_config import setup_logger
+
+logger = setup_logger("result_store")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    created_at REAL NOT NULL,
+    source TEXT,
+    total INTEGER NOT NULL DEFAULT 0,
+    passed INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS pairs (
+    pair_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id INTEGER NOT NULL REFERENCES runs (run_id) ON DELETE CASCADE,
+    job_id TEXT,
+    job_name TEXT,
+    resume_id TEXT,
+    number TEXT,
+    name TEXT,
+    key_profile TEXT,
+    applied_position TEXT,
+    passed INTEGER NOT NULL,
+    elimination_reason TEXT
+);
+CREATE TABLE IF NOT EXISTS filter_outcomes (
+    pair_id INTEGER NOT NULL REFERENCES pairs (pair_id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    filter_name TEXT,
+    passed INTEGER NOT NULL,
+    method TEXT,
+    reason TEXT,
+    detail TEXT,
+    PRIMARY KEY (pair_id, position)
+);
+CREATE INDEX IF NOT EXISTS idx_pairs_job ON pairs (run_id, job_name);
+CREATE INDEX IF NOT EXISTS idx_pairs_resume ON pairs (run_id, resume_id);
+CREATE INDEX IF NOT EXISTS idx_pairs_passed ON pairs (run_id, passed);
+CREATE INDEX IF NOT EXISTS idx_outcomes_failed ON filter_outcomes (filter_name, passed);
+"""
+
+_PAIR_COLUMNS = "p.pair_id, p.number, p.name, p.key_profile, p.applied_position, p.passed, p.elimination_reason"
+
+# 分页查询可用的排序字段 -> 排序列（按序号即按写入顺序，写入前已按序号排序）
+SORT_COLUMNS = {
+    "序号": "p.pair_id",
+    "姓名": "p.name",
+    "应聘岗位": "p.applied_position",
+    "AI初筛结果": "p.passed",
+}
+
+
+def _like_pattern(text: str) -> str:
+    """包含 text 的 LIKE 模式（转义通配符）"""
+    escaped = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def _filter_conditions(job_name: Optional[str] = None, resume_id: Optional[str] = None,
+                       passed: Optional[bool] = None, failed_filter: Optional[str] = None,
+                       search: Optional[str] = None) -> Tuple[List[str], list]:
+    """查询条件（除运行ID外）对应的 WHERE 子句和参数"""
+    conditions: List[str] = []
+    params: list = []
+    if job_name is not None:
+        conditions.append("p.job_name = ?")
+        params.append(job_name)
+    if resume_id is not None:
+        conditions.append("p.resume_id = ?")
+        params.append(str(resume_id))
+    if passed is not None:
+        conditions.append("p.passed = ?")
+        params.append(int(passed))
+    if failed_filter is not None:
+        conditions.append("EXISTS (SELECT 1 FROM filter_outcomes f "
+                          "WHERE f.pair_id = p.pair_id AND f.filter_name = ? AND f.passed = 0)")
+        params.append(failed_filter)
+    if search:
+        conditions.append("(p.name LIKE ? ESCAPE '\\' OR p.key_profile LIKE ? ESCAPE '\\')")
+        params.extend([_like_pattern(search)] * 2)
+    return conditions, params
+
+
+class ResultStore:
+    """筛选结果库（运行、配对、筛选条件结论三张表）"""
+
+    def __init__(self, db_path: str):
+        """
+        打开（或创建）结果库
+
+        Args:
+            db_path: 数据库文件路径
+        """
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.executescript(_SCHEMA)
+
+    def close(self):
+        """关闭数据库连接"""
+        self.conn.close()
+
+    def create_run(self, source: str = "") -> int:
+        """
+        新建一次运行
+
+        Args:
+            source: 运行来源（如 api、export）
+
+        Returns:
+            运行ID
+        """
+        with self.conn:
+            cursor = self.conn.execute("INSERT INTO runs (created_at, source) VALUES (?, ?)", (time.time(), source))
+        return cursor.lastrowid
+
+    def add_records(self, run_id: int, items: List[Tuple[ScreeningResult, Dict]]):
+        """
+        批量写入一次运行的输出记录（一个事务内完成，写入顺序即导出顺序）
+
+        Args:
+            run_id: 运行ID
+            items: (筛选结果, 输出记录) 列表，输出记录格式与 build_output_record 一致
+        """
+        with self.conn:
+            for result, record in items:
+                cursor = self.conn.execute(
+                    "INSERT INTO pairs (run_id, job_id, job_name, resume_id, number, name, key_profile, "
+                    "applied_position, passed, elimination_reason) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (run_id, str(result.job_id), result.job_name, result.resume_id,
+                     json.dumps(record.get("序号"), ensure_ascii=False), record.get("姓名"), record.get("关键画像"),
+                     record.get("应聘岗位"), int(record.get("AI初筛结果") == "拟通过"), record.get("淘汰原因")),
+                )
+                self.conn.executemany(
+                    "INSERT INTO filter_outcomes (pair_id, position, filter_name, passed, method, reason, detail) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    ((cursor.lastrowid, position, detail.get("筛选条件"), int(detail.get("是否通过") == "通过"),
+                      detail.get("判断方法"), detail.get("原因说明"), detail.get("筛选详情"))
+                     for position, detail in enumerate(record.get("筛选条件详情", []))),
+                )
+            self.conn.execute(
+                "UPDATE runs SET total = (SELECT COUNT(*) FROM pairs WHERE run_id = ?), "
+                "passed = (SELECT COUNT(*) FROM pairs WHERE run_id = ? AND passed = 1) WHERE run_id = ?",
+                (run_id, run_id, run_id),
+            )
+
+    def list_runs(self, limit: int = 20) -> List[Dict]:
+        """最近的运行（新的在前）"""
+        rows = self.conn.execute(
+            "SELECT run_id, created_at, source, total, passed FROM runs ORDER BY run_id DESC LIMIT ?", (limit,)
+        )
+        return [
+            {"run_id": run_id, "created_at": created_at, "source": source, "total": total, "passed": passed}
+            for run_id, created_at, source, total, passed in rows
+        ]
+
+    def prune_runs(self, keep: int) -> int:
+        """
+        只保留最近 keep 次运行，更早的运行连同其配对和筛选条件结论一起删除（ON DELETE CASCADE）
+
+        Args:
+            keep: 保留的运行数
+
+        Returns:
+            删除的运行数
+        """
+        with self.conn:
+            cursor = self.conn.execute(
+                "DELETE FROM runs WHERE run_id NOT IN (SELECT run_id FROM runs ORDER BY run_id DESC LIMIT ?)",
+                (max(keep, 0),),
+            )
+        if cursor.rowcount:
+            logger.info(f"已删除 {cursor.rowcount} 次较早的运行（保留最近 {keep} 次）")
+        return cursor.rowcount
+
+    def latest_run_id(self) -> Optional[int]:
+        """最近一次运行的ID，没有运行时返回None"""
+        row = self.conn.execute("SELECT MAX(run_id) FROM runs").fetchone()
+        return row[0]
+
+    def query(self, run_id: int, job_name: Optional[str] = None, resume_id: Optional[str] = None,
+              passed: Optional[bool] = None, failed_filter: Optional[str] = None) -> List[Dict]:
+        """
+        查询一次运行的输出记录
+
+        Args:
+            run_id: 运行ID
+            job_name: 只返回该岗位的记录
+            resume_id: 只返回该简历序号的记录
+            passed: 只返回通过（True）或淘汰（False）的记录
+            failed_filter: 只返回该筛选条件未通过的记录
+
+        Returns:
+            输出记录列表（格式与 简历初筛结果.json 一致，按写入顺序）
+        """
+        return list(self.iter_records(run_id, job_name, resume_id, passed, failed_filter))
+
+    def iter_records(self, run_id: int, job_name: Optional[str] = None, resume_id: Optional[str] = None,
+                     passed: Optional[bool] = None, failed_filter: Optional[str] = None,
+                     search: Optional[str] = None, batch_size: int = 500) -> Iterator[Dict]:
+        """
+        按写入顺序分批读取输出记录（参数与 query 相同，另可按姓名/关键画像过滤，内存占用只与 batch_size 有关）
+
+        Yields:
+            输出记录
+        """
+        for _, record in self._iter_pair_records(run_id, job_name, resume_id, passed, failed_filter, search,
+                                                 batch_size):
+            yield record
+
+    def _iter_pair_records(self, run_id: int, job_name: Optional[str] = None, resume_id: Optional[str] = None,
+                           passed: Optional[bool] = None, failed_filter: Optional[str] = None,
+                           search: Optional[str] = None, batch_size: int = 500) -> Iterator[Tuple[int, Dict]]:
+        """按写入顺序分批读取 (配对ID, 输出记录)"""
+        conditions, params = _filter_conditions(job_name, resume_id, passed, failed_filter, search)
+        where = " AND ".join(["p.run_id = ?", "p.pair_id > ?", *conditions])
+
+        sql = f"SELECT {_PAIR_COLUMNS} FROM pairs p WHERE {where} ORDER BY p.pair_id LIMIT ?"
+        last_pair_id = 0
+        while True:
+            pairs = self.conn.execute(sql, [run_id, last_pair_id, *params, batch_size]).fetchall()
+            if not pairs:
+                break
+            yield from zip((pair[0] for pair in pairs), self._build_records(pairs))
+            last_pair_id = pairs[-1][0]
+
+    def query_page(self, run_id: int, job_name: Optional[str] = None, passed: Optional[bool] = None,
+                   failed_filter: Optional[str] = None, search: Optional[str] = None, sort: str = "序号",
+                   descending: bool = False, offset: int = 0, limit: int = 50) -> Tuple[int, List[Dict]]:
+        """
+        分页查询一次运行的结果摘要（不含筛选条件详情）
+
+        Args:
+            run_id: 运行ID
+            job_name: 只返回该岗位的记录
+            passed: 只返回通过（True）或淘汰（False）的记录
+            failed_filter: 只返回该筛选条件未通过的记录
+            search: 只返回姓名或关键画像包含该文字的记录
+            sort: 排序字段（SORT_COLUMNS 中的键）
+            descending: 是否倒序
+            offset: 跳过的记录数
+            limit: 返回的记录数
+
+        Returns:
+            (符合条件的总记录数, 当前页的摘要列表)，摘要带配对ID（id），用于 get_record 读取完整记录
+
+        Raises:
+            ValueError: 排序字段不支持
+        """
+        if sort not in SORT_COLUMNS:
+            raise ValueError(f"不支持按 {sort} 排序，可选：{'、'.join(SORT_COLUMNS)}")
+        conditions, params = _filter_conditions(job_name, None, passed, failed_filter, search)
+        where = " AND ".join(["p.run_id = ?", *conditions])
+        total = self.conn.execute(f"SELECT COUNT(*) FROM pairs p WHERE {where}", [run_id, *params]).fetchone()[0]
+
+        direction = "DESC" if descending else "ASC"
+        rows = self.conn.execute(
+            f"SELECT {_PAIR_COLUMNS} FROM pairs p WHERE {where} "
+            f"ORDER BY {SORT_COLUMNS[sort]} {direction}, p.pair_id {direction} LIMIT ? OFFSET ?",
+            [run_id, *params, limit, offset],
+        ).fetchall()
+        summaries = [
+            {
+                "id": pair_id,
+                "序号": json.loads(number),
+                "姓名": name,
+                "关键画像": key_profile,
+                "应聘岗位": applied_position,
+                "AI初筛结果": "拟通过" if passed else "拟淘汰",
+                "淘汰原因": elimination_reason
+            }
+            for pair_id, number, name, key_profile, applied_position, passed, elimination_reason in rows
+        ]
+        return total, summaries
+
+    def get_record(self, run_id: int, pair_id: int) -> Optional[Dict]:
+        """
+        读取一条完整的输出记录（含筛选条件详情）
+
+        Args:
+            run_id: 运行ID
+            pair_id: 配对ID（query_page 返回的 id）
+
+        Returns:
+            输出记录（带配对ID），不存在时返回None
+        """
+        row = self.conn.execute(f"SELECT {_PAIR_COLUMNS} FROM pairs p WHERE p.run_id = ? AND p.pair_id = ?",
+                                (run_id, pair_id)).fetchone()
+        if row is None:
+            return None
+        return {"id": pair_id, **self._build_records([row])[0]}
+
+    def facets(self, run_id: int) -> Dict:
+        """
+        一次运行的筛选选项：岗位（按出现顺序）和各筛选条件的未通过人数
+
+        Returns:
+            {"jobs": [岗位, ...], "failed_filters": {筛选条件: 未通过数, ...}}
+        """
+        jobs = [job for job, in self.conn.execute(
+            "SELECT job_name FROM pairs WHERE run_id = ? GROUP BY job_name ORDER BY MIN(pair_id)", (run_id,))]
+        failed = self.conn.execute(
+            "SELECT f.filter_name, COUNT(*) FROM filter_outcomes f JOIN pairs p ON p.pair_id = f.pair_id "
+            "WHERE p.run_id = ? AND f.passed = 0 GROUP BY f.filter_name ORDER BY MIN(f.position)", (run_id,))
+        return {"jobs": jobs, "failed_filters": dict(failed.fetchall())}
+
+    def export_json(self, run_id: int, output_file: str, job_name: Optional[str] = None,
+                    passed: Optional[bool] = None, failed_filter: Optional[str] = None,
+                    search: Optional[str] = None, overrides: Optional[Dict[int, Dict]] = None) -> int:
+        """
+        把一次运行按原有JSON格式导出到文件（逐条写入，内存占用与记录数无关，
+        文件内容与对导出的记录 json.dump(indent=2) 相同）
+
+        Args:
+            run_id: 运行ID
+            output_file: 输出文件路径
+            job_name: 只导出该岗位的记录
+            passed: 只导出通过（True）或淘汰（False）的记录
+            failed_filter: 只导出该筛选条件未通过的记录
+            search: 只导出姓名或关键画像包含该文字的记录
+            overrides: 配对ID -> 替换的字段（如手动标记的 AI初筛结果、淘汰原因），
+                       只替换字段，不影响按 passed 过滤
+
+        Returns:
+            导出的记录数
+        """
+        overrides = overrides or {}
+        count = 0
+        with open(output_file, 'w', encoding='utf-8') as f:
+            for pair_id, record in self._iter_pair_records(run_id, job_name, None, passed, failed_filter, search):
+                record.update(overrides.get(pair_id, {}))
+                f.write("[\n  " if count == 0 else ",\n  ")
+                f.write(json.dumps(record, ensure_ascii=False, indent=2).replace("\n", "\n  "))
+                count += 1
+            f.write("\n]" if count else "[]")
+        logger.info(f"运行 {run_id} 的筛选结果已导出到：{output_file}")
+        return count
+
+    def _build_records(self, pairs: List[tuple]) -> List[Dict]:
+        """由 pairs 行和对应的 filter_outcomes 行还原输出记录"""
+        outcomes: Dict[int, List[Dict]] = {pair[0]: [] for pair in pairs}
+        pair_ids = list(outcomes)
+        # SQLite 单条语句的参数个数有限，分批查询
+        for start in range(0, len(pair_ids), 500):
+            batch = pair_ids[start:start + 500]
+            rows = self.conn.execute(
+                f"SELECT pair_id, filter_name, passed, method, reason, detail FROM filter_outcomes "
+                f"WHERE pair_id IN ({','.join('?' * len(batch))}) ORDER BY pair_id, position",
+                batch,
+            )
+            for pair_id, filter_name, passed, method, reason, detail in rows:
+                outcomes[pair_id].append({
+                    "筛选条件": filter_name,
+                    "是否通过": "通过" if passed else "不通过",
+                    "判断方法": method,
+                    "原因说明": reason,
+                    "筛选详情": detail
+                })
+
+        return [
+            {
+                "序号": json.loads(number),
+                "姓名": name,
+                "关键画像": key_profile,
+                "应聘岗位": applied_position,
+                "AI初筛结果": "拟通过" if passed else "拟淘汰",
+                "淘汰原因": elimination_reason,
+                "筛选条件详情": outcomes[pair_id]
+            }
+            for pair_id, number, name, key_profile, applied_position, passed, elimination_reason in pairs
+        ]
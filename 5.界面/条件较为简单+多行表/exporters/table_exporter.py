@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+表格导出模块（XLSX / CSV）
+
+把输出记录（简历初筛结果.json 的格式）逐行写成表格：每个候选人一行，
+每个筛选条件一组列。XLSX 使用 openpyxl 只写（流式）模式，CSV 逐行写入，
+内存占用与记录数量无关。
+"""
+
+import csv
+import io
+from typing import Dict, Iterable, Iterator, List
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font
+
+from core.rule_engine import FILTER_NAMES
+from utils.logger_config import setup_logger
+
+logger = setup_logger("table_exporter")
+
+# 基本信息列
+BASE_COLUMNS = ["序号", "姓名", "关键画像", "应聘岗位", "AI初筛结果", "淘汰原因"]
+
+# 每个筛选条件的一组列
+FILTER_COLUMN_FIELDS = ["是否通过", "判断方法", "原因说明", "筛选详情"]
+
+
+def build_header() -> List[str]:
+    """表头：基本信息列 + 每个筛选条件一组列（如 学历要求-是否通过）"""
+    header = list(BASE_COLUMNS)
+    for filter_name in FILTER_NAMES:
+        header.extend(f"{filter_name}-{field}" for field in FILTER_COLUMN_FIELDS)
+    return header
+
+
+def record_to_row(record: Dict) -> List:
+    """
+    把一条输出记录展开为一行
+
+    Args:
+        record: 输出记录（格式与 build_output_record 一致）
+
+    Returns:
+        与 build_header() 对应的单元格值列表
+    """
+    row = [record.get(column, "") for column in BASE_COLUMNS]
+    details = {detail.get("筛选条件"): detail for detail in record.get("筛选条件详情", [])}
+    for filter_name in FILTER_NAMES:
+        detail = details.get(filter_name, {})
+        row.extend(detail.get(field, "") for field in FILTER_COLUMN_FIELDS)
+    return row
+
+
+def write_results_xlsx(records: Iterable[Dict], output_file: str, sheet_title: str = "简历初筛结果") -> int:
+    """
+    以 openpyxl 只写模式逐行写出 XLSX
+
+    Args:
+        records: 输出记录（可以是生成器，逐条消费）
+        output_file: 输出文件路径
+        sheet_title: 工作表名称
+
+    Returns:
+        写出的记录数
+    """
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(title=sheet_title)
+    bold = Font(bold=True)
+    header_cells = []
+    for title in build_header():
+        cell = WriteOnlyCell(sheet, value=title)
+        cell.font = bold
+        header_cells.append(cell)
+    sheet.append(header_cells)
+    sheet.freeze_panes = "C2"
+
+    count = 0
+    for record in records:
+        sheet.append(record_to_row(record))
+        count += 1
+
+    workbook.save(output_file)
+    logger.info(f"已导出 {count} 条筛选结果到：{output_file}")
+    return count
+
+
+def write_results_csv(records: Iterable[Dict], output_file: str) -> int:
+    """
+    逐行写出 CSV（UTF-8 带BOM，Excel 可直接打开）
+
+    Args:
+        records: 输出记录（可以是生成器，逐条消费）
+        output_file: 输出文件路径
+
+    Returns:
+        写出的记录数
+    """
+    count = 0
+    with open(output_file, "w", encoding="utf-8-sig", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(build_header())
+        for record in records:
+            writer.writerow(record_to_row(record))
+            count += 1
+    logger.info(f"已导出 {count} 条筛选结果到：{output_file}")
+    return count
+
+
+def iter_results_csv(records: Iterable[Dict]) -> Iterator[bytes]:
+    """
+    逐行生成 CSV 内容（用于流式响应，第一块带UTF-8 BOM）
+
+    Args:
+        records: 输出记录（可以是生成器，逐条消费）
+
+    Yields:
+        UTF-8 编码的CSV行
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def take() -> bytes:
+        data = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return data.encode("utf-8")
+
+    writer.writerow(build_header())
+    yield b"\xef\xbb\xbf" + take()
+    for record in records:
+        writer.writerow(record_to_row(record))
+        yield take()
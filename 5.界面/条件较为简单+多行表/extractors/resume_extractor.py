@@ -38,3 +38,37 @@ class ResumeExtractor:
             return [major_name]
         
         return []
+    
+    @staticmethod
+    def extract_highest_education_form(resume_data: Dict) -> str:
+        """
+        提取最高学历的学习形式（全日制教育/非全日制教育）
+        
+        Args:
+            resume_data: 简历数据
+        
+        Returns:
+            学习形式，无法确定时返回空字符串
+        """
+        education_info = resume_data.get("学习经历统计信息", {})
+        highest_education = education_info.get("最高学历", "")
+        highest_education_degree = education_info.get("最高学历学位", "")  # 可能包含"非全日制"字样
+        
+        # 方法1：从"主要学习经历"中找到最高学历对应的学习形式
+        for exp in resume_data.get("主要学习经历", []):
+            if isinstance(exp, dict):
+                # 如果学历匹配最高学历，记录学习形式
+                if exp.get("学历", "") == highest_education:
+                    highest_education_form = exp.get("学习形式", "")
+                    if highest_education_form:
+                        return highest_education_form
+                    break
+        
+        # 方法2：如果主要学习经历中没有找到，从"最高学历学位"字段判断
+        if highest_education_degree:
+            if "非全日制" in highest_education_degree:
+                return "非全日制教育"
+            elif "全日制" in highest_education_degree:
+                return "全日制教育"
+        
+        return ""
@@ -6,7 +6,8 @@
 
 import re
 from typing import Dict, Optional
-from core.models import FilterResult
+from core.models import FilterResult, ResumeProfile
+from core.profile import build_resume_profile
 from filters.base import BaseFilter
 from extractors.requirement_extractor import RequirementExtractor
 from matchers.rule_matcher import RuleMatcher
@@ -84,7 +85,7 @@ class AgeFilter(BaseFilter):
         
         return None
     
-    async def filter(self, job_data: Dict, resume_data: Dict) -> FilterResult:
+    async def filter(self, job_data: Dict, resume_data: Dict, profile: Optional[ResumeProfile] = None) -> FilterResult:
         """筛选：年龄要求"""
         qualification = job_data.get("资格条件", [])
         age_requirement_raw = RequirementExtractor.extract_age_requirement(qualification)
@@ -102,8 +103,9 @@ class AgeFilter(BaseFilter):
             )
         
         # 提取简历年龄信息
-        basic_info = resume_data.get("基本信息", {})
-        birth_date = basic_info.get("出生日期", "")
+        if profile is None:
+            profile = build_resume_profile(resume_data)
+        birth_date = profile.birth_date
         
         if not birth_date:
             logger.warning(f"年龄筛选：简历中缺少出生日期信息")
@@ -114,8 +116,8 @@ class AgeFilter(BaseFilter):
                 details={"method": "规则匹配-数据缺失"}
             )
         
-        # 计算年龄
-        age = self.calculator.calculate_age(birth_date)
+        # 年龄已在简历画像中计算（无法解析出生日期时按0岁处理，与 Calculator.calculate_age 一致）
+        age = profile.age if profile.age is not None else 0
         max_age = age_requirement.get("max_age")
         logger.debug(f"年龄筛选：出生日期={birth_date}，计算年龄={age}岁，要求≤{max_age}岁")
         
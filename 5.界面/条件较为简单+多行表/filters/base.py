@@ -5,8 +5,8 @@
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict
-from core.models import FilterResult
+from typing import Dict, Optional
+from core.models import FilterResult, ResumeProfile
 
 
 class BaseFilter(ABC):
@@ -26,13 +26,14 @@ class BaseFilter(ABC):
         self.llm_matcher = llm_matcher
     
     @abstractmethod
-    async def filter(self, job_data: Dict, resume_data: Dict) -> FilterResult:
+    async def filter(self, job_data: Dict, resume_data: Dict, profile: Optional[ResumeProfile] = None) -> FilterResult:
         """
         执行筛选
         
         Args:
             job_data: 岗位数据
             resume_data: 简历数据
+            profile: 简历画像（加载时预先计算），为None时由筛选器按需从简历数据构建
         
         Returns:
             FilterResult
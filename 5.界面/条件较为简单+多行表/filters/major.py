@@ -4,11 +4,11 @@
 专业筛选器
 """
 
-from typing import Dict
-from core.models import FilterResult
+from typing import Dict, Optional
+from core.models import FilterResult, ResumeProfile
+from core.profile import build_resume_profile
 from filters.base import BaseFilter
 from extractors.requirement_extractor import RequirementExtractor
-from extractors.resume_extractor import ResumeExtractor
 from matchers.rule_matcher import RuleMatcher
 from matchers.llm_matcher import LLMMatcher
 from utils.logger_config import setup_logger
@@ -32,7 +32,7 @@ class MajorFilter(BaseFilter):
         super().__init__(model_manager, rule_matcher, llm_matcher)
         self.major_library = major_library
     
-    async def filter(self, job_data: Dict, resume_data: Dict) -> FilterResult:
+    async def filter(self, job_data: Dict, resume_data: Dict, profile: Optional[ResumeProfile] = None) -> FilterResult:
         """筛选：专业要求"""
         qualification = job_data.get("资格条件", [])
         major_requirement = RequirementExtractor.extract_major_requirement(qualification)
@@ -44,8 +44,10 @@ class MajorFilter(BaseFilter):
                 source="rule"
             )
         
-        # 提取简历中的所有专业名称
-        major_names = ResumeExtractor.extract_majors_from_resume(resume_data)
+        # 简历中的专业名称和专业类来自简历画像
+        if profile is None:
+            profile = build_resume_profile(resume_data, major_library=self.major_library)
+        major_names = list(profile.majors)
         if not major_names:
             logger.debug("专业筛选：简历中无专业信息")
             return FilterResult(
@@ -55,14 +57,20 @@ class MajorFilter(BaseFilter):
                 details={"method": "规则匹配-数据缺失"}
             )
         
-        # 查找专业对应的专业类
-        major_classes = self.major_library.get_major_classes(major_names) if self.major_library else []
+        major_classes = list(profile.major_classes)
         logger.debug(f"专业筛选：简历专业={major_names}，对应专业类={major_classes}")
         
         work_experience = resume_data.get("主要工作经历", [])
         
+        # 岗位要求的专业类预先编译为位集，与简历画像的专业类位集按位比较
+        requirement_bits = None
+        if self.major_library and isinstance(major_requirement, dict) and "专业" in major_requirement:
+            requirement_bits = self.major_library.compile_major_requirement(major_requirement.get("专业", []))
+        
         # 规则匹配（先进行专业类匹配）
-        result = self.rule_matcher.match_major_rule(major_requirement, major_names, major_classes, work_experience)
+        result = self.rule_matcher.match_major_rule(major_requirement, major_names, major_classes, work_experience,
+                                                    major_class_bits=profile.major_class_bits,
+                                                    requirement_bits=requirement_bits)
         
         # 如果规则匹配成功，直接返回
         if result["matched"]:
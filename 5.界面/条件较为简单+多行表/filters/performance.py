@@ -4,8 +4,8 @@
 绩效筛选器
 """
 
-from typing import Dict
-from core.models import FilterResult
+from typing import Dict, Optional
+from core.models import FilterResult, ResumeProfile
 from filters.base import BaseFilter
 from extractors.requirement_extractor import RequirementExtractor
 from matchers.rule_matcher import RuleMatcher
@@ -15,7 +15,7 @@ from matchers.llm_matcher import LLMMatcher
 class PerformanceFilter(BaseFilter):
     """绩效筛选器"""
     
-    async def filter(self, job_data: Dict, resume_data: Dict) -> FilterResult:
+    async def filter(self, job_data: Dict, resume_data: Dict, profile: Optional[ResumeProfile] = None) -> FilterResult:
         """筛选：绩效要求（异步方法，支持并发LLM调用）"""
         qualification = job_data.get("资格条件", [])
         performance_requirement = RequirementExtractor.extract_performance_requirement(qualification)
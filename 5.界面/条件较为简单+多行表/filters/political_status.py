@@ -4,8 +4,9 @@
 政治面貌筛选器
 """
 
-from typing import Dict
-from core.models import FilterResult
+from typing import Dict, Optional
+from core.models import FilterResult, ResumeProfile
+from core.profile import build_resume_profile
 from filters.base import BaseFilter
 from extractors.requirement_extractor import RequirementExtractor
 from matchers.rule_matcher import RuleMatcher
@@ -14,7 +15,7 @@ from matchers.rule_matcher import RuleMatcher
 class PoliticalStatusFilter(BaseFilter):
     """政治面貌筛选器"""
     
-    async def filter(self, job_data: Dict, resume_data: Dict) -> FilterResult:
+    async def filter(self, job_data: Dict, resume_data: Dict, profile: Optional[ResumeProfile] = None) -> FilterResult:
         """筛选：政治面貌要求"""
         # 岗位可能没有明确的政治面貌要求，需要从岗位职责或资格条件中提取
         qualification = job_data.get("资格条件", [])
@@ -30,8 +31,9 @@ class PoliticalStatusFilter(BaseFilter):
             )
         
         # 提取简历政治面貌
-        basic_info = resume_data.get("基本信息", {})
-        political_status = basic_info.get("政治面貌", "")
+        if profile is None:
+            profile = build_resume_profile(resume_data)
+        political_status = profile.political_status
         
         # 规则匹配
         result = self.rule_matcher.match_political_rule(political_requirement, political_status)
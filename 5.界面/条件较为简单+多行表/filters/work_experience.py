@@ -4,8 +4,8 @@
 工作经历筛选器
 """
 
-from typing import Dict
-from core.models import FilterResult
+from typing import Dict, Optional
+from core.models import FilterResult, ResumeProfile
 from filters.base import BaseFilter
 from extractors.requirement_extractor import RequirementExtractor
 from matchers.llm_matcher import LLMMatcher
@@ -14,7 +14,7 @@ from matchers.llm_matcher import LLMMatcher
 class WorkExperienceFilter(BaseFilter):
     """工作经历筛选器"""
     
-    async def filter(self, job_data: Dict, resume_data: Dict) -> FilterResult:
+    async def filter(self, job_data: Dict, resume_data: Dict, profile: Optional[ResumeProfile] = None) -> FilterResult:
         """筛选：工作经历要求（使用LLM匹配）"""
         qualification = job_data.get("资格条件", [])
         work_exp_requirement = RequirementExtractor.extract_work_experience_requirement(qualification)
@@ -4,8 +4,9 @@
 工作经验筛选器
 """
 
-from typing import Dict
-from core.models import FilterResult
+from typing import Dict, Optional
+from core.models import FilterResult, ResumeProfile
+from core.profile import build_resume_profile
 from filters.base import BaseFilter
 from matchers.llm_matcher import LLMMatcher
 from extractors.requirement_extractor import RequirementExtractor
@@ -17,7 +18,7 @@ logger = setup_logger("work_years_filter")
 class WorkYearsFilter(BaseFilter):
     """工作经验筛选器"""
     
-    async def filter(self, job_data: Dict, resume_data: Dict) -> FilterResult:
+    async def filter(self, job_data: Dict, resume_data: Dict, profile: Optional[ResumeProfile] = None) -> FilterResult:
         """
         筛选：工作经验要求
         逻辑：先获取"工作经验"的"原文"字段判断是否有"相关工作经验"或"相关经验"关键词
@@ -70,11 +71,12 @@ class WorkYearsFilter(BaseFilter):
         # 进行工作年限判断（规则匹配）
         if work_years_requirement:
             logger.debug("工作经验筛选：使用规则进行工作年限判断")
-            basic_info = resume_data.get("基本信息", {})
-            join_date = basic_info.get("参加工作时间", "")
+            if profile is None:
+                profile = build_resume_profile(resume_data)
             work_experience = resume_data.get("主要工作经历", [])
             
-            result = self.rule_matcher.match_work_years_rule(work_years_requirement, work_experience, join_date)
+            result = self.rule_matcher.match_work_years_rule(work_years_requirement, work_experience, profile.join_date,
+                                                             work_years=profile.work_years)
             
             return FilterResult(
                 passed=result["matched"],
@@ -45,6 +45,9 @@ class LLMStudioModelManager:
             timeout=300
         )
         
+        # 已提交但尚未返回的请求数（包括在线程池中排队等待的请求）
+        self.in_flight = 0
+        
         logger.info(f"已初始化 DashScope LLM: 模型={self.model_name}, base_url={self.base_url}")
     
     async def inference(self, prompt: str, model_path: Optional[str] = None, enable_thinking: bool = True) -> str:
@@ -59,6 +62,7 @@ class LLMStudioModelManager:
         Returns:
             完整响应内容
         """
+        self.in_flight += 1
         try:
             request_start = time.time()
             logger.debug(f"[LLM 请求] 开始发送请求到 DashScope，模型: {self.model_name}")
@@ -91,6 +95,8 @@ class LLMStudioModelManager:
                 raise Exception(f"DashScope API Key 错误: {error_msg}，请检查 API Key 是否正确")
             else:
                 raise Exception(f"DashScope 服务调用失败: {error_msg}")
+        finally:
+            self.in_flight -= 1
     
     async def close(self):
         """关闭HTTP会话（ChatOpenAI 会自动管理连接）"""
@@ -101,7 +107,8 @@ class LLMStudioModelManager:
         return {
             "model": self.model_name,
             "base_url": self.base_url,
-            "provider": "DashScope"
+            "provider": "DashScope",
+            "in_flight": self.in_flight
         }
 
 
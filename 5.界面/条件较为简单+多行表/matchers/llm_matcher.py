@@ -9,7 +9,8 @@ import re
 import time
 from typing import Dict, List, Optional
 from utils.logger_config import setup_logger
-from core.models import FilterResult
+from core.models import (LLM_CALL_FAILED_METHOD, LLM_CONNECTION_FAILED_METHOD, LLM_UNAVAILABLE_METHOD,
+                         FilterResult)
 
 logger = setup_logger("llm_matcher")
 
@@ -25,16 +26,19 @@ class LLMMatcher:
             model_manager: 模型管理器
         """
         self.model_manager = model_manager
+        # 模型未初始化时收到的LLM判断请求数（分片工作进程据此找出需要由主进程调用LLM的条件）
+        self.unavailable_calls = 0
     
     async def match_performance_llm(self, requirement, resume_data: Dict) -> FilterResult:
         """使用LLM匹配绩效要求（异步方法）"""
         if not self.model_manager:
             logger.warning("绩效筛选：模型管理器未初始化，无法使用LLM判断")
+            self.unavailable_calls += 1
             return FilterResult(
                 passed=True,
                 reason="模型未初始化，无法使用LLM判断绩效要求",
                 source="rule",
-                details={"method": "规则匹配-模型未初始化"}
+                details={"method": LLM_UNAVAILABLE_METHOD}
             )
         
         try:
@@ -121,18 +125,19 @@ class LLMMatcher:
                 passed=True,
                 reason=f"LLM调用失败：{str(e)}，默认通过",
                 source="rule",
-                details={"method": "规则匹配-LLM调用失败", "error": str(e)}
+                details={"method": LLM_CALL_FAILED_METHOD, "error": str(e)}
             )
     
     async def match_title_llm(self, requirement, resume_data: Dict) -> FilterResult:
         """使用LLM匹配职称要求（异步方法）"""
         if not self.model_manager:
             logger.warning("职称筛选：模型管理器未初始化，无法使用LLM判断")
+            self.unavailable_calls += 1
             return FilterResult(
                 passed=True,
                 reason="模型未初始化，无法使用LLM判断职称要求",
                 source="rule",
-                details={"method": "规则匹配-模型未初始化"}
+                details={"method": LLM_UNAVAILABLE_METHOD}
             )
         
         try:
@@ -219,7 +224,7 @@ class LLMMatcher:
                         passed=True,
                         reason=f"LLM服务连接失败：{str(e)}，默认通过",
                         source="rule",
-                        details={"method": "规则匹配-LLM连接失败", "error": str(e)}
+                        details={"method": LLM_CONNECTION_FAILED_METHOD, "error": str(e)}
                     )
                 raise
             
@@ -246,18 +251,19 @@ class LLMMatcher:
                 passed=True,
                 reason=f"LLM调用失败：{str(e)}，默认通过",
                 source="rule",
-                details={"method": "规则匹配-LLM调用失败", "error": str(e)}
+                details={"method": LLM_CALL_FAILED_METHOD, "error": str(e)}
             )
     
     async def match_major_llm(self, requirement, major_names: List[str], resume_data: Dict) -> FilterResult:
         """使用LLM判断专业是否相关（异步方法）"""
         if not self.model_manager:
             logger.warning("专业筛选：模型管理器未初始化，无法使用LLM判断")
+            self.unavailable_calls += 1
             return FilterResult(
                 passed=True,
                 reason="模型未初始化，无法使用LLM判断专业要求",
                 source="rule",
-                details={"method": "规则匹配-模型未初始化"}
+                details={"method": LLM_UNAVAILABLE_METHOD}
             )
         
         try:
@@ -338,18 +344,19 @@ class LLMMatcher:
                 passed=True,
                 reason=f"LLM调用失败：{str(e)}，默认通过",
                 source="rule",
-                details={"method": "规则匹配-LLM调用失败", "error": str(e)}
+                details={"method": LLM_CALL_FAILED_METHOD, "error": str(e)}
             )
     
     async def match_work_experience_llm(self, requirement, resume_data: Dict) -> FilterResult:
         """使用LLM匹配工作经历要求（异步方法）"""
         if not self.model_manager:
             logger.warning("工作经历筛选：模型管理器未初始化，无法使用LLM判断")
+            self.unavailable_calls += 1
             return FilterResult(
                 passed=True,
                 reason="模型未初始化，无法使用LLM判断工作经历要求",
                 source="rule",
-                details={"method": "规则匹配-模型未初始化"}
+                details={"method": LLM_UNAVAILABLE_METHOD}
             )
         
         try:
@@ -447,7 +454,7 @@ class LLMMatcher:
                         passed=True,
                         reason=f"LLM服务连接失败：{str(e)}，默认通过",
                         source="rule",
-                        details={"method": "规则匹配-LLM连接失败", "error": str(e)}
+                        details={"method": LLM_CONNECTION_FAILED_METHOD, "error": str(e)}
                     )
                 raise
             
@@ -474,18 +481,19 @@ class LLMMatcher:
                 passed=True,
                 reason=f"LLM调用失败：{str(e)}，默认通过",
                 source="rule",
-                details={"method": "规则匹配-LLM调用失败", "error": str(e)}
+                details={"method": LLM_CALL_FAILED_METHOD, "error": str(e)}
             )
     
     async def match_work_years_llm(self, requirement, job_data: Dict, resume_data: Dict) -> FilterResult:
         """使用LLM匹配工作经验要求（异步方法）"""
         if not self.model_manager:
             logger.warning("工作经验筛选：模型管理器未初始化，无法使用LLM判断")
+            self.unavailable_calls += 1
             return FilterResult(
                 passed=True,
                 reason="模型未初始化，无法使用LLM判断工作经验要求",
                 source="rule",
-                details={"method": "规则匹配-模型未初始化"}
+                details={"method": LLM_UNAVAILABLE_METHOD}
             )
         
         try:
@@ -562,7 +570,7 @@ class LLMMatcher:
                         passed=True,
                         reason=f"LLM服务连接失败：{str(e)}，默认通过",
                         source="rule",
-                        details={"method": "规则匹配-LLM连接失败", "error": str(e)}
+                        details={"method": LLM_CONNECTION_FAILED_METHOD, "error": str(e)}
                     )
                 raise
             
@@ -589,5 +597,5 @@ class LLMMatcher:
                 passed=True,
                 reason=f"LLM调用失败：{str(e)}，默认通过",
                 source="rule",
-                details={"method": "规则匹配-LLM调用失败", "error": str(e)}
+                details={"method": LLM_CALL_FAILED_METHOD, "error": str(e)}
             )
@@ -7,9 +7,10 @@
 import re
 import os
 import json
-from typing import Dict, List, Optional
+from typing import Collection, Dict, List, Optional
 from utils.logger_config import setup_logger
 from utils.calculator import Calculator
+from utils.school_index import SchoolIndex
 
 logger = setup_logger("rule_matcher")
 
@@ -25,17 +26,19 @@ class RuleMatcher:
             school_library_path: 院校库JSON文件路径，如果为None则自动查找
         """
         self.calculator = Calculator()
-        self.school_library = self._load_school_library(school_library_path)
+        self.school_index = self._load_school_library(school_library_path)
+        # 院校库字典，key为院校名称，value为属性标签列表
+        self.school_library = self.school_index.schools
     
-    def _load_school_library(self, school_library_path: Optional[str] = None) -> Dict:
+    def _load_school_library(self, school_library_path: Optional[str] = None) -> SchoolIndex:
         """
-        加载院校库
+        加载院校库并构建索引
         
         Args:
             school_library_path: 院校库JSON文件路径
             
         Returns:
-            院校库字典，key为院校名称，value为属性标签列表
+            SchoolIndex（加载失败时为空索引）
         """
         if school_library_path is None:
             # 自动查找院校库文件
@@ -44,33 +47,45 @@ class RuleMatcher:
             project_root = os.path.dirname(os.path.dirname(current_dir))
             school_library_path = os.path.join(project_root, "data", "院校库.json")
         
-        school_library = {}
+        schools = []
         try:
             if os.path.exists(school_library_path):
                 with open(school_library_path, 'r', encoding='utf-8') as f:
                     data = json.load(f)
                     # 解析院校库数据
                     if "院校库列表" in data:
-                        for school in data["院校库列表"]:
-                            school_name = school.get("院校中文名称", "")
-                            attributes = school.get("属性标签", [])
-                            if school_name:
-                                school_library[school_name] = attributes
-                    logger.info(f"✅ 已加载院校库，共 {len(school_library)} 所院校")
+                        schools = data["院校库列表"]
+                    school_index = SchoolIndex(schools)
+                    logger.info(f"✅ 已加载院校库，共 {len(school_index)} 所院校")
+                    return school_index
             else:
                 logger.warning(f"⚠️ 院校库文件不存在: {school_library_path}")
         except Exception as e:
             logger.error(f"❌ 加载院校库失败: {e}")
         
-        return school_library
+        return SchoolIndex([])
     
-    def _check_school_attributes(self, school_name: str, required_attributes: List[str]) -> bool:
+    def lookup_school_attributes(self, school_name: str) -> List[str]:
+        """
+        在院校库中查找学校的属性标签（精确匹配失败时通过院校库索引进行模糊匹配）
+        
+        Args:
+            school_name: 学校名称
+            
+        Returns:
+            属性标签列表（如["985", "211"]），未找到时返回空列表
+        """
+        return self.school_index.lookup(school_name)
+    
+    def _check_school_attributes(self, school_name: str, required_attributes: List[str],
+                                 school_attributes: Optional[Collection[str]] = None) -> bool:
         """
         检查学校是否具有指定的属性标签
         
         Args:
             school_name: 学校名称
             required_attributes: 需要的属性标签列表（如["985", "211"]）
+            school_attributes: 预先查好的学校属性标签（来自简历画像），为None时查询院校库
             
         Returns:
             如果学校具有所有需要的属性标签，返回True
@@ -78,16 +93,8 @@ class RuleMatcher:
         if not school_name or not self.school_library:
             return False
         
-        # 在院校库中查找学校
-        school_attributes = self.school_library.get(school_name, [])
-        if not school_attributes:
-            # 尝试模糊匹配（去除空格、括号等）
-            school_name_clean = school_name.replace(" ", "").replace("（", "(").replace("）", ")")
-            for lib_school_name, lib_attributes in self.school_library.items():
-                lib_school_name_clean = lib_school_name.replace(" ", "").replace("（", "(").replace("）", ")")
-                if school_name_clean == lib_school_name_clean or school_name_clean in lib_school_name_clean or lib_school_name_clean in school_name_clean:
-                    school_attributes = lib_attributes
-                    break
+        if school_attributes is None:
+            school_attributes = self.lookup_school_attributes(school_name)
         
         # 检查是否包含所有需要的属性
         if not school_attributes:
@@ -102,7 +109,9 @@ class RuleMatcher:
     
     def match_education_rule(self, requirement: Dict, highest_edu: str, fulltime_edu: str, 
                             highest_school: str, highest_school_type: str, fulltime_school_type: str,
-                            highest_education_form: str = "") -> Dict:
+                            highest_education_form: str = "",
+                            school_attributes: Optional[Collection[str]] = None,
+                            resume_level: Optional[int] = None) -> Dict:
         """
         匹配学历规则
         
@@ -114,6 +123,8 @@ class RuleMatcher:
             highest_school_type: 简历最高学历毕业院校类型
             fulltime_school_type: 简历全日制毕业院校类型（保留参数，未使用）
             highest_education_form: 简历最高学历的学习形式（"全日制教育"或"非全日制教育"）
+            school_attributes: 简历画像中预先查好的院校属性标签，为None时查询院校库
+            resume_level: 简历画像中预先计算的最高学历等级，为None时从最高学历文本计算
         """
         edu_levels = {
             "博士": 5,
@@ -148,7 +159,7 @@ class RuleMatcher:
                             
                             # 使用院校库判断
                             if highest_school and self.school_library:
-                                matched_ranking = self._check_school_attributes(highest_school, required_attrs)
+                                matched_ranking = self._check_school_attributes(highest_school, required_attrs, school_attributes)
                             else:
                                 # 降级使用学校类型字段
                                 matched_ranking = "985" in highest_school_type or "211" in highest_school_type
@@ -186,17 +197,19 @@ class RuleMatcher:
                         requires_fulltime = True
                 
                 # 提取简历中的学历等级（只使用最高学历）
-                resume_level = 0
-                for edu, level in edu_levels.items():
-                    if edu in highest_edu:
-                        resume_level = max(resume_level, level)
+                if resume_level is None:
+                    resume_level = 0
+                    for edu, level in edu_levels.items():
+                        if edu in highest_edu:
+                            resume_level = max(resume_level, level)
+                resume_level = int(resume_level)
                 
                 # 检查简历学校是否满足985/211要求（只使用最高学历毕业院校类型）
                 has_985_211_resume = False
                 if has_985_211_in_education and required_attributes:
                     # 优先使用院校库判断
                     if highest_school and self.school_library:
-                        has_985_211_resume = self._check_school_attributes(highest_school, required_attributes)
+                        has_985_211_resume = self._check_school_attributes(highest_school, required_attributes, school_attributes)
                     else:
                         # 降级使用学校类型字段（只使用最高学历毕业院校类型）
                         has_985_211_resume = "985" in highest_school_type or "211" in highest_school_type
@@ -392,7 +405,8 @@ class RuleMatcher:
                 "requirement": requirement_text
             }
     
-    def match_major_rule(self, requirement, major_names: List[str], major_classes: List[str], work_experience: List) -> Dict:
+    def match_major_rule(self, requirement, major_names: List[str], major_classes: List[str], work_experience: List,
+                         major_class_bits: Optional[int] = None, requirement_bits: Optional[List[int]] = None) -> Dict:
         """
         匹配专业规则（使用专业类匹配）
         
@@ -401,6 +415,8 @@ class RuleMatcher:
             major_names: 简历专业名称列表
             major_classes: 简历专业对应的专业类名称列表
             work_experience: 工作经历列表
+            major_class_bits: 简历专业类位集（来自简历画像），与 requirement_bits 同时提供时按位比较
+            requirement_bits: 岗位要求的专业类位集（由 MajorLibrary.compile_major_requirement 编译，与专业要求一一对应）
         
         Returns:
             匹配结果字典，包含matched、reason、need_llm等字段
@@ -424,33 +440,37 @@ class RuleMatcher:
                 # 检查专业类匹配：简历的专业类是否在岗位要求的专业类列表中存在
                 major_matched = False
                 matched_classes = []
-                for req_major in required_majors:
-                    if isinstance(req_major, str):
-                        # 移除"类"和"相关专业"后缀，获取专业类名称
-                        req_major_clean = req_major.replace("类", "").replace("相关专业", "").strip()
-                        # 检查简历的专业类是否包含这个专业类
-                        for resume_class in major_classes:
-                            # 移除"类"后缀进行比较
-                            resume_class_clean = resume_class.replace("类", "").strip()
-                            if req_major_clean == resume_class_clean or req_major_clean in resume_class_clean or resume_class_clean in req_major_clean:
-                                major_matched = True
-                                matched_classes.append(req_major)
-                                break
-                        if major_matched:
+                if major_class_bits is not None and requirement_bits is not None:
+                    # 位集比较：第一个与简历专业类有交集的要求即为匹配
+                    for req_major, req_bits in zip(required_majors, requirement_bits):
+                        if req_bits & major_class_bits:
+                            major_matched = True
+                            matched_classes.append(req_major)
                             break
+                else:
+                    for req_major in required_majors:
+                        if isinstance(req_major, str):
+                            # 移除"类"和"相关专业"后缀，获取专业类名称
+                            req_major_clean = req_major.replace("类", "").replace("相关专业", "").strip()
+                            # 检查简历的专业类是否包含这个专业类
+                            for resume_class in major_classes:
+                                # 移除"类"后缀进行比较
+                                resume_class_clean = resume_class.replace("类", "").strip()
+                                if req_major_clean == resume_class_clean or req_major_clean in resume_class_clean or resume_class_clean in req_major_clean:
+                                    major_matched = True
+                                    matched_classes.append(req_major)
+                                    break
+                            if major_matched:
+                                break
                 
                 # 检查工作经历匹配（如果有经历要求）
-                experience_matched = False
-                if experiences:
-                    # 这里可以进一步检查工作经历
-                    experience_matched = False # 简化处理
+                experience_matched = self.match_major_experience(experiences, work_experience)
                 
                 # 判断：根据条件类型
+                matched = self.combine_major_conditions(condition, major_matched, experience_matched)
                 if condition == "或":
-                    matched = major_matched or experience_matched
                     match_detail = f"满足任一条件：专业匹配={major_matched}（匹配的专业类：{matched_classes}），经历匹配={experience_matched}"
                 else:  # "与"条件
-                    matched = major_matched and experience_matched
                     match_detail = f"满足所有条件：专业匹配={major_matched}（匹配的专业类：{matched_classes}），经历匹配={experience_matched}"
                 
                 logger.debug(f"专业筛选结果：{match_detail}")
@@ -502,6 +522,40 @@ class RuleMatcher:
             "need_llm": False
         }
     
+    @staticmethod
+    def match_major_experience(experiences: List, work_experience: List) -> bool:
+        """
+        专业要求中的经历条件是否满足（向量化规则引擎与本方法保持一致）
+        
+        Args:
+            experiences: 岗位专业要求中的经历要求
+            work_experience: 简历工作经历列表
+        
+        Returns:
+            是否满足经历条件（目前简化处理，总为False）
+        """
+        # 这里可以进一步检查工作经历
+        return False
+    
+    @staticmethod
+    def combine_major_conditions(condition: str, major_matched, experience_matched):
+        """
+        按专业要求的条件类型组合专业类匹配和经历匹配
+        
+        参数可以是布尔值，也可以是 NumPy 布尔数组（向量化规则引擎逐列计算时使用）
+        
+        Args:
+            condition: 条件类型（"或"：满足任一条件，"与"：满足所有条件）
+            major_matched: 专业类是否匹配
+            experience_matched: 经历是否匹配
+        
+        Returns:
+            是否满足专业要求
+        """
+        if condition == "或":
+            return major_matched | experience_matched
+        return major_matched & experience_matched
+    
     def match_major_rule_text(self, requirement_text: str, major: str, work_experience: List) -> Dict:
         """匹配专业规则（文本格式）"""
         # 提取专业关键词
@@ -647,8 +701,17 @@ class RuleMatcher:
             "requirement": requirement
         }
     
-    def match_work_years_rule(self, requirement: Dict, work_experience: List, join_date: str) -> Dict:
-        """匹配工作经验年数规则"""
+    def match_work_years_rule(self, requirement: Dict, work_experience: List, join_date: str,
+                              work_years: Optional[int] = None) -> Dict:
+        """
+        匹配工作经验年数规则
+        
+        Args:
+            requirement: 岗位工作经验要求
+            work_experience: 工作经历列表
+            join_date: 参加工作时间
+            work_years: 简历画像中预先计算的工作年限，为None时根据参加工作时间计算
+        """
         method = "规则匹配-数值比较"
         
         # 从requirement中提取最低年限要求
@@ -683,7 +746,7 @@ class RuleMatcher:
         
         # 计算工作年限
         if join_date:
-            years = self.calculator.calculate_work_years(join_date)
+            years = work_years if work_years is not None else self.calculator.calculate_work_years(join_date)
             detail = f"工作年限计算：参加工作时间={join_date}，计算年限={years}年，要求≥{min_years}年"
             logger.debug(f"工作经验筛选：{detail}")
             
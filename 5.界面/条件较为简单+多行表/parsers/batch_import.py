@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+"""
+简历多行表批量导入模块
+
+一次导入多个工作簿（可选每个工作簿的全部工作表），每张工作表作为一个任务
+在进程池中并行解析；解析结果按任务顺序依次合并为一份去重后的简历列表，
+并记录每条简历的来源（文件、工作表、起始行）。
+
+内容完全相同（忽略各文件各自编号的序号）的简历视为重复，只保留第一次出现的
+一条，后续出现的位置记入该简历的来源列表。
+
+用法：
+    python -m parsers.batch_import 文件1.xlsx 文件2.xlsx ... [--all-sheets] [--workers N] [-o 输出.json]
+"""
+import argparse
+import hashlib
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from parsers.detect_merged_cells_with_accuracy import COL_CONFIG, iter_multirow_persons
+from parsers.xlsx_stream_reader import XlsxStreamReader
+
+# 表头第2行与列映射字段名一致的比例达到该值时，认为是简历多行表
+HEADER_MATCH_RATIO = 0.8
+
+
+@dataclass
+class ResumeSource:
+    """简历记录在工作簿中的位置"""
+    file: str
+    sheet: str
+    row: int
+
+
+@dataclass
+class BatchImportResult:
+    """批量导入结果"""
+    resumes: List[Dict] = field(default_factory=list)
+    sources: List[List[ResumeSource]] = field(default_factory=list)  # 与 resumes 一一对应，第一个为保留的记录
+    sheets: int = 0
+    duplicates: int = 0
+
+
+def is_multirow_resume_sheet(reader: XlsxStreamReader) -> bool:
+    """
+    根据前两行表头判断工作表是否为简历多行表（第1行第1列为"序号"，第2行字段名与列映射基本一致）
+
+    Args:
+        reader: 已定位到该工作表的读取器
+
+    Returns:
+        是否为简历多行表
+    """
+    header = {}
+    for row_idx, values in reader.iter_rows():
+        header[row_idx] = values
+        if row_idx >= 2:
+            break
+    first, second = header.get(1, []), header.get(2, [])
+    if not first or first[0] != "序号":
+        return False
+    matched = sum(1 for col_idx, (_, field_name) in COL_CONFIG.items()
+                  if col_idx <= len(second) and second[col_idx - 1] == field_name)
+    return matched >= len(COL_CONFIG) * HEADER_MATCH_RATIO
+
+
+def list_import_tasks(file_paths: Iterable[str], all_sheets: bool = False) -> List[Tuple[str, Optional[str]]]:
+    """
+    列出需要解析的工作表
+
+    Args:
+        file_paths: 工作簿路径列表
+        all_sheets: 是否导入每个工作簿中所有简历多行表格式的工作表（否则只导入活动工作表）
+
+    Returns:
+        [(文件路径, 工作表名称), ...]；只导入活动工作表时工作表名称为None
+    """
+    tasks = []
+    for file_path in file_paths:
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"文件未找到: {file_path}")
+        if not all_sheets:
+            tasks.append((file_path, None))
+            continue
+        with XlsxStreamReader(file_path) as reader:
+            sheet_names = reader.sheet_names
+        for sheet_name in sheet_names:
+            with XlsxStreamReader(file_path, sheet_name) as reader:
+                if is_multirow_resume_sheet(reader):
+                    tasks.append((file_path, sheet_name))
+    return tasks
+
+
+def parse_sheet_task(task: Tuple[str, Optional[str]]) -> Tuple[str, List[Tuple[int, Dict]]]:
+    """
+    解析一张工作表（进程池中执行）
+
+    Args:
+        task: (文件路径, 工作表名称)
+
+    Returns:
+        (工作表名称, [(起始行号, 人员记录), ...])
+    """
+    file_path, sheet_name = task
+    with XlsxStreamReader(file_path, sheet_name) as reader:
+        sheet_name = reader.sheet_name
+    return sheet_name, list(iter_multirow_persons(file_path, sheet_name=sheet_name, with_rows=True))
+
+
+def resume_content_key(person: Dict) -> str:
+    """简历内容指纹（不含序号，各文件的序号各自编号）"""
+    content = {key: value for key, value in person.items() if key != "序号"}
+    payload = json.dumps(content, ensure_ascii=False, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def iter_sheet_results(tasks: List[Tuple[str, Optional[str]]],
+                       max_workers: Optional[int] = None) -> Iterator[Tuple[str, str, List[Tuple[int, Dict]]]]:
+    """
+    并行解析各工作表，按任务顺序逐个返回结果
+
+    Args:
+        tasks: list_import_tasks 的结果
+        max_workers: 进程数，为None时使用CPU核数；只有一个任务或为1时在当前进程解析
+
+    Yields:
+        (文件路径, 工作表名称, [(起始行号, 人员记录), ...])
+    """
+    workers = min(max_workers or os.cpu_count() or 1, len(tasks))
+    if workers <= 1:
+        for task in tasks:
+            sheet_name, persons = parse_sheet_task(task)
+            yield task[0], sheet_name, persons
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for task, (sheet_name, persons) in zip(tasks, executor.map(parse_sheet_task, tasks)):
+            yield task[0], sheet_name, persons
+
+
+def import_resume_workbooks(file_paths: Iterable[str], all_sheets: bool = False,
+                            max_workers: Optional[int] = None) -> BatchImportResult:
+    """
+    批量导入简历多行表并去重
+
+    Args:
+        file_paths: 工作簿路径列表
+        all_sheets: 是否导入每个工作簿中所有简历多行表格式的工作表
+        max_workers: 进程数，为None时使用CPU核数
+
+    Returns:
+        BatchImportResult
+    """
+    tasks = list_import_tasks(file_paths, all_sheets)
+    result = BatchImportResult(sheets=len(tasks))
+    position_by_key: Dict[str, int] = {}
+
+    for file_path, sheet_name, persons in iter_sheet_results(tasks, max_workers):
+        for row_idx, person in persons:
+            source = ResumeSource(file=os.path.basename(file_path), sheet=sheet_name, row=row_idx)
+            key = resume_content_key(person)
+            position = position_by_key.get(key)
+            if position is not None:
+                result.sources[position].append(source)
+                result.duplicates += 1
+                continue
+            position_by_key[key] = len(result.resumes)
+            result.resumes.append(person)
+            result.sources.append([source])
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="简历多行表批量导入（多进程解析、去重、记录来源）")
+    parser.add_argument("files", nargs="+", help="简历多行表工作簿")
+    parser.add_argument("--all-sheets", action="store_true", help="导入每个工作簿中所有简历多行表格式的工作表")
+    parser.add_argument("--workers", type=int, default=None, help="进程数（默认CPU核数）")
+    parser.add_argument("-o", "--output", default="简历-批量导入.json", help="输出简历JSON文件")
+    args = parser.parse_args()
+
+    result = import_resume_workbooks(args.files, args.all_sheets, args.workers)
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(result.resumes, f, ensure_ascii=False, indent=2)
+    sources_file = os.path.splitext(args.output)[0] + "_来源.json"
+    with open(sources_file, "w", encoding="utf-8") as f:
+        json.dump([[asdict(source) for source in sources] for sources in result.sources], f,
+                  ensure_ascii=False, indent=2)
+
+    print(f"✅ 已导入 {len(args.files)} 个工作簿、{result.sheets} 张工作表：{len(result.resumes)} 条简历，"
+          f"去除重复 {result.duplicates} 条")
+    print(f"💾 简历: {args.output}")
+    print(f"💾 来源: {sources_file}")
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    main()
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""
+多行表解析基准测试
+
+生成一个合成的多行表工作簿（默认 10000 行），分别用完整加载的原实现
+（parse_excel_to_multirow_json_full）和 XLSX 流式读取实现（parse_excel_to_multirow_json）
+解析，核对结果一致并输出耗时。原实现的耗时随行数平方增长，只在 --full-rows
+及其两倍行数的工作簿上参与对照。
+
+用法：
+    python parsers/benchmark_multirow_parser.py [--rows 10000] [--full-rows 250]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+from openpyxl import Workbook
+from openpyxl.worksheet.cell_range import CellRange
+from openpyxl.worksheet.merge import MergedCellRange
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from parsers.detect_merged_cells_with_accuracy import (
+    ARRAY_FIELD_ORDERS,
+    COL_CONFIG,
+    parse_excel_to_multirow_json,
+    parse_excel_to_multirow_json_full,
+)
+
+
+def build_synthetic_workbook(file_path, total_rows=10000):
+    """
+    生成合成多行表：每人占 1~5 行，单值列按人纵向合并，数组列逐行填写
+
+    Args:
+        file_path: 输出文件路径
+        total_rows: 数据行数（不含两行表头）
+
+    Returns:
+        人员数
+    """
+    wb = Workbook()
+    ws = wb.active
+    ws.append([category for _, (category, _) in sorted(COL_CONFIG.items())])
+    ws.append([field for _, (_, field) in sorted(COL_CONFIG.items())])
+
+    array_columns = {col for col, (category, _) in COL_CONFIG.items() if category in ARRAY_FIELD_ORDERS}
+    single_columns = [col for col in sorted(COL_CONFIG) if col not in array_columns]
+
+    row_idx = 3
+    person = 0
+    while row_idx < total_rows + 3:
+        person += 1
+        block = min(1 + person % 5, total_rows + 3 - row_idx)
+        for offset in range(block):
+            row = []
+            for col in sorted(COL_CONFIG):
+                if col in array_columns:
+                    row.append(f"P{person}-R{offset}-C{col}")
+                elif offset == 0:
+                    row.append(person if col == 1 else f"P{person}-C{col}")
+                else:
+                    row.append(None)
+            ws.append(row)
+        if block > 1:
+            for col in single_columns:
+                # ws.merge_cells 每次都与已有合并区域逐个比较，数量多时很慢，这里直接加入
+                merged_range = MergedCellRange(ws, CellRange(min_col=col, min_row=row_idx, max_col=col,
+                                                             max_row=row_idx + block - 1).coord)
+                ws.merged_cells.ranges.add(merged_range)
+                ws._clean_merge_range(merged_range)
+        row_idx += block
+
+    wb.save(file_path)
+    return person
+
+
+def run_parsers(rows, compare_full):
+    """
+    生成 rows 行的合成工作簿并计时解析
+
+    Args:
+        rows: 数据行数
+        compare_full: 是否同时运行原实现并核对结果
+
+    Returns:
+        (流式读取耗时, 原实现耗时或None)
+    """
+    fd, file_path = tempfile.mkstemp(suffix=".xlsx")
+    os.close(fd)
+    try:
+        start = time.perf_counter()
+        persons = build_synthetic_workbook(file_path, rows)
+        print(f"📁 合成工作簿：{rows} 行，{persons} 人（生成耗时 {time.perf_counter() - start:.2f}秒）")
+
+        start = time.perf_counter()
+        stream_result = parse_excel_to_multirow_json(file_path)
+        stream_time = time.perf_counter() - start
+        print(f"   ⏱️  流式读取：{stream_time:.2f}秒（{len(stream_result)} 条记录）")
+
+        full_time = None
+        if compare_full:
+            start = time.perf_counter()
+            full_result = parse_excel_to_multirow_json_full(file_path)
+            full_time = time.perf_counter() - start
+            print(f"   ⏱️  完整加载（原实现）：{full_time:.2f}秒")
+            print(f"   ✅ 结果一致：{full_result == stream_result}，加速比 {full_time / stream_time:.1f}x")
+        return stream_time, full_time
+    finally:
+        os.remove(file_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="多行表解析基准测试")
+    parser.add_argument("--rows", type=int, default=10000, help="合成数据行数")
+    parser.add_argument("--full-rows", type=int, default=250,
+                        help="原实现参与对照的最大行数（原实现每个单元格都重新计算 max_column，耗时随行数平方增长）")
+    args = parser.parse_args()
+
+    # 原实现耗时随行数平方增长，在较小的工作簿上对照结果并计时
+    sizes = sorted({min(args.rows, args.full_rows), min(args.rows, args.full_rows * 2), args.rows})
+    for rows in sizes:
+        run_parsers(rows, compare_full=rows <= args.full_rows * 2)
+
+
+if __name__ == "__main__":
+    main()
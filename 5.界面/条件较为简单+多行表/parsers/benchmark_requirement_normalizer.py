@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+"""
+岗位要求规整基准测试
+
+从岗位需求明细表中取出所有岗位的资格条件、岗位任职条件原文，重复 --rounds 轮
+（模拟同一批次大量岗位共用相同条款），分别在每次调用前清空缓存（只有预编译正则）
+和保留缓存两种方式下拆分、规整，核对结果一致并输出耗时和缓存命中率。
+
+用法：
+    python parsers/benchmark_requirement_normalizer.py [岗位表.xlsx ...] [--rounds 50]
+    不指定文件时使用 1.原文件/岗位需求明细表 下的示例岗位表（跳过没有资格条件、岗位任职条件列的工作簿）
+"""
+import argparse
+import glob
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from parsers import requirement_normalizer
+from parsers.detect_merged_cells_with_accuracy_position_adjust import (
+    build_merged_cells_map,
+    get_cell_value,
+    parse_excel_to_position_json,
+    parse_position_requirements,
+    parse_qualification,
+)
+from parsers.xlsx_stream_reader import load_sheet
+
+# 示例岗位表目录（仓库根目录下）
+SAMPLE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "1.原文件", "岗位需求明细表")
+
+
+def collect_requirement_texts(file_path):
+    """
+    读取岗位表中所有资格条件、岗位任职条件单元格的原文
+
+    Returns:
+        ([资格条件原文, ...], [岗位任职条件原文, ...])
+    """
+    ws = load_sheet(file_path)
+    merged_map = build_merged_cells_map(ws)
+    columns = {}
+    for col_idx in range(1, ws.max_column + 1):
+        header = get_cell_value(ws, 2, col_idx, merged_map)
+        if header in ("资格条件", "岗位任职条件"):
+            columns[str(header).strip()] = col_idx
+
+    qualifications, requirements = [], []
+    for row_idx in range(3, ws.max_row + 1):
+        for header, texts in (("资格条件", qualifications), ("岗位任职条件", requirements)):
+            if header in columns:
+                value = get_cell_value(ws, row_idx, columns[header], merged_map)
+                if value:
+                    texts.append(str(value))
+    return qualifications, requirements
+
+
+def normalize_all(qualifications, requirements, clear_cache):
+    """
+    拆分并规整所有原文
+
+    Args:
+        qualifications: 资格条件原文列表
+        requirements: 岗位任职条件原文列表
+        clear_cache: 每次调用前是否清空缓存
+
+    Returns:
+        (规整结果列表, 耗时秒数（不含清空缓存本身的耗时）)
+    """
+    results = []
+    start = time.perf_counter()
+    for text in qualifications:
+        if clear_cache:
+            requirement_normalizer.cache_clear()
+        parsed = []
+        parse_qualification(parsed, text)
+        results.append(parsed)
+    for text in requirements:
+        if clear_cache:
+            requirement_normalizer.cache_clear()
+        parsed = []
+        parse_position_requirements(parsed, text)
+        results.append(parsed)
+    elapsed = time.perf_counter() - start
+
+    if clear_cache:
+        start = time.perf_counter()
+        for _ in range(len(qualifications) + len(requirements)):
+            requirement_normalizer.cache_clear()
+        elapsed -= time.perf_counter() - start
+    return results, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="岗位要求规整基准测试")
+    parser.add_argument("files", nargs="*", help="岗位需求明细表（默认使用示例岗位表）")
+    parser.add_argument("--rounds", type=int, default=50, help="原文重复轮数")
+    args = parser.parse_args()
+
+    files = args.files or sorted(glob.glob(os.path.join(SAMPLE_DIR, "*.xlsx")))
+    qualifications, requirements = [], []
+    for file_path in files:
+        file_qualifications, file_requirements = collect_requirement_texts(file_path)
+        if not file_qualifications and not file_requirements:
+            continue
+        requirement_normalizer.cache_clear()
+        start = time.perf_counter()
+        positions = parse_excel_to_position_json(file_path)
+        parse_time = time.perf_counter() - start
+        print(f"📁 {os.path.basename(file_path)}：{len(positions)} 个岗位，"
+              f"资格条件 {len(file_qualifications)} 条、岗位任职条件 {len(file_requirements)} 条，"
+              f"整表解析 {parse_time:.3f}秒")
+        qualifications.extend(file_qualifications)
+        requirements.extend(file_requirements)
+
+    qualifications *= args.rounds
+    requirements *= args.rounds
+    distinct = len(set(qualifications)) + len(set(requirements))
+    print(f"📊 共 {len(qualifications) + len(requirements)} 条原文（{args.rounds} 轮），其中不同原文 {distinct} 条")
+
+    uncached_results, uncached_time = normalize_all(qualifications, requirements, clear_cache=True)
+    print(f"   ⏱️  不使用缓存：{uncached_time:.3f}秒")
+
+    requirement_normalizer.cache_clear()
+    cached_results, cached_time = normalize_all(qualifications, requirements, clear_cache=False)
+    print(f"   ⏱️  使用缓存：{cached_time:.3f}秒")
+    print(f"   ✅ 结果一致：{uncached_results == cached_results}，加速比 {uncached_time / cached_time:.1f}x")
+
+    for name, info in requirement_normalizer.cache_info().items():
+        calls = info.hits + info.misses
+        if calls:
+            print(f"   • {name}: 命中 {info.hits}/{calls}（{info.hits / calls:.0%}）")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,32 +7,200 @@ import json
 from openpyxl import load_workbook
 from datetime import datetime
 
+from parsers.merged_cells import MergedCellIndex
+from parsers.xlsx_stream_reader import XlsxStreamReader, fill_merged_rows
+
+
+# 解析结果格式版本（输出结构变化时递增，使解析缓存失效）
+PARSER_VERSION = 1
+
+# 列映射（基于分析结果）：列号 -> (分类, 字段)
+COL_CONFIG = {
+    1: ("序号", "序号"),
+    # 岗位信息 (B-D, 2-4)
+    2: ("岗位信息", "应聘单位"),
+    3: ("岗位信息", "应聘部门路径"),
+    4: ("岗位信息", "应聘岗位"),
+    # 基本信息 (E-X, 5-24)
+    5: ("基本信息", "姓名"),
+    6: ("基本信息", "身份证号"),
+    7: ("基本信息", "性别"),
+    8: ("基本信息", "出生日期"),
+    9: ("基本信息", "民族"),
+    10: ("基本信息", "婚姻状况"),
+    11: ("基本信息", "籍贯"),
+    12: ("基本信息", "政治面貌"),
+    13: ("基本信息", "参加党派日期"),
+    14: ("基本信息", "入党转正日期"),
+    15: ("基本信息", "所在二级单位"),
+    16: ("基本信息", "现工作单位"),
+    17: ("基本信息", "现部门路径"),
+    18: ("基本信息", "现职务或岗位"),
+    19: ("基本信息", "现职级"),
+    20: ("基本信息", "从事应聘岗位序列时长"),
+    21: ("基本信息", "参加工作时间"),
+    22: ("基本信息", "手机号码"),
+    23: ("基本信息", "是否属于规范劳动关系后的厂办大集体和职工持股改革后企业原主业人员"),
+    24: ("基本信息", "是否满足回避原则"),
+    # 家庭主要成员情况 (Y-AD, 25-30)
+    25: ("家庭主要成员情况", "序号"),
+    26: ("家庭主要成员情况", "关系"),
+    27: ("家庭主要成员情况", "姓名"),
+    28: ("家庭主要成员情况", "工作单位"),
+    29: ("家庭主要成员情况", "职务或岗位"),
+    30: ("家庭主要成员情况", "政治面貌"),
+    # 主要学习经历 (AE-AL, 31-38)
+    31: ("主要学习经历", "序号"),
+    32: ("主要学习经历", "学习形式"),
+    33: ("主要学习经历", "开始时间"),
+    34: ("主要学习经历", "结束时间"),
+    35: ("主要学习经历", "毕业院校"),
+    36: ("主要学习经历", "专业"),
+    37: ("主要学习经历", "学历"),
+    38: ("主要学习经历", "学位"),
+    # 学习经历统计信息 (AM-BA, 39-53)
+    39: ("学习经历统计信息", "全日制学历"),
+    40: ("学习经历统计信息", "全日制学位"),
+    41: ("学习经历统计信息", "全日制学历毕业院校"),
+    42: ("学习经历统计信息", "全日制毕业院校类型"),
+    43: ("学习经历统计信息", "全日制学历所学专业"),
+    44: ("学习经历统计信息", "全日制学历毕业时间"),
+    45: ("学习经历统计信息", "最高学历"),
+    46: ("学习经历统计信息", "最高学位"),
+    47: ("学习经历统计信息", "最高学历毕业院校"),
+    48: ("学习经历统计信息", "最高学历毕业院校类型"),
+    49: ("学习经历统计信息", "最高学历所学专业"),
+    50: ("学习经历统计信息", "最高学历毕业时间"),
+    51: ("学习经历统计信息", "最高学历学位"),
+    52: ("学习经历统计信息", "毕业院校"),
+    53: ("学习经历统计信息", "专业"),
+    # 主要工作经历 (BB-BO, 54-67)
+    54: ("主要工作经历", "序号"),
+    55: ("主要工作经历", "工作经历类型"),
+    56: ("主要工作经历", "是否班站所长工作经历"),
+    57: ("主要工作经历", "是否党支部书记（副书记）工作经历"),
+    58: ("主要工作经历", "开始时间"),
+    59: ("主要工作经历", "结束时间"),
+    60: ("主要工作经历", "工作单位"),
+    61: ("主要工作经历", "部门路径"),
+    62: ("主要工作经历", "职务或岗位"),
+    63: ("主要工作经历", "职级"),
+    64: ("主要工作经历", "业务类型"),
+    65: ("主要工作经历", "工作类型"),
+    66: ("主要工作经历", "岗位类别"),
+    67: ("主要工作经历", "岗位序列"),
+    # 工作经历统计信息 (BP-CF, 68-84)
+    68: ("工作经历统计信息", "入南网系统日期（取自用工）"),
+    69: ("工作经历统计信息", "录用渠道（取自用工）"),
+    70: ("工作经历统计信息", "系统内工作时长（年）"),
+    71: ("工作经历统计信息", "如社会招聘进系统，是否满足三年"),
+    72: ("工作经历统计信息", "一级单位本部工作时长（年）"),
+    73: ("工作经历统计信息", "二级单位本部工作时长（年）"),
+    74: ("工作经历统计信息", "三级单位本部工作时长（年）"),
+    75: ("工作经历统计信息", "四级单位本部工作时长（年）"),
+    76: ("工作经历统计信息", "基层一线工作时长（年）"),
+    77: ("工作经历统计信息", "二级单位本部职能部门和直属机构管理类和专业技术类岗位工作时长（年）（不含借用经历）"),
+    78: ("工作经历统计信息", "三级单位本部职能部门工作时长（年）（不含借用经历）"),
+    79: ("工作经历统计信息", "二级单位本部职能部门和直属机构管理类和专业技术类岗位工作时长（年）（含借用经历）"),
+    80: ("工作经历统计信息", "三级单位本部职能部门工作时长（年）（含借用经历）"),
+    81: ("工作经历统计信息", "班站所长工作时长（年）"),
+    82: ("工作经历统计信息", "党支部书记（副书记）工作时长（年）"),
+    83: ("工作经历统计信息", "管制业务工作时长（年）"),
+    84: ("工作经历统计信息", "非管制业务工作时长（年）"),
+    # 外语语种及水平 (CG-CK, 85-89)
+    85: ("外语语种及水平", "序号"),
+    86: ("外语语种及水平", "语言"),
+    87: ("外语语种及水平", "级别"),
+    88: ("外语语种及水平", "分数"),
+    89: ("外语语种及水平", "获证时间"),
+    # 职称证书 (CL-CO, 90-93)
+    90: ("职称证书", "序号"),
+    91: ("职称证书", "职称名称"),
+    92: ("职称证书", "职称等级"),
+    93: ("职称证书", "获证时间"),
+    # 职业资格证书 (CP-CR, 94-96)
+    94: ("职业资格证书", "资格名称"),
+    95: ("职业资格证书", "资格等级"),
+    96: ("职业资格证书", "获证时间"),
+    # 职业技能等级 (CS-CU, 97-99)
+    97: ("职业技能等级", "职业技能名称"),
+    98: ("职业技能等级", "技能等级"),
+    99: ("职业技能等级", "获证时间"),
+    # 其他证书 (CV-CX, 100-102)
+    100: ("其他证书", "证书名称"),
+    101: ("其他证书", "证书等级"),
+    102: ("其他证书", "获证时间"),
+    # 个人荣誉 (CY-DC, 103-107)
+    103: ("个人荣誉", "序号"),
+    104: ("个人荣誉", "荣誉级别"),
+    105: ("个人荣誉", "荣誉名称"),
+    106: ("个人荣誉", "授予单位"),
+    107: ("个人荣誉", "获得时间"),
+    # 证书统计信息 (DD-DI, 108-113)
+    108: ("证书统计信息", "职称等级（最高）"),
+    109: ("证书统计信息", "职称名称"),
+    110: ("证书统计信息", "职业技能等级（最高）"),
+    111: ("证书统计信息", "职业技能名称"),
+    112: ("证书统计信息", "个人荣誉级别（最高）"),
+    113: ("证书统计信息", "荣誉名称"),
+    # 个人处分 (DJ-DO, 114-119)
+    114: ("个人处分", "处分类型"),
+    115: ("个人处分", "处分等级"),
+    116: ("个人处分", "处分开始时间"),
+    117: ("个人处分", "处分结束时间"),
+    118: ("个人处分", "处分期限（月）"),
+    119: ("个人处分", "处分单位"),
+    # 处分统计信息 (DP-DQ, 120-121)
+    120: ("处分统计信息", "近三年党纪处分最高等级"),
+    121: ("处分统计信息", "近三年政务处分最高等级"),
+    # 年度绩效情况 (DR-DY, 122-129)
+    122: ("年度绩效情况", "2020年度绩效"),
+    123: ("年度绩效情况", "2021年度绩效"),
+    124: ("年度绩效情况", "2022年度绩效"),
+    125: ("年度绩效情况", "2023年度绩效"),
+    126: ("年度绩效情况", "2024年度绩效"),
+    127: ("年度绩效情况", "2025年度绩效"),
+    128: ("年度绩效情况", '近三年绩效为"A"或"优秀"的个数'),
+    129: ("年度绩效情况", '近六年绩效为"A"或"优秀"的个数'),
+    # 近三年主要工作业绩与成果 (DZ, 130)
+    130: ("近三年主要工作业绩与成果", "近三年主要工作业绩与成果"),
+}
+
+# 数组分类的字段顺序（第一个字段出现时新建一个条目）
+ARRAY_FIELD_ORDERS = {
+    "家庭主要成员情况": ["序号", "关系", "姓名", "工作单位", "职务或岗位", "政治面貌"],
+    "主要学习经历": ["序号", "学习形式", "开始时间", "结束时间", "毕业院校", "专业", "学历", "学位"],
+    "主要工作经历": ["序号", "工作经历类型", "是否班站所长工作经历", "是否党支部书记（副书记）工作经历", "开始时间", "结束时间", "工作单位", "部门路径", "职务或岗位", "职级", "业务类型", "工作类型", "岗位类别", "岗位序列"],
+    "外语语种及水平": ["序号", "语言", "级别", "分数", "获证时间"],
+    "职称证书": ["序号", "职称名称", "职称等级", "获证时间"],
+    "职业资格证书": ["资格名称", "资格等级", "获证时间"],
+    "职业技能等级": ["职业技能名称", "技能等级", "获证时间"],
+    "其他证书": ["证书名称", "证书等级", "获证时间"],
+    "个人荣誉": ["序号", "荣誉级别", "荣誉名称", "授予单位", "获得时间"],
+    "个人处分": ["处分类型", "处分等级", "处分开始时间", "处分结束时间", "处分期限（月）", "处分单位"],
+}
+
+# 直接保存在人员记录顶层的分类（值为单个字段）
+SCALAR_CATEGORIES = ("序号", "近三年主要工作业绩与成果")
+
 
 def build_merged_cells_map(ws):
     """
-    构建合并单元格映射表
-    返回：{(row, col): (master_row, master_col)}
+    构建合并单元格索引（按列二分查找，不按单元格展开）
+    返回：MergedCellIndex，master(row, col) 为 (master_row, master_col) 或 None
     """
-    merged_map = {}
-    for merged_range in ws.merged_cells.ranges:
-        min_row, min_col = merged_range.min_row, merged_range.min_col
-        max_row, max_col = merged_range.max_row, merged_range.max_col
-        
-        # 所有合并区域内的单元格都指向左上角的主单元格
-        for row in range(min_row, max_row + 1):
-            for col in range(min_col, max_col + 1):
-                merged_map[(row, col)] = (min_row, min_col)
-    
-    return merged_map
+    return MergedCellIndex(
+        (merged_range.min_row, merged_range.min_col, merged_range.max_row, merged_range.max_col)
+        for merged_range in ws.merged_cells.ranges
+    )
 
 
 def get_cell_value(ws, row, col, merged_map):
     """
     获取单元格的值（处理合并单元格）
     """
-    cell_coord = (row, col)
-    if cell_coord in merged_map:
-        master_coord = merged_map[cell_coord]
+    master_coord = merged_map.master(row, col)
+    if master_coord is not None:
         return ws.cell(master_coord[0], master_coord[1]).value
     else:
         return ws.cell(row, col).value
@@ -49,9 +217,10 @@ def convert_value(value):
     return str(value).strip()
 
 
-def parse_excel_to_multirow_json(file_path):
+def parse_excel_to_multirow_json_full(file_path):
     """
-    解析 Excel 文件为多行表 JSON 格式
+    解析 Excel 文件为多行表 JSON 格式（完整加载工作簿、逐个单元格读取的原实现，
+    保留用于结果对照和基准测试）
     """
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"文件未找到: {file_path}")
@@ -62,157 +231,7 @@ def parse_excel_to_multirow_json(file_path):
     # 构建合并单元格映射
     merged_map = build_merged_cells_map(ws)
     
-    # 定义列映射（基于分析结果）
-    col_config = {
-        1: ("序号", "序号"),
-        # 岗位信息 (B-D, 2-4)
-        2: ("岗位信息", "应聘单位"),
-        3: ("岗位信息", "应聘部门路径"),
-        4: ("岗位信息", "应聘岗位"),
-        # 基本信息 (E-X, 5-24)
-        5: ("基本信息", "姓名"),
-        6: ("基本信息", "身份证号"),
-        7: ("基本信息", "性别"),
-        8: ("基本信息", "出生日期"),
-        9: ("基本信息", "民族"),
-        10: ("基本信息", "婚姻状况"),
-        11: ("基本信息", "籍贯"),
-        12: ("基本信息", "政治面貌"),
-        13: ("基本信息", "参加党派日期"),
-        14: ("基本信息", "入党转正日期"),
-        15: ("基本信息", "所在二级单位"),
-        16: ("基本信息", "现工作单位"),
-        17: ("基本信息", "现部门路径"),
-        18: ("基本信息", "现职务或岗位"),
-        19: ("基本信息", "现职级"),
-        20: ("基本信息", "从事应聘岗位序列时长"),
-        21: ("基本信息", "参加工作时间"),
-        22: ("基本信息", "手机号码"),
-        23: ("基本信息", "是否属于规范劳动关系后的厂办大集体和职工持股改革后企业原主业人员"),
-        24: ("基本信息", "是否满足回避原则"),
-        # 家庭主要成员情况 (Y-AD, 25-30)
-        25: ("家庭主要成员情况", "序号"),
-        26: ("家庭主要成员情况", "关系"),
-        27: ("家庭主要成员情况", "姓名"),
-        28: ("家庭主要成员情况", "工作单位"),
-        29: ("家庭主要成员情况", "职务或岗位"),
-        30: ("家庭主要成员情况", "政治面貌"),
-        # 主要学习经历 (AE-AL, 31-38)
-        31: ("主要学习经历", "序号"),
-        32: ("主要学习经历", "学习形式"),
-        33: ("主要学习经历", "开始时间"),
-        34: ("主要学习经历", "结束时间"),
-        35: ("主要学习经历", "毕业院校"),
-        36: ("主要学习经历", "专业"),
-        37: ("主要学习经历", "学历"),
-        38: ("主要学习经历", "学位"),
-        # 学习经历统计信息 (AM-BA, 39-53)
-        39: ("学习经历统计信息", "全日制学历"),
-        40: ("学习经历统计信息", "全日制学位"),
-        41: ("学习经历统计信息", "全日制学历毕业院校"),
-        42: ("学习经历统计信息", "全日制毕业院校类型"),
-        43: ("学习经历统计信息", "全日制学历所学专业"),
-        44: ("学习经历统计信息", "全日制学历毕业时间"),
-        45: ("学习经历统计信息", "最高学历"),
-        46: ("学习经历统计信息", "最高学位"),
-        47: ("学习经历统计信息", "最高学历毕业院校"),
-        48: ("学习经历统计信息", "最高学历毕业院校类型"),
-        49: ("学习经历统计信息", "最高学历所学专业"),
-        50: ("学习经历统计信息", "最高学历毕业时间"),
-        51: ("学习经历统计信息", "最高学历学位"),
-        52: ("学习经历统计信息", "毕业院校"),
-        53: ("学习经历统计信息", "专业"),
-        # 主要工作经历 (BB-BO, 54-67)
-        54: ("主要工作经历", "序号"),
-        55: ("主要工作经历", "工作经历类型"),
-        56: ("主要工作经历", "是否班站所长工作经历"),
-        57: ("主要工作经历", "是否党支部书记（副书记）工作经历"),
-        58: ("主要工作经历", "开始时间"),
-        59: ("主要工作经历", "结束时间"),
-        60: ("主要工作经历", "工作单位"),
-        61: ("主要工作经历", "部门路径"),
-        62: ("主要工作经历", "职务或岗位"),
-        63: ("主要工作经历", "职级"),
-        64: ("主要工作经历", "业务类型"),
-        65: ("主要工作经历", "工作类型"),
-        66: ("主要工作经历", "岗位类别"),
-        67: ("主要工作经历", "岗位序列"),
-        # 工作经历统计信息 (BP-CF, 68-84)
-        68: ("工作经历统计信息", "入南网系统日期（取自用工）"),
-        69: ("工作经历统计信息", "录用渠道（取自用工）"),
-        70: ("工作经历统计信息", "系统内工作时长（年）"),
-        71: ("工作经历统计信息", "如社会招聘进系统，是否满足三年"),
-        72: ("工作经历统计信息", "一级单位本部工作时长（年）"),
-        73: ("工作经历统计信息", "二级单位本部工作时长（年）"),
-        74: ("工作经历统计信息", "三级单位本部工作时长（年）"),
-        75: ("工作经历统计信息", "四级单位本部工作时长（年）"),
-        76: ("工作经历统计信息", "基层一线工作时长（年）"),
-        77: ("工作经历统计信息", "二级单位本部职能部门和直属机构管理类和专业技术类岗位工作时长（年）（不含借用经历）"),
-        78: ("工作经历统计信息", "三级单位本部职能部门工作时长（年）（不含借用经历）"),
-        79: ("工作经历统计信息", "二级单位本部职能部门和直属机构管理类和专业技术类岗位工作时长（年）（含借用经历）"),
-        80: ("工作经历统计信息", "三级单位本部职能部门工作时长（年）（含借用经历）"),
-        81: ("工作经历统计信息", "班站所长工作时长（年）"),
-        82: ("工作经历统计信息", "党支部书记（副书记）工作时长（年）"),
-        83: ("工作经历统计信息", "管制业务工作时长（年）"),
-        84: ("工作经历统计信息", "非管制业务工作时长（年）"),
-        # 外语语种及水平 (CG-CK, 85-89)
-        85: ("外语语种及水平", "序号"),
-        86: ("外语语种及水平", "语言"),
-        87: ("外语语种及水平", "级别"),
-        88: ("外语语种及水平", "分数"),
-        89: ("外语语种及水平", "获证时间"),
-        # 职称证书 (CL-CO, 90-93)
-        90: ("职称证书", "序号"),
-        91: ("职称证书", "职称名称"),
-        92: ("职称证书", "职称等级"),
-        93: ("职称证书", "获证时间"),
-        # 职业资格证书 (CP-CR, 94-96)
-        94: ("职业资格证书", "资格名称"),
-        95: ("职业资格证书", "资格等级"),
-        96: ("职业资格证书", "获证时间"),
-        # 职业技能等级 (CS-CU, 97-99)
-        97: ("职业技能等级", "职业技能名称"),
-        98: ("职业技能等级", "技能等级"),
-        99: ("职业技能等级", "获证时间"),
-        # 其他证书 (CV-CX, 100-102)
-        100: ("其他证书", "证书名称"),
-        101: ("其他证书", "证书等级"),
-        102: ("其他证书", "获证时间"),
-        # 个人荣誉 (CY-DC, 103-107)
-        103: ("个人荣誉", "序号"),
-        104: ("个人荣誉", "荣誉级别"),
-        105: ("个人荣誉", "荣誉名称"),
-        106: ("个人荣誉", "授予单位"),
-        107: ("个人荣誉", "获得时间"),
-        # 证书统计信息 (DD-DI, 108-113)
-        108: ("证书统计信息", "职称等级（最高）"),
-        109: ("证书统计信息", "职称名称"),
-        110: ("证书统计信息", "职业技能等级（最高）"),
-        111: ("证书统计信息", "职业技能名称"),
-        112: ("证书统计信息", "个人荣誉级别（最高）"),
-        113: ("证书统计信息", "荣誉名称"),
-        # 个人处分 (DJ-DO, 114-119)
-        114: ("个人处分", "处分类型"),
-        115: ("个人处分", "处分等级"),
-        116: ("个人处分", "处分开始时间"),
-        117: ("个人处分", "处分结束时间"),
-        118: ("个人处分", "处分期限（月）"),
-        119: ("个人处分", "处分单位"),
-        # 处分统计信息 (DP-DQ, 120-121)
-        120: ("处分统计信息", "近三年党纪处分最高等级"),
-        121: ("处分统计信息", "近三年政务处分最高等级"),
-        # 年度绩效情况 (DR-DY, 122-129)
-        122: ("年度绩效情况", "2020年度绩效"),
-        123: ("年度绩效情况", "2021年度绩效"),
-        124: ("年度绩效情况", "2022年度绩效"),
-        125: ("年度绩效情况", "2023年度绩效"),
-        126: ("年度绩效情况", "2024年度绩效"),
-        127: ("年度绩效情况", "2025年度绩效"),
-        128: ("年度绩效情况", '近三年绩效为"A"或"优秀"的个数'),
-        129: ("年度绩效情况", '近六年绩效为"A"或"优秀"的个数'),
-        # 近三年主要工作业绩与成果 (DZ, 130)
-        130: ("近三年主要工作业绩与成果", "近三年主要工作业绩与成果"),
-    }
+    col_config = COL_CONFIG
     
     # 读取数据（从第3行开始）
     result = []
@@ -225,8 +244,7 @@ def parse_excel_to_multirow_json(file_path):
         
         # 检查这一行的序号列是否是主单元格（合并单元格的左上角）
         # 如果是主单元格，说明是新的一行数据开始
-        cell_coord = (row_idx, 1)
-        is_master_cell = cell_coord not in merged_map or merged_map[cell_coord] == cell_coord
+        is_master_cell = merged_map.is_master_or_unmerged(row_idx, 1)
         
         # 如果序号不为空且是主单元格，说明是新的一行数据开始
         # 即使序号相同，如果是主单元格，也应该创建新的人（处理序号重复的情况）
@@ -401,6 +419,109 @@ def add_to_array(array_field, field_name, value, field_order):
             array_field.append(new_item)
 
 
+def compile_column_handlers(col_config, max_column=None):
+    """
+    把列映射编译为按列的处理函数表（解析时不再逐个单元格判断分类）
+    
+    Args:
+        col_config: 列映射 {列号: (分类, 字段)}
+        max_column: 工作表最大列号，超出的列不处理（为None时不限制）
+    
+    Returns:
+        [(列位置(从0开始), 处理函数(person, value)), ...]，按列号排序
+    """
+    handlers = []
+    for col_idx, (category, field) in sorted(col_config.items()):
+        if max_column is not None and col_idx > max_column:
+            break
+        if category in SCALAR_CATEGORIES:
+            def handler(person, value, category=category):
+                person[category] = value
+        elif category in ARRAY_FIELD_ORDERS:
+            def handler(person, value, category=category, field=field, order=ARRAY_FIELD_ORDERS[category]):
+                add_to_array(person[category], field, value, order)
+        else:
+            def handler(person, value, category=category, field=field):
+                person[category][field] = value
+        handlers.append((col_idx - 1, handler))
+    return handlers
+
+
+def group_multirow_persons(filled_rows, handlers, with_rows=False):
+    """
+    把逐行读取的数据行合并为人员记录（序号列为主单元格且不为空的行开始一个新的人）
+    
+    Args:
+        filled_rows: fill_merged_rows 的输出（从第3行开始）
+        handlers: compile_column_handlers 的结果
+        with_rows: 是否同时返回人员记录的起始行号
+    
+    Yields:
+        人员记录字典；with_rows 为True时为 (起始行号, 人员记录字典)
+    """
+    current_person = None
+    current_row = None
+    
+    for row_idx, row_values, is_master_cell in filled_rows:
+        # 序号列是主单元格且不为空时，开始新的人员记录（序号重复时也创建新记录）
+        序号_val = row_values[0] if row_values else None
+        if 序号_val is not None and is_master_cell:
+            if current_person is not None:
+                yield (current_row, current_person) if with_rows else current_person
+            current_person = initialize_person_data(序号_val)
+            current_row = row_idx
+        
+        if current_person is None:
+            continue
+        
+        for position, handler in handlers:
+            value = row_values[position]
+            if value is None:
+                continue
+            value = convert_value(value)
+            if value:
+                handler(current_person, value)
+    
+    # 最后一个人
+    if current_person is not None:
+        yield (current_row, current_person) if with_rows else current_person
+
+
+def iter_multirow_persons(file_path, col_config=None, sheet_name=None, with_rows=False):
+    """
+    流式逐个解析多行表中的人员记录（与 parse_excel_to_multirow_json_full 结果一致）
+    
+    Args:
+        file_path: Excel 文件路径
+        col_config: 列映射，为None时使用 COL_CONFIG
+        sheet_name: 工作表名称，为None时解析活动工作表
+        with_rows: 是否同时返回人员记录的起始行号
+    
+    Yields:
+        人员记录字典；with_rows 为True时为 (起始行号, 人员记录字典)
+    """
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"文件未找到: {file_path}")
+    
+    with XlsxStreamReader(file_path, sheet_name) as reader:
+        merged_ranges = reader.merged_ranges()
+        handlers = compile_column_handlers(col_config or COL_CONFIG)
+        width = max((position for position, _ in handlers), default=-1) + 1
+        
+        # 合并区域超出最后一个数据行时，区域内的空行也要处理
+        last_merged_row = max((max_row for _, _, max_row, _ in merged_ranges), default=None)
+        rows = reader.iter_rows(max_row=last_merged_row)
+        yield from group_multirow_persons(fill_merged_rows(rows, merged_ranges, width, start_row=3),
+                                          handlers, with_rows)
+
+
+def parse_excel_to_multirow_json(file_path):
+    """
+    解析 Excel 文件为多行表 JSON 格式（XLSX 流式读取）
+    """
+    return list(iter_multirow_persons(file_path))
+
+
 def main():
     """主函数"""
     file_name = "（现RPA小工具流程）简历导入多行表-系统架构师_20260116_v4.xlsx"
@@ -440,7 +561,7 @@ def main():
         print("=" * 80)
         print("🎯 准确率评估")
         print("=" * 80)
-        print("• 检测方法: openpyxl (直接读取 Excel XML 结构)")
+        print("• 检测方法: XLSX 流式读取 (zipfile 直接读取 Excel XML 结构)")
         print("• 合并单元格识别准确率: ≥ 99.9%")
         print("• 数据读取准确率: ≥ 99.9%")
         print("• 说明: 直接解析 Excel 文件的 XML 结构，读取 <mergeCells> 标签")
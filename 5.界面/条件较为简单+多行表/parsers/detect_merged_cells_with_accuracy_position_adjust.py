@@ -5,325 +5,48 @@
 import os
 import json
 import re
-from openpyxl import load_workbook
 from datetime import datetime
 
-
-# ========== 规整功能函数 ==========
-
-def extract_condition_type(text):
-    """提取条件类型：或/且"""
-    if not text:
-        return ""
-    
-    or_keywords = ["任一", "或", "可选"]
-    for keyword in or_keywords:
-        if keyword in text:
-            return "或"
-    
-    and_keywords = ["且", "同时", "并"]
-    for keyword in and_keywords:
-        if keyword in text:
-            return "且"
-    
-    return ""
-
-
-def process_education_requirement(original_text):
-    """
-    处理学历要求
-    返回: {"条件": "", "排名": [], "学历": []}
-    """
-    if not original_text or not original_text.strip():
-        return {"条件": "", "排名": [], "学历": []}
-    
-    result = {
-        "条件": extract_condition_type(original_text),
-        "排名": [],
-        "学历": []
-    }
-    
-    # 按①②或标点分割
-    sentences = re.split(r'[①②③④⑤⑥⑦⑧⑨⑩]|[，。；]', original_text)
-    
-    for sentence in sentences:
-        sentence = sentence.strip()
-        if not sentence:
-            continue
-        
-        # 判断是否包含排行榜关键词（不包括985/211）
-        has_ranking = any(keyword in sentence for keyword in ["排行榜", "QS", "泰晤士"])
-        
-        if has_ranking:
-            result["排名"].append(sentence)
-        elif any(keyword in sentence for keyword in ["985", "211", "双一流", "学历", "学位", "本科", "硕士", "博士"]):
-            result["学历"].append(sentence)
-    
-    return result
-
-
-def process_major_requirement(original_text):
-    """
-    处理专业要求
-    返回: {"条件": "", "专业": [], "经历": []}
-    """
-    if not original_text or not original_text.strip():
-        return {"条件": "", "专业": [], "经历": []}
-    
-    result = {
-        "条件": extract_condition_type(original_text),
-        "专业": [],
-        "经历": []
-    }
-    
-    # 分离专业和经历
-    parts = re.split(r'[。]', original_text)
-    
-    for part in parts:
-        part = part.strip()
-        if not part:
-            continue
-        
-        # 判断是否是经历描述
-        if "具备" in part or "工作经历" in part or ("年" in part and "专业" not in part):
-            result["经历"].append(part + "。" if not part.endswith("。") else part)
-        else:
-            # 按逗号分割专业
-            majors = re.split(r'[，,；]', part)
-            for major in majors:
-                major = major.strip()
-                if major and major not in ["或"]:
-                    result["专业"].append(major)
-    
-    return result
-
-
-def process_age_requirement(original_text):
-    """
-    处理年龄要求
-    返回: "" (字符串格式，如 "≤40")
-    """
-    if not original_text or not original_text.strip():
-        return ""
-    
-    # 提取数字
-    numbers = re.findall(r'\d+', original_text)
-    if not numbers:
-        return ""
-    
-    age = numbers[0]
-    
-    # 判断比较关系
-    if "不超过" in original_text or "以下（含）" in original_text:
-        return f"≤{age}"
-    elif "以下" in original_text:
-        return f"<{age}"
-    elif "及以上" in original_text or "不少于" in original_text:
-        return f"≥{age}"
-    elif "以上" in original_text:
-        return f">{age}"
-    elif len(numbers) >= 2:
-        return f"{numbers[0]}-{numbers[1]}"
-    
-    return f"≤{age}"
-
-
-def process_performance_requirement(original_text):
-    """
-    处理绩效要求
-    返回: {"条件": "", "系统内": "", "系统外": ""}
-    """
-    if not original_text or not original_text.strip():
-        return {"条件": "", "系统内": "", "系统外": ""}
-    
-    result = {
-        "条件": "",
-        "系统内": "",
-        "系统外": ""
-    }
-    
-    # 判断是否同时包含系统内和系统外
-    if "系统内" in original_text and "系统外" in original_text:
-        result["条件"] = "与"
-        
-        # 分割系统内和系统外
-        parts = original_text.split("系统外")
-        if len(parts) == 2:
-            # 提取系统内部分
-            system_in_part = parts[0]
-            if "系统内" in system_in_part:
-                system_in_text = system_in_part.split("系统内")[-1].strip()
-                # 移除开头的逗号或顿号
-                system_in_text = re.sub(r'^[，,、]', '', system_in_text)
-                result["系统内"] = system_in_text
-            
-            # 提取系统外部分
-            system_out_text = parts[1].strip()
-            # 移除开头的逗号或顿号
-            system_out_text = re.sub(r'^[，,、]', '', system_out_text)
-            result["系统外"] = system_out_text
-    
-    return result
-
-
-def process_title_requirement(original_text):
-    """
-    处理职称要求
-    返回: [] (数组)
-    """
-    if not original_text or not original_text.strip():
-        return []
-    
-    result = []
-    
-    # 职称等级映射
-    if "正高级" in original_text:
-        result.append("正高级")
-    
-    if "副高级" in original_text or ("高级" in original_text and "副高级" not in result):
-        if "副高级" not in result:
-            result.append("副高级")
-    
-    if "中级" in original_text:
-        result.append("中级")
-    
-    if "初级" in original_text:
-        result.append("初级")
-    
-    # 处理"及以上"的情况
-    if "高级及以上" in original_text or "副高级及以上" in original_text:
-        result = ["正高级", "副高级"]
-    elif "中级及以上" in original_text:
-        result = ["正高级", "副高级", "中级"]
-    
-    return result
-
-
-def process_work_experience_qualification(original_text):
-    """
-    处理资格条件中的工作经历
-    返回: {"条件": "", "南方电网公司系统内应聘人员": "", "南方电网公司系统外应聘人员": ""}
-    """
-    if not original_text or not original_text.strip():
-        return {"条件": "", "南方电网公司系统内应聘人员": "", "南方电网公司系统外应聘人员": ""}
-    
-    result = {
-        "条件": "",
-        "南方电网公司系统内应聘人员": "",
-        "南方电网公司系统外应聘人员": ""
-    }
-    
-    # 判断是否有（1）和（2）标记
-    if "（1）" in original_text and "（2）" in original_text:
-        result["条件"] = "或"
-        
-        # 分割（1）和（2）
-        parts = original_text.split("（2）")
-        if len(parts) == 2:
-            # 提取（1）部分
-            part1 = parts[0]
-            if "（1）" in part1:
-                part1_text = part1.split("（1）")[-1].strip()
-                # 提取系统内应聘人员后的内容
-                if "系统内应聘人员" in part1_text or "南方电网公司系统内应聘人员" in part1_text:
-                    system_in_text = re.split(r'系统内应聘人员[:：]', part1_text)[-1].strip()
-                    result["南方电网公司系统内应聘人员"] = system_in_text
-            
-            # 提取（2）部分
-            part2_text = parts[1].strip()
-            # 提取系统外应聘人员后的内容
-            if "系统外应聘人员" in part2_text or "南方电网公司系统外应聘人员" in part2_text:
-                system_out_text = re.split(r'系统外应聘人员[:：]', part2_text)[-1].strip()
-                result["南方电网公司系统外应聘人员"] = system_out_text
-    
-    return result
-
-
-def process_work_experience_position(original_text):
-    """
-    处理岗位任职条件中的工作经验
-    返回: "" (字符串格式，如 "≥3")
-    
-    只有当文本明确包含年限相关的关键词时才提取数字
-    """
-    if not original_text or not original_text.strip():
-        return ""
-    
-    # 必须包含年限相关的关键词
-    year_keywords = ["年", "工作经验", "工作年限", "从业经验"]
-    has_year_keyword = any(keyword in original_text for keyword in year_keywords)
-    
-    if not has_year_keyword:
-        return ""
-    
-    # 查找"数字+年"的模式
-    year_pattern = re.search(r'(\d+)\s*年', original_text)
-    if not year_pattern:
-        return ""
-    
-    years = year_pattern.group(1)
-    
-    # 判断比较关系（在数字附近查找）
-    # 获取匹配位置前后的文本
-    match_pos = year_pattern.start()
-    context = original_text[max(0, match_pos-10):min(len(original_text), match_pos+20)]
-    
-    if "及以上" in context or "不少于" in context:
-        return f"≥{years}"
-    elif "以上" in context and "及以上" not in context:
-        return f">{years}"
-    elif "以下" in context and "及以下" not in context:
-        return f"<{years}"
-    elif "及以下" in context or "不超过" in context:
-        return f"≤{years}"
-    
-    # 检查是否有范围（如"3-5年"）
-    range_pattern = re.search(r'(\d+)\s*[-~至]\s*(\d+)\s*年', original_text)
-    if range_pattern:
-        return f"{range_pattern.group(1)}-{range_pattern.group(2)}"
-    
-    # 默认返回 ≥
-    return f"≥{years}"
-
-
-def process_certificate_requirement(original_text):
-    """
-    处理持证要求
-    返回: "" (直接返回原文)
-    """
-    if not original_text:
-        return ""
-    return original_text.strip()
-
+from parsers.merged_cells import MergedCellIndex
+from parsers.requirement_normalizer import (
+    process_age_requirement,
+    process_certificate_requirement,
+    process_education_requirement,
+    process_major_requirement,
+    process_performance_requirement,
+    process_title_requirement,
+    process_work_experience_position,
+    process_work_experience_qualification,
+    split_position_requirement_clauses,
+    split_qualification_clauses,
+)
+from parsers.xlsx_stream_reader import ensure_workbook_exists, load_sheet
+
+
+# 解析结果格式版本（输出结构或规整规则变化时递增，使解析缓存失效）
+PARSER_VERSION = 1
+
+# 岗位职责按"1."等编号分条
+_DUTY_NUMBER_RE = re.compile(r'\d+\.')
+_DUTY_SPLIT_RE = re.compile(r'\n(?=\d+\.)')
 
 # ========== Excel 解析函数 ==========
 
 def build_merged_cells_map(ws):
     """
-    构建合并单元格映射表
-    返回：{(row, col): (master_row, master_col)}
+    构建合并单元格索引（按列二分查找，不按单元格展开）
+    返回：MergedCellIndex，master(row, col) 为 (master_row, master_col) 或 None
     """
-    merged_map = {}
-    for merged_range in ws.merged_cells.ranges:
-        min_row, min_col = merged_range.min_row, merged_range.min_col
-        max_row, max_col = merged_range.max_row, merged_range.max_col
-        
-        # 所有合并区域内的单元格都指向左上角的主单元格
-        for row in range(min_row, max_row + 1):
-            for col in range(min_col, max_col + 1):
-                merged_map[(row, col)] = (min_row, min_col)
-    
-    return merged_map
+    return MergedCellIndex(ws.merged_ranges)
 
 
 def get_cell_value(ws, row, col, merged_map):
     """获取单元格的值（处理合并单元格）"""
-    cell_coord = (row, col)
-    if cell_coord in merged_map:
-        master_coord = merged_map[cell_coord]
-        return ws.cell(master_coord[0], master_coord[1]).value
+    master_coord = merged_map.master(row, col)
+    if master_coord is not None:
+        return ws.cell_value(master_coord[0], master_coord[1])
     else:
-        return ws.cell(row, col).value
+        return ws.cell_value(row, col)
 
 
 def convert_value(value):
@@ -360,61 +83,8 @@ def parse_position_requirements(requirements_list, text):
     if requirements_list:
         return
     
-    # 判断是否是结构化格式（包含章节标题）
-    is_structured = bool(re.search(r'\d+\.(工作经验|工作年限|能力要求|持证要求|证书要求)[:：]', text))
-    
-    # 初始化所有字段
-    work_exp_content = ""
-    ability_items = []
-    cert_content = ""
-    
-    if is_structured:
-        # 结构化格式：按章节解析
-        parts = re.split(r'\n(?=\d+\.)', text)
-        
-        for part in parts:
-            part = part.strip()
-            if not part:
-                continue
-            
-            # 提取条件类型和内容
-            match = re.match(r'^(\d+)\.(.*?)[:：](.*)$', part, re.DOTALL)
-            if match:
-                num = match.group(1)
-                condition_type = match.group(2).strip()
-                content = match.group(3).strip()
-                
-                # 根据条件类型分配到对应字段
-                if "工作经验" in condition_type or "工作年限" in condition_type:
-                    work_exp_content = content
-                elif "能力要求" in condition_type or "能力" in condition_type:
-                    # 能力要求需要进一步按小点分割
-                    ability_parts = re.split(r'\n(?=（\d+）|(\(\d+\)))', content)
-                    for ability_part in ability_parts:
-                        if ability_part is None:
-                            continue
-                        ability_part = ability_part.strip()
-                        # 排除空行和纯编号，也排除只包含标题的行（如"能力要求："）
-                        if ability_part and not re.match(r'^（\d+）$|^\(\d+\)$', ability_part):
-                            # 如果这一行只是"能力要求："之类的标题，跳过
-                            if not re.match(r'^[^\(（]*[:：]\s*$', ability_part):
-                                ability_items.append(ability_part)
-                    
-                    if not ability_items and content:
-                        ability_items.append(content)
-                        
-                elif "持证" in condition_type or "证书" in condition_type:
-                    cert_content = content
-    else:
-        # 简单格式：全部内容归入能力要求
-        # 按换行分割
-        lines = text.split('\n')
-        for line in lines:
-            line = line.strip()
-            if line:
-                # 跳过纯标题行（如"1. 能力要求："）
-                if not re.match(r'^\d+\.\s*[^\(（]*[:：]\s*$', line):
-                    ability_items.append(line)
+    # 按章节（或逐行）拆分为工作经验、能力要求、持证要求
+    work_exp_content, ability_items, cert_content = split_position_requirement_clauses(text)
     
     # 固定输出三个字段（即使为空）
     # 1. 工作经验
@@ -428,7 +98,7 @@ def parse_position_requirements(requirements_list, text):
     
     # 2. 能力要求
     requirements_list.append({
-        "能力要求": ability_items
+        "能力要求": list(ability_items)
     })
     
     # 3. 持证要求
@@ -452,43 +122,9 @@ def parse_qualification(qualifications_list, text):
     if qualifications_list:
         return
     
-    # 初始化所有字段内容
-    education_content = ""
-    major_content = ""
-    age_content = ""
-    performance_content = ""
-    title_content = ""
-    work_history_content = ""
-    
-    if text:
-        # 按数字编号分割
-        parts = re.split(r'\n(?=\d+\.)', text)
-        
-        for part in parts:
-            part = part.strip()
-            if not part:
-                continue
-            
-            # 提取条件类型和内容
-            match = re.match(r'^(\d+)\.(.*?)[:：](.*)$', part, re.DOTALL)
-            if match:
-                num = match.group(1)
-                condition_type = match.group(2).strip()
-                content = match.group(3).strip()
-                
-                # 根据条件类型分配到对应字段
-                if "学历" in condition_type:
-                    education_content = content
-                elif "专业" in condition_type:
-                    major_content = content
-                elif "年龄" in condition_type:
-                    age_content = content
-                elif "绩效" in condition_type:
-                    performance_content = content
-                elif "职称" in condition_type:
-                    title_content = content
-                elif "工作经历" in condition_type or "工作年限" in condition_type:
-                    work_history_content = content
+    # 按数字编号拆分为各条款
+    (education_content, major_content, age_content,
+     performance_content, title_content, work_history_content) = split_qualification_clauses(text)
     
     # 固定输出六个字段（按顺序，即使为空）
     # 1. 学历要求
@@ -549,12 +185,13 @@ def parse_qualification(qualifications_list, text):
 def parse_excel_to_position_json(file_path):
     """
     解析岗位需求明细表 Excel 文件为 JSON 格式（带规整）
+    
+    Args:
+        file_path: Excel 文件路径，或二进制文件对象（如内存中的上传内容）
     """
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"文件未找到: {file_path}")
+    ensure_workbook_exists(file_path)
     
-    wb = load_workbook(file_path, data_only=True)
-    ws = wb.active
+    ws = load_sheet(file_path)
     
     # 构建合并单元格映射
     merged_map = build_merged_cells_map(ws)
@@ -625,8 +262,8 @@ def parse_excel_to_position_json(file_path):
                 position["工作地点"] = value
             elif header == "岗位职责" and value:
                 # 分割岗位职责
-                if re.search(r'\d+\.', value):
-                    duties = re.split(r'\n(?=\d+\.)', value)
+                if _DUTY_NUMBER_RE.search(value):
+                    duties = _DUTY_SPLIT_RE.split(value)
                     for duty in duties:
                         duty = duty.strip()
                         if duty and duty not in position["岗位职责"]:
@@ -730,7 +367,7 @@ def main():
         print("=" * 80)
         print("🎯 功能说明")
         print("=" * 80)
-        print("• 检测方法: openpyxl (直接读取 Excel XML 结构)")
+        print("• 检测方法: XLSX 流式读取 (zipfile 直接读取 Excel XML 结构)")
         print("• 合并单元格识别准确率: ≥ 99.9%")
         print("• 数据读取准确率: ≥ 99.9%")
         print("• 规整功能: ✅ 自动填充'规整后'字段")
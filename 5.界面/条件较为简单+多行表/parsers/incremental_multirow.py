@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+"""
+简历多行表增量解析模块（按人员行块）
+
+多行表中每个人占一个行块：序号列的主单元格所在行，加上到下一个人之前的后续行
+（序号列合并区域覆盖的行）。解析时为每个行块计算摘要（各行原始XML字节、行号相对
+块首的偏移和从块内开始的合并区域），连同解析出的人员记录保存为解析清单。
+
+同一来源的新版本工作簿再次解析时，只读取行的原始字节计算摘要：摘要在上一份清单中
+出现过的行块直接复用上次的人员记录，只有新增或修改过的行块才解析XML、填充合并单元格
+和规整字段，解析耗时与变化的行数成正比（常见的追加人员只解析新增的行块）。
+
+以下情况清单不可复用，全部行块重新解析：
+- 解析器版本、日期格式样式或 1904 日期系统不同；
+- 上一版本的共享字符串表不是本次的前缀（行内只记共享字符串下标，下标对应的文字可能已变）。
+有合并区域跨越两个人员行块时行块不能单独解析，按整表解析，不生成清单。
+
+用法：
+    python -m parsers.incremental_multirow 简历表.xlsx [--manifest 解析清单.pkl] [-o 输出.json]
+"""
+import argparse
+import copy
+import hashlib
+import json
+import os
+import pickle
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, List, Optional
+
+from parsers.detect_merged_cells_with_accuracy import PARSER_VERSION
+from parsers.merged_cells import MergedCellIndex
+from parsers.resume_ingest import HEADER_ROWS, LAYOUT_MULTIROW, LAYOUTS, detect_layout, ingest_resume_workbook
+from parsers.xlsx_stream_reader import (XlsxStreamReader, ensure_workbook_exists, fill_merged_rows,
+                                        raw_first_cell_has_value)
+
+
+@dataclass
+class RowBlockManifest:
+    """解析清单：工作簿的解析条件和各人员行块的摘要 -> 人员记录"""
+    parser_version: int
+    date1904: bool
+    date_styles: FrozenSet[int]
+    timedelta_styles: FrozenSet[int]
+    shared_strings_count: int
+    shared_strings_digest: str
+    blocks: Dict[str, Dict] = field(default_factory=dict)
+
+
+@dataclass
+class IncrementalParseResult:
+    """增量解析结果"""
+    persons: List[Dict] = field(default_factory=list)
+    manifest: Optional[RowBlockManifest] = None  # 有跨行块的合并区域时为None
+    reused_blocks: int = 0
+    parsed_blocks: int = 0
+
+
+class _CrossBlockMerge(Exception):
+    """合并区域跨越人员行块"""
+
+
+def block_digest(block_start, raw_rows, block_merges):
+    """
+    人员行块的摘要
+
+    Args:
+        block_start: 行块起始行号
+        raw_rows: 行块内的 [(行号, 行元素原始字节), ...]
+        block_merges: 从行块内开始的合并区域
+
+    Returns:
+        十六进制摘要
+    """
+    digest = hashlib.sha256()
+    for row_idx, raw_row in raw_rows:
+        digest.update(b"%d:%d\n" % (row_idx - block_start, len(raw_row)))
+        digest.update(raw_row)
+    for min_row, min_col, max_row, max_col in block_merges:
+        digest.update(b"m%d,%d,%d,%d\n" % (min_row - block_start, min_col, max_row - block_start, max_col))
+    return digest.hexdigest()
+
+
+def _manifest_reusable(manifest, reader, shared_strings_prefix):
+    """上一份清单在本次解析中是否可以复用"""
+    return (manifest is not None
+            and manifest.parser_version == PARSER_VERSION
+            and manifest.date1904 == reader.date1904
+            and manifest.date_styles == frozenset(reader.date_styles)
+            and manifest.timedelta_styles == frozenset(reader.timedelta_styles)
+            and shared_strings_prefix == manifest.shared_strings_digest)
+
+
+def _iter_row_blocks(reader, merged_ranges):
+    """
+    按人员行块切分工作表的原始行
+
+    Yields:
+        (起始行号, 结束行号, [(行号, 行元素原始字节), ...], 从块内开始的合并区域)
+
+    Raises:
+        _CrossBlockMerge: 有合并区域从前面的行延续到行块起始行
+    """
+    merged_index = MergedCellIndex(merged_ranges)
+    # 按起始行排序的合并区域：到第 i 个为止的最大结束行，用于判断是否有区域跨过行块起始行
+    reach, farthest = [], 0
+    for _, _, max_row, _ in merged_ranges:
+        farthest = max(farthest, max_row)
+        reach.append(farthest)
+    next_range = 0
+
+    block_start, block_rows = None, []
+    last_row = 0
+    for row_idx, raw_row in reader.iter_raw_rows():
+        last_row = row_idx
+        if (row_idx > HEADER_ROWS and raw_first_cell_has_value(raw_row)
+                and merged_index.is_master_or_unmerged(row_idx, 1)):
+            # 新的人员行块：之前开始的合并区域不能延续到本行
+            first_after = next_range
+            while first_after < len(merged_ranges) and merged_ranges[first_after][0] < row_idx:
+                first_after += 1
+            if first_after and reach[first_after - 1] >= row_idx:
+                raise _CrossBlockMerge()
+            if block_start is not None:
+                yield block_start, row_idx - 1, block_rows, merged_ranges[next_range:first_after]
+            next_range = first_after
+            block_start, block_rows = row_idx, []
+        elif block_start is None:
+            continue
+        block_rows.append((row_idx, raw_row))
+
+    if block_start is not None:
+        # 最后一个行块延续到最后一行（合并区域超出最后一个数据行时包括区域内的空行）
+        block_end = max(last_row, reach[-1] if reach else 0)
+        yield block_start, block_end, block_rows, merged_ranges[next_range:]
+
+
+def _parse_block(reader, block_start, block_end, raw_rows, block_merges):
+    """解析一个人员行块（块内缺少的行按空行处理）"""
+    layout = LAYOUTS[LAYOUT_MULTIROW]
+    decoded = dict(reader.decode_raw_rows(raw_rows))
+    rows = ((row_idx, decoded.get(row_idx, [])) for row_idx in range(block_start, block_end + 1))
+    filled_rows = fill_merged_rows(rows, block_merges, layout.width, start_row=block_start)
+    return next(iter(layout.group_rows(filled_rows, layout.handlers)))
+
+
+def parse_multirow_incremental(file_path, manifest=None, sheet_name=None):
+    """
+    增量解析简历多行表：复用上一份解析清单中未变化的人员行块
+
+    Args:
+        file_path: Excel 文件路径，或二进制文件对象（如内存中的上传内容）
+        manifest: 同一来源上一版本工作簿的解析清单（RowBlockManifest），为None时全部解析
+        sheet_name: 工作表名称，为None时解析活动工作表
+
+    Returns:
+        IncrementalParseResult（人员记录与 parse_excel_to_multirow_json 的结果一致）
+    """
+    ensure_workbook_exists(file_path)
+
+    with XlsxStreamReader(file_path, sheet_name) as reader:
+        merged_ranges = reader.merged_ranges()
+        header = []
+        for row_idx, values in reader.iter_rows():
+            header.append(values)
+            if row_idx >= HEADER_ROWS:
+                break
+        layout, _ = detect_layout(header, merged_ranges)
+        if layout != LAYOUT_MULTIROW:
+            raise ValueError(f"简历文件识别为{layout}格式，只支持简历多行表")
+
+        prefix_count = manifest.shared_strings_count if manifest is not None else None
+        sst_digest, sst_count, sst_prefix = reader.shared_strings_digest(prefix_count)
+        previous_blocks = manifest.blocks if _manifest_reusable(manifest, reader, sst_prefix) else {}
+
+        result = IncrementalParseResult(manifest=RowBlockManifest(
+            parser_version=PARSER_VERSION,
+            date1904=reader.date1904,
+            date_styles=frozenset(reader.date_styles),
+            timedelta_styles=frozenset(reader.timedelta_styles),
+            shared_strings_count=sst_count,
+            shared_strings_digest=sst_digest,
+        ))
+        blocks = result.manifest.blocks
+        try:
+            for block_start, block_end, raw_rows, block_merges in _iter_row_blocks(reader, merged_ranges):
+                digest = block_digest(block_start, raw_rows, block_merges)
+                person = blocks.get(digest)
+                if person is not None:
+                    # 同一工作簿中内容相同的行块：各自使用独立的记录
+                    person = copy.deepcopy(person)
+                    result.reused_blocks += 1
+                elif digest in previous_blocks:
+                    person = blocks[digest] = previous_blocks[digest]
+                    result.reused_blocks += 1
+                else:
+                    person = blocks[digest] = _parse_block(reader, block_start, block_end, raw_rows, block_merges)
+                    result.parsed_blocks += 1
+                result.persons.append(person)
+            return result
+        except _CrossBlockMerge:
+            pass
+
+    # 有跨行块的合并区域：按整表解析
+    persons = ingest_resume_workbook(file_path, sheet_name, layout=LAYOUT_MULTIROW).persons
+    return IncrementalParseResult(persons=persons, parsed_blocks=len(persons))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="简历多行表增量解析（复用未变化的人员行块）")
+    parser.add_argument("file", help="简历多行表工作簿")
+    parser.add_argument("--manifest", default=None, help="解析清单文件（存在时复用，解析后更新）")
+    parser.add_argument("--sheet", default=None, help="工作表名称（默认活动工作表）")
+    parser.add_argument("-o", "--output", default=None, help="输出JSON文件（默认与工作簿同名）")
+    args = parser.parse_args()
+
+    manifest = None
+    if args.manifest and os.path.exists(args.manifest):
+        with open(args.manifest, "rb") as f:
+            manifest = pickle.load(f)
+
+    result = parse_multirow_incremental(args.file, manifest, args.sheet)
+    output_file = args.output or os.path.splitext(args.file)[0] + ".json"
+    with open(output_file, "w", encoding="utf-8") as f:
+        json.dump(result.persons, f, ensure_ascii=False, indent=2)
+    if args.manifest and result.manifest is not None:
+        with open(args.manifest, "wb") as f:
+            pickle.dump(result.manifest, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    print(f"✅ 共 {len(result.persons)} 条记录：复用 {result.reused_blocks} 个行块，解析 {result.parsed_blocks} 个行块")
+    print(f"💾 输出文件: {output_file}")
+
+
+if __name__ == "__main__":
+    main()
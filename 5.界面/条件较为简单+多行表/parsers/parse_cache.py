@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+"""
+Excel 解析结果缓存模块（按文件内容寻址）
+
+以（文件内容 SHA-256, 解析器名称, 解析器版本）为键，把解析结果用 pickle 序列化、
+zlib 压缩后保存在 SQLite 中。同一份工作簿再次上传时直接取出上次的解析结果，
+不再解析和规整。缓存总大小超过上限时，按最近使用时间淘汰最久未用的条目。
+
+支持增量解析的解析器另外按来源（上传的文件名）保存最近一次的解析清单，内容变化的
+新版本工作簿可以交给解析器只解析变化的部分；解析清单和解析结果一起按大小淘汰。
+"""
+import hashlib
+import pickle
+import sqlite3
+import time
+import zlib
+
+from utils.logger_config import setup_logger
+
+logger = setup_logger("parse_cache")
+
+# 缓存总大小上限（压缩后字节数）
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS parse_cache (
+    cache_key TEXT PRIMARY KEY,
+    parser TEXT NOT NULL,
+    payload BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_parse_cache_last_used ON parse_cache (last_used);
+"""
+
+
+def file_sha256(file_path):
+    """文件内容的 SHA-256"""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ParseCache:
+    """解析结果缓存（SQLite，按最近使用时间淘汰）"""
+
+    def __init__(self, db_path, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        打开（或创建）缓存库
+
+        Args:
+            db_path: 数据库文件路径
+            max_bytes: 缓存总大小上限（压缩后字节数）
+        """
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        self.conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        self.conn.executescript(_SCHEMA)
+
+    def close(self):
+        """关闭数据库连接"""
+        self.conn.close()
+
+    def get(self, cache_key):
+        """
+        读取缓存的解析结果（命中时更新最近使用时间）
+
+        Returns:
+            解析结果；未命中时返回None
+        """
+        row = self.conn.execute("SELECT payload FROM parse_cache WHERE cache_key = ?", (cache_key,)).fetchone()
+        if row is None:
+            return None
+        with self.conn:
+            self.conn.execute("UPDATE parse_cache SET last_used = ? WHERE cache_key = ?", (time.time(), cache_key))
+        return pickle.loads(zlib.decompress(row[0]))
+
+    def put(self, cache_key, parser, data):
+        """
+        保存解析结果，并淘汰超出大小上限的最久未用条目
+
+        Args:
+            cache_key: 缓存键
+            parser: 解析器名称
+            data: 解析结果
+        """
+        payload = zlib.compress(pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
+        if len(payload) > self.max_bytes:
+            logger.warning(f"⚠️ 解析结果过大（{len(payload)} 字节），不写入缓存")
+            return
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO parse_cache (cache_key, parser, payload, size, last_used) VALUES (?, ?, ?, ?, ?)",
+                (cache_key, parser, payload, len(payload), time.time()),
+            )
+            self._evict()
+
+    def _evict(self):
+        """删除最久未用的条目，直到总大小不超过上限"""
+        total = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM parse_cache").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        evicted = 0
+        for cache_key, size in self.conn.execute("SELECT cache_key, size FROM parse_cache ORDER BY last_used").fetchall():
+            if total <= self.max_bytes:
+                break
+            self.conn.execute("DELETE FROM parse_cache WHERE cache_key = ?", (cache_key,))
+            total -= size
+            evicted += 1
+        logger.info(f"解析缓存超出上限，已淘汰 {evicted} 条")
+
+    def parse(self, file_path, parser, parser_name, parser_version, content_hash=None):
+        """
+        解析工作簿，内容、解析器名称和版本都相同时直接返回缓存结果
+
+        Args:
+            file_path: Excel 文件路径，或二进制文件对象（此时必须提供 content_hash）
+            parser: 解析函数 parser(file_path)
+            parser_name: 解析器名称
+            parser_version: 解析器版本（解析结果格式变化时递增）
+            content_hash: 文件内容的 SHA-256（如接收上传时已计算），为None时读取文件计算
+
+        Returns:
+            (解析结果, 是否命中缓存)
+        """
+        cache_key = f"{parser_name}:{parser_version}:{content_hash or file_sha256(file_path)}"
+        data = self.get(cache_key)
+        if data is not None:
+            logger.info(f"♻️ 解析缓存命中：{parser_name}")
+            return data, True
+        data = parser(file_path)
+        if data:
+            self.put(cache_key, parser_name, data)
+        return data, False
+
+    def parse_incremental(self, file_path, parser, parser_name, parser_version, source_name, content_hash=None):
+        """
+        增量解析工作簿：内容相同时直接返回缓存结果，否则把同一来源上次的解析清单交给解析器
+
+        Args:
+            file_path: Excel 文件路径，或二进制文件对象（此时必须提供 content_hash）
+            parser: 解析函数 parser(file_path, 上次的解析清单或None) -> (解析结果, 新的解析清单或None)
+            parser_name: 解析器名称
+            parser_version: 解析器版本（解析结果格式变化时递增）
+            source_name: 来源名称（如上传的文件名），同一来源的各个版本共用一份解析清单
+            content_hash: 文件内容的 SHA-256（如接收上传时已计算），为None时读取文件计算
+
+        Returns:
+            (解析结果, 是否命中缓存)
+        """
+        cache_key = f"{parser_name}:{parser_version}:{content_hash or file_sha256(file_path)}"
+        data = self.get(cache_key)
+        if data is not None:
+            logger.info(f"♻️ 解析缓存命中：{parser_name}")
+            return data, True
+        manifest_key = f"manifest:{parser_name}:{parser_version}:{source_name}"
+        data, manifest = parser(file_path, self.get(manifest_key))
+        if data:
+            self.put(cache_key, parser_name, data)
+        if manifest is not None:
+            self.put(manifest_key, parser_name, manifest)
+        return data, False
@@ -0,0 +1,441 @@
+# -*- coding: utf-8 -*-
+"""
+岗位要求规整模块
+
+把资格条件、岗位任职条件的原文拆分为各条款，并把每个条款规整为结构化结果。
+正则表达式在模块加载时预编译；拆分和规整结果按原文缓存（LRU），同一批岗位中
+大量重复的条款只计算一次。
+
+缓存中保存的是不可变的元组，对外的 process_* 函数每次都组装新的 dict/list，
+调用方修改返回值不会影响缓存。
+"""
+import re
+from functools import lru_cache
+
+# 每个缓存保留的不同原文数量
+CACHE_SIZE = 4096
+
+# ========== 预编译正则 ==========
+
+_EDUCATION_SPLIT_RE = re.compile(r'[①②③④⑤⑥⑦⑧⑨⑩]|[，。；]')
+_MAJOR_PART_SPLIT_RE = re.compile(r'[。]')
+_MAJOR_ITEM_SPLIT_RE = re.compile(r'[，,；]')
+_DIGITS_RE = re.compile(r'\d+')
+_LEADING_SEPARATOR_RE = re.compile(r'^[，,、]')
+_SYSTEM_IN_APPLICANT_RE = re.compile(r'系统内应聘人员[:：]')
+_SYSTEM_OUT_APPLICANT_RE = re.compile(r'系统外应聘人员[:：]')
+_YEARS_RE = re.compile(r'(\d+)\s*年')
+_YEAR_RANGE_RE = re.compile(r'(\d+)\s*[-~至]\s*(\d+)\s*年')
+
+_NUMBERED_SECTION_SPLIT_RE = re.compile(r'\n(?=\d+\.)')
+_NUMBERED_SECTION_RE = re.compile(r'^(\d+)\.(.*?)[:：](.*)$', re.DOTALL)
+_STRUCTURED_REQUIREMENT_RE = re.compile(r'\d+\.(工作经验|工作年限|能力要求|持证要求|证书要求)[:：]')
+_ABILITY_SPLIT_RE = re.compile(r'\n(?=（\d+）|(\(\d+\)))')
+_ABILITY_NUMBER_ONLY_RE = re.compile(r'^（\d+）$|^\(\d+\)$')
+_ABILITY_TITLE_ONLY_RE = re.compile(r'^[^\(（]*[:：]\s*$')
+_NUMBERED_TITLE_ONLY_RE = re.compile(r'^\d+\.\s*[^\(（]*[:：]\s*$')
+
+_OR_KEYWORDS = ("任一", "或", "可选")
+_AND_KEYWORDS = ("且", "同时", "并")
+_RANKING_KEYWORDS = ("排行榜", "QS", "泰晤士")
+_EDUCATION_KEYWORDS = ("985", "211", "双一流", "学历", "学位", "本科", "硕士", "博士")
+_YEAR_KEYWORDS = ("年", "工作经验", "工作年限", "从业经验")
+
+
+# ========== 条款拆分 ==========
+
+@lru_cache(maxsize=CACHE_SIZE)
+def split_qualification_clauses(text):
+    """
+    按数字编号把资格条件原文拆分为各条款
+
+    Args:
+        text: 资格条件原文（已去除首尾空白）
+
+    Returns:
+        (学历, 专业, 年龄, 绩效, 职称, 工作经历) 六个条款原文，缺少的为空字符串
+    """
+    education = major = age = performance = title = work_history = ""
+    if not text:
+        return education, major, age, performance, title, work_history
+
+    for part in _NUMBERED_SECTION_SPLIT_RE.split(text):
+        part = part.strip()
+        if not part:
+            continue
+
+        match = _NUMBERED_SECTION_RE.match(part)
+        if match:
+            condition_type = match.group(2).strip()
+            content = match.group(3).strip()
+
+            if "学历" in condition_type:
+                education = content
+            elif "专业" in condition_type:
+                major = content
+            elif "年龄" in condition_type:
+                age = content
+            elif "绩效" in condition_type:
+                performance = content
+            elif "职称" in condition_type:
+                title = content
+            elif "工作经历" in condition_type or "工作年限" in condition_type:
+                work_history = content
+
+    return education, major, age, performance, title, work_history
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def split_position_requirement_clauses(text):
+    """
+    把岗位任职条件原文拆分为工作经验、能力要求、持证要求
+
+    含"1.工作经验："等章节标题的按章节拆分，否则全部内容逐行归入能力要求
+
+    Args:
+        text: 岗位任职条件原文（已去除首尾空白，非空）
+
+    Returns:
+        (工作经验原文, 能力要求条目元组, 持证要求原文)
+    """
+    work_exp_content = ""
+    ability_items = []
+    cert_content = ""
+
+    if _STRUCTURED_REQUIREMENT_RE.search(text):
+        for part in _NUMBERED_SECTION_SPLIT_RE.split(text):
+            part = part.strip()
+            if not part:
+                continue
+
+            match = _NUMBERED_SECTION_RE.match(part)
+            if match:
+                condition_type = match.group(2).strip()
+                content = match.group(3).strip()
+
+                if "工作经验" in condition_type or "工作年限" in condition_type:
+                    work_exp_content = content
+                elif "能力要求" in condition_type or "能力" in condition_type:
+                    # 能力要求按（1）(1) 小点分割，排除纯编号和只有标题的行
+                    for ability_part in _ABILITY_SPLIT_RE.split(content):
+                        if ability_part is None:
+                            continue
+                        ability_part = ability_part.strip()
+                        if ability_part and not _ABILITY_NUMBER_ONLY_RE.match(ability_part):
+                            if not _ABILITY_TITLE_ONLY_RE.match(ability_part):
+                                ability_items.append(ability_part)
+
+                    if not ability_items and content:
+                        ability_items.append(content)
+
+                elif "持证" in condition_type or "证书" in condition_type:
+                    cert_content = content
+    else:
+        for line in text.split('\n'):
+            line = line.strip()
+            # 跳过纯标题行（如"1. 能力要求："）
+            if line and not _NUMBERED_TITLE_ONLY_RE.match(line):
+                ability_items.append(line)
+
+    return work_exp_content, tuple(ability_items), cert_content
+
+
+# ========== 条款规整 ==========
+
+@lru_cache(maxsize=CACHE_SIZE)
+def extract_condition_type(text):
+    """提取条件类型：或/且"""
+    if not text:
+        return ""
+
+    for keyword in _OR_KEYWORDS:
+        if keyword in text:
+            return "或"
+
+    for keyword in _AND_KEYWORDS:
+        if keyword in text:
+            return "且"
+
+    return ""
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _normalize_education(original_text):
+    """学历要求规整结果：(条件, 排名元组, 学历元组)"""
+    rankings = []
+    educations = []
+
+    # 按①②或标点分割
+    for sentence in _EDUCATION_SPLIT_RE.split(original_text):
+        sentence = sentence.strip()
+        if not sentence:
+            continue
+
+        # 排行榜关键词优先（985/211 归入学历）
+        if any(keyword in sentence for keyword in _RANKING_KEYWORDS):
+            rankings.append(sentence)
+        elif any(keyword in sentence for keyword in _EDUCATION_KEYWORDS):
+            educations.append(sentence)
+
+    return extract_condition_type(original_text), tuple(rankings), tuple(educations)
+
+
+def process_education_requirement(original_text):
+    """
+    处理学历要求
+    返回: {"条件": "", "排名": [], "学历": []}
+    """
+    if not original_text or not original_text.strip():
+        return {"条件": "", "排名": [], "学历": []}
+
+    condition, rankings, educations = _normalize_education(original_text)
+    return {"条件": condition, "排名": list(rankings), "学历": list(educations)}
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _normalize_major(original_text):
+    """专业要求规整结果：(条件, 专业元组, 经历元组)"""
+    majors = []
+    experiences = []
+
+    # 分离专业和经历
+    for part in _MAJOR_PART_SPLIT_RE.split(original_text):
+        part = part.strip()
+        if not part:
+            continue
+
+        if "具备" in part or "工作经历" in part or ("年" in part and "专业" not in part):
+            experiences.append(part if part.endswith("。") else part + "。")
+        else:
+            # 按逗号分割专业
+            for major in _MAJOR_ITEM_SPLIT_RE.split(part):
+                major = major.strip()
+                if major and major != "或":
+                    majors.append(major)
+
+    return extract_condition_type(original_text), tuple(majors), tuple(experiences)
+
+
+def process_major_requirement(original_text):
+    """
+    处理专业要求
+    返回: {"条件": "", "专业": [], "经历": []}
+    """
+    if not original_text or not original_text.strip():
+        return {"条件": "", "专业": [], "经历": []}
+
+    condition, majors, experiences = _normalize_major(original_text)
+    return {"条件": condition, "专业": list(majors), "经历": list(experiences)}
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def process_age_requirement(original_text):
+    """
+    处理年龄要求
+    返回: "" (字符串格式，如 "≤40")
+    """
+    if not original_text or not original_text.strip():
+        return ""
+
+    numbers = _DIGITS_RE.findall(original_text)
+    if not numbers:
+        return ""
+
+    age = numbers[0]
+
+    # 判断比较关系
+    if "不超过" in original_text or "以下（含）" in original_text:
+        return f"≤{age}"
+    elif "以下" in original_text:
+        return f"<{age}"
+    elif "及以上" in original_text or "不少于" in original_text:
+        return f"≥{age}"
+    elif "以上" in original_text:
+        return f">{age}"
+    elif len(numbers) >= 2:
+        return f"{numbers[0]}-{numbers[1]}"
+
+    return f"≤{age}"
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _normalize_performance(original_text):
+    """绩效要求规整结果：(条件, 系统内, 系统外)"""
+    condition = system_in_text = system_out_text = ""
+
+    # 同时包含系统内和系统外时分别提取
+    if "系统内" in original_text and "系统外" in original_text:
+        condition = "与"
+
+        parts = original_text.split("系统外")
+        if len(parts) == 2:
+            system_in_part = parts[0]
+            if "系统内" in system_in_part:
+                system_in_text = system_in_part.split("系统内")[-1].strip()
+                system_in_text = _LEADING_SEPARATOR_RE.sub('', system_in_text)
+
+            system_out_text = _LEADING_SEPARATOR_RE.sub('', parts[1].strip())
+
+    return condition, system_in_text, system_out_text
+
+
+def process_performance_requirement(original_text):
+    """
+    处理绩效要求
+    返回: {"条件": "", "系统内": "", "系统外": ""}
+    """
+    if not original_text or not original_text.strip():
+        return {"条件": "", "系统内": "", "系统外": ""}
+
+    condition, system_in_text, system_out_text = _normalize_performance(original_text)
+    return {"条件": condition, "系统内": system_in_text, "系统外": system_out_text}
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _normalize_title(original_text):
+    """职称要求规整结果：职称元组"""
+    result = []
+
+    # 职称等级映射
+    if "正高级" in original_text:
+        result.append("正高级")
+
+    if "副高级" in original_text or "高级" in original_text:
+        result.append("副高级")
+
+    if "中级" in original_text:
+        result.append("中级")
+
+    if "初级" in original_text:
+        result.append("初级")
+
+    # 处理"及以上"的情况
+    if "高级及以上" in original_text or "副高级及以上" in original_text:
+        result = ["正高级", "副高级"]
+    elif "中级及以上" in original_text:
+        result = ["正高级", "副高级", "中级"]
+
+    return tuple(result)
+
+
+def process_title_requirement(original_text):
+    """
+    处理职称要求
+    返回: [] (数组)
+    """
+    if not original_text or not original_text.strip():
+        return []
+
+    return list(_normalize_title(original_text))
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _normalize_work_experience_qualification(original_text):
+    """资格条件工作经历规整结果：(条件, 系统内应聘人员, 系统外应聘人员)"""
+    condition = system_in_text = system_out_text = ""
+
+    # 有（1）和（2）标记时分别提取系统内、系统外应聘人员的要求
+    if "（1）" in original_text and "（2）" in original_text:
+        condition = "或"
+
+        parts = original_text.split("（2）")
+        if len(parts) == 2:
+            part1 = parts[0]
+            if "（1）" in part1:
+                part1_text = part1.split("（1）")[-1].strip()
+                if "系统内应聘人员" in part1_text:
+                    system_in_text = _SYSTEM_IN_APPLICANT_RE.split(part1_text)[-1].strip()
+
+            part2_text = parts[1].strip()
+            if "系统外应聘人员" in part2_text:
+                system_out_text = _SYSTEM_OUT_APPLICANT_RE.split(part2_text)[-1].strip()
+
+    return condition, system_in_text, system_out_text
+
+
+def process_work_experience_qualification(original_text):
+    """
+    处理资格条件中的工作经历
+    返回: {"条件": "", "南方电网公司系统内应聘人员": "", "南方电网公司系统外应聘人员": ""}
+    """
+    if not original_text or not original_text.strip():
+        return {"条件": "", "南方电网公司系统内应聘人员": "", "南方电网公司系统外应聘人员": ""}
+
+    condition, system_in_text, system_out_text = _normalize_work_experience_qualification(original_text)
+    return {
+        "条件": condition,
+        "南方电网公司系统内应聘人员": system_in_text,
+        "南方电网公司系统外应聘人员": system_out_text
+    }
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def process_work_experience_position(original_text):
+    """
+    处理岗位任职条件中的工作经验
+    返回: "" (字符串格式，如 "≥3")
+
+    只有当文本明确包含年限相关的关键词时才提取数字
+    """
+    if not original_text or not original_text.strip():
+        return ""
+
+    if not any(keyword in original_text for keyword in _YEAR_KEYWORDS):
+        return ""
+
+    # 查找"数字+年"的模式
+    year_match = _YEARS_RE.search(original_text)
+    if not year_match:
+        return ""
+
+    years = year_match.group(1)
+
+    # 在数字附近判断比较关系
+    match_pos = year_match.start()
+    context = original_text[max(0, match_pos - 10):min(len(original_text), match_pos + 20)]
+
+    if "及以上" in context or "不少于" in context:
+        return f"≥{years}"
+    elif "以上" in context and "及以上" not in context:
+        return f">{years}"
+    elif "以下" in context and "及以下" not in context:
+        return f"<{years}"
+    elif "及以下" in context or "不超过" in context:
+        return f"≤{years}"
+
+    # 检查是否有范围（如"3-5年"）
+    range_match = _YEAR_RANGE_RE.search(original_text)
+    if range_match:
+        return f"{range_match.group(1)}-{range_match.group(2)}"
+
+    # 默认返回 ≥
+    return f"≥{years}"
+
+
+def process_certificate_requirement(original_text):
+    """
+    处理持证要求
+    返回: "" (直接返回原文)
+    """
+    if not original_text:
+        return ""
+    return original_text.strip()
+
+
+# 带缓存的函数（统计和清空缓存用）
+_CACHED_FUNCTIONS = (
+    split_qualification_clauses, split_position_requirement_clauses, extract_condition_type,
+    _normalize_education, _normalize_major, process_age_requirement, _normalize_performance,
+    _normalize_title, _normalize_work_experience_qualification, process_work_experience_position,
+)
+
+
+def cache_info():
+    """各缓存的命中统计 {函数名: CacheInfo}"""
+    return {func.__name__: func.cache_info() for func in _CACHED_FUNCTIONS}
+
+
+def cache_clear():
+    """清空所有缓存"""
+    for func in _CACHED_FUNCTIONS:
+        func.cache_clear()
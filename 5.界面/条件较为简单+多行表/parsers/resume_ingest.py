@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+"""
+简历表统一导入模块（自动识别单行表 / 多行表）
+
+只打开一次工作簿：先读取前两行表头和合并区域判断表格格式，再把后续数据行按
+对应格式的列处理函数表逐行解析，调用方不需要事先知道上传的是哪种格式。
+
+识别结果按表头指纹缓存，同一模板的工作簿再次导入时不再比对表头。
+
+用法：
+    python -m parsers.resume_ingest 简历表.xlsx [-o 输出.json] [--sheet 工作表名称]
+"""
+import argparse
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Tuple
+
+from parsers import detect_merged_cells_with_accuracy as multirow_parser
+from parsers import detect_merged_cells_with_accuracy_dan as single_row_parser
+from parsers.xlsx_stream_reader import XlsxStreamReader, ensure_workbook_exists, fill_merged_rows
+
+LAYOUT_MULTIROW = "多行表"
+LAYOUT_SINGLE_ROW = "单行表"
+
+# 表头行数（第1行为分类，第2行为字段名），数据从下一行开始
+HEADER_ROWS = 2
+
+# 第2行字段名与列映射一致的比例达到该值时，认为是该格式
+HEADER_MATCH_RATIO = 0.8
+
+# 表头指纹 -> 格式名称 的缓存条数
+LAYOUT_CACHE_SIZE = 256
+
+
+@dataclass(frozen=True)
+class ResumeLayout:
+    """一种简历表格式：列映射、编译好的列处理函数表和按人合并数据行的函数"""
+    name: str
+    col_config: Dict[int, Tuple[str, str]]
+    handlers: List[Tuple[int, Callable]]
+    width: int
+    group_rows: Callable
+
+
+@dataclass
+class ResumeImport:
+    """简历表导入结果"""
+    layout: str
+    persons: List[Dict] = field(default_factory=list)
+    layout_cached: bool = False  # 是否直接使用了表头指纹缓存中的识别结果
+
+
+def _build_layout(name, col_config, compile_handlers, group_rows):
+    handlers = compile_handlers(col_config)
+    width = max((position for position, _ in handlers), default=-1) + 1
+    return ResumeLayout(name, col_config, handlers, width, group_rows)
+
+
+# 各格式的列处理函数表在模块加载时编译一次，所有导入共用
+LAYOUTS = {
+    LAYOUT_MULTIROW: _build_layout(LAYOUT_MULTIROW, multirow_parser.COL_CONFIG,
+                                   multirow_parser.compile_column_handlers,
+                                   multirow_parser.group_multirow_persons),
+    LAYOUT_SINGLE_ROW: _build_layout(LAYOUT_SINGLE_ROW, single_row_parser.COL_CONFIG,
+                                     single_row_parser.compile_column_handlers,
+                                     single_row_parser.group_single_row_persons),
+}
+
+_layout_cache = OrderedDict()
+
+
+def _normalize_header(value):
+    """表头文字规整（去空白，中文引号按英文引号比较）"""
+    if value is None:
+        return ""
+    return str(value).strip().replace("“", '"').replace("”", '"')
+
+
+def header_signature(header_rows):
+    """
+    表头指纹（前两行表头文字的 SHA-256）
+
+    Args:
+        header_rows: [第1行值列表, 第2行值列表]
+
+    Returns:
+        十六进制摘要
+    """
+    payload = json.dumps([[_normalize_header(value) for value in values] for values in header_rows],
+                         ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def header_match_ratio(field_row, col_config):
+    """
+    字段名行与列映射一致的比例
+
+    Args:
+        field_row: 第2行（字段名）值列表
+        col_config: 列映射 {列号: (分类, 字段)}
+
+    Returns:
+        0~1 之间的比例
+    """
+    matched = sum(1 for col_idx, (_, field_name) in col_config.items()
+                  if col_idx <= len(field_row)
+                  and _normalize_header(field_row[col_idx - 1]) == _normalize_header(field_name))
+    return matched / len(col_config) if col_config else 0.0
+
+
+def has_multirow_merges(merged_ranges):
+    """序号列（第1列）在表头以下是否有跨多行的纵向合并（多行表每人占多行）"""
+    return any(min_col == 1 and min_row > HEADER_ROWS and max_row > min_row
+               for min_row, min_col, max_row, _ in merged_ranges)
+
+
+def detect_layout(header_rows, merged_ranges):
+    """
+    识别简历表格式：先按表头字段名匹配，表头都不匹配时按序号列的合并结构判断
+
+    Args:
+        header_rows: [第1行值列表, 第2行值列表]
+        merged_ranges: 工作表的合并区域
+
+    Returns:
+        (格式名称, 是否使用了缓存的识别结果)
+    """
+    signature = header_signature(header_rows)
+    name = _layout_cache.get(signature)
+    if name is not None:
+        _layout_cache.move_to_end(signature)
+        return name, True
+
+    field_row = header_rows[1] if len(header_rows) > 1 else []
+    ratios = {layout.name: header_match_ratio(field_row, layout.col_config) for layout in LAYOUTS.values()}
+    name = max(ratios, key=ratios.get)
+    if ratios[name] < HEADER_MATCH_RATIO:
+        # 表头不是已知模板：不缓存（同样的表头可能对应不同的合并结构）
+        return (LAYOUT_MULTIROW if has_multirow_merges(merged_ranges) else LAYOUT_SINGLE_ROW), False
+
+    _layout_cache[signature] = name
+    if len(_layout_cache) > LAYOUT_CACHE_SIZE:
+        _layout_cache.popitem(last=False)
+    return name, False
+
+
+def _chain_rows(header, rows):
+    """已读取的表头行 + 剩余数据行"""
+    yield from header
+    yield from rows
+
+
+def ingest_resume_workbook(file_path, sheet_name=None, layout=None, with_rows=False):
+    """
+    导入简历表（单行表或多行表），一次读取完成格式识别和解析
+
+    Args:
+        file_path: Excel 文件路径，或二进制文件对象（如内存中的上传内容）
+        sheet_name: 工作表名称，为None时解析活动工作表
+        layout: 指定格式名称（LAYOUT_MULTIROW / LAYOUT_SINGLE_ROW），为None时自动识别
+        with_rows: 人员记录是否为 (起始行号, 人员记录) 形式
+
+    Returns:
+        ResumeImport
+    """
+    ensure_workbook_exists(file_path)
+    if layout is not None and layout not in LAYOUTS:
+        raise ValueError(f"未知的简历表格式: {layout}")
+
+    with XlsxStreamReader(file_path, sheet_name) as reader:
+        merged_ranges = reader.merged_ranges()
+        # 合并区域超出最后一个数据行时，区域内的空行也要处理
+        last_merged_row = max((max_row for _, _, max_row, _ in merged_ranges), default=None)
+        rows = reader.iter_rows(max_row=last_merged_row)
+
+        # 先读表头，识别格式后表头行和其余数据行一起交给合并单元格填充
+        header = []
+        for row_idx, values in rows:
+            header.append((row_idx, values))
+            if row_idx >= HEADER_ROWS:
+                break
+
+        layout_cached = False
+        if layout is None:
+            layout, layout_cached = detect_layout([values for _, values in header], merged_ranges)
+        resume_layout = LAYOUTS[layout]
+
+        all_rows = _chain_rows(header, rows)
+        filled_rows = fill_merged_rows(all_rows, merged_ranges, resume_layout.width, start_row=HEADER_ROWS + 1)
+        persons = list(resume_layout.group_rows(filled_rows, resume_layout.handlers, with_rows))
+
+    return ResumeImport(layout=layout, persons=persons, layout_cached=layout_cached)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="简历表导入（自动识别单行表/多行表）")
+    parser.add_argument("file", help="简历表工作簿")
+    parser.add_argument("--sheet", default=None, help="工作表名称（默认活动工作表）")
+    parser.add_argument("-o", "--output", default=None, help="输出JSON文件（默认与工作簿同名）")
+    args = parser.parse_args()
+
+    result = ingest_resume_workbook(args.file, args.sheet)
+    output_file = args.output or os.path.splitext(args.file)[0] + ".json"
+    with open(output_file, "w", encoding="utf-8") as f:
+        json.dump(result.persons, f, ensure_ascii=False, indent=2)
+
+    print(f"✅ 识别为简历{result.layout}，共 {len(result.persons)} 条记录")
+    print(f"💾 输出文件: {output_file}")
+
+
+if __name__ == "__main__":
+    main()
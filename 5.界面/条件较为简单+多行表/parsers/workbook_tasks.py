@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""
+上传工作簿的解析任务（在后端的解析进程池中执行）
+
+每个任务在子进程中打开解析结果缓存、解析工作簿（缓存命中时直接取出），只把解析
+结果传回主进程：解析和规整都不占用后端的事件循环，简历表和岗位表可以同时解析。
+
+上传的工作簿以内存中的内容（bytes）传入，直接从内存解析，不写临时文件；接收上传时
+已计算的内容摘要一并传入，缓存查找不再读一遍内容。
+"""
+import hashlib
+import io
+
+from parsers.detect_merged_cells_with_accuracy import PARSER_VERSION as RESUME_PARSER_VERSION
+from parsers.detect_merged_cells_with_accuracy_position_adjust import PARSER_VERSION as POSITION_PARSER_VERSION
+from parsers.detect_merged_cells_with_accuracy_position_adjust import parse_excel_to_position_json
+from parsers.incremental_multirow import parse_multirow_incremental
+from parsers.parse_cache import ParseCache
+from utils.logger_config import setup_logger
+
+logger = setup_logger("workbook_tasks")
+
+
+def parse_resume_workbook(file_path, manifest=None):
+    """
+    解析简历文件（本版本只支持简历多行表）
+
+    同名简历文件上次的解析清单可用时，只解析新增或修改过的人员行块。
+
+    Returns:
+        (简历列表, 解析清单)
+    """
+    result = parse_multirow_incremental(file_path, manifest)
+    if result.reused_blocks:
+        logger.info(f"♻️ 增量解析简历：复用 {result.reused_blocks} 人，解析 {result.parsed_blocks} 人")
+    return result.persons, result.manifest
+
+
+def _workbook_source(source):
+    """内存中的工作簿内容包装为文件对象，文件路径原样返回"""
+    if isinstance(source, (bytes, bytearray)):
+        return io.BytesIO(source)
+    return source
+
+
+def parse_resume_task(cache_path, source, source_name, content_hash=None):
+    """
+    解析上传的简历文件（使用解析结果缓存）
+
+    Args:
+        cache_path: 解析结果缓存库路径
+        source: 简历文件路径，或内存中的文件内容（bytes）
+        source_name: 上传时的文件名（同名文件共用增量解析清单）
+        content_hash: 文件内容的 SHA-256，为None时读取内容计算
+
+    Returns:
+        (简历列表, 是否命中缓存)
+    """
+    if content_hash is None and isinstance(source, (bytes, bytearray)):
+        content_hash = hashlib.sha256(source).hexdigest()
+    parse_cache = ParseCache(cache_path)
+    try:
+        return parse_cache.parse_incremental(_workbook_source(source), parse_resume_workbook, "简历多行表",
+                                             RESUME_PARSER_VERSION, source_name, content_hash)
+    finally:
+        parse_cache.close()
+
+
+def parse_position_task(cache_path, source, content_hash=None):
+    """
+    解析上传的岗位文件（使用解析结果缓存）
+
+    Args:
+        cache_path: 解析结果缓存库路径
+        source: 岗位文件路径，或内存中的文件内容（bytes）
+        content_hash: 文件内容的 SHA-256，为None时读取内容计算
+
+    Returns:
+        (岗位列表, 是否命中缓存)
+    """
+    if content_hash is None and isinstance(source, (bytes, bytearray)):
+        content_hash = hashlib.sha256(source).hexdigest()
+    parse_cache = ParseCache(cache_path)
+    try:
+        return parse_cache.parse(_workbook_source(source), parse_excel_to_position_json, "岗位需求明细表",
+                                 POSITION_PARSER_VERSION, content_hash)
+    finally:
+        parse_cache.close()
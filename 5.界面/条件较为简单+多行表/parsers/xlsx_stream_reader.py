@@ -0,0 +1,747 @@
+# -*- coding: utf-8 -*-
+"""
+XLSX 流式读取模块（不经过 openpyxl）
+
+直接用 zipfile 解压工作表XML，按块切出完整的 <row> 元素交给 C 实现的
+xml.etree.ElementTree 解析（不为每个单元格产生解析事件）：
+- 按 workbook.xml 的 activeTab 和关系文件定位当前活动工作表；
+- 逐行输出单元格的值，每次只保留一块（约1MB）XML，内存占用与行数无关；
+- 共享字符串表按需读取（只读到用到的最大下标为止）；
+- <mergeCells> 在工作表XML末尾，单独扫描一遍原始字节取出合并区域；
+- 按 styles.xml 的数字格式识别日期单元格，自行把日期序列号转换为 datetime。
+
+单元格取值规则与 openpyxl 的 data_only 模式一致（数字、布尔、共享/内联字符串、
+日期格式和错误值），解析结果与原来用 openpyxl 读取时相同。
+"""
+import hashlib
+import os
+import posixpath
+import re
+import zipfile
+from datetime import datetime, time, timedelta
+from xml.etree.ElementTree import fromstring
+
+from parsers.merged_cells import MergedCellIndex
+
+# 内置数字格式中表示日期/时间的格式编号（与 openpyxl 的内置格式表一致）
+BUILTIN_DATE_FORMAT_IDS = frozenset({14, 15, 16, 17, 18, 19, 20, 21, 22, 45, 46, 47})
+
+# 内置数字格式中表示时长的格式编号（[h]:mm:ss）
+BUILTIN_TIMEDELTA_FORMAT_IDS = frozenset({46})
+
+# 判断自定义数字格式是否为日期：去掉引号内文字和颜色等方括号标记后仍含日期字符
+_FORMAT_STRIP_RE = re.compile(r'".*?"|\[(?!hh?\]|mm?\]|ss?\])[^\]]*\]')
+_DATE_CHAR_RE = re.compile(r"(?<![_\\])[dmhysDMHYS]")
+_TIMEDELTA_RE = re.compile(r"\[hh?\](:mm(:ss(\.0*)?)?)?|\[mm?\](:ss(\.0*)?)?|\[ss?\](\.0*)?")
+
+# <mergeCell ref="A1:B2"/>（可能带命名空间前缀）
+_MERGE_CELL_RE = re.compile(rb'<(?:[\w.-]+:)?mergeCell\s[^>]*?\bref="([^"]+)"')
+
+_RANGE_REF_RE = re.compile(r"\$?([A-Za-z]+)\$?(\d+)(?::\$?([A-Za-z]+)\$?(\d+))?")
+
+# 根元素的开始标签（跳过XML声明和注释）
+_ROOT_TAG_RE = re.compile(rb"<(?![?!])([\w.-]+:)?([\w.-]+)[^>]*>")
+
+# 原始字节中的单元格、单元格列号、非空的 <v>、内联字符串 <is>
+_RAW_CELL_RE = re.compile(rb'<(?:[\w.-]+:)?c\b([^>]*?)(?:/>|>(.*?)</(?:[\w.-]+:)?c>)', re.DOTALL)
+_RAW_CELL_REF_RE = re.compile(rb'\br="([A-Za-z]+)')
+_RAW_VALUE_RE = re.compile(rb'<(?:[\w.-]+:)?v>[^<]')
+_RAW_INLINE_RE = re.compile(rb'<(?:[\w.-]+:)?is\b')
+
+# 行开始标签中的行号、元素的命名空间前缀
+_RAW_ROW_REF_RE = re.compile(rb'\br="(\d+)"')
+_RAW_ITEM_PREFIX_RE = re.compile(rb'<([\w.-]+:)?')
+
+# 子元素名 -> 匹配原始字节的正则
+_RAW_ITEM_PATTERNS = {}
+
+# 每次从压缩包读取的字节数
+_CHUNK_SIZE = 1 << 20
+
+_WINDOWS_EPOCH = datetime(1899, 12, 30)
+_MAC_EPOCH = datetime(1904, 1, 1)
+_SECONDS_PER_DAY = 86400
+
+# 列字母 -> 列号 缓存
+_column_cache = {}
+
+
+def column_index(letters):
+    """列字母转列号（A -> 1）"""
+    index = _column_cache.get(letters)
+    if index is None:
+        index = 0
+        for char in letters.upper():
+            index = index * 26 + ord(char) - 64
+        _column_cache[letters] = index
+    return index
+
+
+def parse_range_ref(ref):
+    """
+    解析区域引用（如 A1:C3 或 B2）
+
+    Returns:
+        (min_row, min_col, max_row, max_col)
+    """
+    match = _RANGE_REF_RE.fullmatch(ref)
+    if match is None:
+        raise ValueError(f"无法识别的单元格区域: {ref}")
+    start_col, start_row, end_col, end_row = match.groups()
+    min_col, min_row = column_index(start_col), int(start_row)
+    if end_col is None:
+        return min_row, min_col, min_row, min_col
+    max_col, max_row = column_index(end_col), int(end_row)
+    return min(min_row, max_row), min(min_col, max_col), max(min_row, max_row), max(min_col, max_col)
+
+
+def is_date_format(format_code):
+    """数字格式是否为日期/时间格式（只看第一段）"""
+    if format_code is None:
+        return False
+    format_code = _FORMAT_STRIP_RE.sub("", format_code.split(";")[0])
+    return _DATE_CHAR_RE.search(format_code) is not None
+
+
+def is_timedelta_format(format_code):
+    """数字格式是否为时长格式（如 [h]:mm:ss）"""
+    if format_code is None:
+        return False
+    return _TIMEDELTA_RE.search(format_code.split(";")[0]) is not None
+
+
+def excel_serial_to_datetime(serial, date1904=False, as_timedelta=False):
+    """
+    Excel 日期序列号转 Python 日期时间
+
+    Args:
+        serial: 序列号（天数，小数部分为一天内的时间）
+        date1904: 工作簿是否使用 1904 日期系统
+        as_timedelta: 是否按时长返回 timedelta
+
+    Returns:
+        datetime；小于1的序列号返回 time；as_timedelta 为True时返回 timedelta
+    """
+    if as_timedelta:
+        value = timedelta(days=serial)
+        if value.microseconds:
+            # 保留到毫秒
+            value = timedelta(seconds=value.total_seconds() // 1, microseconds=round(value.microseconds, -3))
+        return value
+
+    day, fraction = divmod(serial, 1)
+    diff = timedelta(milliseconds=round(fraction * _SECONDS_PER_DAY * 1000))
+    if 0 <= serial < 1 and diff.days == 0:
+        minutes, seconds = divmod(diff.seconds, 60)
+        hours, minutes = divmod(minutes, 60)
+        return time(hours, minutes, seconds, diff.microseconds)
+    if date1904:
+        return _MAC_EPOCH + timedelta(days=day) + diff
+    # Excel 把 1900 年当作闰年（存在 1900-02-29），序列号 60 之前的日期要补回一天
+    if 0 < serial < 60:
+        day += 1
+    return _WINDOWS_EPOCH + timedelta(days=day) + diff
+
+
+def _cast_number(text):
+    """数字文本转 int 或 float"""
+    if "." in text or "E" in text or "e" in text:
+        return float(text)
+    return int(text)
+
+
+def _local_name(tag):
+    """去掉命名空间的标签名"""
+    return tag.rsplit("}", 1)[-1]
+
+
+def _namespace(tag):
+    """标签的命名空间部分（含花括号），没有命名空间时为空字符串"""
+    return tag[:tag.index("}") + 1] if tag.startswith("{") else ""
+
+
+def _text_content(element, ns):
+    """
+    字符串项（<si> 或 <is>）的纯文本：直接的 <t> 加上各个格式段 <r><t>，不含注音 <rPh>
+    """
+    text_tag = f"{ns}t"
+    if len(element) == 1 and element[0].tag == text_tag:
+        return element[0].text or ""
+    run_tag = f"{ns}r"
+    snippets = []
+    for child in element:
+        if child.tag == text_tag:
+            if child.text is not None:
+                snippets.append(child.text)
+        elif child.tag == run_tag:
+            text = child.findtext(text_tag)
+            if text is not None:
+                snippets.append(text)
+    return "".join(snippets)
+
+
+def ensure_workbook_exists(file_path):
+    """工作簿为文件路径时检查文件是否存在（二进制文件对象直接使用）"""
+    if isinstance(file_path, (str, os.PathLike)) and not os.path.exists(file_path):
+        raise FileNotFoundError(f"文件未找到: {file_path}")
+
+
+def iter_xml_segments(source, container, item):
+    """
+    按块读取XML原始字节，切出容器元素下以 </item> 结尾的完整片段（不解析）
+
+    Args:
+        source: 二进制文件对象
+        container: 容器元素名（不含命名空间前缀，如 b"sheetData"）
+        item: 子元素名（如 b"row"）
+
+    Yields:
+        (根元素开始标签, 片段, 根元素结束标签)；三者拼接后是可以单独解析的XML
+    """
+    buffer = b""
+    root_start = root_end = item_end = container_end = None
+    while True:
+        chunk = source.read(_CHUNK_SIZE)
+        buffer += chunk
+        if item_end is None:
+            root_match = _ROOT_TAG_RE.search(buffer)
+            container_match = re.search(rb"<([\w.-]+:)?" + container + rb"\b[^>]*?(/?)>", buffer)
+            if container_match is None:
+                if not chunk:
+                    return
+                continue
+            if container_match.group(2):
+                # 空容器（<sheetData/>）
+                return
+            root_prefix, root_name = root_match.group(1) or b"", root_match.group(2)
+            root_start = root_match.group(0) if root_match.start() != container_match.start() else \
+                container_match.group(0)
+            root_end = b"</" + root_prefix + root_name + b">"
+            prefix = container_match.group(1) or b""
+            item_end = b"</" + prefix + item + b">"
+            container_end = b"</" + prefix + container + b">"
+            buffer = buffer[container_match.end():]
+
+        if chunk:
+            cut = buffer.rfind(item_end)
+            if cut < 0:
+                continue
+            cut += len(item_end)
+        else:
+            # 读完后，容器结束标签之前剩余的（可能是自闭合的）子元素
+            cut = buffer.find(container_end)
+            if cut < 0:
+                cut = len(buffer)
+        segment, buffer = buffer[:cut], buffer[cut:]
+        if segment.strip():
+            yield root_start, segment, root_end
+        if not chunk:
+            return
+
+
+def iter_xml_items(source, container, item):
+    """
+    逐个读取XML中某个容器元素下的子元素（如 sheetData 下的 row、sst 下的 si）
+
+    按块读取原始字节，切出以 </item> 结尾的完整片段，连同根元素的开始标签
+    （保留命名空间声明）一起交给 fromstring 解析，每次只解析一个片段。
+
+    Args:
+        source: 二进制文件对象
+        container: 容器元素名（不含命名空间前缀，如 b"sheetData"）
+        item: 子元素名（如 b"row"）
+
+    Yields:
+        子元素（Element）
+    """
+    for root_start, segment, root_end in iter_xml_segments(source, container, item):
+        yield from fromstring(root_start + segment + root_end)
+
+
+def raw_item_pattern(item):
+    """匹配单个完整子元素原始字节的正则（子元素不嵌套同名元素）"""
+    pattern = _RAW_ITEM_PATTERNS.get(item)
+    if pattern is None:
+        pattern = re.compile(rb"<(?:[\w.-]+:)?" + item + rb"\b[^>]*?(?:/>|>.*?</(?:[\w.-]+:)?" + item + rb">)",
+                             re.DOTALL)
+        _RAW_ITEM_PATTERNS[item] = pattern
+    return pattern
+
+
+def raw_first_cell_has_value(raw_row):
+    """
+    行原始字节中第1列单元格是否有值（与 iter_rows 读出的值不为None一致）
+
+    Args:
+        raw_row: iter_raw_rows 输出的行原始字节
+
+    Returns:
+        是否有值
+    """
+    match = _RAW_CELL_RE.search(raw_row)
+    if match is None:
+        return False
+    attributes, content = match.group(1), match.group(2)
+    ref = _RAW_CELL_REF_RE.search(attributes)
+    if ref is not None and ref.group(1).upper() != b"A":
+        return False
+    if not content:
+        return False
+    if _RAW_VALUE_RE.search(content) is not None:
+        return True
+    return b'"inlineStr"' in attributes and _RAW_INLINE_RE.search(content) is not None
+
+
+class LazySharedStrings:
+    """共享字符串表：按需从 sharedStrings.xml 顺序读取，只读到用到的最大下标为止"""
+
+    def __init__(self, archive, path):
+        """
+        Args:
+            archive: 已打开的 ZipFile
+            path: sharedStrings.xml 在压缩包中的路径（为None时表示没有共享字符串）
+        """
+        self._strings = []
+        self._source = archive.open(path) if path else None
+        self._items = iter_xml_items(self._source, b"sst", b"si") if self._source else None
+
+    def __getitem__(self, index):
+        while index >= len(self._strings):
+            if not self._read_next():
+                raise IndexError(f"共享字符串下标超出范围: {index}")
+        return self._strings[index]
+
+    def _read_next(self):
+        """读取下一条字符串，已读完时返回False"""
+        if self._items is None:
+            return False
+        for element in self._items:
+            ns = _namespace(element.tag)
+            self._strings.append(_text_content(element, ns).replace("x005F_", ""))
+            return True
+        self.close()
+        return False
+
+    def close(self):
+        """关闭底层文件"""
+        if self._source is not None:
+            self._source.close()
+            self._source = None
+            self._items = None
+
+
+class XlsxStreamReader:
+    """XLSX 工作表流式读取器"""
+
+    def __init__(self, file_path, sheet_name=None):
+        """
+        打开工作簿并定位工作表
+
+        Args:
+            file_path: Excel 文件路径，或可随机读取的二进制文件对象（如内存中的上传内容）
+            sheet_name: 工作表名称，为None时读取活动工作表（与 openpyxl 的 wb.active 相同）
+        """
+        self.file_path = file_path
+        self.archive = zipfile.ZipFile(file_path)
+        try:
+            workbook_path = self._office_document_path()
+            workbook = fromstring(self.archive.read(workbook_path))
+            relations = self._read_relationships(workbook_path)
+
+            self.date1904 = False
+            sheets = []
+            active_tab = 0
+            for element in workbook.iter():
+                tag = _local_name(element.tag)
+                if tag == "workbookPr":
+                    self.date1904 = element.get("date1904", "").lower() in ("1", "true")
+                elif tag == "workbookView" and element.get("activeTab") is not None:
+                    active_tab = int(element.get("activeTab"))
+                elif tag == "sheet":
+                    relation_id = next((value for key, value in element.attrib.items()
+                                        if _local_name(key) == "id"), None)
+                    sheets.append((element.get("name"), relations.get(relation_id, (None, None))[1]))
+
+            if not sheets:
+                raise ValueError(f"工作簿中没有工作表: {file_path}")
+            self.sheet_names = [name for name, _ in sheets]
+            if sheet_name is None:
+                self.sheet_name, self.worksheet_path = sheets[active_tab if active_tab < len(sheets) else 0]
+            else:
+                matched = [sheet for sheet in sheets if sheet[0] == sheet_name]
+                if not matched:
+                    raise KeyError(f"工作表不存在: {sheet_name}")
+                self.sheet_name, self.worksheet_path = matched[0]
+
+            targets = {kind: target for kind, target in relations.values()}
+            self.shared_strings_path = targets.get("sharedStrings")
+            self.shared_strings = LazySharedStrings(self.archive, self.shared_strings_path)
+            self.date_styles, self.timedelta_styles = self._read_date_styles(targets.get("styles"))
+        except Exception:
+            self.archive.close()
+            raise
+
+    def _office_document_path(self):
+        """工作簿主文件（workbook.xml）在压缩包中的路径"""
+        try:
+            root = fromstring(self.archive.read("_rels/.rels"))
+        except KeyError:
+            return "xl/workbook.xml"
+        for element in root:
+            if element.get("Type", "").endswith("/officeDocument"):
+                return element.get("Target").lstrip("/")
+        return "xl/workbook.xml"
+
+    def _read_relationships(self, part_path):
+        """
+        读取部件的关系文件
+
+        Returns:
+            {关系ID: (关系类型的最后一段, 目标在压缩包中的路径)}
+        """
+        folder, name = posixpath.split(part_path)
+        rels_path = posixpath.join(folder, "_rels", f"{name}.rels")
+        try:
+            root = fromstring(self.archive.read(rels_path))
+        except KeyError:
+            return {}
+        relations = {}
+        for element in root:
+            target = element.get("Target", "")
+            if target.startswith("/"):
+                target = target.lstrip("/")
+            else:
+                target = posixpath.normpath(posixpath.join(folder, target))
+            relations[element.get("Id")] = (element.get("Type", "").rsplit("/", 1)[-1], target)
+        return relations
+
+    def _read_date_styles(self, styles_path):
+        """
+        从 styles.xml 找出使用日期格式和时长格式的单元格样式编号
+
+        Returns:
+            (日期样式编号集合, 时长样式编号集合)
+        """
+        date_styles, timedelta_styles = set(), set()
+        if not styles_path:
+            return date_styles, timedelta_styles
+        try:
+            root = fromstring(self.archive.read(styles_path))
+        except KeyError:
+            return date_styles, timedelta_styles
+
+        custom_formats = {}
+        cell_xfs = None
+        for element in root:
+            tag = _local_name(element.tag)
+            if tag == "numFmts":
+                for number_format in element:
+                    custom_formats[int(number_format.get("numFmtId"))] = number_format.get("formatCode")
+            elif tag == "cellXfs":
+                cell_xfs = element
+
+        for style_id, xf in enumerate(cell_xfs if cell_xfs is not None else []):
+            format_id = int(xf.get("numFmtId", 0))
+            if format_id in custom_formats:
+                format_code = custom_formats[format_id]
+                if is_date_format(format_code):
+                    date_styles.add(style_id)
+                if is_timedelta_format(format_code):
+                    timedelta_styles.add(style_id)
+            else:
+                if format_id in BUILTIN_DATE_FORMAT_IDS:
+                    date_styles.add(style_id)
+                if format_id in BUILTIN_TIMEDELTA_FORMAT_IDS:
+                    timedelta_styles.add(style_id)
+        return date_styles, timedelta_styles
+
+    def merged_ranges(self):
+        """
+        读取工作表的合并区域（<mergeCells> 位于工作表XML末尾，直接扫描原始字节）
+
+        Returns:
+            [(min_row, min_col, max_row, max_col), ...]，按 min_row 排序
+        """
+        ranges = []
+        tail = b""
+        with self.archive.open(self.worksheet_path) as source:
+            while True:
+                chunk = source.read(1 << 20)
+                if not chunk:
+                    break
+                buffer = tail + chunk
+                # 最后一个 "<" 之后的标签可能不完整，留到下一块
+                cut = buffer.rfind(b"<")
+                if cut < 0:
+                    cut = len(buffer)
+                for match in _MERGE_CELL_RE.finditer(buffer, 0, cut):
+                    ranges.append(parse_range_ref(match.group(1).decode("ascii")))
+                tail = buffer[cut:]
+        for match in _MERGE_CELL_RE.finditer(tail):
+            ranges.append(parse_range_ref(match.group(1).decode("ascii")))
+        ranges.sort()
+        return ranges
+
+    def iter_rows(self, max_row=None):
+        """
+        按行号顺序逐行读取单元格的值
+
+        中间缺少的行输出为空列表；max_row 大于最后一行时，之后的行也输出为空列表。
+
+        Args:
+            max_row: 至少输出到第几行（为None时到最后一个有数据的行为止）
+
+        Yields:
+            (行号(从1开始), 值列表（第i个元素为第i+1列，行尾的空单元格不计入）)
+        """
+        last_row = 0
+        row_tag = None
+        with self.archive.open(self.worksheet_path) as source:
+            for element in iter_xml_items(source, b"sheetData", b"row"):
+                if row_tag is None:
+                    row_tag = f"{_namespace(element.tag)}row"
+                if element.tag != row_tag:
+                    continue
+
+                row_ref = element.get("r")
+                row_idx = int(row_ref) if row_ref else last_row + 1
+                while last_row + 1 < row_idx:
+                    last_row += 1
+                    yield last_row, []
+                last_row = row_idx
+                yield row_idx, self._row_values(element)
+
+        while max_row is not None and last_row < max_row:
+            last_row += 1
+            yield last_row, []
+
+    def _row_values(self, element):
+        """
+        行元素中各单元格的值
+
+        Returns:
+            值列表（第i个元素为第i+1列，行尾的空单元格不计入）
+        """
+        ns = _namespace(element.tag)
+        cell_tag, value_tag, inline_tag = f"{ns}c", f"{ns}v", f"{ns}is"
+        shared_strings = self.shared_strings
+        date_styles = self.date_styles
+
+        values = []
+        column = 0
+        for cell in element:
+            if cell.tag != cell_tag:
+                continue
+            ref = cell.get("r")
+            column = column_index(ref.rstrip("0123456789")) if ref else column + 1
+
+            data_type = cell.get("t", "n")
+            if data_type == "inlineStr":
+                inline = cell.find(inline_tag)
+                value = _text_content(inline, ns) if inline is not None else None
+            else:
+                value = cell.findtext(value_tag) or None
+                if value is not None:
+                    if data_type == "n":
+                        value = _cast_number(value)
+                        style_id = int(cell.get("s", 0))
+                        if style_id in date_styles:
+                            try:
+                                value = excel_serial_to_datetime(value, self.date1904,
+                                                                 style_id in self.timedelta_styles)
+                            except (OverflowError, ValueError):
+                                value = "#VALUE!"
+                    elif data_type == "s":
+                        value = shared_strings[int(value)]
+                    elif data_type == "b":
+                        value = bool(int(value))
+                    elif data_type == "d":
+                        value = datetime.fromisoformat(value.rstrip("Z"))
+            if value is None:
+                continue
+            if column > len(values):
+                values.extend([None] * (column - len(values)))
+            values[column - 1] = value
+        return values
+
+    def iter_raw_rows(self):
+        """
+        逐行读取行元素的原始XML字节（不解析单元格），用于按字节比对行内容
+
+        Yields:
+            (行号, 行元素原始字节)
+        """
+        pattern = raw_item_pattern(b"row")
+        row_start = row_end = None
+        last_row = 0
+        with self.archive.open(self.worksheet_path) as source:
+            for root_start, segment, root_end in iter_xml_segments(source, b"sheetData", b"row"):
+                self._row_wrapper = (root_start, root_end)
+                if row_end is None:
+                    first = pattern.search(segment)
+                    if first is None:
+                        continue
+                    prefix = _RAW_ITEM_PREFIX_RE.match(first.group(0)).group(1) or b""
+                    row_start, row_end = b"<" + prefix + b"row", b"</" + prefix + b"row>"
+
+                # 按结束标签切分比逐个正则匹配快得多；含自闭合空行（<row .../>）的片段再逐个匹配
+                for piece in segment.split(row_end):
+                    piece = piece.strip()
+                    if not piece:
+                        continue
+                    if piece.count(row_start) == 1 and not piece.endswith(b"/>"):
+                        raw_rows = (piece + row_end,)
+                    else:
+                        raw_rows = [match.group(0) for match in pattern.finditer(piece + row_end)]
+                    for raw_row in raw_rows:
+                        row_ref = _RAW_ROW_REF_RE.search(raw_row, 0, raw_row.find(b">"))
+                        row_idx = int(row_ref.group(1)) if row_ref else last_row + 1
+                        last_row = row_idx
+                        yield row_idx, raw_row
+
+    def decode_raw_rows(self, raw_rows):
+        """
+        解析 iter_raw_rows 读出的若干行（需在 iter_raw_rows 开始读取之后调用）
+
+        Args:
+            raw_rows: [(行号, 行元素原始字节), ...]
+
+        Returns:
+            [(行号, 值列表), ...]
+        """
+        if not raw_rows:
+            return []
+        root_start, root_end = self._row_wrapper
+        elements = fromstring(root_start + b"".join(raw_row for _, raw_row in raw_rows) + root_end)
+        return [(row_idx, self._row_values(element)) for (row_idx, _), element in zip(raw_rows, elements)]
+
+    def shared_strings_digest(self, prefix_count=None):
+        """
+        共享字符串表原始字节的摘要（比较两个版本的工作簿中同一下标的字符串是否相同）
+
+        Args:
+            prefix_count: 同时计算前 prefix_count 条的摘要
+
+        Returns:
+            (全部条目的摘要, 条数, 前 prefix_count 条的摘要)；未指定 prefix_count 或条目不足时第三项为None
+        """
+        digest = hashlib.sha256()
+        total = 0
+        prefix_digest = digest.hexdigest() if prefix_count == 0 else None
+        if self.shared_strings_path:
+            pattern = raw_item_pattern(b"si")
+            with self.archive.open(self.shared_strings_path) as source:
+                for _, segment, _ in iter_xml_segments(source, b"sst", b"si"):
+                    for match in pattern.finditer(segment):
+                        digest.update(match.group(0))
+                        total += 1
+                        if total == prefix_count:
+                            prefix_digest = digest.hexdigest()
+        return digest.hexdigest(), total, prefix_digest
+
+    def close(self):
+        """关闭工作簿"""
+        self.shared_strings.close()
+        self.archive.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+def fill_merged_rows(rows, merged_ranges, width, start_row=1):
+    """
+    逐行把合并区域内的单元格填为主单元格的值（不保存整张工作表）
+
+    Args:
+        rows: iter_rows 的输出，需覆盖到最后一个合并区域的结束行
+        merged_ranges: merged_ranges 的结果（按 min_row 排序）
+        width: 每行输出的列数
+        start_row: 从第几行开始输出（之前的行只用于记录合并区域主单元格的值）
+
+    Yields:
+        (行号, 长度为 width 的值列表, 第1列是否为合并区域的主单元格或不在合并区域内)
+    """
+    next_range = 0
+    # 覆盖当前行的合并区域：[max_row, min_row, min_col, max_col, 主单元格的值]
+    active_ranges = []
+    for row_idx, values in rows:
+        # 加入从本行开始的合并区域（主单元格在本行），移除已结束的合并区域
+        while next_range < len(merged_ranges) and merged_ranges[next_range][0] <= row_idx:
+            min_row, min_col, max_row, max_col = merged_ranges[next_range]
+            # 主单元格所在行不在数据中（空行）时主单元格的值为空
+            master_value = values[min_col - 1] if min_row == row_idx and min_col <= len(values) else None
+            active_ranges.append([max_row, min_row, min_col, max_col, master_value])
+            next_range += 1
+        if active_ranges:
+            active_ranges = [active for active in active_ranges if active[0] >= row_idx]
+
+        if row_idx < start_row:
+            continue
+
+        row_values = list(values[:width])
+        if len(row_values) < width:
+            row_values.extend([None] * (width - len(row_values)))
+        is_master_cell = True
+        for max_row, min_row, min_col, max_col, master_value in active_ranges:
+            if min_col > width:
+                continue
+            for position in range(min_col - 1, min(max_col, width)):
+                row_values[position] = master_value
+            if min_col == 1 and min_row != row_idx:
+                is_master_cell = False
+        yield row_idx, row_values, is_master_cell
+
+
+class StreamedSheet:
+    """
+    整张工作表的单元格值（用于岗位表等需要按坐标随机读取的小表）
+
+    只保存非空单元格的值，提供 max_row、max_column、merged_ranges 和 cell_value(row, col)。
+    """
+
+    def __init__(self, file_path, sheet_name=None):
+        """
+        Args:
+            file_path: Excel 文件路径
+            sheet_name: 工作表名称，为None时读取活动工作表
+        """
+        self.cells = {}
+        self.max_row = 0
+        self.max_column = 0
+        with XlsxStreamReader(file_path, sheet_name) as reader:
+            self.merged_ranges = reader.merged_ranges()
+            merged_index = MergedCellIndex(self.merged_ranges)
+            for row_idx, values in reader.iter_rows():
+                for col_idx, value in enumerate(values, 1):
+                    # 与 Excel 一致，合并区域内只保留主单元格的值
+                    if value is not None and merged_index.is_master_or_unmerged(row_idx, col_idx):
+                        self.cells[(row_idx, col_idx)] = value
+                if values:
+                    self.max_row = row_idx
+                    self.max_column = max(self.max_column, len(values))
+        # 合并区域也计入工作表范围
+        for _, _, max_row, max_col in self.merged_ranges:
+            self.max_row = max(self.max_row, max_row)
+            self.max_column = max(self.max_column, max_col)
+
+    def cell_value(self, row, col):
+        """读取单元格的值（空单元格返回None）"""
+        return self.cells.get((row, col))
+
+
+def load_sheet(file_path, sheet_name=None):
+    """
+    读取整张工作表
+
+    Args:
+        file_path: Excel 文件路径
+        sheet_name: 工作表名称，为None时读取活动工作表
+
+    Returns:
+        StreamedSheet
+    """
+    return StreamedSheet(file_path, sheet_name)
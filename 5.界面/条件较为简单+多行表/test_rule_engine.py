@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+规则引擎一致性测试
+在示例简历和岗位数据（以及改变了学历、专业、年龄、工作年限要求的岗位变体）上
+分别用逐份筛选（RuleMatcher）和向量化规则引擎筛选，断言两者对每个筛选条件的判断一致，
+生成原因说明后的 ScreeningResult 完全相同。
+
+运行：python test_rule_engine.py 或 python -m pytest test_rule_engine.py
+"""
+
+import asyncio
+import contextlib
+import copy
+import glob
+import io
+import json
+import os
+
+from core.screener import ResumeScreener
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.path.join(APP_DIR, "data")
+POSITION_FILE = os.path.join(DATA_DIR, "条件要求较简单的部分岗位岗位要求-模拟数据-岗位已推测_20260119_v1_去掉系统外.json")
+
+
+# 岗位变体中各要求替换成的规整后取值
+EDUCATION_VARIANTS = [
+    {"条件": "或", "排名": [], "学历": ["本科及以上学历"]},
+    {"条件": "或", "排名": [], "学历": ["全日制硕士研究生及以上学历"]},
+    {"条件": "与", "排名": ["原985、211院校"], "学历": ["全日制本科及以上学历"]},
+    {"条件": "或", "排名": ["原985院校"], "学历": ["博士研究生"]},
+]
+MAJOR_VARIANTS = [
+    {"条件": "或", "专业": ["计算机类", "电子信息类"], "经历": []},
+    {"条件": "与", "专业": ["电气类"], "经历": ["具备2年信息技术业务工作经历"]},
+    {"条件": "", "专业": ["工商管理类相关专业", "管理科学与工程类"], "经历": []},
+]
+AGE_VARIANTS = ["≤25", "≤30", "≤35", "≤40", "≤45", "≤60"]
+WORK_YEARS_VARIANTS = ["≥1年", "≥3年", "≥5年", "≥10年", "≥20年"]
+
+
+def load_json(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def replace_requirement(job, name, normalized, section="资格条件"):
+    """复制岗位并把某个要求的规整后取值替换为 normalized（没有该要求时追加）"""
+    variant = copy.deepcopy(job)
+    items = variant.setdefault(section, [])
+    requirement = {name: [{"原文": str(normalized)}, {"规整后": normalized}]}
+    for position, item in enumerate(items):
+        if isinstance(item, dict) and name in item:
+            items[position] = requirement
+            break
+    else:
+        items.append(requirement)
+    return variant
+
+
+def job_variants(positions):
+    """示例岗位及其改变了单个要求的变体"""
+    for job in positions:
+        yield job
+        for education in EDUCATION_VARIANTS:
+            yield replace_requirement(job, "学历要求", education)
+        for major in MAJOR_VARIANTS:
+            yield replace_requirement(job, "专业要求", major)
+        for age in AGE_VARIANTS:
+            yield replace_requirement(job, "年龄要求", age)
+        for work_years in WORK_YEARS_VARIANTS:
+            yield replace_requirement(job, "工作经验", work_years, section="岗位任职条件")
+
+
+async def compare_workbook(screener, resume_list, positions):
+    """
+    对一份简历数据比较两种筛选方式
+
+    Returns:
+        规则引擎判断的配对数
+    """
+    profiles = screener.build_profiles(resume_list)
+    position_index = screener.build_position_index(profiles)
+    rule_engine = screener.build_rule_engine(profiles)
+    engine_pairs = 0
+
+    for job in positions:
+        scalar = await screener.screen_batch(job, resume_list, profiles=profiles, position_index=position_index)
+        compact = await screener.screen_batch(job, resume_list, profiles=profiles, position_index=position_index,
+                                              rule_engine=rule_engine)
+        assert len(compact) == len(scalar), job.get("岗位")
+
+        for fast, slow in zip(compact, scalar):
+            assert fast.resume_index == slow.resume_index
+            label = f"岗位 {job.get('岗位')} 简历 {slow.resume_id}"
+            if screener.is_rule_result(fast):
+                engine_pairs += 1
+            assert fast.passed == slow.passed, label
+            assert [(d["filter_name"], d["passed"]) for d in fast.filter_details] == \
+                   [(d["filter_name"], d["passed"]) for d in slow.filter_details], label
+
+        rendered = await screener.render_results(job, compact, resume_list, profiles=profiles)
+        assert rendered == scalar, job.get("岗位")
+
+    return engine_pairs
+
+
+def test_rule_engine_matches_rule_matcher():
+    """规则引擎与逐份筛选对所有示例配对的判断一致"""
+    screener = ResumeScreener(None, os.path.join(DATA_DIR, "专业库.json"), os.path.join(DATA_DIR, "院校库.json"))
+    positions = list(job_variants(load_json(POSITION_FILE)))
+    resume_files = sorted(glob.glob(os.path.join(DATA_DIR, "*简历导入多行表*.json")))
+    assert resume_files
+
+    engine_pairs = 0
+    for resume_file in resume_files:
+        # 逐份打印的筛选结果与测试无关
+        with contextlib.redirect_stdout(io.StringIO()):
+            engine_pairs += asyncio.run(compare_workbook(screener, load_json(resume_file), positions))
+    # 示例岗位中至少有一部分由规则引擎判断，否则测试没有意义
+    assert engine_pairs > 0
+
+
+if __name__ == "__main__":
+    test_rule_engine_matches_rule_matcher()
+    print("✅ 规则引擎与逐份筛选的结果一致")
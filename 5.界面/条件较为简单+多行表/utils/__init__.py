@@ -5,11 +5,13 @@
 """
 
 from .major_library import MajorLibrary
+from .school_index import SchoolIndex
 from .calculator import Calculator
 from .data_loader import load_job_data, load_resume_data
 
 __all__ = [
     'MajorLibrary',
+    'SchoolIndex',
     'Calculator',
     'load_job_data',
     'load_resume_data',
@@ -5,6 +5,7 @@
 """
 
 from datetime import datetime
+from typing import Optional
 
 
 class Calculator:
@@ -18,6 +19,14 @@ class Calculator:
         - "1998-05-10" (只有日期)
         - "1998-05-10 00:00:00" (日期+时间)
         """
+        age = Calculator.parse_age(birth_date)
+        return age if age is not None else 0
+    
+    @staticmethod
+    def parse_age(birth_date: str) -> Optional[int]:
+        """
+        计算年龄，无法解析出生日期时返回None（用于区分"0岁"和"无数据"）
+        """
         try:
             if isinstance(birth_date, str) and birth_date.strip():
                 # 解析日期格式，支持 "1998-05-10" 或 "1998-05-10 00:00:00"
@@ -36,7 +45,7 @@ class Calculator:
                     return age
         except Exception as e:
             pass
-        return 0
+        return None
     
     @staticmethod
     def calculate_work_years(join_date: str) -> int:
@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+JSON 响应模块
+
+安装了 orjson 时用 orjson 序列化响应（比标准库 json 快数倍），否则与 FastAPI 的
+JSONResponse 完全相同。后端把它设为默认响应类。
+"""
+
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:
+    # 未安装 orjson 时使用标准库 json（pip install orjson 可加快大结果的序列化）
+    orjson = None
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON 响应（优先使用 orjson 序列化）"""
+
+    def render(self, content: Any) -> bytes:
+        if orjson is None:
+            return super().render(content)
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+事件循环延迟监测模块
+
+后台协程每隔固定间隔睡眠一次，实际醒来的时间比预期晚多少就是事件循环被
+同步代码阻塞的时长（循环延迟）。保留最近一段时间的采样，供健康检查接口
+报告当前、平均、P99 和最大延迟。
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Dict, Optional
+
+# 默认采样间隔（秒）
+DEFAULT_INTERVAL = 0.25
+
+# 默认保留的采样数（按默认间隔约为最近 5 分钟）
+DEFAULT_WINDOW = 1200
+
+
+class LoopLagMonitor:
+    """事件循环延迟监测"""
+
+    def __init__(self, interval: float = DEFAULT_INTERVAL, window: int = DEFAULT_WINDOW):
+        """
+        Args:
+            interval: 采样间隔（秒）
+            window: 保留的采样数
+        """
+        self.interval = interval
+        self.samples = deque(maxlen=window)
+        self.max_lag = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """开始监测（需在事件循环中调用）"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """停止监测"""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self):
+        while True:
+            expected = time.perf_counter() + self.interval
+            await asyncio.sleep(self.interval)
+            lag = max(time.perf_counter() - expected, 0.0)
+            self.samples.append(lag)
+            self.max_lag = max(self.max_lag, lag)
+
+    def snapshot(self) -> Dict[str, float]:
+        """
+        循环延迟统计（毫秒）
+
+        Returns:
+            {"current_ms", "mean_ms", "p99_ms", "window_max_ms", "max_ms", "samples"}
+        """
+        samples = sorted(self.samples)
+        if not samples:
+            return {"current_ms": 0.0, "mean_ms": 0.0, "p99_ms": 0.0, "window_max_ms": 0.0,
+                    "max_ms": 0.0, "samples": 0}
+        p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+        return {
+            "current_ms": round(self.samples[-1] * 1000, 1),
+            "mean_ms": round(sum(samples) / len(samples) * 1000, 1),
+            "p99_ms": round(p99 * 1000, 1),
+            "window_max_ms": round(samples[-1] * 1000, 1),
+            "max_ms": round(self.max_lag * 1000, 1),
+            "samples": len(samples),
+        }
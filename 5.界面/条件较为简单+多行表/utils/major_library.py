@@ -6,12 +6,32 @@
 
 import json
 import os
-from typing import Dict, List, Optional
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
 from .logger_config import setup_logger
 
 logger = setup_logger("major_library")
 
 
+def normalize_major_name(name: str) -> str:
+    """
+    规范化专业名称（用于专业名称不完全一致时的查找）
+    
+    去除空格和括号内的方向说明，去除末尾的"专业"，如
+    "计算机科学与技术（软件工程方向）专业" -> "计算机科学与技术"
+    """
+    name = re.sub(r"\s+", "", name or "").replace("（", "(").replace("）", ")")
+    name = re.sub(r"\([^()]*\)", "", name)
+    if name.endswith("专业") and len(name) > 2:
+        name = name[:-2]
+    return name
+
+
+def normalize_class_name(name: str) -> str:
+    """规范化专业类名称（去除"类"和"相关专业"，用于专业类之间的包含比较）"""
+    return name.replace("类", "").replace("相关专业", "").strip()
+
+
 class MajorLibrary:
     """专业库管理器"""
     
@@ -25,6 +45,7 @@ class MajorLibrary:
         self.library_path = library_path
         self.major_library = self._load_major_library(library_path)
         self.major_to_classes = self._build_major_to_classes_map()
+        self._build_indexes()
     
     def _load_major_library(self, library_path: Optional[str] = None) -> Dict:
         """
@@ -76,20 +97,122 @@ class MajorLibrary:
         logger.debug(f"专业映射构建完成，共 {len(major_to_classes)} 个专业")
         return major_to_classes
     
+    def _build_indexes(self):
+        """
+        构建专业库索引：门类 -> 专业类 -> 专业的反向索引、专业类序号、
+        专业名称到专业类序号位集的映射，以及规范化专业名称映射
+        """
+        # 专业类序号 <-> 专业类名称
+        self.class_names: List[str] = []
+        self.class_ids: Dict[str, int] = {}
+        # 门类 -> 专业类名称列表，专业类 -> 专业名称列表
+        self.category_to_classes: Dict[str, List[str]] = {}
+        self.class_to_majors: Dict[str, List[str]] = {}
+        
+        for category in self.major_library.get("专业分类列表", []):
+            category_name = category.get("门类名称", "")
+            for major_class in category.get("专业类列表", []):
+                class_name = major_class.get("专业类名称", "")
+                if not class_name:
+                    continue
+                if class_name not in self.class_ids:
+                    self.class_ids[class_name] = len(self.class_names)
+                    self.class_names.append(class_name)
+                self.category_to_classes.setdefault(category_name, [])
+                if class_name not in self.category_to_classes[category_name]:
+                    self.category_to_classes[category_name].append(class_name)
+                self.class_to_majors.setdefault(class_name, []).extend(major_class.get("专业名称列表", []))
+        
+        # 专业名称 -> 专业类位集（第 i 位对应 class_names[i]）
+        self.major_to_class_bits: Dict[str, int] = {}
+        for major_name, class_names in self.major_to_classes.items():
+            bits = 0
+            for class_name in class_names:
+                bits |= 1 << self.class_ids[class_name]
+            self.major_to_class_bits[major_name] = bits
+        
+        # 规范化专业名称 -> 专业库中的专业名称列表
+        self.normalized_majors: Dict[str, List[str]] = {}
+        for major_name in self.major_to_classes:
+            self.normalized_majors.setdefault(normalize_major_name(major_name), []).append(major_name)
+        
+        self._requirement_cache: Dict[Tuple[str, ...], List[int]] = {}
+    
+    def resolve_major_names(self, major_name: str) -> List[str]:
+        """
+        把简历中的专业名称解析为专业库中的专业名称（精确匹配失败时使用规范化名称）
+        
+        Args:
+            major_name: 简历中的专业名称
+        
+        Returns:
+            专业库中的专业名称列表，未找到时返回空列表
+        """
+        if major_name in self.major_to_classes:
+            return [major_name]
+        return self.normalized_majors.get(normalize_major_name(major_name), [])
+    
+    def get_major_class_bits(self, major_names: Iterable[str]) -> int:
+        """
+        根据专业名称列表计算专业类位集
+        
+        Args:
+            major_names: 专业名称列表
+        
+        Returns:
+            专业类位集（第 i 位对应 class_names[i]）
+        """
+        bits = 0
+        for major_name in major_names:
+            for resolved_name in self.resolve_major_names(major_name):
+                bits |= self.major_to_class_bits[resolved_name]
+        return bits
+    
+    def compile_major_requirement(self, required_majors: Iterable[str]) -> List[int]:
+        """
+        把岗位要求的专业类列表编译为专业类位集（结果按要求缓存）
+        
+        专业类名称去除"类"和"相关专业"后相等或互相包含即视为匹配，
+        与 RuleMatcher.match_major_rule 的比较方式一致。
+        
+        Args:
+            required_majors: 岗位要求的专业类列表
+        
+        Returns:
+            与 required_majors 一一对应的位集列表
+        """
+        # 非字符串的要求（如嵌套的列表、字典）不可哈希，在缓存键中以None占位（位集为0），
+        # 保持与 required_majors 一一对应
+        key = tuple(req_major if isinstance(req_major, str) else None for req_major in required_majors)
+        compiled = self._requirement_cache.get(key)
+        if compiled is None:
+            compiled = []
+            for req_major in key:
+                bits = 0
+                if req_major is not None:
+                    req_major_clean = normalize_class_name(req_major)
+                    for class_id, class_name in enumerate(self.class_names):
+                        class_name_clean = class_name.replace("类", "").strip()
+                        if req_major_clean == class_name_clean or req_major_clean in class_name_clean or class_name_clean in req_major_clean:
+                            bits |= 1 << class_id
+                compiled.append(bits)
+            self._requirement_cache[key] = compiled
+        return compiled
+    
     def get_major_classes(self, major_names: List[str]) -> List[str]:
         """
         根据专业名称列表查找对应的专业类名称列表
         
         Args:
-            major_names: 专业名称列表
+            major_names: 专业名称列表（与专业库不完全一致时按规范化名称查找）
         
         Returns:
             专业类名称列表（去重）
         """
         class_names = []
         for major_name in major_names:
-            if major_name in self.major_to_classes:
-                class_names.extend(self.major_to_classes[major_name])
+            for resolved_name in self.resolve_major_names(major_name):
+                class_names.extend(self.major_to_classes[resolved_name])
         
         # 去重并返回
         return list(set(class_names))
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+院校库索引模块
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict, deque
+from typing import Dict, List, Optional, Tuple
+from .logger_config import setup_logger
+
+logger = setup_logger("school_index")
+
+# 按学校名称缓存的查询结果数上限
+LOOKUP_CACHE_SIZE = 4096
+
+# 拼接院校名称时使用的分隔符（院校名称中不会出现）
+_NAME_SEPARATOR = "\x00"
+
+
+def normalize_school_name(name: str) -> str:
+    """规范化院校名称（去除空格，全角括号转为半角）"""
+    return name.replace(" ", "").replace("（", "(").replace("）", ")")
+
+
+def _strip_brackets(name: str) -> str:
+    """去除括号字符（如 中国地质大学(武汉) -> 中国地质大学武汉）"""
+    return name.replace("(", "").replace(")", "")
+
+
+class _ContainmentAutomaton:
+    """Aho-Corasick 自动机：一次扫描找出查询名称中包含的所有院校名称"""
+
+    def __init__(self, patterns: List[Tuple[str, int]]):
+        """
+        构建自动机
+
+        Args:
+            patterns: (规范化院校名称, 院校序号) 列表
+        """
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        # 每个状态结束的院校中序号最小的一个（含失败链上的院校）
+        self.output: List[Optional[int]] = [None]
+
+        for pattern, order in patterns:
+            state = 0
+            for char in pattern:
+                next_state = self.goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self.goto)
+                    self.goto[state][char] = next_state
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append(None)
+                state = next_state
+            if self.output[state] is None or order < self.output[state]:
+                self.output[state] = order
+
+        # 广度优先构建失败指针，并沿失败链合并输出
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[next_state] = self.goto[fallback].get(char, 0)
+                inherited = self.output[self.fail[next_state]]
+                if inherited is not None and (self.output[next_state] is None or inherited < self.output[next_state]):
+                    self.output[next_state] = inherited
+
+    def first_contained(self, text: str) -> Optional[int]:
+        """返回 text 中包含的院校名称里序号最小的一个，没有则返回None"""
+        state = 0
+        best = None
+        for char in text:
+            while state and char not in self.goto[state]:
+                state = self.fail[state]
+            state = self.goto[state].get(char, 0)
+            found = self.output[state]
+            if found is not None and (best is None or found < best):
+                best = found
+        return best
+
+
+class _SuffixArray:
+    """
+    广义后缀数组：找出名称包含查询名称的院校中序号最小的一个
+
+    所有院校名称的后缀排序后，以查询名称开头的后缀是连续的一段（二分查找，
+    每次比较只取查询名称长度的前缀），再用线段树求这一段中最小的院校序号；
+    一次查询 O(len(查询名称) × log(名称总长))，与院校数量无关。
+    """
+
+    def __init__(self, patterns: List[Tuple[str, int]]):
+        """
+        构建后缀数组
+
+        Args:
+            patterns: (规范化院校名称, 院校序号) 列表
+        """
+        # 所有名称用分隔符拼接，后缀用在拼接文本中的起始位置表示
+        self.text = _NAME_SEPARATOR.join(pattern for pattern, _ in patterns)
+        suffixes = []
+        offset = 0
+        for pattern, order in patterns:
+            end = offset + len(pattern)
+            # 只按名称内的部分排序：分隔符小于任何字符，与按整个后缀排序的顺序一致
+            suffixes.extend((self.text[start:end], start, order) for start in range(offset, end))
+            offset = end + len(_NAME_SEPARATOR)
+        suffixes.sort()
+
+        self.starts = array("i", (start for _, start, _ in suffixes))
+        # 线段树（叶子为各后缀所属的院校序号），用于求区间内最小的院校序号
+        self.size = len(suffixes)
+        self.tree = array("i", [0]) * self.size + array("i", (order for _, _, order in suffixes))
+        for node in range(self.size - 1, 0, -1):
+            self.tree[node] = min(self.tree[2 * node], self.tree[2 * node + 1])
+
+    def first_containing(self, text: str) -> Optional[int]:
+        """返回名称包含 text 的院校中序号最小的一个，没有则返回None"""
+        if not text or _NAME_SEPARATOR in text:
+            return None
+
+        def prefix(start: int) -> str:
+            return self.text[start:start + len(text)]
+
+        low = bisect_left(self.starts, text, key=prefix)
+        high = bisect_right(self.starts, text, lo=low, key=prefix)
+        if low == high:
+            return None
+
+        best = None
+        low += self.size
+        high += self.size
+        while low < high:
+            if low & 1:
+                best = self.tree[low] if best is None else min(best, self.tree[low])
+                low += 1
+            if high & 1:
+                high -= 1
+                best = self.tree[high] if best is None else min(best, self.tree[high])
+            low //= 2
+            high //= 2
+        return best
+
+
+class SchoolIndex:
+    """院校库索引（加载时构建一次，查询结果按学校名称缓存）"""
+
+    def __init__(self, schools: List[Dict]):
+        """
+        构建索引
+
+        Args:
+            schools: 院校库列表（院校库.json 中的 "院校库列表"）
+        """
+        # 院校中文名称 -> 属性标签（与原院校库字典一致）
+        self.schools: Dict[str, List[str]] = {}
+        for school in schools:
+            school_name = school.get("院校中文名称", "")
+            if school_name:
+                self.schools[school_name] = school.get("属性标签", [])
+
+        self._names: List[str] = list(self.schools.keys())
+        # 别名（英文名称、去括号名称） -> 院校序号
+        self._aliases: Dict[str, int] = {}
+        patterns = []
+
+        english_names = {school.get("院校中文名称", ""): school.get("院校英文名称", "") for school in schools}
+        for order, school_name in enumerate(self._names):
+            normalized = normalize_school_name(school_name)
+            patterns.append((normalized, order))
+
+            english_name = english_names.get(school_name, "")
+            if english_name:
+                self._aliases.setdefault(" ".join(english_name.lower().split()), order)
+            self._aliases.setdefault(_strip_brackets(normalized), order)
+
+        # 查询名称包含院校名称：Aho-Corasick 自动机；院校名称包含查询名称：广义后缀数组
+        self._automaton = _ContainmentAutomaton(patterns)
+        self._suffixes = _SuffixArray(patterns)
+        # 查询结果缓存（最近使用的 LOOKUP_CACHE_SIZE 个学校名称）
+        self._cache: "OrderedDict[str, List[str]]" = OrderedDict()
+        logger.debug(f"院校库索引构建完成，共 {len(self._names)} 所院校")
+
+    def __len__(self) -> int:
+        return len(self.schools)
+
+    def lookup(self, school_name: str) -> List[str]:
+        """
+        查找学校的属性标签（结果按学校名称缓存，只保留最近使用的 LOOKUP_CACHE_SIZE 个）
+
+        依次尝试：精确匹配；规范化名称相等或互相包含（取院校库中靠前的院校）；
+        英文名称或去括号名称别名。
+
+        Args:
+            school_name: 学校名称
+
+        Returns:
+            属性标签列表，未找到时返回空列表
+        """
+        if not school_name or not self.schools:
+            return []
+
+        cached = self._cache.get(school_name)
+        if cached is not None:
+            self._cache.move_to_end(school_name)
+            return cached
+
+        cached = self._lookup(school_name)
+        self._cache[school_name] = cached
+        if len(self._cache) > LOOKUP_CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return cached
+
+    def _lookup(self, school_name: str) -> List[str]:
+        school_attributes = self.schools.get(school_name, [])
+        if school_attributes:
+            return school_attributes
+
+        normalized = normalize_school_name(school_name)
+        if not normalized:
+            return []
+
+        # 院校名称包含查询名称（含相等），或查询名称包含院校名称
+        candidates = [order for order in (self._suffixes.first_containing(normalized),
+                                          self._automaton.first_contained(normalized)) if order is not None]
+        if not candidates:
+            alias = self._aliases.get(" ".join(school_name.lower().split()))
+            if alias is None:
+                alias = self._aliases.get(_strip_brackets(normalized))
+            if alias is None:
+                return []
+            candidates = [alias]
+
+        return self.schools[self._names[min(candidates)]]
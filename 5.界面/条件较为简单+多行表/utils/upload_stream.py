@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+上传文件接收模块
+
+按块读取上传的文件，边读取边计算 SHA-256 和累计大小：超过大小上限时立即停止读取
+并拒绝，不会把超大的文件整个读完。内容保存在内存中（同步筛选，直接从内存解析，
+不写临时文件），或边读取边写入指定的文件（后台任务，服务重启后仍可执行）。
+接收时算好的摘要交给解析结果缓存，不再为查缓存把文件重新读一遍。
+"""
+
+import asyncio
+import hashlib
+import os
+from dataclasses import dataclass
+from typing import Optional, Union
+
+# 单个上传文件的默认大小上限（字节）
+DEFAULT_MAX_UPLOAD_BYTES = 50 * 1024 * 1024
+
+# 每次读取的块大小（字节）
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+
+class UploadTooLargeError(Exception):
+    """上传的文件超过大小上限"""
+
+
+@dataclass
+class ReceivedUpload:
+    """接收完成的上传文件"""
+    filename: str
+    sha256: Optional[str]  # 文件内容的 SHA-256（旧任务未记录时为None）
+    size: int
+    data: Optional[bytes] = None  # 内存中的内容（写入文件时为None）
+    path: Optional[str] = None  # 写入的文件路径
+
+    @property
+    def source(self) -> Union[bytes, str]:
+        """交给解析任务的工作簿来源：内存中的内容或文件路径"""
+        return self.data if self.data is not None else self.path
+
+
+def too_large_message(filename: str, max_bytes: int) -> str:
+    """超过大小上限时的提示"""
+    return f"上传文件 {filename} 超过大小上限 {max_bytes / (1024 * 1024):g}MB"
+
+
+async def receive_upload(upload, max_bytes: int = DEFAULT_MAX_UPLOAD_BYTES, save_path: Optional[str] = None,
+                         chunk_size: int = DEFAULT_CHUNK_SIZE) -> ReceivedUpload:
+    """
+    按块接收上传文件，同时计算 SHA-256
+
+    Args:
+        upload: 上传文件（FastAPI 的 UploadFile）
+        max_bytes: 大小上限（字节），超过时停止读取
+        save_path: 写入的文件路径，为None时内容保存在内存中
+        chunk_size: 每次读取的块大小
+
+    Returns:
+        ReceivedUpload
+
+    Raises:
+        UploadTooLargeError: 文件超过大小上限（已写入的部分文件会被删除）
+    """
+    filename = upload.filename or ""
+    # 请求中带有文件大小时不读取内容直接拒绝
+    if upload.size is not None and upload.size > max_bytes:
+        raise UploadTooLargeError(too_large_message(filename, max_bytes))
+
+    digest = hashlib.sha256()
+    size = 0
+    chunks = []
+    output = open(save_path, "wb") if save_path else None
+    try:
+        while True:
+            chunk = await upload.read(chunk_size)
+            if not chunk:
+                break
+            size += len(chunk)
+            if size > max_bytes:
+                raise UploadTooLargeError(too_large_message(filename, max_bytes))
+            digest.update(chunk)
+            if output is not None:
+                await asyncio.to_thread(output.write, chunk)
+            else:
+                chunks.append(chunk)
+    except BaseException:
+        if output is not None:
+            output.close()
+            os.remove(save_path)
+        raise
+    if output is not None:
+        output.close()
+        return ReceivedUpload(filename, digest.hexdigest(), size, path=save_path)
+    return ReceivedUpload(filename, digest.hexdigest(), size, data=b"".join(chunks))